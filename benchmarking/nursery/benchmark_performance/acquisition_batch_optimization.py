@@ -0,0 +1,111 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares local optimization of the expected improvement acquisition function,
+starting from ``K`` candidates, either one by one with
+:meth:`~syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components.LBFGSOptimizeAcquisition.optimize`,
+or in lockstep with
+:meth:`~syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components.LBFGSOptimizeAcquisition.optimize_batch`.
+This is what happens when a batch of configurations is suggested in one go.
+A GP surrogate model is fitted to a random function, and local optimizations
+start from the top scoring of ``--num_initial`` random candidates. We report
+the real time and the average acquisition function value at the optimized
+candidates.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.common import (
+    dictionarize_objective,
+    INTERNAL_METRIC_NAME,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    DEFAULT_OPTIMIZATION_CONFIG,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.models.gp_model import (
+    GaussProcEmpiricalBayesEstimator,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.models.meanstd_acqfunc_impl import (
+    EIAcquisitionFunction,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components import (
+    LBFGSOptimizeAcquisition,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.test_objects import (
+    create_tuning_job_state,
+    default_gpmodel,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_data", type=int, default=100)
+    parser.add_argument("--dimension", type=int, default=5)
+    parser.add_argument("--num_candidates", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--num_initial", type=int, default=2000)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    config_space = {f"x{i}": uniform(0.0, 1.0) for i in range(args.dimension)}
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    features = random_state.rand(args.num_data, args.dimension)
+    targets = np.sum(np.sin(5 * features), axis=1)
+    state = create_tuning_job_state(
+        hp_ranges=hp_ranges,
+        cand_tuples=[tuple(x) for x in features],
+        metrics=[dictionarize_objective(y) for y in targets],
+    )
+    gpmodel = default_gpmodel(
+        state, random_seed=0, optimization_config=DEFAULT_OPTIMIZATION_CONFIG
+    )
+    estimator = GaussProcEmpiricalBayesEstimator(
+        active_metric=INTERNAL_METRIC_NAME, gpmodel=gpmodel, num_fantasy_samples=20
+    )
+    predictor = estimator.fit_from_state(state, update_params=True)
+    acquisition_function = EIAcquisitionFunction(predictor)
+    local_optimizer = LBFGSOptimizeAcquisition(
+        hp_ranges, predictor, EIAcquisitionFunction
+    )
+
+    for num_candidates in args.num_candidates:
+        # As in Bayesian optimization, we start from the top scoring among a
+        # larger number of random candidates
+        candidates = hp_ranges.random_configs(random_state, args.num_initial)
+        scores = acquisition_function.score(candidates)
+        candidates = [candidates[pos] for pos in np.argsort(scores)[:num_candidates]]
+        acq_initial = np.mean(
+            acquisition_function.compute_acq(hp_ranges.to_ndarray_matrix(candidates))
+        )
+        start_time = perf_counter()
+        optimized_single = [local_optimizer.optimize(cand) for cand in candidates]
+        time_single = perf_counter() - start_time
+        start_time = perf_counter()
+        optimized_batch = local_optimizer.optimize_batch(candidates)
+        time_batch = perf_counter() - start_time
+        acq_single, acq_batch = [
+            np.mean(acquisition_function.compute_acq(hp_ranges.to_ndarray_matrix(x)))
+            for x in (optimized_single, optimized_batch)
+        ]
+        print(
+            f"K = {num_candidates:3d}: one by one {time_single:6.2f} s "
+            f"(mean acq {acq_single:.4f}), batch {time_batch:6.2f} s "
+            f"(mean acq {acq_batch:.4f}), initial mean acq {acq_initial:.4f}"
+        )
@@ -0,0 +1,109 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares loading a tabulated blackbox with objective values read into memory
+(``mmap_mode=None``, as before) against memory-mapping them from disk
+(``mmap_mode="c"``, the default now). A random blackbox of the size of
+``fcnet`` (4 tasks, 62208 configurations, 4 seeds, 100 fidelities) is
+serialized, then loaded in a fresh process per mode, which queries a
+number of configurations of a single task. We report the time for loading
+and querying, as well as the peak resident memory of the process.
+"""
+import tempfile
+from argparse import ArgumentParser
+from multiprocessing import get_context
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.blackbox_repository.blackbox_tabular import (
+    BlackboxTabular,
+    serialize,
+    deserialize,
+)
+from syne_tune.config_space import randint
+
+
+def _create_blackboxes(args) -> dict:
+    random_state = np.random.default_rng(0)
+    hyperparameters = pd.DataFrame(
+        {"hp_x": np.arange(args.num_configs), "hp_y": np.arange(args.num_configs)}
+    )
+    return {
+        f"task{i}": BlackboxTabular(
+            hyperparameters=hyperparameters,
+            configuration_space={
+                "hp_x": randint(0, args.num_configs - 1),
+                "hp_y": randint(0, args.num_configs - 1),
+            },
+            fidelity_space={"hp_epoch": randint(1, args.num_fidelities)},
+            objectives_evaluations=random_state.random(
+                (args.num_configs, args.num_seeds, args.num_fidelities, 4),
+                dtype=np.float32,
+            ),
+        )
+        for i in range(args.num_tasks)
+    }
+
+
+def _peak_memory_mib() -> float:
+    # Peak resident set size of this process. Unlike ``ru_maxrss``, this is
+    # not inherited from the parent
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+
+
+def _load_and_query(path: str, mmap_mode, num_queries: int, queue):
+    start_time = perf_counter()
+    blackbox = deserialize(path, mmap_mode=mmap_mode)["task0"]
+    time_load = perf_counter() - start_time
+    num_configs = len(blackbox.hyperparameters)
+    positions = np.random.default_rng(1).integers(0, num_configs, size=num_queries)
+    configs = [{"hp_x": pos, "hp_y": pos} for pos in positions]
+    start_time = perf_counter()
+    values = blackbox.objective_function_batch(configs, fidelities=1, seeds=0)
+    time_query = perf_counter() - start_time
+    queue.put((time_load, time_query, _peak_memory_mib(), float(values.sum())))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_tasks", type=int, default=4)
+    parser.add_argument("--num_configs", type=int, default=62208)
+    parser.add_argument("--num_seeds", type=int, default=4)
+    parser.add_argument("--num_fidelities", type=int, default=100)
+    parser.add_argument("--num_queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    context = get_context("spawn")
+    with tempfile.TemporaryDirectory() as path:
+        serialize(_create_blackboxes(args), path)
+        results = dict()
+        for mmap_mode in (None, "c"):
+            queue = context.Queue()
+            process = context.Process(
+                target=_load_and_query,
+                args=(path, mmap_mode, args.num_queries, queue),
+            )
+            process.start()
+            results[mmap_mode] = queue.get()
+            process.join()
+    assert results[None][3] == results["c"][3]
+    for mmap_mode, (time_load, time_query, peak_memory_mib, _) in results.items():
+        print(
+            f"mmap_mode={str(mmap_mode):>4}: load {time_load:.3f} s, "
+            f"query {time_query:.4f} s, peak memory {peak_memory_mib:.1f} MiB"
+        )
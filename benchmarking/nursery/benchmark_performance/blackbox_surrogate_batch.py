@@ -0,0 +1,96 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares querying a surrogate blackbox
+(:class:`~syne_tune.blackbox_repository.blackbox_surrogate.BlackboxSurrogate`)
+for learning curves of many configurations one by one with
+``objective_function``, against a single call of
+``objective_function_batch``. Also reports the time for repeated queries one
+by one, which are served from the memo cache. A random tabulated blackbox is
+wrapped with a KNN surrogate, both with ``predict_curves=True`` and
+``predict_curves=False``.
+"""
+import itertools
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KNeighborsRegressor
+
+from syne_tune.blackbox_repository.blackbox_surrogate import add_surrogate
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.config_space import randint
+
+
+def _create_blackbox(num_epochs: int) -> BlackboxTabular:
+    domains = {f"hp_x{i}": list(range(5)) for i in range(5)}
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(*domains.values())), columns=list(domains.keys())
+    )
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, num_epochs, 2)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        objectives_evaluations[:, :, :, 1], axis=2
+    )
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={name: randint(0, 4) for name in domains.keys()},
+        fidelity_space={"hp_epoch": randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["error", "elapsed_time"],
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_epochs", type=int, default=50)
+    parser.add_argument("--num_configs", type=int, default=1000)
+    args = parser.parse_args()
+
+    blackbox = _create_blackbox(args.num_epochs)
+    random_state = np.random.RandomState(1)
+    configurations = [
+        {name: int(random_state.randint(0, 5)) for name in blackbox.hyperparameters}
+        for _ in range(args.num_configs)
+    ]
+    for predict_curves in (True, False):
+        surrogate_blackbox = add_surrogate(
+            blackbox,
+            surrogate=KNeighborsRegressor(n_neighbors=1),
+            predict_curves=predict_curves,
+            fit_differences=["elapsed_time"],
+        )
+        start_time = perf_counter()
+        batch = surrogate_blackbox.objective_function_batch(configurations, seeds=0)
+        time_batch = perf_counter() - start_time
+        start_time = perf_counter()
+        single = [
+            surrogate_blackbox.objective_function(config, seed=0)
+            for config in configurations
+        ]
+        time_single = perf_counter() - start_time
+        start_time = perf_counter()
+        for config in configurations:
+            surrogate_blackbox.objective_function(config, seed=0)
+        time_memo = perf_counter() - start_time
+        assert np.allclose(batch, np.stack(single))
+        print(
+            f"predict_curves={str(predict_curves):>5}: "
+            f"one by one {1e6 * time_single / args.num_configs:8.1f} us, "
+            f"batch {1e6 * time_batch / args.num_configs:8.1f} us, "
+            f"memoized {1e6 * time_memo / args.num_configs:8.1f} us "
+            "(per configuration)"
+        )
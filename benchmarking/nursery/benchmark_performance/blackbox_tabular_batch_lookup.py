@@ -0,0 +1,147 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of looking up objective values of many configurations in a
+:class:`~syne_tune.blackbox_repository.blackbox_tabular.BlackboxTabular`,
+using tables of the size of the ``nasbench201`` and ``fcnet`` blackboxes
+(filled with random values, so that no download is needed). Before, each
+lookup used ``.loc`` on the pandas MultiIndex ``hyperparameters_index``.
+Lookups now use a hash index, and ``objective_function_batch`` gathers the
+values of all configurations with a single indexing operation.
+"""
+import itertools
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.config_space import choice, randint
+
+# Name: (hyperparameter domains, num_seeds, num_fidelities, num_objectives)
+BLACKBOX_SIZES = {
+    # 5 operations on each of 6 edges of the cell
+    "nasbench201": (
+        {f"hp_x{i}": list(range(5)) for i in range(6)},
+        3,
+        200,
+        6,
+    ),
+    "fcnet": (
+        {
+            "hp_activation_fn_1": ["relu", "tanh"],
+            "hp_activation_fn_2": ["relu", "tanh"],
+            "hp_batch_size": [8, 16, 32, 64],
+            "hp_dropout_1": [0.0, 0.3, 0.6],
+            "hp_dropout_2": [0.0, 0.3, 0.6],
+            "hp_init_lr": [0.0005, 0.001, 0.005, 0.01, 0.05, 0.1],
+            "hp_lr_schedule": ["cosine", "const"],
+            "hp_n_units_1": [16, 32, 64, 128, 256, 512],
+            "hp_n_units_2": [16, 32, 64, 128, 256, 512],
+        },
+        4,
+        100,
+        4,
+    ),
+}
+
+
+def _create_blackbox(name: str, random_state: np.random.Generator) -> BlackboxTabular:
+    domains, num_seeds, num_fidelities, num_objectives = BLACKBOX_SIZES[name]
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(*domains.values())), columns=list(domains.keys())
+    )
+    objectives_evaluations = random_state.random(
+        (len(hyperparameters), num_seeds, num_fidelities, num_objectives),
+        dtype=np.float32,
+    )
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={name: choice(values) for name, values in domains.items()},
+        fidelity_space={"hp_epoch": randint(1, num_fidelities)},
+        objectives_evaluations=objectives_evaluations,
+    )
+
+
+def _lookup_with_multiindex(
+    blackbox: BlackboxTabular, config: dict, fidelity: int, seed: int
+) -> np.ndarray:
+    # Lookup as done before the hash index was introduced
+    key = tuple(config[key] for key in blackbox._hp_cols)
+    matching_index = blackbox.hyperparameters_index.loc[key].values
+    index = blackbox.hyperparameters.loc[matching_index].index.values[0]
+    fidelity_index = blackbox.fidelity_map[fidelity]
+    return blackbox.objectives_evaluations[index, seed, fidelity_index, :]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_queries", type=int, default=5000)
+    parser.add_argument("--num_multiindex_queries", type=int, default=500)
+    parser.add_argument(
+        "--blackboxes", type=str, nargs="+", default=["nasbench201", "fcnet"]
+    )
+    args = parser.parse_args()
+
+    random_state = np.random.default_rng(0)
+    for name in args.blackboxes:
+        blackbox = _create_blackbox(name, random_state)
+        num_configs = len(blackbox.hyperparameters)
+        print(f"\n{name}: {num_configs} configurations")
+        all_configs = blackbox.hyperparameters.to_dict("records")
+        positions = random_state.integers(0, num_configs, size=args.num_queries)
+        configs = [all_configs[pos] for pos in positions]
+        fidelities = random_state.integers(
+            1, blackbox.num_fidelities + 1, size=args.num_queries
+        ).tolist()
+        seeds = random_state.integers(0, blackbox.num_seeds, size=args.num_queries)
+
+        start_time = perf_counter()
+        num_multiindex = args.num_multiindex_queries
+        values_multiindex = np.array(
+            [
+                _lookup_with_multiindex(blackbox, config, fidelity, seed)
+                for config, fidelity, seed in zip(
+                    configs[:num_multiindex],
+                    fidelities[:num_multiindex],
+                    seeds[:num_multiindex],
+                )
+            ]
+        )
+        time_multiindex = (perf_counter() - start_time) / num_multiindex
+
+        start_time = perf_counter()
+        values_single = np.array(
+            [
+                list(blackbox.objective_function(config, fidelity, seed).values())
+                for config, fidelity, seed in zip(configs, fidelities, seeds)
+            ]
+        )
+        # Includes building the hash index
+        time_single = (perf_counter() - start_time) / args.num_queries
+
+        start_time = perf_counter()
+        values_batch = blackbox.objective_function_batch(
+            configs, fidelities=fidelities, seeds=seeds
+        )
+        time_batch = (perf_counter() - start_time) / args.num_queries
+
+        assert np.array_equal(values_single, values_batch)
+        assert np.array_equal(values_multiindex, values_batch[:num_multiindex])
+        for label, time_per_query in (
+            ("MultiIndex .loc (before)", time_multiindex),
+            ("objective_function", time_single),
+            ("objective_function_batch", time_batch),
+        ):
+            print(f"{label:>25}: {1e6 * time_per_query:9.2f} us per query")
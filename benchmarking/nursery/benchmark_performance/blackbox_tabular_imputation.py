@@ -0,0 +1,103 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the former imputation of missing objective values in
+:class:`~syne_tune.blackbox_repository.blackbox_tabular.BlackboxTabular`
+(nested Python loops) with the vectorized forward-fill along the fidelity
+axis, as well as repeated calls which use the cached result. The table has
+the size of the ``lcbench`` blackbox (2000 configurations, 52 fidelities,
+7 objectives) by default, with a fraction of entries missing.
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.config_space import randint
+
+
+def _impute_with_loops(objectives_evaluations: np.ndarray) -> np.ndarray:
+    # Former implementation
+    objectives_evaluations = objectives_evaluations.copy()
+    (
+        num_configs,
+        num_seeds,
+        num_fidelities,
+        num_objectives,
+    ) = objectives_evaluations.shape
+    for config_idx in range(num_configs):
+        for seed_idx in range(num_seeds):
+            for fidelity_idx in range(num_fidelities):
+                for objective_idx in range(num_objectives):
+                    if np.isnan(
+                        objectives_evaluations[config_idx][seed_idx][fidelity_idx][
+                            objective_idx
+                        ]
+                    ):
+                        objectives_evaluations[config_idx][seed_idx][fidelity_idx][
+                            objective_idx
+                        ] = objectives_evaluations[config_idx][seed_idx][
+                            fidelity_idx - 1
+                        ][
+                            objective_idx
+                        ]
+    nan_mask = np.isnan(objectives_evaluations).any((1, 2, 3))
+    return objectives_evaluations[~nan_mask]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_configs", type=int, default=2000)
+    parser.add_argument("--num_seeds", type=int, default=1)
+    parser.add_argument("--num_fidelities", type=int, default=52)
+    parser.add_argument("--num_objectives", type=int, default=7)
+    parser.add_argument("--missing_fraction", type=float, default=0.1)
+    parser.add_argument("--num_repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    random_state = np.random.default_rng(0)
+    objectives_evaluations = random_state.random(
+        (args.num_configs, args.num_seeds, args.num_fidelities, args.num_objectives)
+    )
+    objectives_evaluations[
+        random_state.random(objectives_evaluations.shape) < args.missing_fraction
+    ] = np.nan
+    blackbox = BlackboxTabular(
+        hyperparameters=pd.DataFrame({"hp_x": np.arange(args.num_configs)}),
+        configuration_space={"hp_x": randint(0, args.num_configs - 1)},
+        fidelity_space={"hp_epoch": randint(1, args.num_fidelities)},
+        objectives_evaluations=objectives_evaluations,
+    )
+
+    start_time = perf_counter()
+    values_loops = _impute_with_loops(objectives_evaluations)
+    time_loops = perf_counter() - start_time
+
+    start_time = perf_counter()
+    _, values = blackbox._impute_objectives_values()
+    time_vectorized = perf_counter() - start_time
+
+    start_time = perf_counter()
+    for _ in range(args.num_repeats):
+        blackbox.hyperparameter_objectives_values(predict_curves=True)
+    time_repeated = (perf_counter() - start_time) / args.num_repeats
+
+    np.testing.assert_array_equal(values, values_loops)
+    for label, duration in (
+        ("Nested loops (before)", time_loops),
+        ("Vectorized", time_vectorized),
+        ("hyperparameter_objectives_values (cached)", time_repeated),
+    ):
+        print(f"{label:>42}: {duration:.3f} s")
@@ -0,0 +1,119 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares running a simulated experiment on a tabulated blackbox with
+:class:`~syne_tune.Tuner` and
+:class:`~syne_tune.backend.simulator_backend.SimulatorCallback`, with
+:func:`~syne_tune.experiments.fast_simulate.fast_simulate`. A random
+tabulated blackbox of the size of ``nasbench201`` (15625 configurations, 200
+epochs) is used, together with ASHA. Both runs produce the same results. We
+report the real time of each simulation and whether results coincide.
+"""
+import itertools
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.backend.simulator_backend.time_keeper import SimulatedTimeKeeper
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.config_space import choice, randint
+from syne_tune.experiments.fast_simulate import fast_simulate
+from syne_tune.optimizer.baselines import ASHA
+
+
+def _create_blackbox(num_epochs: int) -> BlackboxTabular:
+    domains = {f"hp_x{i}": list(range(5)) for i in range(6)}
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(*domains.values())), columns=list(domains.keys())
+    )
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, num_epochs, 2)
+    epoch_times = 1 + 9 * random_state.rand(len(hyperparameters), 1, 1)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        np.repeat(epoch_times, num_epochs, axis=2), axis=2
+    )
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={name: choice(values) for name, values in domains.items()},
+        fidelity_space={"hp_epoch": randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["error", "elapsed_time"],
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--num_epochs", type=int, default=200)
+    parser.add_argument("--max_wallclock_time", type=float, default=200000)
+    args = parser.parse_args()
+
+    # Real time spent in the tuning loop leaks into simulated time. We switch
+    # this off, so that results of both runs can be compared
+    SimulatedTimeKeeper.real_time_since_last_recent_exit = lambda self: 0.0
+    blackbox = _create_blackbox(args.num_epochs)
+    stop_criterion = StoppingCriterion(max_wallclock_time=args.max_wallclock_time)
+
+    def create_trial_backend():
+        return UserBlackboxBackend(blackbox=blackbox, elapsed_time_attr="elapsed_time")
+
+    def create_scheduler():
+        return ASHA(
+            blackbox.configuration_space,
+            metric="error",
+            resource_attr="hp_epoch",
+            max_t=args.num_epochs,
+            random_seed=31415927,
+        )
+
+    callback = SimulatorCallback(advance_to_next_event=True)
+    tuner = Tuner(
+        trial_backend=create_trial_backend(),
+        scheduler=create_scheduler(),
+        stop_criterion=stop_criterion,
+        n_workers=args.n_workers,
+        sleep_time=0,
+        results_update_interval=3600,
+        print_update_interval=3600,
+        callbacks=[callback],
+        save_tuner=False,
+    )
+    start_time = perf_counter()
+    tuner.run()
+    time_tuner = perf_counter() - start_time
+    df_tuner = callback.dataframe()
+
+    start_time = perf_counter()
+    df_fast = fast_simulate(
+        trial_backend=create_trial_backend(),
+        scheduler=create_scheduler(),
+        stop_criterion=stop_criterion,
+        n_workers=args.n_workers,
+        advance_to_next_event=True,
+    )
+    time_fast = perf_counter() - start_time
+
+    num_trials = df_tuner["trial_id"].nunique()
+    print(f"{len(df_tuner)} results from {num_trials} trials")
+    print(f"Tuner + SimulatorCallback: {time_tuner:7.2f} s")
+    print(f"fast_simulate:             {time_fast:7.2f} s")
+    print(f"Results are the same: {df_fast.equals(df_tuner)}")
@@ -0,0 +1,103 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of recomputing the posterior state of
+:class:`~syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression.GaussianProcessRegression`
+after appending new rows to the data (new observations, or pending
+evaluations with fantasy values), with and without reusing the Cholesky
+factor of the previous state. This is what happens in Bayesian optimization
+between two refits of the hyperparameters, and when fantasies are added
+for pending evaluations. We report the real time per call of
+``recompute_states`` for different numbers of observations, and the maximum
+deviation of predictions.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression import (
+    GaussianProcessRegression,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import (
+    Matern52,
+)
+
+
+def _recompute_states(
+    model: GaussianProcessRegression,
+    features: np.ndarray,
+    targets: np.ndarray,
+    num_data: int,
+    num_new: int,
+    num_repeats: int,
+    incremental: bool,
+) -> float:
+    data = {"features": features[:num_data], "targets": targets[:num_data]}
+    data_new = {
+        "features": features[: num_data + num_new],
+        "targets": targets[: num_data + num_new],
+    }
+    time_spent = 0
+    for _ in range(num_repeats):
+        model.recompute_states(data)
+        if not incremental:
+            # Forces a full recomputation
+            model._params_for_states = None
+        start_time = perf_counter()
+        model.recompute_states(data_new)
+        time_spent += perf_counter() - start_time
+    return time_spent / num_repeats
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_data", type=int, nargs="+", default=[500, 1000, 2000])
+    parser.add_argument("--num_new", type=int, default=1)
+    parser.add_argument("--dimension", type=int, default=10)
+    parser.add_argument("--num_repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    max_num_data = max(args.num_data) + args.num_new
+    features = random_state.rand(max_num_data, args.dimension)
+    targets = np.sum(np.sin(5 * features), axis=1) + 0.1 * random_state.randn(
+        max_num_data
+    )
+    features_test = random_state.rand(100, args.dimension)
+    model = GaussianProcessRegression(kernel=Matern52(dimension=args.dimension))
+    for num_data in args.num_data:
+        predictions = dict()
+        times = dict()
+        for name, incremental in (("full", False), ("incremental", True)):
+            times[name] = _recompute_states(
+                model,
+                features,
+                targets,
+                num_data=num_data,
+                num_new=args.num_new,
+                num_repeats=args.num_repeats,
+                incremental=incremental,
+            )
+            predictions[name] = model.predict(features_test)[0]
+        max_deviation = max(
+            np.max(np.abs(x - y))
+            for x, y in zip(predictions["full"], predictions["incremental"])
+        )
+        print(
+            f"n = {num_data:5d}: full {times['full'] * 1000:8.2f} ms, "
+            f"incremental {times['incremental'] * 1000:8.2f} ms "
+            f"(max deviation {max_deviation:.2e})"
+        )
@@ -0,0 +1,96 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of predictions of
+:class:`~syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gpr_mcmc.GPRegressionMCMC`
+for a single test point, as requested in every step of L-BFGS when the
+acquisition function is optimized. We compare predictions state by state
+(triangular solve per MCMC sample) with stacked predictions (cached inverse
+Cholesky factors, stacked matrix products). We report the real time per
+call of ``predict`` (the time for computing the inverse factors once is
+reported separately), and the maximum deviation of predictions.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    MCMCConfig,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_model import (
+    GaussianProcessModel,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gpr_mcmc import (
+    GPRegressionMCMC,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import (
+    Matern52,
+)
+
+
+def _predict(predict_func, features_test: np.ndarray) -> float:
+    start_time = perf_counter()
+    for pos in range(features_test.shape[0]):
+        predict_func(features_test[pos : (pos + 1)])
+    return (perf_counter() - start_time) / features_test.shape[0]
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_data", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--dimension", type=int, default=6)
+    parser.add_argument("--num_samples", type=int, default=20)
+    parser.add_argument("--num_calls", type=int, default=100)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    max_num_data = max(args.num_data)
+    features = random_state.rand(max_num_data, args.dimension)
+    targets = np.sum(np.sin(5 * features), axis=1, keepdims=True) + 0.1 * (
+        random_state.randn(max_num_data, 1)
+    )
+    features_test = random_state.rand(args.num_calls, args.dimension)
+    for num_data in args.num_data:
+        model = GPRegressionMCMC(
+            build_kernel=lambda: Matern52(dimension=args.dimension, ARD=True),
+            # ``n_samples`` includes the burn-in samples
+            mcmc_config=MCMCConfig(
+                n_samples=args.num_samples + 10, n_burnin=10, n_thinning=1
+            ),
+            random_seed=1,
+        )
+        model.fit({"features": features[:num_data], "targets": targets[:num_data]})
+        time_serial = _predict(
+            lambda x: GaussianProcessModel.predict(model, x), features_test
+        )
+        start_time = perf_counter()
+        model.predict(features_test[:1])  # Computes inverse Cholesky factors
+        time_inverse = perf_counter() - start_time
+        time_stacked = _predict(model.predict, features_test)
+        max_deviation = max(
+            np.max(np.abs(x[0] - y[0]))
+            for x, y in zip(
+                model.predict(features_test[:1]),
+                GaussianProcessModel.predict(model, features_test[:1]),
+            )
+        )
+        print(
+            f"n = {num_data:5d}, {len(model.samples)} samples: "
+            f"serial {time_serial * 1000:6.2f} ms, "
+            f"stacked {time_stacked * 1000:6.2f} ms "
+            f"(inverse factors {time_inverse * 1000:7.2f} ms once, "
+            f"max deviation {max_deviation:.2e})"
+        )
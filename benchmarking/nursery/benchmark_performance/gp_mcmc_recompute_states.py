@@ -0,0 +1,118 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of recomputing the posterior states of
+:class:`~syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gpr_mcmc.GPRegressionMCMC`
+(one state per MCMC sample) after appending new rows to the data, as happens
+between two refits in Bayesian optimization, or when fantasies are added for
+pending evaluations. We compare recomputing all states from scratch (as
+done previously) with reusing the likelihood objects and Cholesky factors of
+the previous states. We report the real time per call of
+``recompute_states``, and the maximum deviation of predictions.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    MCMCConfig,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gpr_mcmc import (
+    GPRegressionMCMC,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import (
+    Matern52,
+)
+
+
+def _recompute_states(
+    model: GPRegressionMCMC,
+    data: dict,
+    data_new: dict,
+    num_repeats: int,
+    incremental: bool,
+) -> float:
+    time_spent = 0
+    for _ in range(num_repeats):
+        model.recompute_states(data)
+        if not incremental:
+            # Forces recomputation from scratch
+            model._sample_likelihoods = None
+            model._states = None
+        start_time = perf_counter()
+        model.recompute_states(data_new)
+        time_spent += perf_counter() - start_time
+    return time_spent / num_repeats
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_data", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--num_new", type=int, default=1)
+    parser.add_argument("--dimension", type=int, default=6)
+    parser.add_argument("--num_samples", type=int, default=20)
+    parser.add_argument("--num_repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    random_state = np.random.RandomState(0)
+    max_num_data = max(args.num_data) + args.num_new
+    features = random_state.rand(max_num_data, args.dimension)
+    targets = np.sum(np.sin(5 * features), axis=1, keepdims=True) + 0.1 * (
+        random_state.randn(max_num_data, 1)
+    )
+    features_test = random_state.rand(100, args.dimension)
+    for num_data in args.num_data:
+        model = GPRegressionMCMC(
+            build_kernel=lambda: Matern52(dimension=args.dimension, ARD=True),
+            # ``n_samples`` includes the burn-in samples
+            mcmc_config=MCMCConfig(
+                n_samples=args.num_samples + 10, n_burnin=10, n_thinning=1
+            ),
+            random_seed=1,
+        )
+        data = {"features": features[:num_data], "targets": targets[:num_data]}
+        model.fit(data)
+        # New rows come with fantasy targets, one column per MCMC sample
+        num_all = num_data + args.num_new
+        data = {
+            "features": features[:num_data],
+            "targets": np.tile(targets[:num_data], (1, model.number_samples)),
+        }
+        data_new = {
+            "features": features[:num_all],
+            "targets": np.tile(targets[:num_all], (1, model.number_samples)),
+        }
+        predictions = dict()
+        times = dict()
+        for name, incremental in (("full", False), ("incremental", True)):
+            times[name] = _recompute_states(
+                model,
+                data,
+                data_new,
+                num_repeats=args.num_repeats,
+                incremental=incremental,
+            )
+            predictions[name] = [x[0] for x in model.predict(features_test)]
+        max_deviation = max(
+            np.max(np.abs(x - y))
+            for x, y in zip(predictions["full"], predictions["incremental"])
+        )
+        print(
+            f"n = {num_data:5d}, {len(model.samples)} samples: "
+            f"full {times['full'] * 1000:8.2f} ms, "
+            f"incremental {times['incremental'] * 1000:8.2f} ms "
+            f"(max deviation {max_deviation:.2e})"
+        )
@@ -0,0 +1,91 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the time for fitting the hyperparameters of
+:class:`~syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression.GaussianProcessRegression`
+by maximizing the marginal likelihood, running the L-BFGS restarts
+sequentially or in parallel (``n_workers`` processes). We report real time
+for different numbers of restarts, and check that the fitted parameters are
+the same. Note that a speed-up can only be expected with several CPU cores.
+"""
+import logging
+import os
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    OptimizationConfig,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression import (
+    GaussianProcessRegression,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import (
+    Matern52,
+)
+
+
+def _fit_model(data: dict, n_starts: int, n_workers: int, maxiter: int):
+    dimension = data["features"].shape[1]
+    model = GaussianProcessRegression(
+        kernel=Matern52(dimension=dimension, ARD=True),
+        optimization_config=OptimizationConfig(
+            lbfgs_tol=1e-6,
+            lbfgs_maxiter=maxiter,
+            verbose=False,
+            n_starts=n_starts,
+            n_workers=n_workers,
+        ),
+        random_seed=31415927,
+    )
+    start_time = perf_counter()
+    model.fit(data)
+    return perf_counter() - start_time, model.get_params()
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_data", type=int, default=500)
+    parser.add_argument("--dimension", type=int, default=10)
+    parser.add_argument("--n_starts", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--n_workers", type=int, default=None)
+    parser.add_argument("--maxiter", type=int, default=50)
+    args = parser.parse_args()
+    n_workers = args.n_workers
+    if n_workers is None:
+        n_workers = os.cpu_count()
+
+    random_state = np.random.RandomState(0)
+    features = random_state.rand(args.num_data, args.dimension)
+    targets = np.sum(np.sin(5 * features), axis=1) + 0.1 * random_state.randn(
+        args.num_data
+    )
+    data = {"features": features, "targets": targets}
+    print(f"n = {args.num_data}, d = {args.dimension}, n_workers = {n_workers}")
+    for n_starts in args.n_starts:
+        time_sequential, params_sequential = _fit_model(
+            data, n_starts=n_starts, n_workers=1, maxiter=args.maxiter
+        )
+        time_parallel, params_parallel = _fit_model(
+            data, n_starts=n_starts, n_workers=n_workers, maxiter=args.maxiter
+        )
+        same_params = all(
+            np.array_equal(value, params_parallel[name])
+            for name, value in params_sequential.items()
+        )
+        print(
+            f"n_starts = {n_starts}: sequential {time_sequential:7.2f} s, "
+            f"parallel {time_parallel:7.2f} s (same parameters: {same_params})"
+        )
@@ -0,0 +1,71 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares :func:`~syne_tune.optimizer.schedulers.multiobjective.utils.hypervolume_cumulative`
+with the previous implementation, which computes the hypervolume indicator
+with pymoo from scratch for every prefix of the results. Results are
+sampled at random, such that the Pareto front grows over time. For the
+previous implementation, only the first ``--num_points_pymoo`` points are
+used, and times are extrapolated quadratically.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+from pymoo.indicators.hv import HV
+
+from syne_tune.optimizer.schedulers.multiobjective.utils import (
+    hypervolume_cumulative,
+)
+
+
+def _sample_results(num_points: int, num_dims: int, seed: int) -> np.ndarray:
+    random_state = np.random.RandomState(seed)
+    # Points close to the simplex, getting closer over time
+    points = random_state.rand(num_points, num_dims)
+    points /= points.sum(axis=1, keepdims=True)
+    noise = random_state.rand(num_points) / np.sqrt(np.arange(1, num_points + 1))
+    return points + noise.reshape((-1, 1))
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_points", type=int, default=10000)
+    parser.add_argument("--num_points_pymoo", type=int, default=2000)
+    args = parser.parse_args()
+
+    for num_dims in (2, 3):
+        results_array = _sample_results(args.num_points, num_dims, seed=num_dims)
+        reference_point = np.full(num_dims, 1.5)
+        start_time = perf_counter()
+        hv_incremental = hypervolume_cumulative(results_array, reference_point)
+        time_incremental = perf_counter() - start_time
+        num_points_pymoo = min(args.num_points_pymoo, args.num_points)
+        indicator_fn = HV(ref_point=reference_point)
+        start_time = perf_counter()
+        hv_pymoo = np.array(
+            [
+                indicator_fn(results_array[: (idx + 1)])
+                for idx in range(num_points_pymoo)
+            ]
+        )
+        time_pymoo = (perf_counter() - start_time) * (
+            args.num_points / num_points_pymoo
+        ) ** 2
+        same = np.allclose(hv_incremental[:num_points_pymoo], hv_pymoo)
+        print(
+            f"d = {num_dims}: incremental {time_incremental:7.2f} s, "
+            f"pymoo (extrapolated) {time_pymoo:8.2f} s, same results: {same}"
+        )
@@ -0,0 +1,120 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares loading results of a comparative study for plotting, as done by
+:class:`~syne_tune.experiments.ComparativeResults`, with and without
+restricting the columns loaded, parallel loading, and the on-disk cache. We
+create ``--num_experiments`` synthetic experiments in a temporary directory,
+whose results have ``--num_columns`` columns and ``--num_rows`` rows.
+"""
+import json
+import logging
+import os
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.constants import (
+    ST_METADATA_FILENAME,
+    ST_RESULTS_DATAFRAME_FILENAME,
+    ST_TUNER_TIME,
+)
+from syne_tune.experiments.visualization.results_utils import (
+    create_index_for_result_files,
+    load_results_dataframe_per_benchmark,
+)
+
+EXPERIMENT_NAME = "study"
+
+
+def _create_experiments(
+    root_path: Path, num_experiments: int, num_rows: int, num_columns: int
+):
+    random_state = np.random.RandomState(0)
+    for exp_id in range(num_experiments):
+        setup_name = f"setup{exp_id % 4}"
+        tuner_name = f"{EXPERIMENT_NAME}-2023-03-19-22-01-57-{exp_id:03d}"
+        tuner_path = root_path / EXPERIMENT_NAME / str(exp_id) / tuner_name
+        tuner_path.mkdir(parents=True)
+        with open(tuner_path / ST_METADATA_FILENAME, "w") as f:
+            json.dump({"algorithm": setup_name, "benchmark": "bm"}, f)
+        data = {
+            ST_TUNER_TIME: np.cumsum(random_state.rand(num_rows)),
+            "trial_id": np.arange(num_rows) // 10,
+            "error": random_state.rand(num_rows),
+        }
+        for col in range(num_columns - 3):
+            data[f"column{col}"] = random_state.rand(num_rows)
+        pd.DataFrame(data).to_csv(
+            tuner_path / ST_RESULTS_DATAFRAME_FILENAME, index=False
+        )
+
+
+def _load(columns, num_workers: int, use_cache: bool) -> pd.DataFrame:
+    index = create_index_for_result_files(
+        experiment_names=(EXPERIMENT_NAME,),
+        metadata_to_setup=lambda metadata: metadata["algorithm"],
+        use_cache=use_cache,
+    )
+    return load_results_dataframe_per_benchmark(
+        index["index"]["bm"],
+        columns=columns,
+        num_workers=num_workers,
+        use_cache=use_cache,
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_experiments", type=int, default=1000)
+    parser.add_argument("--num_rows", type=int, default=1000)
+    parser.add_argument("--num_columns", type=int, default=50)
+    parser.add_argument("--num_workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    columns = [ST_TUNER_TIME, "trial_id", "error"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["SYNETUNE_FOLDER"] = tmpdir
+        _create_experiments(
+            Path(tmpdir), args.num_experiments, args.num_rows, args.num_columns
+        )
+        df_expected = None
+        for name, kwargs in [
+            ("all columns", dict(columns=None, num_workers=1, use_cache=False)),
+            ("usecols", dict(columns=columns, num_workers=1, use_cache=False)),
+            (
+                f"usecols, {args.num_workers} workers",
+                dict(columns=columns, num_workers=args.num_workers, use_cache=False),
+            ),
+            (
+                "usecols, cache (cold)",
+                dict(columns=columns, num_workers=args.num_workers, use_cache=True),
+            ),
+            (
+                "usecols, cache (warm)",
+                dict(columns=columns, num_workers=args.num_workers, use_cache=True),
+            ),
+        ]:
+            start_time = perf_counter()
+            df = _load(**kwargs)
+            time_load = perf_counter() - start_time
+            df = df[columns + ["setup_name", "subplot_no", "tuner_name"]]
+            if df_expected is None:
+                df_expected = df
+            same = df.equals(df_expected)
+            print(f"{name:>28}: {time_load:7.2f} s, same results: {same}")
@@ -0,0 +1,72 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares wall-clock time of running the same number of short trials with
+:class:`~syne_tune.backend.LocalBackend`, once with the tuner sleeping for
+``sleep_time`` seconds whenever all workers are busy (default), and once with
+``wait_for_trial_events=True``, where the tuner wakes up as soon as a trial
+reports or finishes.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend import LocalBackend
+from syne_tune.config_space import randint
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.util import script_height_example_path
+
+
+def run_experiment(
+    wait_for_trial_events: bool, n_workers: int, num_trials: int, sleep_time: float
+) -> float:
+    config_space = {
+        "steps": 3,
+        "sleep_time": 0.01,
+        "width": randint(0, 20),
+        "height": randint(-100, 100),
+    }
+    tuner = Tuner(
+        trial_backend=LocalBackend(entry_point=str(script_height_example_path())),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_num_trials_completed=num_trials),
+        n_workers=n_workers,
+        sleep_time=sleep_time,
+        save_tuner=False,
+        wait_for_trial_events=wait_for_trial_events,
+    )
+    start_time = perf_counter()
+    tuner.run()
+    return perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--num_trials", type=int, default=20)
+    parser.add_argument("--sleep_time", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for wait_for_trial_events in [False, True]:
+        wallclock_time = run_experiment(
+            wait_for_trial_events=wait_for_trial_events,
+            n_workers=args.n_workers,
+            num_trials=args.num_trials,
+            sleep_time=args.sleep_time,
+        )
+        print(
+            f"wait_for_trial_events = {wait_for_trial_events}: "
+            f"{args.num_trials} trials in {wallclock_time:.2f} secs"
+        )
@@ -0,0 +1,67 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of fetching new results from the ``std.out`` log of a
+running trial, as done by :class:`~syne_tune.backend.LocalBackend` in every
+iteration of the tuner loop. Before, the full log was parsed on every poll
+(cost grows with the size of the log), while
+:class:`~syne_tune.report.IncrementalLogRetriever` only parses lines appended
+since the last poll (cost stays flat).
+"""
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+
+from syne_tune.constants import ST_SAGEMAKER_METRIC_TAG
+from syne_tune.report import retrieve, IncrementalLogRetriever
+
+
+def _append_reports(log_path: Path, start: int, num_reports: int):
+    with open(log_path, "a") as f:
+        for step in range(start, start + num_reports):
+            f.write(f"training step {step}\n")
+            f.write(
+                f"[{ST_SAGEMAKER_METRIC_TAG}]: "
+                f'{{"epoch": {step}, "loss": {1.0 / (step + 1)}, "st_worker_iter": {step}}}\n'
+            )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_polls", type=int, default=200)
+    parser.add_argument("--reports_per_poll", type=int, default=100)
+    parser.add_argument("--print_every", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_path = Path(tmpdir) / "std.out"
+        log_retriever = IncrementalLogRetriever(log_path)
+        num_reports = 0
+        print("num_reports  full_reparse[ms]  incremental[ms]")
+        for poll in range(1, args.num_polls + 1):
+            _append_reports(log_path, num_reports, args.reports_per_poll)
+            num_reports += args.reports_per_poll
+            start_time = perf_counter()
+            with open(log_path, "r") as f:
+                all_metrics = retrieve(log_lines=f.readlines())
+            time_full = perf_counter() - start_time
+            start_time = perf_counter()
+            log_retriever.retrieve_new()
+            time_incremental = perf_counter() - start_time
+            assert len(all_metrics) == len(log_retriever.metrics) == num_reports
+            if poll % args.print_every == 0:
+                print(
+                    f"{num_reports:11d}  {1000 * time_full:16.3f}  "
+                    f"{1000 * time_incremental:15.3f}"
+                )
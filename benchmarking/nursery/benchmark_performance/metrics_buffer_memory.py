@@ -0,0 +1,107 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the memory needed to store results reported by trials, as done by
+trial backends in ``TrialResult.metrics`` and by
+:class:`~syne_tune.results_callback.StoreResultsCallback`. Before, results
+were stored as lists of dictionaries, while
+:class:`~syne_tune.backend.metrics_buffer.MetricsBuffer` stores them in
+columns. Memory is measured with ``tracemalloc``. The time for creating a
+dataframe from all results is reported as well.
+"""
+import json
+import tracemalloc
+from argparse import ArgumentParser
+from time import perf_counter
+
+import pandas as pd
+
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+from syne_tune.constants import (
+    ST_WORKER_TIME,
+    ST_WORKER_TIMESTAMP,
+    ST_WORKER_ITER,
+    ST_DECISION,
+    ST_STATUS,
+    ST_TRIAL_ID,
+    ST_TUNER_TIME,
+)
+
+
+def _trial_results(trial_id: int, num_reports: int):
+    for epoch in range(1, num_reports + 1):
+        # Results are parsed from JSON, as done by the backends
+        yield json.loads(
+            json.dumps(
+                {
+                    "epoch": epoch,
+                    "mean_loss": 1.0 / (epoch + trial_id),
+                    ST_WORKER_TIME: 0.1 * epoch,
+                    ST_WORKER_TIMESTAMP: 1.7e9 + epoch,
+                    ST_WORKER_ITER: epoch - 1,
+                }
+            )
+        )
+
+
+def _callback_row(trial_id: int, result: dict) -> dict:
+    row = dict(result)
+    row[ST_DECISION] = "CONTINUE"
+    row[ST_STATUS] = "InProgress"
+    row[ST_TRIAL_ID] = trial_id
+    row["config_lr"] = 0.001 * (trial_id + 1)
+    row[ST_TUNER_TIME] = 0.5 * result["epoch"]
+    return row
+
+
+def _fill(container_type, num_trials: int, num_reports: int):
+    trial_metrics = dict()
+    callback_results = container_type()
+    for trial_id in range(num_trials):
+        metrics = container_type()
+        for result in _trial_results(trial_id, num_reports):
+            metrics.append(result)
+            callback_results.append(_callback_row(trial_id, result))
+        trial_metrics[trial_id] = metrics
+    return trial_metrics, callback_results
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_trials", type=int, default=1000)
+    parser.add_argument("--num_reports", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{args.num_trials} trials, {args.num_reports} reports per trial")
+    for name, container_type in (("list", list), ("MetricsBuffer", MetricsBuffer)):
+        tracemalloc.start()
+        start_time = perf_counter()
+        trial_metrics, callback_results = _fill(
+            container_type, args.num_trials, args.num_reports
+        )
+        time_fill = perf_counter() - start_time
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start_time = perf_counter()
+        if container_type is list:
+            df = pd.DataFrame(callback_results)
+        else:
+            df = callback_results.to_dataframe()
+        time_df = perf_counter() - start_time
+        assert len(df) == args.num_trials * args.num_reports
+        print(
+            f"{name:>13}: memory = {memory / 2**20:8.1f} MiB, "
+            f"time to fill = {time_fill:.2f} secs, "
+            f"time to dataframe = {time_df:.2f} secs"
+        )
+        del trial_metrics, callback_results, df
@@ -0,0 +1,108 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Scaling benchmark for the kernels in
+:mod:`syne_tune.optimizer.schedulers.multiobjective.non_dominated_priority`.
+We compare :func:`pareto_efficient` and :func:`compute_epsilon_net` against
+the previous implementations (copied below) for growing numbers of points, and
+check that outputs are identical. The previous implementations are skipped for
+more than ``--max_points_previous`` points.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.optimizer.schedulers.multiobjective.non_dominated_priority import (
+    pareto_efficient,
+    compute_epsilon_net,
+)
+
+
+def pareto_efficient_previous(X: np.ndarray) -> np.ndarray:
+    mask = np.ones(X.shape[0], dtype=bool)
+    for i, allocation in enumerate(X):
+        if mask[i]:
+            dominated = np.all(allocation <= X[mask], axis=1) * np.any(
+                allocation < X[mask], axis=1
+            )
+            mask[mask] = ~dominated
+    return mask
+
+
+def compute_epsilon_net_previous(X: np.ndarray, dim: int) -> np.ndarray:
+    indices = set(range(X.shape[0]))
+    initial_index = np.argmin(X, axis=0)[dim]
+    order = [initial_index]
+    indices.remove(initial_index)
+    while indices:
+        ordered_indices = list(indices)
+        diff = X[ordered_indices][:, None, :].repeat(len(order), axis=1) - X[order]
+        min_distances = np.linalg.norm(diff, axis=-1).min(-1)
+        choice = ordered_indices[min_distances.argmax()]
+        order.append(choice)
+        indices.remove(choice)
+    ranks = np.empty(len(order), dtype=int)
+    for rank, i in enumerate(order):
+        ranks[i] = rank
+    return np.array(ranks)
+
+
+def _timed(func, *args):
+    start_time = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start_time
+
+
+def _sample_points(num_points: int, num_dims: int, seed: int) -> np.ndarray:
+    # Half of the points lie on a simplex (and are Pareto efficient), the
+    # others are dominated by them
+    random_state = np.random.RandomState(seed)
+    X = random_state.rand(num_points, num_dims)
+    num_front = num_points // 2
+    X[:num_front] /= X[:num_front].sum(axis=1, keepdims=True)
+    X[num_front:] += 1
+    return X
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--max_points", type=int, default=100000)
+    parser.add_argument("--max_points_previous", type=int, default=10000)
+    parser.add_argument("--max_points_epsilon_net", type=int, default=10000)
+    args = parser.parse_args()
+
+    for num_dims in (2, 3):
+        num_points = 1000
+        while num_points <= args.max_points:
+            X = _sample_points(num_points, num_dims, seed=num_points)
+            mask, time_new = _timed(pareto_efficient, X)
+            msg = f"pareto_efficient     D={num_dims}, N={num_points:6d}: {time_new:8.3f} s"
+            if num_points <= args.max_points_previous:
+                mask_previous, time_previous = _timed(pareto_efficient_previous, X)
+                same = np.array_equal(mask, mask_previous)
+                msg += f" (previous {time_previous:8.3f} s, same: {same})"
+            print(msg)
+            if num_points <= args.max_points_epsilon_net:
+                ranks, time_new = _timed(compute_epsilon_net, X, 0)
+                msg = f"compute_epsilon_net  D={num_dims}, N={num_points:6d}: {time_new:8.3f} s"
+                if num_points <= args.max_points_previous // 4:
+                    ranks_previous, time_previous = _timed(
+                        compute_epsilon_net_previous, X, 0
+                    )
+                    same = np.array_equal(ranks, ranks_previous)
+                    msg += f" (previous {time_previous:8.3f} s, same: {same})"
+                print(msg)
+            num_points *= 10
@@ -0,0 +1,76 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the throughput (trials per second) of
+:class:`~syne_tune.backend.PythonBackend` starting a new Python process for
+every trial (default), against running trials on a pool of persistent worker
+processes (``num_pooled_workers``). The tuned function is cheap, so that
+throughput is dominated by the overhead of starting trials.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Optional
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend import PythonBackend
+from syne_tune.config_space import uniform
+from syne_tune.optimizer.baselines import RandomSearch
+
+
+def cheap_function(x: float, epochs: int):
+    from syne_tune import Reporter
+
+    reporter = Reporter()
+    for epoch in range(1, epochs + 1):
+        reporter(epoch=epoch, y=(x - 1) ** 2 + 1 / epoch)
+
+
+def trials_per_second(
+    num_pooled_workers: Optional[int], n_workers: int, num_trials: int
+) -> float:
+    config_space = {"x": uniform(-5, 5), "epochs": 3}
+    tuner = Tuner(
+        trial_backend=PythonBackend(
+            tune_function=cheap_function,
+            config_space=config_space,
+            num_pooled_workers=num_pooled_workers,
+        ),
+        scheduler=RandomSearch(config_space, metric="y", mode="min"),
+        stop_criterion=StoppingCriterion(max_num_trials_completed=num_trials),
+        n_workers=n_workers,
+        save_tuner=False,
+        wait_for_trial_events=True,
+    )
+    start_time = perf_counter()
+    tuner.run()
+    return num_trials / (perf_counter() - start_time)
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--num_trials", type=int, default=40)
+    args = parser.parse_args()
+
+    for num_pooled_workers in [None, args.n_workers]:
+        throughput = trials_per_second(
+            num_pooled_workers=num_pooled_workers,
+            n_workers=args.n_workers,
+            num_trials=args.num_trials,
+        )
+        print(
+            f"num_pooled_workers = {num_pooled_workers}: "
+            f"{throughput:.2f} trials per second"
+        )
@@ -0,0 +1,139 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of generating random candidates with
+:class:`~syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components.RandomStatefulCandidateGenerator`
+and encoding them into the feature matrix used for scoring them with an
+acquisition function. We compare three code paths:
+
+* "config": Sample and encode config by config (as done previously)
+* "dicts": Sample and encode vectorized over each hyperparameter, but
+  create configurations and check them against the exclusion list via
+  match strings (``generate_candidates_en_bulk``)
+* "encoded": Sample directly into the encoded matrix and check rows against
+  the exclusion list by their bytes
+  (``generate_candidates_en_bulk_encoded``). Only the top scoring
+  candidates are decoded to configurations
+
+We report the real time per call for sampling (including the exclusion
+check), encoding, and decoding, and whether the encoded matrices of the
+last two paths coincide.
+"""
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from syne_tune.config_space import (
+    loguniform,
+    uniform,
+    lograndint,
+    randint,
+    choice,
+    finrange,
+    ordinal,
+)
+from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components import (
+    RandomStatefulCandidateGenerator,
+)
+from syne_tune.optimizer.schedulers.searchers.utils import HyperparameterRanges
+from syne_tune.optimizer.schedulers.searchers.utils.exclusion_list import (
+    ExclusionList,
+)
+from syne_tune.optimizer.schedulers.searchers.utils.hp_ranges_factory import (
+    make_hyperparameter_ranges,
+)
+
+
+config_space = {
+    "learning_rate": loguniform(1e-6, 1),
+    "weight_decay": uniform(0, 1),
+    "batch_size": lograndint(8, 512),
+    "num_layers": randint(1, 10),
+    "activation": choice(["relu", "tanh", "gelu"]),
+    "optimizer": choice(["sgd", "adam"]),
+    "dropout": finrange(0, 0.5, 6),
+    "width": ordinal([64, 128, 256, 512], kind="nn-log"),
+}
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--num_candidates", type=int, nargs="+", default=[1000, 5000, 20000]
+    )
+    parser.add_argument("--num_excluded", type=int, default=100)
+    parser.add_argument("--num_decoded", type=int, default=20)
+    parser.add_argument("--num_repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    random_state = np.random.RandomState(0)
+    exclusion_list = ExclusionList(
+        hp_ranges, hp_ranges.random_configs(random_state, args.num_excluded)
+    )
+    for num_candidates in args.num_candidates:
+        times = {
+            name: {"sample": 0, "encode": 0, "decode": 0}
+            for name in ("config", "dicts", "encoded")
+        }
+        for repeat in range(args.num_repeats):
+            # Previous code path: Sample and encode config by config
+            start_time = perf_counter()
+            configs = [
+                config
+                for config in (
+                    hp_ranges.random_config(random_state) for _ in range(num_candidates)
+                )
+                if not exclusion_list.contains(config)
+            ]
+            times["config"]["sample"] += perf_counter() - start_time
+            start_time = perf_counter()
+            HyperparameterRanges.to_ndarray_matrix(hp_ranges, configs)
+            times["config"]["encode"] += perf_counter() - start_time
+            # Vectorized code path, creating configurations
+            generator = RandomStatefulCandidateGenerator(
+                hp_ranges, np.random.RandomState(repeat)
+            )
+            start_time = perf_counter()
+            configs = generator.generate_candidates_en_bulk(
+                num_candidates, exclusion_list=exclusion_list
+            )
+            times["dicts"]["sample"] += perf_counter() - start_time
+            start_time = perf_counter()
+            features_dicts = hp_ranges.to_ndarray_matrix(configs)
+            times["dicts"]["encode"] += perf_counter() - start_time
+            # Encoded code path
+            generator = RandomStatefulCandidateGenerator(
+                hp_ranges, np.random.RandomState(repeat)
+            )
+            start_time = perf_counter()
+            features_encoded = generator.generate_candidates_en_bulk_encoded(
+                num_candidates, exclusion_list=exclusion_list
+            )
+            times["encoded"]["sample"] += perf_counter() - start_time
+            start_time = perf_counter()
+            [hp_ranges.from_ndarray(x) for x in features_encoded[: args.num_decoded]]
+            times["encoded"]["decode"] += perf_counter() - start_time
+            assert np.array_equal(features_dicts, features_encoded)
+        parts = []
+        for name, x in times.items():
+            total = sum(x.values()) * 1000 / args.num_repeats
+            details = ", ".join(
+                f"{k} {v * 1000 / args.num_repeats:.2f}" for k, v in x.items()
+            )
+            parts.append(f"{name} {total:8.2f} ms ({details})")
+        print(f"N = {num_candidates:6d}: " + "; ".join(parts))
+    print("Encoded matrices of dicts and encoded paths coincide")
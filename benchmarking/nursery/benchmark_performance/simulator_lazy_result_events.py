@@ -0,0 +1,116 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares simulations where all result events of a trial are pushed onto the
+event heap when the trial starts (default), with ``lazy_result_events=True``,
+where only the next result event of each running trial is on the heap. ASHA
+stops most trials after few epochs, which requires removing their remaining
+events from the heap in the default mode. A random tabulated blackbox with
+learning curves of length ``--num_epochs`` is used. We report the real time
+of each simulation and the maximum size of the event heap.
+"""
+import itertools
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.config_space import choice, randint
+from syne_tune.optimizer.baselines import ASHA
+from syne_tune.tuner_callback import TunerCallback
+
+
+class RecordHeapSize(TunerCallback):
+    def __init__(self, trial_backend: UserBlackboxBackend):
+        self.trial_backend = trial_backend
+        self.max_heap_size = 0
+
+    def on_loop_start(self):
+        heap_size = len(self.trial_backend._simulator_state.event_heap)
+        self.max_heap_size = max(self.max_heap_size, heap_size)
+
+
+def _create_blackbox(num_epochs: int) -> BlackboxTabular:
+    domains = {f"hp_x{i}": list(range(5)) for i in range(6)}
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(*domains.values())), columns=list(domains.keys())
+    )
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, num_epochs, 2)
+    epoch_times = 1 + 9 * random_state.rand(len(hyperparameters), 1, 1)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        np.repeat(epoch_times, num_epochs, axis=2), axis=2
+    )
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={name: choice(values) for name, values in domains.items()},
+        fidelity_space={"hp_epoch": randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["error", "elapsed_time"],
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--n_workers", type=int, default=32)
+    parser.add_argument("--num_epochs", type=int, default=1000)
+    parser.add_argument("--max_num_trials_started", type=int, default=2000)
+    args = parser.parse_args()
+
+    blackbox = _create_blackbox(args.num_epochs)
+    for lazy_result_events in (False, True):
+        trial_backend = UserBlackboxBackend(
+            blackbox=blackbox,
+            elapsed_time_attr="elapsed_time",
+            lazy_result_events=lazy_result_events,
+        )
+        heap_callback = RecordHeapSize(trial_backend)
+        tuner = Tuner(
+            trial_backend=trial_backend,
+            scheduler=ASHA(
+                blackbox.configuration_space,
+                metric="error",
+                resource_attr="hp_epoch",
+                max_t=args.num_epochs,
+                reduction_factor=10,
+                random_seed=31415927,
+            ),
+            stop_criterion=StoppingCriterion(
+                max_num_trials_started=args.max_num_trials_started
+            ),
+            n_workers=args.n_workers,
+            sleep_time=0,
+            results_update_interval=3600,
+            print_update_interval=3600,
+            callbacks=[
+                SimulatorCallback(advance_to_next_event=True),
+                heap_callback,
+            ],
+            save_tuner=False,
+        )
+        start_time = perf_counter()
+        tuner.run()
+        time_run = perf_counter() - start_time
+        print(
+            f"lazy_result_events={str(lazy_result_events):>5}: {time_run:7.2f} s, "
+            f"maximum heap size {heap_callback.max_heap_size}"
+        )
@@ -0,0 +1,124 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares simulations where :class:`SimulatorCallback` advances time by
+``tuner_sleep_time`` whenever all workers are busy (default), with advancing
+time directly to the next event of the simulator
+(``advance_to_next_event=True``), with and without quantization to multiples
+of ``tuner_sleep_time``. A random tabulated blackbox with epoch times similar
+to ``nasbench201`` is used, with random search and ASHA. We report the real
+time of each simulation and the number of iterations of the tuning loop.
+"""
+import itertools
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.config_space import choice, randint
+from syne_tune.constants import ST_TUNER_TIME
+from syne_tune.optimizer.baselines import ASHA
+from syne_tune.tuner_callback import TunerCallback
+
+
+class CountLoopIterations(TunerCallback):
+    def __init__(self):
+        self.num_iterations = 0
+
+    def on_loop_start(self):
+        self.num_iterations += 1
+
+
+def _create_blackbox(num_epochs: int) -> BlackboxTabular:
+    # 5 operations on each of 6 edges of the cell
+    domains = {f"hp_x{i}": list(range(5)) for i in range(6)}
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(*domains.values())), columns=list(domains.keys())
+    )
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, num_epochs, 2)
+    # Epochs take between 20 and 200 seconds, depending on the configuration
+    epoch_times = 20 + 180 * random_state.rand(len(hyperparameters), 1, 1)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        np.repeat(epoch_times, num_epochs, axis=2), axis=2
+    )
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={name: choice(values) for name, values in domains.items()},
+        fidelity_space={"hp_epoch": randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["error", "elapsed_time"],
+    )
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--n_workers", type=int, default=4)
+    parser.add_argument("--num_epochs", type=int, default=200)
+    parser.add_argument("--max_wallclock_time", type=float, default=24 * 3600)
+    parser.add_argument("--tuner_sleep_time", type=float, default=5)
+    args = parser.parse_args()
+
+    blackbox = _create_blackbox(args.num_epochs)
+    for name, callback_kwargs in (
+        ("fixed steps", dict()),
+        ("next event", dict(advance_to_next_event=True)),
+        (
+            "next event (quantized)",
+            dict(advance_to_next_event=True, quantize_to_sleep_time=True),
+        ),
+    ):
+        simulator_callback = SimulatorCallback(**callback_kwargs)
+        count_callback = CountLoopIterations()
+        tuner = Tuner(
+            trial_backend=UserBlackboxBackend(
+                blackbox=blackbox,
+                elapsed_time_attr="elapsed_time",
+                tuner_sleep_time=args.tuner_sleep_time,
+            ),
+            scheduler=ASHA(
+                blackbox.configuration_space,
+                metric="error",
+                resource_attr="hp_epoch",
+                max_t=args.num_epochs,
+                random_seed=31415927,
+            ),
+            stop_criterion=StoppingCriterion(
+                max_wallclock_time=args.max_wallclock_time
+            ),
+            n_workers=args.n_workers,
+            sleep_time=0,
+            results_update_interval=3600,
+            print_update_interval=3600,
+            callbacks=[simulator_callback, count_callback],
+            save_tuner=False,
+        )
+        start_time = perf_counter()
+        tuner.run()
+        time_run = perf_counter() - start_time
+        results = simulator_callback.dataframe()
+        print(
+            f"{name:>22}: {time_run:7.2f} s, "
+            f"{count_callback.num_iterations:6d} loop iterations, "
+            f"{len(results):6d} results, "
+            f"final simulated time {results[ST_TUNER_TIME].max():.0f} s"
+        )
@@ -0,0 +1,155 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of starting and resuming trials in
+:class:`~syne_tune.blackbox_repository.simulated_tabular_backend.UserBlackboxBackend`
+with and without its learning curve cache. Without the cache, every resume
+queries the blackbox again and creates result dictionaries for all
+fidelities, before filtering out those below the paused level. This is what
+happens with pause-and-resume schedulers, such as promotion-based ASHA or
+PBT. A random tabulated blackbox with learning curves of length
+``--num_epochs`` is used, and each trial is paused and resumed every
+``--step`` epochs. We report the real time spent in the backend, and check
+that results are the same.
+"""
+import itertools
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from syne_tune.backend.trial_status import Status
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.config_space import choice, randint
+
+
+class UncachedUserBlackboxBackend(UserBlackboxBackend):
+    """
+    Queries the blackbox for each start or resume of a trial, as was done
+    before learning curves were cached.
+    """
+
+    def _run_job_and_collect_results(self, trial_id: int, config=None):
+        if config is None:
+            config = self._trial_dict[trial_id].config
+        seed = self._seed_for_trial.get(trial_id)
+        if seed is None:
+            seed = np.random.randint(0, self.blackbox.num_seeds)
+            self._seed_for_trial[trial_id] = seed
+        all_results = self.config_objectives(config, seed=seed)
+        resource_paused = self._resource_paused_for_trial.get(trial_id)
+        if resource_paused is not None:
+            resource_attr = self.resource_attr
+            elapsed_time_offset = 0
+            results = []
+            for result in all_results:
+                resource = int(result[resource_attr])
+                if resource > resource_paused:
+                    results.append(result)
+                elif resource == resource_paused:
+                    elapsed_time_offset = result[self.elapsed_time_attr]
+            for result in results:
+                result[self.elapsed_time_attr] -= elapsed_time_offset
+        else:
+            results = all_results
+        et_attr = self.elapsed_time_attr
+        results[0][et_attr] = max(results[0][et_attr], 0.01)
+        for i in range(1, len(results)):
+            results[i][et_attr] = max(
+                results[i][et_attr], results[i - 1][et_attr] + 0.01
+            )
+        return Status.completed, results
+
+
+def _create_blackbox(num_epochs: int) -> BlackboxTabular:
+    domains = {f"hp_x{i}": list(range(5)) for i in range(6)}
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(*domains.values())), columns=list(domains.keys())
+    )
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, num_epochs, 2)
+    epoch_times = 1 + 9 * random_state.rand(len(hyperparameters), 1, 1)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        np.repeat(epoch_times, num_epochs, axis=2), axis=2
+    )
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={name: choice(values) for name, values in domains.items()},
+        fidelity_space={"hp_epoch": randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["error", "elapsed_time"],
+    )
+
+
+def _pause_and_resume(backend: UserBlackboxBackend, num_trials: int, step: int):
+    """
+    Runs ``num_trials`` trials until the end, pausing and resuming each of them
+    every ``step`` epochs. Returns results of all trials, and the real time
+    spent in the backend to create them.
+    """
+    num_epochs = len(backend.blackbox.fidelity_values)
+    configs = backend.blackbox.hyperparameters.iloc[:num_trials].to_dict("records")
+    all_results = []
+    time_spent = 0
+    backend.time_keeper.start_of_time()
+    for config in configs:
+        config["max_epochs"] = step
+        # Registers the trial with the backend. Its results are obtained
+        # below
+        trial_id = backend.start_trial(config).trial_id
+        while True:
+            start_time = perf_counter()
+            _, results = backend._run_job_and_collect_results(trial_id, config)
+            time_spent += perf_counter() - start_time
+            all_results.extend(results)
+            if config["max_epochs"] >= num_epochs:
+                break
+            backend._resource_paused_for_trial[trial_id] = config["max_epochs"]
+            config["max_epochs"] += step
+    return all_results, time_spent
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    parser = ArgumentParser()
+    parser.add_argument("--num_epochs", type=int, default=1000)
+    parser.add_argument("--num_trials", type=int, default=100)
+    parser.add_argument("--step", type=int, default=10)
+    args = parser.parse_args()
+
+    blackbox = _create_blackbox(args.num_epochs)
+    all_results = dict()
+    num_resumes = args.num_trials * (args.num_epochs // args.step)
+    for name, backend_cls in (
+        ("uncached", UncachedUserBlackboxBackend),
+        ("cached", UserBlackboxBackend),
+    ):
+        backend = backend_cls(
+            blackbox=blackbox,
+            elapsed_time_attr="elapsed_time",
+            max_resource_attr="max_epochs",
+        )
+        results, time_spent = _pause_and_resume(
+            backend, num_trials=args.num_trials, step=args.step
+        )
+        all_results[name] = results
+        print(
+            f"{name:>8}: {time_spent:7.2f} s, "
+            f"{time_spent / num_resumes * 1e6:8.1f} us per start or resume"
+        )
+    print(f"Results are the same: {all_results['uncached'] == all_results['cached']}")
@@ -0,0 +1,93 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of storing results in
+:class:`~syne_tune.results_callback.StoreResultsCallback`, as done every
+``results_update_interval`` seconds during tuning. By default, all results
+are written to a single compressed CSV file each time (cost grows with the
+number of results), while with ``append_only=True`` only new results are
+written as a new segment (cost stays flat). Loading all results at the end
+is timed as well.
+"""
+import tempfile
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from unittest.mock import Mock
+
+from syne_tune.backend.trial_status import Trial
+from syne_tune.results_callback import StoreResultsCallback, load_results_dataframe
+
+
+def _create_callback(tuner_path: Path, append_only: bool) -> StoreResultsCallback:
+    tuner_path.mkdir()
+    tuner = Mock(
+        tuner_path=tuner_path, results_update_interval=3600, background_writer=None
+    )
+    callback = StoreResultsCallback(append_only=append_only)
+    callback.on_tuning_start(tuner)
+    return callback
+
+
+def _append_results(callback: StoreResultsCallback, start: int, num_results: int):
+    for step in range(start, start + num_results):
+        trial = Trial(trial_id=step % 16, config={"x": step % 16}, creation_time=None)
+        callback.on_trial_result(
+            trial=trial,
+            status="InProgress",
+            result={"epoch": step // 16 + 1, "loss": 1.0 / (step + 1)},
+            decision="CONTINUE",
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_stores", type=int, default=100)
+    parser.add_argument("--results_per_store", type=int, default=500)
+    parser.add_argument("--print_every", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        callbacks = {
+            append_only: _create_callback(Path(tmpdir) / str(append_only), append_only)
+            for append_only in (False, True)
+        }
+        total_times = {append_only: 0.0 for append_only in callbacks}
+        num_results = 0
+        print("num_results  full_rewrite[ms]  append_only[ms]")
+        for store in range(1, args.num_stores + 1):
+            times = dict()
+            for append_only, callback in callbacks.items():
+                _append_results(callback, num_results, args.results_per_store)
+                start_time = perf_counter()
+                callback.store_results()
+                times[append_only] = perf_counter() - start_time
+                total_times[append_only] += times[append_only]
+            num_results += args.results_per_store
+            if store % args.print_every == 0:
+                print(
+                    f"{num_results:11d}  {1000 * times[False]:16.3f}  "
+                    f"{1000 * times[True]:15.3f}"
+                )
+        print(
+            f"Total time storing: full_rewrite = {total_times[False]:.3f} secs, "
+            f"append_only = {total_times[True]:.3f} secs"
+        )
+        for append_only in callbacks:
+            start_time = perf_counter()
+            df = load_results_dataframe(Path(tmpdir) / str(append_only))
+            assert len(df) == num_results
+            print(
+                f"Time loading (append_only = {append_only}): "
+                f"{perf_counter() - start_time:.3f} secs"
+            )
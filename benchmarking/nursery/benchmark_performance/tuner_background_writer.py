@@ -0,0 +1,128 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Measures the time the tuning loop spends on persisting results and tuner
+checkpoints, as a function of storage latency. Slow storage is simulated by
+delaying each file write by ``storage_latency`` seconds. By default, writes
+happen on the loop thread, so that the latency adds to every save. With
+``save_in_background=True``, writes are done by a background thread, and the
+time spent by the loop does not depend on the latency (as long as the writer
+keeps up). The final flush is timed separately.
+"""
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+import pandas as pd
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend import LocalBackend
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+from syne_tune.backend.trial_status import Status, TrialResult
+from syne_tune.config_space import randint
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.util import script_height_example_path
+
+
+def _with_latency(write_method, latency: float):
+    def delayed_write_method(*args, **kwargs):
+        time.sleep(latency)
+        return write_method(*args, **kwargs)
+
+    return delayed_write_method
+
+
+def _create_tuner(tuner_name: str, save_in_background: bool) -> Tuner:
+    config_space = {"steps": 100, "width": randint(0, 20)}
+    tuner = Tuner(
+        trial_backend=LocalBackend(entry_point=str(script_height_example_path())),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_wallclock_time=1),
+        n_workers=4,
+        tuner_name=tuner_name,
+        save_in_background=save_in_background,
+    )
+    tuner.tuner_path.mkdir(parents=True)
+    tuner.callbacks[0].on_tuning_start(tuner)
+    return tuner
+
+
+def _append_results(tuner: Tuner, start: int, num_results: int):
+    trial_dict = tuner.trial_backend._trial_dict
+    for step in range(start, start + num_results):
+        trial_id = step // 100
+        if trial_id not in trial_dict:
+            trial_dict[trial_id] = TrialResult(
+                trial_id=trial_id,
+                config={"width": trial_id % 20},
+                creation_time=datetime.now(),
+                status=Status.in_progress,
+                metrics=MetricsBuffer(),
+            )
+        trial = trial_dict[trial_id]
+        result = {"epoch": len(trial.metrics) + 1, "mean_loss": 1.0 / (step + 1)}
+        trial.metrics.append(result)
+        tuner.callbacks[0].on_trial_result(
+            trial=trial, status=trial.status, result=result, decision="CONTINUE"
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_saves", type=int, default=20)
+    parser.add_argument("--results_per_save", type=int, default=50)
+    parser.add_argument(
+        "--storage_latencies", type=float, nargs="+", default=[0.0, 0.05, 0.2]
+    )
+    args = parser.parse_args()
+
+    original_methods = {
+        (Path, "write_bytes"): Path.write_bytes,
+        (Path, "write_text"): Path.write_text,
+        (pd.DataFrame, "to_csv"): pd.DataFrame.to_csv,
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["SYNETUNE_FOLDER"] = tmpdir
+        print("latency[s]  background  loop_per_save[ms]  final_flush[ms]")
+        for storage_latency in args.storage_latencies:
+            for (cls, name), method in original_methods.items():
+                setattr(cls, name, _with_latency(method, storage_latency))
+            for save_in_background in (False, True):
+                tuner = _create_tuner(
+                    tuner_name=f"background-{save_in_background}",
+                    save_in_background=save_in_background,
+                )
+                time_loop = 0.0
+                for save in range(args.num_saves):
+                    _append_results(
+                        tuner, save * args.results_per_save, args.results_per_save
+                    )
+                    start_time = perf_counter()
+                    tuner.callbacks[0].store_results()
+                    tuner._save_checkpoint()
+                    time_loop += perf_counter() - start_time
+                    # Time between saves, in which the tuner makes decisions
+                    time.sleep(2 * storage_latency)
+                start_time = perf_counter()
+                if tuner.background_writer is not None:
+                    tuner.background_writer.close()
+                time_flush = perf_counter() - start_time
+                print(
+                    f"{storage_latency:10.3f}  {str(save_in_background):>10}  "
+                    f"{1000 * time_loop / args.num_saves:17.3f}  "
+                    f"{1000 * time_flush:15.3f}"
+                )
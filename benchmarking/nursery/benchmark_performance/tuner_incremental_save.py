@@ -0,0 +1,120 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Compares the cost of saving the :class:`~syne_tune.Tuner` every
+``results_update_interval`` seconds while tuning is running. By default, the
+whole tuner is serialized each time (cost grows with the number of results),
+while with ``save_tuner_incrementally=True``, only results since the previous
+save are appended to a journal, along with the remaining tuner state (cost
+stays roughly flat, apart from occasional compactions). Loading the tuner at
+the end is timed as well.
+"""
+import os
+import tempfile
+from argparse import ArgumentParser
+from datetime import datetime
+from time import perf_counter
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend import LocalBackend
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+from syne_tune.backend.trial_status import Status, TrialResult
+from syne_tune.config_space import randint
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.util import script_height_example_path
+
+
+def _create_tuner(tuner_name: str, save_tuner_incrementally: bool) -> Tuner:
+    config_space = {"steps": 100, "width": randint(0, 20)}
+    tuner = Tuner(
+        trial_backend=LocalBackend(entry_point=str(script_height_example_path())),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_wallclock_time=1),
+        n_workers=4,
+        tuner_name=tuner_name,
+        save_tuner_incrementally=save_tuner_incrementally,
+    )
+    tuner.tuner_path.mkdir(parents=True)
+    tuner.callbacks[0].on_tuning_start(tuner)
+    return tuner
+
+
+def _append_results(tuner: Tuner, start: int, num_results: int, results_per_trial):
+    trial_dict = tuner.trial_backend._trial_dict
+    for step in range(start, start + num_results):
+        trial_id = step // results_per_trial
+        if trial_id not in trial_dict:
+            trial_dict[trial_id] = TrialResult(
+                trial_id=trial_id,
+                config={"width": trial_id % 20},
+                creation_time=datetime.now(),
+                status=Status.in_progress,
+                metrics=MetricsBuffer(),
+            )
+        trial = trial_dict[trial_id]
+        result = {"epoch": len(trial.metrics) + 1, "mean_loss": 1.0 / (step + 1)}
+        trial.metrics.append(result)
+        tuner.last_seen_result_per_trial[trial_id] = result
+        tuner.callbacks[0].on_trial_result(
+            trial=trial, status=trial.status, result=result, decision="CONTINUE"
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--num_saves", type=int, default=100)
+    parser.add_argument("--results_per_save", type=int, default=500)
+    parser.add_argument("--results_per_trial", type=int, default=100)
+    parser.add_argument("--print_every", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["SYNETUNE_FOLDER"] = tmpdir
+        tuners = {
+            incremental: _create_tuner(
+                tuner_name=f"incremental-{incremental}",
+                save_tuner_incrementally=incremental,
+            )
+            for incremental in (False, True)
+        }
+        total_times = {incremental: 0.0 for incremental in tuners}
+        num_results = 0
+        print("num_results  full_save[ms]  incremental[ms]")
+        for save in range(1, args.num_saves + 1):
+            times = dict()
+            for incremental, tuner in tuners.items():
+                _append_results(
+                    tuner, num_results, args.results_per_save, args.results_per_trial
+                )
+                start_time = perf_counter()
+                tuner._save_checkpoint()
+                times[incremental] = perf_counter() - start_time
+                total_times[incremental] += times[incremental]
+            num_results += args.results_per_save
+            if save % args.print_every == 0:
+                print(
+                    f"{num_results:11d}  {1000 * times[False]:13.3f}  "
+                    f"{1000 * times[True]:15.3f}"
+                )
+        print(
+            f"Total time saving: full_save = {total_times[False]:.3f} secs, "
+            f"incremental = {total_times[True]:.3f} secs"
+        )
+        for incremental, tuner in tuners.items():
+            start_time = perf_counter()
+            loaded_tuner = Tuner.load(str(tuner.tuner_path))
+            assert len(loaded_tuner.callbacks[0].results) == num_results
+            print(
+                f"Time loading (incremental = {incremental}): "
+                f"{perf_counter() - start_time:.3f} secs"
+            )
@@ -12,8 +12,10 @@
 # permissions and limitations under the License.
 import logging
 import os
+import selectors
 import shutil
 import sys
+import time
 from operator import itemgetter
 import subprocess
 from datetime import datetime
@@ -21,8 +23,9 @@ from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 
 from syne_tune.backend.trial_backend import TrialBackend, BUSY_STATUS
+from syne_tune.backend.metrics_buffer import MetricsBuffer
 from syne_tune.num_gpu import get_num_gpus
-from syne_tune.report import retrieve
+from syne_tune.report import IncrementalLogRetriever
 from syne_tune.backend.trial_status import TrialResult, Status
 from syne_tune.constants import ST_CHECKPOINT_DIR, ST_CONFIG_JSON_FNAME_ARG
 from syne_tune.util import experiment_path, random_string, dump_json_with_numpy
@@ -39,6 +42,12 @@ if "OMP_NUM_THREADS" not in os.environ:
     os.environ["OMP_NUM_THREADS"] = "1"
 
 
+# In :meth:`LocalBackend.wait_for_trial_event`, the logs of busy trials are
+# checked for new output in intervals of this many seconds. Termination of
+# trial processes is noticed immediately if pidfd is supported (Linux)
+EVENT_POLL_INTERVAL = 0.02
+
+
 class LocalBackend(TrialBackend):
     """
     A backend running locally by spawning sub-process concurrently. Note that
@@ -92,6 +101,10 @@ class LocalBackend(TrialBackend):
         # Trials which may currently be busy (status in ``BUSY_STATUS``). The
         # corresponding jobs are polled for status in ``busy_trial_ids``.
         self._busy_trial_id_candidates = set()
+        # Maps ``trial_id`` to retriever of metrics from ``std.out`` of trial.
+        # Remembers which part of the log has been parsed already, so that only
+        # newly appended lines are processed in :meth:`_all_trial_results`.
+        self._trial_log_retriever = dict()
 
     def trial_path(self, trial_id: int) -> Path:
         """
@@ -246,15 +259,26 @@ class LocalBackend(TrialBackend):
                 if self._is_process_done(trial_id=trial_id):
                     self._write_time_stamp(trial_id=trial_id, name="end")
 
-            metrics = retrieve(log_lines=self.stdout(trial_id=trial_id))
+            log_retriever = self._log_retriever(trial_id)
+            log_retriever.retrieve_new()
             trial_results = self._trial_dict[trial_id].add_results(
-                metrics=metrics,
+                metrics=log_retriever.metrics,
                 status=status,
                 training_end_time=training_end_time,
             )
             res.append(trial_results)
         return res
 
+    def _log_retriever(self, trial_id: int) -> IncrementalLogRetriever:
+        log_retriever = self._trial_log_retriever.get(trial_id)
+        if log_retriever is None:
+            log_retriever = IncrementalLogRetriever(
+                self.trial_path(trial_id=trial_id) / "std.out",
+                metrics=MetricsBuffer(),
+            )
+            self._trial_log_retriever[trial_id] = log_retriever
+        return log_retriever
+
     def _release_from_worker(self, trial_id: int):
         if trial_id in self._busy_trial_id_candidates:
             self._busy_trial_id_candidates.remove(trial_id)
@@ -338,6 +362,60 @@ class LocalBackend(TrialBackend):
         else:
             return []
 
+    def wait_for_trial_event(self, timeout: float) -> float:
+        start_time = time.perf_counter()
+        # Only trials which are running and whose termination has not been
+        # registered yet are watched
+        trial_ids = [
+            trial_id
+            for trial_id in self._busy_trial_id_candidates
+            if self._trial_dict[trial_id].status == Status.in_progress
+        ]
+        selector = self._process_exit_selector(trial_ids)
+        try:
+            while not self._has_trial_event(trial_ids):
+                remaining_time = timeout - (time.perf_counter() - start_time)
+                if remaining_time <= 0:
+                    break
+                wait_time = min(remaining_time, EVENT_POLL_INTERVAL)
+                if selector is not None:
+                    selector.select(timeout=wait_time)
+                else:
+                    time.sleep(wait_time)
+        finally:
+            if selector is not None:
+                for key in list(selector.get_map().values()):
+                    os.close(key.fd)
+                selector.close()
+        return time.perf_counter() - start_time
+
+    def _has_trial_event(self, trial_ids: List[int]) -> bool:
+        return any(
+            self._is_process_done(trial_id)
+            or self._log_retriever(trial_id).has_new_output()
+            for trial_id in trial_ids
+        )
+
+    def _process_exit_selector(
+        self, trial_ids: List[int]
+    ) -> Optional[selectors.BaseSelector]:
+        """
+        If pidfd is supported, we return a selector which becomes ready as soon
+        as one of the processes for ``trial_ids`` terminates. Otherwise,
+        ``None`` is returned.
+        """
+        if not trial_ids or not hasattr(os, "pidfd_open"):
+            return None
+        selector = selectors.DefaultSelector()
+        for trial_id in trial_ids:
+            try:
+                pidfd = os.pidfd_open(self.trial_subprocess[trial_id].pid)
+            except OSError:
+                # Process is already gone, or pidfd not supported by the kernel
+                continue
+            selector.register(pidfd, selectors.EVENT_READ)
+        return selector
+
     def stdout(self, trial_id: int) -> List[str]:
         with open(self.trial_path(trial_id=trial_id) / "std.out", "r") as f:
             return f.readlines()
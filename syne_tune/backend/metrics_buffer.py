@@ -0,0 +1,211 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Any, List, Optional, Iterable, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Type codes of ``array`` used for numeric columns
+_FLOAT_COLUMN = "d"
+_INT_COLUMN = "q"
+# Columns of other values are Python lists
+_OBJECT_COLUMN = "o"
+# Entries of columns for results which do not contain the metric
+_FILL_VALUE = {_FLOAT_COLUMN: np.nan, _INT_COLUMN: 0, _OBJECT_COLUMN: None}
+
+
+def _column_kind(value: Any) -> str:
+    if isinstance(value, float):
+        return _FLOAT_COLUMN
+    if isinstance(value, int) and not isinstance(value, bool):
+        return _INT_COLUMN
+    return _OBJECT_COLUMN
+
+
+def _new_column(kind: str, num_rows: int) -> Union[array, List[Any]]:
+    column = [_FILL_VALUE[kind]] * num_rows
+    return column if kind == _OBJECT_COLUMN else array(kind, column)
+
+
+class MetricsBuffer(Sequence):
+    """
+    Stores a sequence of results (dictionaries from metric name to value), as
+    reported for a trial, in a compact columnar format. Each metric is stored
+    in a growable array of its own, holding ``float`` or ``int`` values, or a
+    list of Python objects for values of other types. Metric names are
+    interned, and the set of names of each result is stored as index into a
+    table of such sets.
+
+    This class can be used in place of a list of dictionaries. Indexing
+    returns a dictionary (or a list of dictionaries for a slice), which is a
+    copy, so modifying it does not change the buffer. Results can be appended,
+    and the buffer can be truncated by ``del buffer[start:]``. Use
+    :meth:`to_dataframe` in order to convert the results to a dataframe.
+
+    :param results: Initial results, optional
+    """
+
+    def __init__(self, results: Optional[Iterable[Dict[str, Any]]] = None):
+        self._columns: Dict[str, Union[array, List[Any]]] = dict()
+        self._kinds: Dict[str, str] = dict()
+        # For each row, index into ``_key_sets``
+        self._row_key_sets = array("i")
+        self._key_sets: List[Tuple[str, ...]] = []
+        self._key_set_index: Dict[Tuple[str, ...], int] = dict()
+        if results is not None:
+            self.extend(results)
+
+    def __len__(self) -> int:
+        return len(self._row_key_sets)
+
+    def _key_set_id(self, keys: Tuple[str, ...]) -> int:
+        key_set_id = self._key_set_index.get(keys)
+        if key_set_id is None:
+            keys = tuple(sys.intern(key) for key in keys)
+            key_set_id = len(self._key_sets)
+            self._key_sets.append(keys)
+            self._key_set_index[keys] = key_set_id
+        return key_set_id
+
+    def _convert_to_object_column(self, key: str):
+        self._columns[key] = list(self._columns[key])
+        self._kinds[key] = _OBJECT_COLUMN
+
+    def append(self, result: Dict[str, Any]):
+        """
+        :param result: Result to be appended
+        """
+        num_rows = len(self)
+        for key, value in result.items():
+            column = self._columns.get(key)
+            kind = _column_kind(value)
+            if column is None:
+                key = sys.intern(key)
+                self._columns[key] = _new_column(kind, num_rows)
+                self._kinds[key] = kind
+            elif kind != self._kinds[key] and self._kinds[key] != _OBJECT_COLUMN:
+                self._convert_to_object_column(key)
+            try:
+                self._columns[key].append(value)
+            except OverflowError:
+                # Integer too large for int64
+                self._convert_to_object_column(key)
+                self._columns[key].append(value)
+        if len(self._columns) > len(result):
+            # Fill columns for metrics not in ``result``
+            for key, column in self._columns.items():
+                if len(column) == num_rows:
+                    column.append(_FILL_VALUE[self._kinds[key]])
+        self._row_key_sets.append(self._key_set_id(tuple(result.keys())))
+
+    def extend(self, results: Iterable[Dict[str, Any]]):
+        """
+        :param results: Results to be appended
+        """
+        for result in results:
+            self.append(result)
+
+    def _row(self, pos: int) -> Dict[str, Any]:
+        return {
+            key: self._columns[key][pos]
+            for key in self._key_sets[self._row_key_sets[pos]]
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(pos) for pos in range(*index.indices(len(self)))]
+        num_rows = len(self)
+        if index < 0:
+            index += num_rows
+        if not 0 <= index < num_rows:
+            raise IndexError("MetricsBuffer index out of range")
+        return self._row(index)
+
+    def __delitem__(self, index):
+        if not (
+            isinstance(index, slice)
+            and index.stop is None
+            and index.step in (None, 1)
+            and index.start is not None
+            and index.start >= 0
+        ):
+            raise ValueError("MetricsBuffer only supports del buffer[start:]")
+        start = index.start
+        for column in self._columns.values():
+            del column[start:]
+        del self._row_key_sets[start:]
+
+    def __iter__(self):
+        for pos in range(len(self)):
+            yield self._row(pos)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            row == other_row for row, other_row in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"MetricsBuffer({list(self)})"
+
+    def __getstate__(self):
+        return {
+            "columns": self._columns,
+            "kinds": self._kinds,
+            "row_key_sets": self._row_key_sets,
+            "key_sets": self._key_sets,
+        }
+
+    def __setstate__(self, state):
+        self._columns = {sys.intern(key): col for key, col in state["columns"].items()}
+        self._kinds = {sys.intern(key): kind for key, kind in state["kinds"].items()}
+        self._row_key_sets = state["row_key_sets"]
+        self._key_sets = []
+        self._key_set_index = dict()
+        for keys in state["key_sets"]:
+            self._key_set_id(keys)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        :return: Dataframe with a row for every result and a column for every
+            metric, with NaN if a metric is missing in a result. This is the
+            same as ``pd.DataFrame(list(buffer))``
+        """
+        row_key_sets = np.frombuffer(self._row_key_sets, dtype=np.int32)
+        data = dict()
+        for key, column in self._columns.items():
+            key_set_ids = [
+                key_set_id
+                for key_set_id, keys in enumerate(self._key_sets)
+                if key in keys
+            ]
+            missing_pos = np.flatnonzero(~np.isin(row_key_sets, key_set_ids))
+            kind = self._kinds[key]
+            if kind == _OBJECT_COLUMN:
+                # Leave type inference to pandas, as for a list of dictionaries
+                values = list(column)
+                for pos in missing_pos:
+                    values[pos] = np.nan
+                values = pd.Series(values)
+            else:
+                dtype = np.float64 if kind == _FLOAT_COLUMN else np.int64
+                values = np.array(column, dtype=dtype)
+                if missing_pos.size > 0:
+                    values = values.astype(np.float64)
+                    values[missing_pos] = np.nan
+            data[key] = values
+        return pd.DataFrame(data, index=pd.RangeIndex(len(self)))
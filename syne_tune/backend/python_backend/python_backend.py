@@ -12,6 +12,7 @@
 # permissions and limitations under the License.
 import hashlib
 import logging
+import os
 import types
 from pathlib import Path
 from typing import Callable, Dict, Optional, Any
@@ -19,9 +20,12 @@ from typing import Callable, Dict, Optional, Any
 import dill
 
 from syne_tune.backend import LocalBackend
+from syne_tune.backend.python_backend.worker_pool import WorkerPool
 from syne_tune.config_space import config_space_to_json_dict
 from syne_tune.util import dump_json_with_numpy
 
+logger = logging.getLogger(__name__)
+
 
 def file_md5(filename: str) -> str:
     hash_md5 = hashlib.md5()
@@ -66,6 +70,17 @@ class PythonBackend(LocalBackend):
 
     See ``examples/launch_height_python_backend.py`` for a complete example.
 
+    By default, a new Python process is started for every trial, which
+    deserializes and runs ``tune_function``. If ``num_pooled_workers`` is
+    given, trials are instead run by a pool of persistent worker processes
+    (see :class:`~syne_tune.backend.python_backend.worker_pool.WorkerPool`),
+    each of which loads the function only once. Reported results are sent
+    back directly, instead of being parsed from the log of the trial. This
+    can substantially increase throughput if trials are short, or if the
+    function has expensive imports. Note that in this mode, a worker
+    may be reused for many trials, so ``tune_function`` should not leave
+    behind global state, and GPUs are not rotated between trials.
+
     Additional arguments on top of parent class
     :class:`~syne_tune.backend.LocalBackend`:
 
@@ -74,6 +89,11 @@ class PythonBackend(LocalBackend):
         be performed inside the function body.
     :param config_space: Configuration space corresponding to arguments of
         ``tune_function``
+    :param num_pooled_workers: If given, trials are run by a pool of persistent
+        worker processes, with this many workers started initially. This
+        should be at least the number of workers used by
+        :class:`~syne_tune.Tuner`. Defaults to ``None`` (new process for
+        every trial)
     """
 
     def __init__(
@@ -82,7 +102,11 @@ class PythonBackend(LocalBackend):
         config_space: Dict[str, object],
         rotate_gpus: bool = True,
         delete_checkpoints: bool = False,
+        num_pooled_workers: Optional[int] = None,
     ):
+        if num_pooled_workers is not None:
+            assert num_pooled_workers >= 1, "num_pooled_workers must be positive"
+            rotate_gpus = False
         super(PythonBackend, self).__init__(
             entry_point=str(Path(__file__).parent / "python_entrypoint.py"),
             rotate_gpus=rotate_gpus,
@@ -92,6 +116,10 @@ class PythonBackend(LocalBackend):
         self.config_space = config_space
         # save function without reference to global variables or modules
         self.tune_function = types.FunctionType(tune_function.__code__, {})
+        self.num_pooled_workers = num_pooled_workers
+        # md5 hash of serialized function, computed once it is written
+        self._tune_function_hash = None
+        self._worker_pool = None
 
     @property
     def tune_function_path(self) -> Path:
@@ -111,15 +139,49 @@ class PythonBackend(LocalBackend):
     def _schedule(self, trial_id: int, config: Dict[str, Any]):
         if not (self.tune_function_path / "tune_function.dill").exists():
             self.save_tune_function(self.tune_function)
+        if self._tune_function_hash is None:
+            self._tune_function_hash = file_md5(
+                str(self.tune_function_path / "tune_function.dill")
+            )
+        if self.num_pooled_workers is not None:
+            self._schedule_on_worker_pool(trial_id=trial_id, config=config)
+            return
         config = config.copy()
         config["tune_function_root"] = str(self.tune_function_path)
         # to detect if the serialized function is the same as the one passed by the user, we pass the md5 to the
         # endpoint script. The hash is checked before executing the function.
-        config["tune_function_hash"] = file_md5(
-            str(self.tune_function_path / "tune_function.dill")
-        )
+        config["tune_function_hash"] = self._tune_function_hash
         super(PythonBackend, self)._schedule(trial_id=trial_id, config=config)
 
+    def _schedule_on_worker_pool(self, trial_id: int, config: Dict[str, Any]):
+        if self._worker_pool is None:
+            self._worker_pool = WorkerPool(
+                tune_function_root=self.tune_function_path,
+                tune_function_hash=self._tune_function_hash,
+                num_workers=self.num_pooled_workers,
+                log_path=self.local_path / "worker_pool",
+            )
+        trial_path = self.trial_path(trial_id)
+        os.makedirs(trial_path, exist_ok=True)
+        dump_json_with_numpy(config, str(trial_path / "config.json"))
+        logger.debug(f"scheduling {trial_id}, {config} on worker pool")
+        self.trial_subprocess[trial_id] = self._worker_pool.start_trial(
+            trial_id=trial_id, config=config, trial_path=trial_path
+        )
+        self._busy_trial_id_candidates.add(trial_id)  # Mark trial as busy
+
+    def _log_retriever(self, trial_id: int):
+        if self.num_pooled_workers is not None:
+            # Results are sent directly by the worker
+            return self._worker_pool.trial_results(trial_id)
+        else:
+            return super(PythonBackend, self)._log_retriever(trial_id)
+
+    def stop_all(self):
+        super(PythonBackend, self).stop_all()
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+
     def save_tune_function(self, tune_function):
         self.tune_function_path.mkdir(parents=True, exist_ok=True)
         with open(self.tune_function_path / "tune_function.dill", "wb") as file:
@@ -128,3 +190,4 @@ class PythonBackend(LocalBackend):
             config_space_to_json_dict(self.config_space),
             filename=self.tune_function_path / "configspace.json",
         )
+        self._tune_function_hash = None
@@ -0,0 +1,167 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+"""
+Entry point of a worker process of :class:`WorkerPool`. The serialized function
+from ``PythonBackend`` is loaded once (after checking its md5 hash), then the
+worker runs one trial after the other, as sent by the backend via the
+connection. Reports are sent back to the backend via the same connection. A
+running trial is interrupted by sending ``SIGUSR1`` to the worker.
+"""
+import json
+import logging
+import os
+import signal
+import sys
+import traceback
+from argparse import ArgumentParser
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Callable, Dict, Any
+
+import dill
+
+from syne_tune.backend.python_backend.python_backend import file_md5
+from syne_tune.config_space import config_space_from_json_dict
+from syne_tune.report import set_report_callback
+
+# Return code of a trial which has been interrupted
+INTERRUPTED_RETURNCODE = -signal.SIGUSR1
+
+
+class TrialInterrupted(BaseException):
+    pass
+
+
+_trial_running = False
+
+
+def _interrupt_trial(signum, frame):
+    # The signal may arrive after the trial finished, in which case it is
+    # ignored. ``TrialInterrupted`` is raised at most once per trial
+    global _trial_running
+    if _trial_running:
+        _trial_running = False
+        raise TrialInterrupted()
+
+
+def _send(connection: Connection, message: tuple):
+    # A message must not be written partially, since this corrupts the
+    # connection
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGUSR1})
+    try:
+        connection.send(message)
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGUSR1})
+
+
+def _redirect(fd: int, path: str):
+    with open(path, "a") as f:
+        os.dup2(f.fileno(), fd)
+
+
+def run_trial(
+    tune_function: Callable,
+    config: Dict[str, Any],
+    trial_id: int,
+    stdout_path: str,
+    stderr_path: str,
+    connection: Connection,
+) -> int:
+    """
+    Runs ``tune_function`` for a trial, while stdout and stderr are redirected
+    to the files of the trial.
+
+    :return: Return code (0 for success)
+    """
+    global _trial_running
+    original_fds = os.dup(1), os.dup(2)
+    _redirect(1, stdout_path)
+    _redirect(2, stderr_path)
+    set_report_callback(
+        lambda report_str: _send(connection, ("result", trial_id, report_str))
+    )
+    try:
+        try:
+            _trial_running = True
+            tune_function(**config)
+            returncode = 0
+        except TrialInterrupted:
+            returncode = INTERRUPTED_RETURNCODE
+        except SystemExit as ex:
+            returncode = (
+                ex.code if isinstance(ex.code, int) else int(ex.code is not None)
+            )
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGUSR1})
+            _trial_running = False
+    except TrialInterrupted:
+        # The signal arrived in one of the handlers above, before it could be
+        # blocked. Since ``_trial_running`` has been cleared by the signal
+        # handler, the signal cannot interrupt the cleanup below
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGUSR1})
+        returncode = INTERRUPTED_RETURNCODE
+    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGUSR1})
+    set_report_callback(None)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for fd, original_fd in zip((1, 2), original_fds):
+        os.dup2(original_fd, fd)
+        os.close(original_fd)
+    return returncode
+
+
+if __name__ == "__main__":
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+
+    parser = ArgumentParser()
+    parser.add_argument(f"--tune_function_root", type=str)
+    parser.add_argument(f"--tune_function_hash", type=str)
+    parser.add_argument(f"--connection_fd", type=int)
+    args, _ = parser.parse_known_args()
+
+    root = Path(args.tune_function_root)
+    assert (
+        file_md5(root / "tune_function.dill") == args.tune_function_hash
+    ), "The hash of the tuned function should match the hash obtained when serializing in Syne Tune."
+    with open(root / "tune_function.dill", "rb") as file:
+        tuned_function = dill.load(file)
+    with open(root / "configspace.json", "r") as file:
+        config_space = config_space_from_json_dict(json.load(file))
+
+    signal.signal(signal.SIGUSR1, _interrupt_trial)
+    connection = Connection(args.connection_fd)
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break  # Backend has gone away
+        if message is None:
+            break
+        trial_id, config, stdout_path, stderr_path = message
+        hps = {k: v for k, v in config.items() if k in config_space}
+        returncode = run_trial(
+            tune_function=tuned_function,
+            config=hps,
+            trial_id=trial_id,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path,
+            connection=connection,
+        )
+        try:
+            _send(connection, ("done", trial_id, returncode))
+        except (BrokenPipeError, ConnectionResetError):
+            break
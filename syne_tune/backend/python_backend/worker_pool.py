@@ -0,0 +1,261 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class _Worker:
+    """
+    Worker process of :class:`WorkerPool`, together with the connection to it.
+    """
+
+    def __init__(self, process: subprocess.Popen, connection: Connection):
+        self.process = process
+        self.connection = connection
+        # Trial currently run by the worker
+        self.trial_process = None
+
+
+class PooledTrialProcess:
+    """
+    Stands in for the ``subprocess.Popen`` object of a trial, when the trial
+    is run by a worker of :class:`WorkerPool`. Supports the methods and
+    attributes of ``subprocess.Popen`` used by
+    :class:`~syne_tune.backend.LocalBackend`.
+    """
+
+    def __init__(self, pool: "WorkerPool", trial_id: int, pid: int):
+        self._pool = pool
+        self.trial_id = trial_id
+        # Process ID of the worker
+        self.pid = pid
+        self.returncode = None
+        # Results received after the trial has been interrupted are dropped
+        self.interrupted = False
+
+    def poll(self) -> Optional[int]:
+        self._pool.receive_messages()
+        return self.returncode
+
+    def kill(self):
+        """
+        Interrupts the trial, the worker then becomes available for the next
+        one.
+        """
+        self._pool.receive_messages()
+        if self.returncode is None:
+            self.interrupted = True
+            os.kill(self.pid, signal.SIGUSR1)
+
+
+class PooledTrialResults:
+    """
+    Collects results sent by the worker running a trial. Supports the methods
+    and attributes of :class:`~syne_tune.report.IncrementalLogRetriever` used
+    by :class:`~syne_tune.backend.LocalBackend`, so that results are obtained
+    without parsing the log of the trial.
+    """
+
+    def __init__(self, pool: "WorkerPool"):
+        self._pool = pool
+        self.metrics = MetricsBuffer()
+        self._num_retrieved = 0
+
+    def has_new_output(self) -> bool:
+        self._pool.receive_messages()
+        return len(self.metrics) > self._num_retrieved
+
+    def retrieve_new(self) -> List[Dict[str, Any]]:
+        self._pool.receive_messages()
+        new_metrics = self.metrics[self._num_retrieved :]
+        self._num_retrieved = len(self.metrics)
+        return new_metrics
+
+
+class WorkerPool:
+    """
+    Pool of persistent worker processes running trials for
+    :class:`~syne_tune.backend.PythonBackend`. Each worker loads the tuned
+    function once, then runs trials one after the other, avoiding the start
+    of a new Python interpreter (and the imports of the function) for every
+    trial. Configurations are sent to workers, and reported results are sent
+    back, via socket connections.
+
+    Workers are started when the pool is created. If all workers are busy
+    when a trial is to be started (for example, because a worker is still
+    busy with stopping a trial), another worker is started.
+
+    :param tune_function_root: Directory containing the serialized function
+        and configuration space
+    :param tune_function_hash: md5 hash of the serialized function
+    :param num_workers: Number of workers started initially
+    :param log_path: Directory for stdout and stderr of workers, outside of
+        running trials
+    """
+
+    def __init__(
+        self,
+        tune_function_root: Path,
+        tune_function_hash: str,
+        num_workers: int,
+        log_path: Path,
+    ):
+        self.tune_function_root = tune_function_root
+        self.tune_function_hash = tune_function_hash
+        self.log_path = log_path
+        self._workers = []
+        self._num_workers_started = 0
+        # Maps ``trial_id`` to results received for the trial
+        self._trial_results = dict()
+        for _ in range(num_workers):
+            self._start_worker()
+
+    def _start_worker(self) -> _Worker:
+        self.log_path.mkdir(parents=True, exist_ok=True)
+        worker_id = self._num_workers_started
+        self._num_workers_started += 1
+        parent_socket, child_socket = socket.socketpair()
+        cmd = [
+            sys.executable,
+            str(Path(__file__).parent / "python_worker.py"),
+            "--tune_function_root",
+            str(self.tune_function_root),
+            "--tune_function_hash",
+            self.tune_function_hash,
+            "--connection_fd",
+            str(child_socket.fileno()),
+        ]
+        with open(self.log_path / f"worker-{worker_id}.out", "a") as stdout:
+            with open(self.log_path / f"worker-{worker_id}.err", "a") as stderr:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=stdout,
+                    stderr=stderr,
+                    pass_fds=(child_socket.fileno(),),
+                )
+        child_socket.close()
+        worker = _Worker(process=process, connection=Connection(parent_socket.detach()))
+        self._workers.append(worker)
+        logger.debug(f"Started worker {worker_id} with pid {process.pid}")
+        return worker
+
+    def start_trial(
+        self, trial_id: int, config: Dict[str, Any], trial_path: Path
+    ) -> PooledTrialProcess:
+        """
+        Sends trial to a free worker. Its stdout and stderr are written to
+        ``std.out`` and ``std.err`` in ``trial_path``.
+
+        :param trial_id: ID of trial
+        :param config: Configuration of trial
+        :param trial_path: Directory for files of trial
+        :return: Object standing in for the process running the trial
+        """
+        self.receive_messages()
+        worker = next((w for w in self._workers if w.trial_process is None), None)
+        if worker is None:
+            worker = self._start_worker()
+        worker.connection.send(
+            (
+                trial_id,
+                config,
+                str(trial_path / "std.out"),
+                str(trial_path / "std.err"),
+            )
+        )
+        worker.trial_process = PooledTrialProcess(
+            pool=self, trial_id=trial_id, pid=worker.process.pid
+        )
+        return worker.trial_process
+
+    def trial_results(self, trial_id: int) -> PooledTrialResults:
+        """
+        :param trial_id: ID of trial
+        :return: Results received for trial so far, over all its runs
+        """
+        results = self._trial_results.get(trial_id)
+        if results is None:
+            results = PooledTrialResults(pool=self)
+            self._trial_results[trial_id] = results
+        return results
+
+    def receive_messages(self):
+        """
+        Processes all messages sent by workers since the last call.
+        """
+        for worker in list(self._workers):
+            try:
+                while worker.connection.poll():
+                    kind, trial_id, value = worker.connection.recv()
+                    trial_process = worker.trial_process
+                    assert trial_process.trial_id == trial_id
+                    if kind == "result":
+                        if not trial_process.interrupted:
+                            self.trial_results(trial_id).metrics.append(
+                                json.loads(value)
+                            )
+                    else:
+                        trial_process.returncode = value
+                        worker.trial_process = None
+            except (EOFError, OSError):
+                self._remove_dead_worker(worker)
+
+    def _remove_dead_worker(self, worker: _Worker):
+        returncode = worker.process.wait()
+        logger.warning(
+            f"Worker with pid {worker.process.pid} terminated with return code "
+            f"{returncode}. Check {self.log_path} for its logs"
+        )
+        if worker.trial_process is not None:
+            worker.trial_process.returncode = returncode or 1
+        worker.connection.close()
+        self._workers.remove(worker)
+
+    def shutdown(self):
+        """
+        Terminates all workers. Running trials are killed. Workers are started
+        again if further trials are started.
+        """
+        self.receive_messages()
+        for worker in self._workers:
+            if worker.trial_process is not None:
+                worker.process.kill()
+            else:
+                try:
+                    worker.connection.send(None)
+                except OSError:
+                    pass
+        for worker in self._workers:
+            returncode = worker.process.wait()
+            if worker.trial_process is not None:
+                worker.trial_process.returncode = returncode
+            worker.connection.close()
+        self._workers = []
+
+    def __getstate__(self):
+        # Worker processes and connections cannot be serialized
+        state = self.__dict__.copy()
+        state["_workers"] = []
+        return state
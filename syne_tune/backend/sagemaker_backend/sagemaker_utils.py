@@ -27,6 +27,7 @@ from sagemaker import Session
 from sagemaker.estimator import Framework, EstimatorBase
 
 import syne_tune
+from syne_tune.backend.metrics_buffer import MetricsBuffer
 from syne_tune.backend.trial_status import TrialResult
 from syne_tune.constants import (
     ST_SAGEMAKER_METRIC_TAG,
@@ -168,7 +169,7 @@ def sagemaker_search(
             trial_dict[trial_id] = TrialResult(
                 trial_id=trial_id,
                 config=hps,
-                metrics=metrics,
+                metrics=MetricsBuffer(metrics),
                 status=job_info["TrainingJobStatus"],
                 creation_time=job_info["CreationTime"],
                 training_end_time=job_info.get("TrainingEndTime", None),
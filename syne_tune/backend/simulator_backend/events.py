@@ -66,6 +66,52 @@ class OnTrialResultEvent(Event):
     result: Dict[str, Any]
 
 
+@dataclass
+class ResultsCursor:
+    """
+    Results reported by a running trial, together with the position of the
+    next result to arrive at the backend. Used by
+    :class:`~syne_tune.backend.simulator_backend.SimulatorBackend` with
+    ``lazy_result_events=True``.
+
+    :param trial_id: ID of trial
+    :param results: Results reported by the trial
+    :param result_times: Times at which results arrive at the backend
+    :param time_complete: Time at which the trial completes
+    :param status: Status of the trial when it completes
+    :param position: Position of next result in ``results``
+    :param cancelled: Set to ``True`` if the trial is stopped before it
+        completes. Events for this cursor are then ignored
+    """
+
+    trial_id: int
+    results: List[Dict[str, Any]]
+    result_times: List[float]
+    time_complete: float
+    status: str
+    position: int = 0
+    cancelled: bool = False
+
+    def next_event_time(self) -> float:
+        if self.position < len(self.results):
+            return self.result_times[self.position]
+        else:
+            return self.time_complete
+
+
+@dataclass
+class NextResultEvent(Event):
+    """
+    Next result of ``cursor`` arrives at the backend, or the trial completes
+    if all results have arrived. There is at most one such event for each
+    running trial on the heap. Once processed, the event for the next result
+    is pushed.
+
+    """
+
+    cursor: ResultsCursor
+
+
 EventHeapType = List[Tuple[float, int, Event]]
 
 
@@ -124,3 +170,9 @@ class SimulatorState:
                 heapq.heappop(self.event_heap)
                 result = (top_time, top_event)
         return result
+
+    def next_event_time(self) -> Optional[float]:
+        """
+        :return: Time of event on top of heap, or None if the heap is empty
+        """
+        return self.event_heap[0][0] if self.event_heap else None
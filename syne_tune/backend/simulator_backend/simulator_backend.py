@@ -26,6 +26,7 @@ from syne_tune.backend.trial_backend import (
 from syne_tune.backend.local_backend import LocalBackend
 from syne_tune.util import dump_json_with_numpy
 from syne_tune.backend.trial_status import TrialResult, Status, Trial
+from syne_tune.backend.metrics_buffer import MetricsBuffer
 from syne_tune.backend.simulator_backend.time_keeper import SimulatedTimeKeeper
 from syne_tune.backend.simulator_backend.events import (
     SimulatorState,
@@ -33,6 +34,8 @@ from syne_tune.backend.simulator_backend.events import (
     CompleteEvent,
     StopEvent,
     OnTrialResultEvent,
+    NextResultEvent,
+    ResultsCursor,
 )
 from syne_tune.constants import (
     ST_CHECKPOINT_DIR,
@@ -126,6 +129,17 @@ class SimulatorBackend(LocalBackend):
         :meth:`~syne_tune.Tuner.run`. This information is needed in
         :class:`~syne_tune.backend.simulator_backend.SimulatorCallback`.
         Defaults to :const:`~syne_tune.tuner.DEFAULT_SLEEP_TIME`
+    :param lazy_result_events: If ``False``, all ``OnTrialResultEvent``
+        events of a trial, together with its ``CompleteEvent``, are pushed
+        when the trial starts, and they have to be removed from the heap if
+        the trial is stopped. If ``True``, a
+        :class:`~syne_tune.backend.simulator_backend.events.ResultsCursor` is
+        created for the trial instead, and only the event for its next
+        result is on the heap. Stopping a trial just marks its cursor as
+        cancelled. This keeps the heap small and stopping cheap, which
+        matters for long learning curves and early stopping schedulers.
+        Results of a trial arrive in the order in which they are reported,
+        so their elapsed times must be non-decreasing. Defaults to ``False``
     """
 
     def __init__(
@@ -135,6 +149,7 @@ class SimulatorBackend(LocalBackend):
         simulator_config: Optional[SimulatorConfig] = None,
         tuner_sleep_time: float = TUNER_DEFAULT_SLEEP_TIME,
         debug_resource_attr: Optional[str] = None,
+        lazy_result_events: bool = False,
     ):
         super().__init__(entry_point=entry_point, rotate_gpus=False)
         self.elapsed_time_attr = elapsed_time_attr
@@ -144,6 +159,10 @@ class SimulatorBackend(LocalBackend):
             self.simulator_config = simulator_config
         self.tuner_sleep_time = tuner_sleep_time
         self._debug_resource_attr = debug_resource_attr
+        self.lazy_result_events = lazy_result_events
+        # Used if ``lazy_result_events == True``: Maps ``trial_id`` of running
+        # trial to its results cursor
+        self._results_cursors = dict()
         # Start with empty event queue
         self._simulator_state = SimulatorState()
         self._time_keeper = SimulatedTimeKeeper()
@@ -205,6 +224,8 @@ class SimulatorBackend(LocalBackend):
                 self._process_stop_event(trial_id=trial_id, time_event=time_event)
             elif isinstance(event, OnTrialResultEvent):
                 self._process_on_trial_result_event(time_event=time_event, event=event)
+            elif isinstance(event, NextResultEvent):
+                self._process_next_result_event(time_event=time_event, event=event)
             else:
                 raise TypeError(f"Event at time {time_event} of unknown type: {event}")
             next_event = self._simulator_state.next_until(time_now)
@@ -216,8 +237,8 @@ class SimulatorBackend(LocalBackend):
         # Run training script and record results
         status, results = self._run_job_and_collect_results(trial_id, config=config)
         time_final_result = time_event
-        deb_it = 0  # DEBUG
-        for i, result in enumerate(results):
+        result_times = []
+        for result in results:
             elapsed_time = result.get(self.elapsed_time_attr)
             assert elapsed_time is not None, (
                 f"Result for trial_id = {trial_id} does not contain "
@@ -226,37 +247,87 @@ class SimulatorBackend(LocalBackend):
                 + "must be set as elapsed_time_attr here."
             )
             _time_result = time_event + float(elapsed_time)
-            time_result = _time_result + self.simulator_config.delay_on_trial_result
-            self._simulator_state.push(
-                OnTrialResultEvent(trial_id=trial_id, result=result),
-                event_time=time_result,
+            result_times.append(
+                _time_result + self.simulator_config.delay_on_trial_result
             )
             time_final_result = max(time_final_result, _time_result)
-            # DEBUG:
-            if deb_it < 10:
-                if self._debug_resource_attr:
-                    k = self._debug_resource_attr
-                    debug_kwargs = {k: result.get(k)}
-                else:
-                    debug_kwargs = dict()
-                self._debug_message(
-                    "OnTrialResultEvent",
-                    time=time_result,
-                    trial_id=trial_id,
-                    pushed=True,
-                    **debug_kwargs,
-                )
-                deb_it += 1
         time_complete = (
             time_final_result + self.simulator_config.delay_complete_after_final_report
         )
+        if self.lazy_result_events:
+            cursor = ResultsCursor(
+                trial_id=trial_id,
+                results=results,
+                result_times=result_times,
+                time_complete=time_complete,
+                status=status,
+            )
+            self._results_cursors[trial_id] = cursor
+            self._push_next_result_event(cursor)
+        else:
+            for deb_it, (result, time_result) in enumerate(zip(results, result_times)):
+                self._simulator_state.push(
+                    OnTrialResultEvent(trial_id=trial_id, result=result),
+                    event_time=time_result,
+                )
+                # DEBUG:
+                if deb_it < 10:
+                    self._debug_message(
+                        "OnTrialResultEvent",
+                        time=time_result,
+                        trial_id=trial_id,
+                        pushed=True,
+                        **self._debug_kwargs(result),
+                    )
+            self._simulator_state.push(
+                CompleteEvent(trial_id=trial_id, status=status),
+                event_time=time_complete,
+            )
+            self._debug_message(
+                "CompleteEvent", time=time_complete, trial_id=trial_id, pushed=True
+            )
+        self._busy_trial_ids.add(trial_id)
+
+    def _debug_kwargs(self, result: dict) -> dict:
+        if self._debug_resource_attr:
+            k = self._debug_resource_attr
+            return {k: result.get(k)}
+        else:
+            return dict()
+
+    def _push_next_result_event(self, cursor: ResultsCursor):
+        event_time = cursor.next_event_time()
         self._simulator_state.push(
-            CompleteEvent(trial_id=trial_id, status=status), event_time=time_complete
+            NextResultEvent(trial_id=cursor.trial_id, cursor=cursor),
+            event_time=event_time,
         )
         self._debug_message(
-            "CompleteEvent", time=time_complete, trial_id=trial_id, pushed=True
+            "NextResultEvent",
+            time=event_time,
+            trial_id=cursor.trial_id,
+            pushed=True,
+            position=cursor.position,
         )
-        self._busy_trial_ids.add(trial_id)
+
+    def _process_next_result_event(self, time_event: float, event: NextResultEvent):
+        cursor = event.cursor
+        if cursor.cancelled:
+            # Trial has been stopped
+            return
+        trial_id = cursor.trial_id
+        if cursor.position < len(cursor.results):
+            result = cursor.results[cursor.position]
+            cursor.position += 1
+            self._process_on_trial_result_event(
+                time_event=time_event,
+                event=OnTrialResultEvent(trial_id=trial_id, result=result),
+            )
+            self._push_next_result_event(cursor)
+        else:
+            del self._results_cursors[trial_id]
+            self._process_complete_event(
+                trial_id=trial_id, time_event=time_event, status=cursor.status
+            )
 
     def _process_complete_event(self, trial_id: int, time_event: float, status: str):
         self._debug_message(
@@ -273,7 +344,9 @@ class SimulatorBackend(LocalBackend):
             # No results reported for the trial. This can happen if
             # the trial failed
             self._trial_dict[trial_id] = trial_result.add_results(
-                metrics=[], status=status, training_end_time=training_end_time
+                metrics=MetricsBuffer(),
+                status=status,
+                training_end_time=training_end_time,
             )
         if trial_id in self._busy_trial_ids:
             self._busy_trial_ids.remove(trial_id)
@@ -283,8 +356,13 @@ class SimulatorBackend(LocalBackend):
         # Remove all remaining events for ``trial_id``. This includes
         # the ``CompleteEvent`` pushed with ``StartEvent``, so there can
         # be no confusion with the 2nd ``CompleteEvent`` pushed by
-        # ``_stop_trial``.
-        self._simulator_state.remove_events(trial_id)
+        # ``_stop_trial``. If the trial has a results cursor, its remaining
+        # events are ignored once the cursor is cancelled.
+        cursor = self._results_cursors.pop(trial_id, None)
+        if cursor is not None:
+            cursor.cancelled = True
+        else:
+            self._simulator_state.remove_events(trial_id)
         if trial_id in self._busy_trial_ids:
             self._busy_trial_ids.remove(trial_id)
 
@@ -293,16 +371,11 @@ class SimulatorBackend(LocalBackend):
     ):
         trial_id = event.trial_id
         result = copy.copy(event.result)
-        if self._debug_resource_attr:
-            k = self._debug_resource_attr
-            debug_kwargs = {k: result.get(k)}
-        else:
-            debug_kwargs = dict()
         self._debug_message(
             "OnTrialResultEvent",
             time=time_event,
             trial_id=trial_id,
-            **debug_kwargs,
+            **self._debug_kwargs(result),
         )
         # Append timestamps to ``result``. This is done here, but not in
         # the other backends, for which timestamps are only added when
@@ -317,7 +390,7 @@ class SimulatorBackend(LocalBackend):
             trial_result.metrics.append(result)
         else:
             self._trial_dict[trial_id] = trial_result.add_results(
-                metrics=[result],
+                metrics=MetricsBuffer([result]),
                 status=Status.in_progress,
                 training_end_time=None,
             )
@@ -518,6 +591,13 @@ class SimulatorBackend(LocalBackend):
         results = all_results[num_already_before:]
         return status, results
 
+    def next_event_time(self) -> Optional[float]:
+        """
+        :return: Simulated time of the next event to be processed, or ``None``
+            if there are no pending events
+        """
+        return self._simulator_state.next_event_time()
+
     def busy_trial_ids(self) -> List[Tuple[int, str]]:
         self._process_events_until_now()
         return [(trial_id, Status.in_progress) for trial_id in self._busy_trial_ids]
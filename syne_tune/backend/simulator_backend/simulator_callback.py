@@ -12,6 +12,7 @@
 # permissions and limitations under the License.
 from typing import Optional
 import logging
+import math
 
 from syne_tune.results_callback import StoreResultsCallback, ExtraResultsComposer
 from syne_tune.backend.simulator_backend.simulator_backend import SimulatorBackend
@@ -23,6 +24,70 @@ from syne_tune.optimizer.schedulers.fifo import FIFOScheduler
 logger = logging.getLogger(__name__)
 
 
+def simulated_stop_criterion(stop_criterion):
+    """
+    Since ``TuningStatus`` is measuring real time, not simulated time, the
+    ``max_wallclock_time`` part of a stopping criterion is replaced by
+    ``max_metric_value`` w.r.t. ST_TUNER_TIME. Note that
+    :class:`~syne_tune.backend.simulator_backend.SimulatorBackend` is adding
+    ST_TUNER_TIME to any result it receives.
+
+    :param stop_criterion: Stopping criterion passed to
+        :class:`~syne_tune.Tuner`
+    :return: Stopping criterion to be used with the simulator backend. This is
+        ``stop_criterion`` itself if it does not have to be modified
+    """
+    if not isinstance(stop_criterion, StoppingCriterion):
+        # Note: We could raise an exception here ...
+        logger.warning(
+            "The stop_criterion argument to Tuner is not of type "
+            + "StoppingCriterion. This can be problematic when using "
+            + "the SimulatorBackend. If your stop_criterion depends on "
+            + "wallclock time, you'll get wrong behaviour. It is highly "
+            + "recommended to use StoppingCriterion!"
+        )
+    elif stop_criterion.max_wallclock_time is not None:
+        max_wallclock_time = stop_criterion.max_wallclock_time
+        stop_criterion = StoppingCriterion(
+            max_num_trials_started=stop_criterion.max_num_trials_started,
+            max_num_trials_completed=stop_criterion.max_num_trials_completed,
+            max_cost=stop_criterion.max_cost,
+            max_num_trials_finished=stop_criterion.max_num_trials_finished,
+            max_metric_value={ST_TUNER_TIME: max_wallclock_time},
+            max_num_evaluations=stop_criterion.max_num_evaluations,
+        )
+    return stop_criterion
+
+
+def advance_time_when_sleeping(
+    trial_backend: SimulatorBackend,
+    advance_to_next_event: bool = False,
+    quantize_to_sleep_time: bool = False,
+):
+    """
+    Advances the time keeper of ``trial_backend`` when the tuner is sleeping,
+    see :class:`SimulatorCallback`.
+
+    :param trial_backend: Simulator backend
+    :param advance_to_next_event: See :class:`SimulatorCallback`
+    :param quantize_to_sleep_time: See :class:`SimulatorCallback`
+    """
+    time_keeper = trial_backend.time_keeper
+    tuner_sleep_time = trial_backend.tuner_sleep_time
+    next_event_time = None
+    if advance_to_next_event:
+        next_event_time = trial_backend.next_event_time()
+    if next_event_time is None:
+        time_keeper.advance(tuner_sleep_time)
+    elif quantize_to_sleep_time and tuner_sleep_time > 0:
+        num_steps = max(
+            math.ceil((next_event_time - time_keeper.time()) / tuner_sleep_time), 1
+        )
+        time_keeper.advance(num_steps * tuner_sleep_time)
+    else:
+        time_keeper.advance_to(next_event_time)
+
+
 class SimulatorCallback(StoreResultsCallback):
     """
     Callback to be used in :meth:`~syne_tune.Tuner.run` in order to support the
@@ -33,6 +98,17 @@ class SimulatorCallback(StoreResultsCallback):
     defined in the backend). The real sleep time in :class:`~syne_tune.Tuner`
     must be 0.
 
+    If ``advance_to_next_event=True``, :meth:`on_tuning_sleep` advances the
+    ``time_keeper`` directly to the time of the next event of the simulator
+    (for example, the next result reported by a running trial) instead. When
+    all workers are busy for a long time, this avoids many iterations of the
+    tuning loop in which nothing happens, which speeds up simulations
+    substantially. If also ``quantize_to_sleep_time=True``, time is advanced
+    by the smallest multiple of ``tuner_sleep_time`` which reaches the next
+    event. This is what happens with ``advance_to_next_event=False`` as well
+    (up to real time spent in the tuning loop), so that results are close to
+    what is obtained in the default mode.
+
     Second, we need to make sure that results written out are annotated by
     simulated time, not real time. This is already catered for by
     :class:`~syne_tune.backend.SimulatorBackend` adding ``ST_TUNER_TIME``
@@ -51,9 +127,20 @@ class SimulatorCallback(StoreResultsCallback):
     :param extra_results_composer: Optional. If given, this is called in
         :meth:`on_trial_result`, and the resulting dictionary is appended as
         extra columns to the results dataframe
+    :param advance_to_next_event: If ``True``, :meth:`on_tuning_sleep`
+        advances time to the next event of the simulator, see above. Defaults
+        to ``False``
+    :param quantize_to_sleep_time: Only if ``advance_to_next_event=True``. If
+        ``True``, time is advanced by a multiple of ``tuner_sleep_time``, see
+        above. Defaults to ``False``
     """
 
-    def __init__(self, extra_results_composer: Optional[ExtraResultsComposer] = None):
+    def __init__(
+        self,
+        extra_results_composer: Optional[ExtraResultsComposer] = None,
+        advance_to_next_event: bool = False,
+        quantize_to_sleep_time: bool = False,
+    ):
         # Note: ``results_update_interval`` is w.r.t. real time, not
         # simulated time. Storing results intermediately is not important for
         # the simulator backend, so the default is larger
@@ -61,38 +148,18 @@ class SimulatorCallback(StoreResultsCallback):
             add_wallclock_time=True,
             extra_results_composer=extra_results_composer,
         )
-        self._tuner_sleep_time = None
+        self.advance_to_next_event = advance_to_next_event
+        self.quantize_to_sleep_time = quantize_to_sleep_time
         self._time_keeper = None
+        self._backend = None
         self._tuner = None
         self._backup_stop_criterion = None
 
     def _modify_stop_criterion(self, tuner: "Tuner"):
         stop_criterion = tuner.stop_criterion
-        if not isinstance(stop_criterion, StoppingCriterion):
-            # Note: We could raise an exception here ...
-            logger.warning(
-                "The stop_criterion argument to Tuner is not of type "
-                + "StoppingCriterion. This can be problematic when using "
-                + "the SimulatorBackend. If your stop_criterion depends on "
-                + "wallclock time, you'll get wrong behaviour. It is highly "
-                + "recommended to use StoppingCriterion!"
-            )
-        elif stop_criterion.max_wallclock_time is not None:
-            # Since ``TuningStatus`` is measuring real time, not simulated time,
-            # we need to replace the ``max_wallclock_time`` part of this criterion
-            # by ``max_metric_value`` w.r.t. ST_TUNER_TIME. Note that
-            # ``SimulatorBackend`` is adding ST_TUNER_TIME to any result it
-            # receives
+        new_stop_criterion = simulated_stop_criterion(stop_criterion)
+        if new_stop_criterion is not stop_criterion:
             self._backup_stop_criterion = stop_criterion
-            max_wallclock_time = stop_criterion.max_wallclock_time
-            new_stop_criterion = StoppingCriterion(
-                max_num_trials_started=stop_criterion.max_num_trials_started,
-                max_num_trials_completed=stop_criterion.max_num_trials_completed,
-                max_cost=stop_criterion.max_cost,
-                max_num_trials_finished=stop_criterion.max_num_trials_finished,
-                max_metric_value={ST_TUNER_TIME: max_wallclock_time},
-                max_num_evaluations=stop_criterion.max_num_evaluations,
-            )
             tuner.stop_criterion = new_stop_criterion
 
     def on_tuning_start(self, tuner: "Tuner"):
@@ -110,6 +177,7 @@ class SimulatorCallback(StoreResultsCallback):
             tuner.sleep_time == 0
         ), "Initialize Tuner with sleep_time = 0 if you use the SimulatorBackend"
         self._time_keeper = backend.time_keeper
+        self._backend = backend
         scheduler = tuner.scheduler
         if isinstance(scheduler, FIFOScheduler):
             # Assign backend.time_keeper. It is important to do this here,
@@ -121,16 +189,20 @@ class SimulatorCallback(StoreResultsCallback):
             # time_keeper object then).
             scheduler.set_time_keeper(self._time_keeper)
         self._time_keeper.start_of_time()
-        self._tuner_sleep_time = backend.tuner_sleep_time
         # Modify ``tuner.stop_criterion`` in case it depends on wallclock time
         self._modify_stop_criterion(tuner)
         self._tuner = tuner
 
     def on_tuning_sleep(self, sleep_time: float):
-        self._time_keeper.advance(self._tuner_sleep_time)
+        advance_time_when_sleeping(
+            trial_backend=self._backend,
+            advance_to_next_event=self.advance_to_next_event,
+            quantize_to_sleep_time=self.quantize_to_sleep_time,
+        )
 
     def on_tuning_end(self):
         super().on_tuning_end()
         # Restore ``stop_criterion``
         self._tuner.stop_criterion = self._backup_stop_criterion
         self._tuner = None
+        self._backend = None
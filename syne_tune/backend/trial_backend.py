@@ -14,9 +14,11 @@ from collections import defaultdict
 
 from datetime import datetime
 from pathlib import Path
+import time
 from typing import Dict, List, Tuple, Optional, Any
 import logging
 
+from syne_tune.backend.metrics_buffer import MetricsBuffer
 from syne_tune.backend.trial_status import TrialResult, Trial, Status
 from syne_tune.constants import ST_WORKER_TIMESTAMP
 
@@ -91,7 +93,7 @@ class TrialBackend:
             config=config,
             creation_time=now,
             status=Status.in_progress,
-            metrics=[],
+            metrics=MetricsBuffer(),
         )
         self._trial_dict[trial_id] = trial
 
@@ -293,6 +295,21 @@ class TrialBackend:
         """
         raise NotImplementedError
 
+    def wait_for_trial_event(self, timeout: float) -> float:
+        """Waits until some busy trial has reported a new result or finished,
+        but at most ``timeout`` seconds. Used by :class:`~syne_tune.Tuner` when
+        all workers are busy, if ``wait_for_trial_events=True``.
+
+        The default implementation simply sleeps for ``timeout`` seconds.
+        Backends which can be notified of such events should override this
+        method, so that the tuner can react to them without delay.
+
+        :param timeout: Maximum time to wait (in secs)
+        :return: Time (in secs) which was actually spent waiting
+        """
+        time.sleep(timeout)
+        return timeout
+
     def stdout(self, trial_id: int) -> List[str]:
         """Fetch ``stdout`` log for trial
 
@@ -13,7 +13,7 @@
 # requires python 3.7
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Optional, Sequence
 
 try:
     from typing_extensions import Literal
@@ -54,7 +54,8 @@ class Trial:
 class TrialResult(Trial):
     # Metrics recorded for each call of ``report``. Each metric is a dictionary from metric name to value (
     # could be numeric or string, the only constrain is that it must be compatible with json).
-    metrics: List[Dict[str, object]]
+    # Backends store them in a ``MetricsBuffer``, which can be used like a list of dictionaries.
+    metrics: Sequence[Dict[str, object]]
     status: Literal[
         Status.completed,
         Status.in_progress,
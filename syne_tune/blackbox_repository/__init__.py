@@ -16,6 +16,7 @@ from syne_tune.blackbox_repository.blackbox_offline import (  # noqa: F401
 )
 from syne_tune.blackbox_repository.repository import (  # noqa: F401
     load_blackbox,
+    load_blackbox_cached,
     blackbox_list,
 )
 from syne_tune.blackbox_repository.blackbox_surrogate import add_surrogate  # noqa: F401
@@ -28,6 +29,7 @@ __all__ = [
     "BlackboxOffline",
     "deserialize",
     "load_blackbox",
+    "load_blackbox_cached",
     "blackbox_list",
     "add_surrogate",
     "BlackboxRepositoryBackend",
@@ -13,7 +13,7 @@
 from numbers import Number
 
 import pandas as pd
-from typing import Optional, Callable, List, Tuple, Union, Dict, Any
+from typing import Optional, Callable, List, Tuple, Union, Dict, Any, Sequence
 import numpy as np
 
 
@@ -91,6 +91,43 @@ class Blackbox:
             seed=seed,
         )
 
+    def objective_function_batch(
+        self,
+        configurations: List[Dict[str, Any]],
+        fidelities: Optional[Union[Sequence[Union[dict, Number]], dict, Number]] = None,
+        seeds: Optional[Union[Sequence[int], int]] = None,
+    ) -> np.ndarray:
+        """Returns evaluations of the blackbox for several configurations.
+
+        The default implementation calls :meth:`objective_function` for each
+        configuration. Subclasses may provide a faster implementation.
+
+        :param configurations: configurations to be evaluated
+        :param fidelities: one fidelity per configuration, or a single one used
+            for all. If not given, all fidelities are returned, as in
+            :meth:`objective_function`
+        :param seeds: one seed per configuration, or a single one used for all.
+            Only used if the blackbox defines multiple seeds. If not given, a
+            seed is drawn at random for every configuration
+        :return: array of objective values, with shape
+            ``(num_configurations, num_objectives)`` if ``fidelities`` is given,
+            and shape ``(num_configurations, num_fidelities, num_objectives)``
+            otherwise. The order of objectives is given by
+            :attr:`objectives_names`
+        """
+        num_configs = len(configurations)
+        if fidelities is None or isinstance(fidelities, (dict, Number)):
+            fidelities = [fidelities] * num_configs
+        if seeds is None or isinstance(seeds, Number):
+            seeds = [seeds] * num_configs
+        results = []
+        for config, fidelity, seed in zip(configurations, fidelities, seeds):
+            result = self.objective_function(config, fidelity=fidelity, seed=seed)
+            if isinstance(result, dict):
+                result = [result[name] for name in self.objectives_names]
+            results.append(result)
+        return np.array(results)
+
     def _objective_function(
         self,
         configuration: Dict[str, Any],
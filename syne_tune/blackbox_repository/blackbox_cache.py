@@ -0,0 +1,169 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from collections import OrderedDict
+import logging
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*args, **kwargs) -> Hashable:
+    """
+    Creates a hashable cache key from the arguments. Dictionaries, lists and
+    tuples are converted recursively, so that dictionaries with the same
+    entries map to the same key. Values which are not hashable are represented
+    by their ``repr``.
+
+    :return: Cache key
+    """
+    return _hashable((args, kwargs))
+
+
+def _hashable(value) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(
+            sorted(((str(k), _hashable(v)) for k, v in value.items()), key=repr)
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class BlackboxCache:
+    """
+    Cache for blackboxes, with least recently used (LRU) eviction once more
+    than ``max_size`` entries are stored. Loading tabulated blackboxes or
+    fitting surrogate models is expensive, while blackboxes are not modified
+    by simulations, so they can be shared between all backends in a process.
+
+    Entries are created by :meth:`get`, which calls ``load`` in case of a
+    miss, or by :meth:`preload`. The number of hits and misses are counted,
+    see :meth:`statistics`.
+
+    :param max_size: Maximum number of entries. If 0, nothing is cached
+    """
+
+    def __init__(self, max_size: int):
+        assert max_size >= 0, f"max_size = {max_size} must not be negative"
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def set_max_size(self, max_size: int):
+        """
+        Changes the maximum number of entries. If there are more entries,
+        the least recently used ones are evicted.
+
+        :param max_size: New maximum number of entries
+        """
+        assert max_size >= 0, f"max_size = {max_size} must not be negative"
+        self._max_size = max_size
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _evict(self):
+        while len(self._entries) > self._max_size:
+            key, _ = self._entries.popitem(last=False)
+            self.num_evictions += 1
+            logger.info(f"Evicting blackbox from cache: {key}")
+
+    def _insert(self, key: Hashable, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        :param key: Cache key, see :func:`cache_key`
+        :param load: Called without arguments in case of a miss, the result
+            is inserted into the cache
+        :return: Cached value for ``key``
+        """
+        if key in self._entries:
+            self.num_hits += 1
+            self._entries.move_to_end(key)
+            value = self._entries[key]
+        else:
+            self.num_misses += 1
+            value = load()
+            self._insert(key, value)
+        return value
+
+    def preload(self, key: Hashable, load: Callable[[], Any]):
+        """
+        Loads value for ``key`` and inserts it into the cache, unless it is
+        already present. This does not count as hit or miss.
+
+        :param key: Cache key, see :func:`cache_key`
+        :param load: Called without arguments if ``key`` is not in the cache
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self._insert(key, load())
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+        """
+        self._entries.clear()
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        :return: Dictionary with number of hits, misses and evictions, as well
+            as current and maximum number of entries
+        """
+        return {
+            "num_hits": self.num_hits,
+            "num_misses": self.num_misses,
+            "num_evictions": self.num_evictions,
+            "size": len(self._entries),
+            "max_size": self._max_size,
+        }
+
+
+DEFAULT_BLACKBOX_CACHE_SIZE = 4
+
+
+_blackbox_cache: Optional[BlackboxCache] = None
+
+
+def blackbox_cache() -> BlackboxCache:
+    """
+    :return: Blackbox cache shared by the whole process, used by
+        :func:`~syne_tune.blackbox_repository.load_blackbox_cached` and
+        :class:`~syne_tune.blackbox_repository.BlackboxRepositoryBackend`
+    """
+    global _blackbox_cache
+
+    if _blackbox_cache is None:
+        _blackbox_cache = BlackboxCache(max_size=DEFAULT_BLACKBOX_CACHE_SIZE)
+    return _blackbox_cache
@@ -10,7 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Optional, Tuple, List, Dict, Any
+from collections import OrderedDict
+from numbers import Number
+from typing import Optional, Tuple, List, Dict, Any, Union, Sequence
 import pandas as pd
 from sklearn.neighbors import KNeighborsRegressor
 from sklearn.pipeline import Pipeline, FeatureUnion, make_pipeline
@@ -25,6 +27,7 @@ from syne_tune.blackbox_repository.blackbox import (
     ObjectiveFunctionResult,
 )
 from syne_tune.blackbox_repository.blackbox_offline import BlackboxOffline
+from syne_tune.blackbox_repository.blackbox_cache import cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +113,14 @@ class BlackboxSurrogate(Blackbox):
         are subsampled without replacement. If ``num_seeds`` is used, this is a
         limit on the data per seed
     :param name:
+    :param prediction_cache_size: Predictions of :meth:`objective_function`
+        are memoized, keyed by configuration, fidelity and seed. This is the
+        maximum number of predictions stored, the least recently used ones
+        are evicted. Use 0 to switch off memoization. Defaults to 10000
+    :param random_seed: If given, random choices made when fitting the
+        surrogate (subsampling for ``max_fit_samples`` and ``random_state`` of
+        the estimator, if it has one) are determined by this seed. Otherwise,
+        the global random number generator is used
     """
 
     def __init__(
@@ -126,6 +137,8 @@ class BlackboxSurrogate(Blackbox):
         fit_differences: Optional[List[str]] = None,
         max_fit_samples: Optional[int] = None,
         name: Optional[str] = None,
+        prediction_cache_size: int = 10000,
+        random_seed: Optional[int] = None,
     ):
         super(BlackboxSurrogate, self).__init__(
             configuration_space=configuration_space,
@@ -153,6 +166,12 @@ class BlackboxSurrogate(Blackbox):
         self.name = name
         self._fidelity_values = fidelity_values
         self.num_seeds = num_seeds
+        self.random_seed = random_seed
+        assert (
+            prediction_cache_size >= 0
+        ), f"prediction_cache_size = {prediction_cache_size} must not be negative"
+        self.prediction_cache_size = prediction_cache_size
+        self._prediction_cache = OrderedDict()
         self.fit_surrogate(X=X, y=y)
 
     @staticmethod
@@ -317,7 +336,7 @@ class BlackboxSurrogate(Blackbox):
         Note: ``fidelity_values`` need not be contiguous (``1, 2, 3, ...``). We use
         generalized weighted finite differences to account for that.
 
-        :param prediction: Shape ``(num_fidelities, num_objectives)``
+        :param prediction: Shape ``(..., num_fidelities, num_objectives)``
         :return:
         """
         num_fidelities = self.num_fidelities
@@ -326,8 +345,10 @@ class BlackboxSurrogate(Blackbox):
             if is_contiguous:
                 spacing = 1
             for objective_pos in self.fit_differences:
-                prediction_new = np.cumsum(prediction[:, objective_pos] * spacing)
-                prediction[:, objective_pos] = prediction_new
+                prediction_new = np.cumsum(
+                    prediction[..., objective_pos] * spacing, axis=-1
+                )
+                prediction[..., objective_pos] = prediction_new
             return prediction
         else:
             return prediction
@@ -338,6 +359,12 @@ class BlackboxSurrogate(Blackbox):
         be a matrix with the number of columns equal to the number of fidelity
         values (the ``predict_curves = True`` case).
         """
+        if self.random_seed is None:
+            random_state = np.random
+        else:
+            random_state = np.random.RandomState(self.random_seed)
+            if "random_state" in self.surrogate.get_params():
+                self.surrogate.set_params(random_state=self.random_seed)
         self.surrogate_pipeline = [
             self.make_model_pipeline(
                 configuration_space=self.configuration_space,
@@ -347,18 +374,85 @@ class BlackboxSurrogate(Blackbox):
             )
             for _ in range(self.num_seeds)
         ]
+        # Memoized predictions are not valid anymore
+        self._prediction_cache.clear()
         y = self._transform_to_finite_differences(y)
         Xs, ys = self._data_for_seeds(X, y)
         for pipeline, features, targets in zip(self.surrogate_pipeline, Xs, ys):
             # todo would be nicer to have this in the feature pipeline
             num_data = len(features)
             if self.max_fit_samples is not None and self.max_fit_samples < num_data:
-                random_indices = np.random.permutation(num_data)[: self.max_fit_samples]
+                random_indices = random_state.permutation(num_data)[
+                    : self.max_fit_samples
+                ]
                 features = features.loc[random_indices]
                 targets = targets.loc[random_indices]
             pipeline.fit(X=features, y=targets)
         return self
 
+    def _fidelity_indices(self, fidelities: np.ndarray) -> np.ndarray:
+        assert self.fidelity_values is not None, "blackbox has no fidelities"
+        matches = np.asarray(fidelities).reshape((-1, 1)) == np.asarray(
+            self.fidelity_values
+        ).reshape((1, -1))
+        assert np.all(
+            matches.any(axis=1)
+        ), f"fidelities {fidelities} not all among {self.fidelity_values}"
+        return matches.argmax(axis=1)
+
+    def _predict(
+        self,
+        configurations: List[Dict[str, Any]],
+        fidelities: Optional[np.ndarray],
+        seed: int,
+    ) -> np.ndarray:
+        """
+        Runs a single ``predict`` of the surrogate model for ``seed`` on all
+        ``configurations``.
+
+        :param configurations: Configurations to predict for
+        :param fidelities: One fidelity value per configuration. If not given,
+            predictions for all fidelities are returned
+        :param seed: Seed (selects surrogate model)
+        :return: Predictions, shape ``(num_configs, num_objectives)`` if
+            ``fidelities`` is given or there are no fidelity values, shape
+            ``(num_configs, num_fidelities, num_objectives)`` otherwise
+        """
+        pipeline = self.surrogate_pipeline[seed]
+        num_configs = len(configurations)
+        features = pd.DataFrame(configurations)
+        all_fidelities = self.fidelity_values
+        do_fit_diffs = len(self.fit_differences) > 0
+        if self.predict_curves:
+            # Multivariate regression
+            prediction = self._transform_from_finite_differences(
+                pipeline.predict(features).reshape(
+                    (num_configs, self.num_fidelities, -1)
+                )
+            )
+        elif all_fidelities is not None and (fidelities is None or do_fit_diffs):
+            # Univariate regression, where fidelity is an input. We predict
+            # for all fidelities of all configurations at once
+            features = features.loc[
+                features.index.repeat(self.num_fidelities)
+            ].reset_index(drop=True)
+            features[self.fidelity_name()] = np.tile(all_fidelities, num_configs)
+            prediction = self._transform_from_finite_differences(
+                pipeline.predict(features).reshape(
+                    (num_configs, self.num_fidelities, -1)
+                )
+            )
+        else:
+            # Univariate regression, where fidelity (if any) is an input
+            if fidelities is not None:
+                features[self.fidelity_name()] = fidelities
+            return pipeline.predict(features).reshape((num_configs, -1))
+        if fidelities is not None:
+            prediction = prediction[
+                np.arange(num_configs), self._fidelity_indices(fidelities)
+            ]
+        return prediction
+
     def _objective_function(
         self,
         configuration: Dict[str, Any],
@@ -371,60 +465,88 @@ class BlackboxSurrogate(Blackbox):
             assert (
                 0 <= seed < self.num_seeds
             ), f"seed = {seed}, must be in [0, {self.num_seeds - 1}]"
-        surrogate_input = configuration.copy()
-        single_fidelity = fidelity is not None
-        do_fit_diffs = len(self.fit_differences) > 0
-        if self.fidelity_values is not None:
-            fidelity_attr = self.fidelity_name()
+        if fidelity is not None:
+            # If there are several fidelity values, pick the first
+            fidelity = next(iter(fidelity.values()))
+        # Predictions are deterministic, so they can be memoized. This helps
+        # in particular with pause and resume scheduling, where the same
+        # configuration is queried several times
+        key = (cache_key(configuration), fidelity, seed)
+        prediction = self._prediction_cache.get(key)
+        if prediction is None:
+            prediction = self._predict(
+                [configuration],
+                fidelities=None if fidelity is None else np.array([fidelity]),
+                seed=seed,
+            )[0]
+            if self.prediction_cache_size > 0:
+                self._prediction_cache[key] = prediction
+                if len(self._prediction_cache) > self.prediction_cache_size:
+                    self._prediction_cache.popitem(last=False)
         else:
-            fidelity_attr = None
-        if not self.predict_curves:
-            # Univariate regression, where fidelity is an input
-            if (not do_fit_diffs) and (single_fidelity or self.fidelity_values is None):
-                if single_fidelity:
-                    surrogate_input.update(fidelity)
-                # use the surrogate model for prediction
-                prediction = self.surrogate_pipeline[seed].predict(
-                    pd.DataFrame([surrogate_input])
-                )
-                # converts the returned nd-array with shape (1, num_metrics)
-                # to the list of objectives values
-                prediction = prediction.reshape(-1).tolist()
-                # convert prediction to dictionary
-                prediction = dict(zip(self.objectives_names, prediction))
-            else:
-                # when no fidelity is given and a fidelity space exists, we
-                # return all fidelities
-                # we construct a input dataframe with all fidelity for the
-                # configuration given to call the transformer at once which
-                # is more efficient due to vectorization
-                surrogate_input_df = pd.DataFrame(
-                    [surrogate_input] * self.num_fidelities
-                )
-                surrogate_input_df[fidelity_attr] = self.fidelity_values
-                prediction = self._transform_from_finite_differences(
-                    self.surrogate_pipeline[seed].predict(surrogate_input_df)
-                )
-            extract_fidelity = do_fit_diffs and single_fidelity
+            self._prediction_cache.move_to_end(key)
+        prediction = prediction.copy()
+        if prediction.ndim == 1:
+            # convert prediction to dictionary
+            return dict(zip(self.objectives_names, prediction.tolist()))
         else:
-            # Multivariate regression
-            prediction = self.surrogate_pipeline[seed].predict(
-                pd.DataFrame([surrogate_input])
+            return prediction
+
+    def objective_function_batch(
+        self,
+        configurations: List[Dict[str, Any]],
+        fidelities: Optional[Union[Sequence[Union[dict, Number]], dict, Number]] = None,
+        seeds: Optional[Union[Sequence[int], int]] = None,
+    ) -> np.ndarray:
+        """
+        Configurations are grouped by seed, and predictions for each group are
+        obtained by a single ``predict`` call of the surrogate model, which is
+        much faster than calling :meth:`objective_function` for each
+        configuration. If there are no fidelity values, the result has shape
+        ``(num_configurations, num_objectives)`` also if ``fidelities`` is not
+        given.
+        """
+        num_configs = len(configurations)
+        for configuration in configurations:
+            self._check_keys(config=configuration, fidelity=None)
+        if seeds is None:
+            seeds = np.random.randint(0, self.num_seeds, size=num_configs)
+        else:
+            seeds = np.broadcast_to(np.asarray(seeds, dtype=np.int64), (num_configs,))
+            assert np.all(
+                (0 <= seeds) & (seeds < self.num_seeds)
+            ), f"seeds = {seeds}, must be in [0, {self.num_seeds - 1}]"
+        if fidelities is not None:
+            if isinstance(fidelities, (dict, Number)):
+                fidelities = [fidelities]
+            fidelities = np.broadcast_to(
+                np.array(
+                    [
+                        next(iter(fidelity.values()))
+                        if isinstance(fidelity, dict)
+                        else fidelity
+                        for fidelity in fidelities
+                    ]
+                ),
+                (num_configs,),
             )
-            prediction = self._transform_from_finite_differences(
-                prediction.reshape((self.num_fidelities, -1))
+        result = None
+        for seed in np.unique(seeds):
+            indices = np.flatnonzero(seeds == seed)
+            prediction = self._predict(
+                [configurations[index] for index in indices],
+                fidelities=None if fidelities is None else fidelities[indices],
+                seed=seed,
             )
-            extract_fidelity = single_fidelity
-
-        if extract_fidelity:
-            assert self.fidelity_values is not None, "blackbox has no fidelities"
-            # If there are several fidelity values, pick the first
-            fidelity = list(fidelity.values())[0]
-            ind = np.where(self.fidelity_values == fidelity)
-            assert ind, f"fidelity {fidelity} not among {self.fidelity_values}"
-            ind = ind[0]
-            prediction = dict(zip(self.objectives_names, prediction[ind]))
-        return prediction
+            if result is None:
+                result = np.empty(
+                    (num_configs,) + prediction.shape[1:], dtype=prediction.dtype
+                )
+            result[indices] = prediction
+        if result is None:
+            # No configurations
+            result = np.zeros((0, len(self.objectives_names)))
+        return result
 
     def hyperparameter_objectives_values(
         self, predict_curves: bool = False
@@ -439,6 +561,7 @@ def add_surrogate(
     predict_curves: Optional[bool] = None,
     separate_seeds: bool = False,
     fit_differences: Optional[List[str]] = None,
+    random_seed: Optional[int] = None,
 ):
     """
     Fits a blackbox surrogates that can be evaluated anywhere, which can be useful
@@ -473,6 +596,10 @@ def add_surrogate(
         these objectives, the ``y`` data is transformed to finite differences
         before fitting the model. This is recommended for ``elapsed_time``
         objectives.
+    :param random_seed: If given, random choices made when fitting the
+        surrogate are determined by this seed, see
+        :class:`BlackboxSurrogate`. Otherwise, the global random number
+        generator is used
     :return: a blackbox where the output is obtained through the fitted surrogate
     """
     if configuration_space is None:
@@ -496,4 +623,5 @@ def add_surrogate(
         predict_curves=predict_curves,
         num_seeds=num_seeds,
         fit_differences=fit_differences,
+        random_seed=random_seed,
     )
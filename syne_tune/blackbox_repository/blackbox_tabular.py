@@ -10,8 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+from numbers import Number
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Union, Any
+from typing import List, Dict, Optional, Tuple, Union, Any, Sequence
 import pandas as pd
 import numpy as np
 
@@ -95,8 +96,12 @@ class BlackboxTabular(Blackbox):
         self.hyperparameters_index = hyperparameters.copy()
         self.hyperparameters_index["index"] = hyperparameters.index
         self.hyperparameters_index.set_index(self._hp_cols, inplace=True)
+        # Maps tuple of hyperparameter values to index, created lazily
+        self._config_to_index = None
 
         self.objectives_evaluations = objectives_evaluations
+        # Result of ``_impute_objectives_values``, created lazily
+        self._imputed_objectives_values = None
         if objectives_names is None:
             self.objectives_names = [f"y{i}" for i in range(num_objectives)]
 
@@ -127,18 +132,7 @@ class BlackboxTabular(Blackbox):
         if not isinstance(configuration, dict):
             objectives_values = self.objectives_evaluations[configuration, seed, :, :]
             return objectives_values
-        try:
-            key = tuple(configuration[key] for key in self._hp_cols)
-            matching_index = self.hyperparameters_index.loc[key].values
-        except KeyError:
-            raise ValueError(
-                f"the hyperparameter {configuration} is not present in available evaluations. Use ``add_surrogate(blackbox)`` if"
-                f" you want to add interpolation or a surrogate model that support querying any configuration."
-            )
-
-        df_found = self.hyperparameters.loc[matching_index]
-        assert len(df_found) == 1
-        index = df_found.index.values[0]
+        index = self._configuration_index(configuration)
 
         if fidelity is None:
             # returns all fidelities
@@ -151,6 +145,76 @@ class BlackboxTabular(Blackbox):
             ]
             return dict(zip(self.objectives_names, objectives_values))
 
+    def _configuration_index(self, configuration: Union[dict, int]) -> int:
+        """
+        :param configuration: Configuration, or its index
+        :return: Index of ``configuration`` in :attr:`objectives_evaluations`
+        """
+        if not isinstance(configuration, dict):
+            return configuration
+        if self._config_to_index is None:
+            # Hash index from hyperparameter values to index. Built on first
+            # use, since this takes time for large tables
+            self._config_to_index = dict(
+                zip(
+                    self.hyperparameters[self._hp_cols].itertuples(
+                        index=False, name=None
+                    ),
+                    self.hyperparameters.index,
+                )
+            )
+        try:
+            key = tuple(configuration[key] for key in self._hp_cols)
+            return self._config_to_index[key]
+        except KeyError:
+            raise ValueError(
+                f"the hyperparameter {configuration} is not present in available evaluations. Use ``add_surrogate(blackbox)`` if"
+                f" you want to add interpolation or a surrogate model that support querying any configuration."
+            )
+
+    def objective_function_batch(
+        self,
+        configurations: List[Union[dict, int]],
+        fidelities: Optional[Union[Sequence[Union[dict, Number]], dict, Number]] = None,
+        seeds: Optional[Union[Sequence[int], int]] = None,
+    ) -> np.ndarray:
+        """
+        Configurations are mapped to their index in the table, after which all
+        objective values are gathered from :attr:`objectives_evaluations` in a
+        single indexing operation. Configurations can also be given by their
+        index.
+        """
+        for configuration in configurations:
+            if isinstance(configuration, dict):
+                self._check_keys(config=configuration, fidelity=None)
+        num_configs = len(configurations)
+        indices = np.array(
+            [self._configuration_index(config) for config in configurations],
+            dtype=np.int64,
+        )
+        if seeds is None:
+            seeds = np.random.randint(0, self.num_seeds, size=num_configs)
+        else:
+            seeds = np.broadcast_to(np.asarray(seeds, dtype=np.int64), (num_configs,))
+            assert np.all((0 <= seeds) & (seeds < self.num_seeds))
+        if fidelities is None:
+            return self.objectives_evaluations[indices, seeds, :, :]
+        if isinstance(fidelities, (dict, Number)):
+            fidelities = [fidelities]
+        fidelity_indices = np.array(
+            [
+                self.fidelity_map[
+                    next(iter(fidelity.values()))
+                    if isinstance(fidelity, dict)
+                    else fidelity
+                ]
+                for fidelity in fidelities
+            ],
+            dtype=np.int64,
+        )
+        fidelity_indices = np.broadcast_to(fidelity_indices, (num_configs,))
+        return self.objectives_evaluations[indices, seeds, fidelity_indices, :]
+
     @property
     def fidelity_values(self) -> np.array:
         return self._fidelity_values
@@ -159,37 +223,46 @@ class BlackboxTabular(Blackbox):
         """Replaces nan values in objectives with first previous non-nan value.
 
         Time objective should be cumulative, otherwise each step will consume additional time.
+
+        The result is cached, so that repeated calls (for example, when fitting
+        surrogate models several times) do not recompute it. The cache is
+        invalidated if :attr:`objectives_evaluations` is assigned a new array,
+        but not if it is modified in place.
         """
-        # Replace nan with previous value. Assumes that elapsed time is cumulative.
-        objectives_evaluations = self.objectives_evaluations.copy()
+        if self._imputed_objectives_values is not None:
+            source, result = self._imputed_objectives_values
+            if source is self.objectives_evaluations:
+                return result
+        # Replace nan with previous value along the fidelity axis. Assumes that
+        # elapsed time is cumulative.
+        objectives_evaluations = np.array(self.objectives_evaluations)
         hyperparameters = self.hyperparameters.copy()
-        (
-            num_configs,
-            num_seeds,
-            num_fidelities,
-            num_objectives,
-        ) = objectives_evaluations.shape
-        for config_idx in range(num_configs):
-            for seed_idx in range(num_seeds):
-                for fidelity_idx in range(num_fidelities):
-                    for objective_idx in range(num_objectives):
-                        if np.isnan(
-                            objectives_evaluations[config_idx][seed_idx][fidelity_idx][
-                                objective_idx
-                            ]
-                        ):
-                            objectives_evaluations[config_idx][seed_idx][fidelity_idx][
-                                objective_idx
-                            ] = objectives_evaluations[config_idx][seed_idx][
-                                fidelity_idx - 1
-                            ][
-                                objective_idx
-                            ]
+        # A nan at the first fidelity is replaced by the value at the last
+        # fidelity (if this is not nan)
+        first_values = objectives_evaluations[:, :, 0, :]
+        first_nan_mask = np.isnan(first_values)
+        first_values[first_nan_mask] = objectives_evaluations[:, :, -1, :][
+            first_nan_mask
+        ]
+        # For every entry, the index of the closest previous (or same) fidelity
+        # with a non-nan value, or 0 if there is none
+        num_fidelities = objectives_evaluations.shape[2]
+        source_index = np.where(
+            np.isnan(objectives_evaluations),
+            0,
+            np.arange(num_fidelities).reshape((1, 1, -1, 1)),
+        )
+        np.maximum.accumulate(source_index, axis=2, out=source_index)
+        objectives_evaluations = np.take_along_axis(
+            objectives_evaluations, source_index, axis=2
+        )
         # Drop all hyperparameters with all nan objectives.
         nan_mask = np.isnan(objectives_evaluations).any((1, 2, 3))
         hyperparameters = hyperparameters[~nan_mask]
         objectives_evaluations = objectives_evaluations[~nan_mask]
-        return hyperparameters, objectives_evaluations
+        result = (hyperparameters, objectives_evaluations)
+        self._imputed_objectives_values = (self.objectives_evaluations, result)
+        return result
 
     # TODO: It is odd that ``y`` is transposed when compared to
     # ``objectives_evaluations``. Keep it this way, but it would be simpler
@@ -371,7 +444,9 @@ def serialize(
     )
 
 
-def deserialize(path: str) -> Dict[str, BlackboxTabular]:
+def deserialize(
+    path: str, mmap_mode: Optional[str] = "c"
+) -> Dict[str, BlackboxTabular]:
     """
     Deserialize blackboxes contained in a path that were saved with :func:`serialize`
     above.
@@ -381,8 +456,17 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
     as ``serialize`` is a member function there. A possible way to unify is to
     have serialize also be a free function for ``BlackboxOffline``.
 
+    By default, objective values are memory-mapped from disk instead of being
+    read into memory. Each blackbox holds a view for its task, and only the
+    parts of the file accessed are read. Several processes loading the same
+    blackbox share the file in the page cache.
+
     :param path: a path that contains blackboxes that were saved with
         :func:`serialize`
+    :param mmap_mode: Passed to ``np.load`` for loading objective values.
+        Defaults to "c" (copy-on-write: values can be modified, but changes
+        are not written to disk). Use "r" for read-only arrays, or ``None`` to
+        load all values into memory
     :return: a dictionary from task name to blackbox
     """
     path = Path(path)
@@ -399,16 +483,17 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
     with open(path / "fidelities_values.npy", "rb") as f:
         fidelity_values = np.load(f)
 
-    # possibly we could use memmap to avoid memory use or speed-up loading times
-    with open(path / "objectives_evaluations.npy", "rb") as f:
-        objectives_evaluations = np.load(f)
+    # (num_tasks, num_hps, num_seeds, num_fidelities, num_objectives)
+    objectives_evaluations = np.load(
+        path / "objectives_evaluations.npy", mmap_mode=mmap_mode
+    )
 
     return {
         task: BlackboxTabular(
             hyperparameters=hyperparameters,
             configuration_space=configuration_space,
             fidelity_space=fidelity_space,
-            objectives_evaluations=objectives_evaluations[i],
+            objectives_evaluations=np.asarray(objectives_evaluations[i]),
             fidelity_values=fidelity_values,
             objectives_names=objectives_names,
         )
@@ -295,12 +295,16 @@ def serialize(
     )
 
 
-def deserialize(path: str) -> Dict[str, BlackboxTabular]:
+def deserialize(
+    path: str, mmap_mode: Optional[str] = "c"
+) -> Dict[str, BlackboxTabular]:
     """
     Deserialize blackboxes contained in a path that were saved with ``serialize`` above.
     TODO: the API is currently dissonant with ``serialize``, ``deserialize`` for BlackboxOffline as ``serialize`` is there a member.
     A possible way to unify is to have serialize also be a free function for BlackboxOffline.
     :param path: a path that contains blackboxes that were saved with ``serialize``
+    :param mmap_mode: Passed to ``np.load`` for loading objective values, see
+        :func:`~syne_tune.blackbox_repository.blackbox_tabular.deserialize`
     :return: a dictionary from task name to blackbox
     """
     path = Path(path)
@@ -320,8 +324,9 @@ def deserialize(path: str) -> Dict[str, BlackboxTabular]:
         with open(path / f"{task}-fidelity_values.npy", "rb") as f:
             fidelity_values = np.load(f)
 
-        with open(path / f"{task}-objectives_evaluations.npy", "rb") as f:
-            objectives_evaluations = np.load(f)
+        objectives_evaluations = np.load(
+            path / f"{task}-objectives_evaluations.npy", mmap_mode=mmap_mode
+        )
 
         bb_dict[task] = BlackboxTabular(
             hyperparameters=hyperparameters,
@@ -23,6 +23,7 @@ except ImportError:
     print(try_import_aws_message())
 
 from syne_tune.blackbox_repository.blackbox import Blackbox
+from syne_tune.blackbox_repository.blackbox_cache import blackbox_cache, cache_key
 from syne_tune.blackbox_repository.blackbox_offline import (
     deserialize as deserialize_offline,
 )
@@ -67,6 +68,7 @@ def load_blackbox(
     generate_if_not_found: bool = True,
     yahpo_kwargs: Optional[dict] = None,
     ignore_hash: bool = True,  # TODO: Switch back to ``False`` once hash computation fixed
+    mmap_mode: Optional[str] = "c",
 ) -> Union[Dict[str, Blackbox], Blackbox]:
     """
     :param name: name of a blackbox present in the repository, see
@@ -103,6 +105,12 @@ def load_blackbox(
     :param ignore_hash: do not check if hash of currently stored files matches the
         pre-computed hash. Be careful with this option. If hashes do not match, results
         might not be reproducible.
+    :param mmap_mode: For tabulated blackboxes, objective values are
+        memory-mapped from disk with this mode, so that only the parts of the
+        file which are accessed are read, and several processes share the
+        file in the page cache. Defaults to "c" (copy-on-write). Use ``None``
+        in order to load all values into memory. See
+        :func:`~syne_tune.blackbox_repository.blackbox_tabular.deserialize`
     :return: blackbox with the given name, download it if not present.
     """
     tgt_folder = blackbox_local_path(name)
@@ -168,13 +176,32 @@ def load_blackbox(
             yahpo_kwargs = dict()
         return instantiate_yahpo(name, **yahpo_kwargs)
     elif name.startswith("pd1"):
-        return deserialize_pd1(tgt_folder)
+        return deserialize_pd1(tgt_folder, mmap_mode=mmap_mode)
     elif (tgt_folder / "hyperparameters.parquet").exists():
-        return deserialize_tabular(tgt_folder)
+        return deserialize_tabular(tgt_folder, mmap_mode=mmap_mode)
     else:
         return deserialize_offline(tgt_folder)
 
 
+def load_blackbox_cached(name: str, **kwargs) -> Union[Dict[str, Blackbox], Blackbox]:
+    """
+    Same as :func:`load_blackbox`, but the result is stored in the blackbox
+    cache shared by the whole process (see
+    :func:`~syne_tune.blackbox_repository.blackbox_cache.blackbox_cache`), so
+    that loading the same blackbox several times is cheap. Note that the
+    blackbox returned may be shared with other callers, and must not be
+    modified.
+
+    :param name: Name of blackbox, see :func:`load_blackbox`
+    :param kwargs: Further arguments to :func:`load_blackbox`
+    :return: Blackbox with the given name
+    """
+    return blackbox_cache().get(
+        cache_key("load_blackbox", name, **kwargs),
+        lambda: load_blackbox(name, **kwargs),
+    )
+
+
 def check_blackbox_local_files(tgt_folder) -> bool:
     """checks whether the file of the blackbox ``name`` are present in ``repository_path``"""
     return tgt_folder.exists() and (tgt_folder / "metadata.json").exists()
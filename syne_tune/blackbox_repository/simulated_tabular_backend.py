@@ -12,14 +12,15 @@
 # permissions and limitations under the License.
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 import numpy as np
 
 from syne_tune.backend.simulator_backend.simulator_backend import SimulatorBackend
 from syne_tune.backend.trial_status import Status
-from syne_tune.blackbox_repository import add_surrogate, load_blackbox
+from syne_tune.blackbox_repository import add_surrogate, load_blackbox_cached
 from syne_tune.blackbox_repository.blackbox import Blackbox
+from syne_tune.blackbox_repository.blackbox_cache import blackbox_cache, cache_key
 from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
 from syne_tune.blackbox_repository.utils import metrics_for_configuration
 from syne_tune.config_space import (
@@ -57,6 +58,9 @@ class _BlackboxSimulatorBackend(SimulatorBackend):
         self._support_checkpointing = support_checkpointing
         self._seed_for_trial = dict()
         self._resource_paused_for_trial = dict()
+        # Maps ``trial_id`` to learning curve of trial, see
+        # :meth:`_learning_curve`
+        self._learning_curve_for_trial = dict()
 
     @property
     def blackbox(self) -> Blackbox:
@@ -78,6 +82,11 @@ class _BlackboxSimulatorBackend(SimulatorBackend):
             resource = int(result[resource_attr])
             self._resource_paused_for_trial[trial_id] = resource
 
+    def _stop_trial(self, trial_id: int, result: Optional[dict]):
+        super()._stop_trial(trial_id, result)
+        # Stopped trials are not resumed
+        self._learning_curve_for_trial.pop(trial_id, None)
+
     def _filter_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         config_space = self.blackbox.configuration_space
         return {k: v for k, v in config.items() if k in config_space}
@@ -100,6 +109,49 @@ class _BlackboxSimulatorBackend(SimulatorBackend):
             seed=seed,
         )
 
+    @property
+    def _elapsed_time_pos(self) -> int:
+        return self.blackbox.objectives_names.index(self.elapsed_time_attr)
+
+    def _learning_curve(
+        self, trial_id: int, config: Dict[str, Any], seed: Optional[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns learning curve for a trial, consisting of ``resources``
+        (fidelity values) and ``objective_values`` of shape
+        ``(len(resources), num_objectives)``. The curve is obtained from the
+        blackbox when a trial is started, and stored until the trial is
+        stopped or runs until the end, so that resuming a paused trial does
+        not require another query to the blackbox.
+
+        :param trial_id: ID of trial
+        :param config: Configuration of trial
+        :param seed: Seed for query to blackbox
+        :return: ``(resources, objective_values)``
+        """
+        filtered_config = self._filter_config(config)
+        entry = self._learning_curve_for_trial.get(trial_id)
+        if (
+            entry is not None
+            and entry[0] == filtered_config
+            and (seed is None or entry[1] == seed)
+        ):
+            return entry[2], entry[3]
+        resources = self.blackbox.fidelity_values
+        assert resources is not None, "Blackbox must come with fidelities"
+        resources = np.asarray(resources)
+        assert np.all(
+            resources[1:] > resources[:-1]
+        ), f"Fidelity values of blackbox must be increasing: {resources}"
+        objective_values = self.blackbox.objective_function(filtered_config, seed=seed)
+        self._learning_curve_for_trial[trial_id] = (
+            filtered_config,
+            seed,
+            resources,
+            objective_values,
+        )
+        return resources, objective_values
+
     def _run_job_and_collect_results(
         self, trial_id: int, config: Optional[dict] = None
     ) -> (str, List[dict]):
@@ -120,30 +172,41 @@ class _BlackboxSimulatorBackend(SimulatorBackend):
                 seed = np.random.randint(0, self.blackbox.num_seeds)
                 self._seed_for_trial[trial_id] = seed
 
-        # Fetch all results for this trial from the table
-        all_results = self.config_objectives(config, seed=seed)
-
-        status = Status.completed
+        resources, objective_values = self._learning_curve(trial_id, config, seed)
+        # Results to be returned are in ``range(start, end)``. We only create
+        # result dictionaries for them
+        mattr = self._max_resource_attr
+        if mattr is not None and mattr in config:
+            end = int(np.searchsorted(resources, int(config[mattr]), side="right"))
+        else:
+            end = len(resources)
+        start = 0
+        elapsed_time_offset = 0
         resource_paused = self._resource_paused_for_trial.get(trial_id)
         if resource_paused is not None and self._support_checkpointing:
             # If checkpointing is supported and trial has been paused, we
             # can ignore results up until the paused level. Also, the
             # elapsed_time field in later results needs to be corrected
             # to not count the time for skipped results
-            resource_attr = self.resource_attr
-            elapsed_time_offset = 0
-            results = []
-            for result in all_results:
-                resource = int(result[resource_attr])
-                if resource > resource_paused:
-                    results.append(result)
-                elif resource == resource_paused:
-                    elapsed_time_offset = result[self.elapsed_time_attr]
+            start = int(np.searchsorted(resources, resource_paused, side="right"))
+            if start > 0 and resources[start - 1] == resource_paused:
+                elapsed_time_offset = objective_values[
+                    start - 1, self._elapsed_time_pos
+                ]
+        objectives_names = self.blackbox.objectives_names
+        resource_attr = self.resource_attr
+        results = []
+        for pos in range(start, end):
+            result = dict(zip(objectives_names, objective_values[pos]))
+            result[resource_attr] = resources[pos]
+            results.append(result)
+        if elapsed_time_offset != 0:
             for result in results:
                 result[self.elapsed_time_attr] -= elapsed_time_offset
-        else:
-            # Use all results from the start
-            results = all_results
+        if end == len(resources):
+            # Trial runs until the end, so it will not be resumed
+            self._learning_curve_for_trial.pop(trial_id, None)
+        status = Status.completed
 
         # Makes sure that time is monotonically increasing which may not be the
         # case due to numerical errors or due to the use of a surrogate
@@ -246,6 +309,15 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
     same seed is used for all :meth:`_run_job_and_collect_results` calls for
     the same trial. This is important for pause and resume scheduling.
 
+    The blackbox (along with a fitted surrogate model) is stored in the cache
+    shared by the whole process (see
+    :func:`~syne_tune.blackbox_repository.blackbox_cache.blackbox_cache`), so
+    that it is loaded only once when running many experiments with the same
+    arguments. Fitting a surrogate model can be random. Its seed is given by
+    ``random_seed`` in ``add_surrogate_kwargs`` or else by
+    ``surrogate_random_seed``, and is part of the cache key. The global random
+    number generator is not used.
+
     :param blackbox_name: Name of a blackbox, must have been registered in
         blackbox repository.
     :param elapsed_time_attr: Name of the column containing cumulative time
@@ -274,11 +346,21 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         as ``yahpo_kwargs`` to
         :func:`~syne_tune.blackbox_repository.load_blackbox`. In this case,
         ``surrogate`` is ignored (YAHPO always uses surrogates).
+    :param add_surrogate_kwargs: Additional arguments to
+        :func:`~syne_tune.blackbox_repository.add_surrogate`, if ``surrogate``
+        is given
+    :param surrogate_random_seed: Seed for fitting the surrogate model, if
+        ``random_seed`` is not given in ``add_surrogate_kwargs``. Defaults to 0
     :param config_space_surrogate: If ``surrogate`` is given, this is the
         configuration space for the surrogate blackbox. If not given, the
         space of the original blackbox is used. However, its numerical parameters
         have finite domains (categorical or ordinal), which is usually not what
         we want for a surrogate.
+    :param blackbox: Optional. If given, this blackbox is used instead of
+        loading it (and adding a surrogate) according to the arguments above,
+        which it has to correspond to. This allows several backends to share
+        the same blackbox. The blackbox is not serialized along with the
+        backend
     :param simulatorbackend_kwargs: Additional arguments to parent
         :class:`~syne_tune.backend.simulator_backend.SimulatorBackend`
     """
@@ -294,7 +376,9 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         surrogate: Optional[str] = None,
         surrogate_kwargs: Optional[dict] = None,
         add_surrogate_kwargs: Optional[dict] = None,
+        surrogate_random_seed: int = 0,
         config_space_surrogate: Optional[dict] = None,
+        blackbox: Optional[Blackbox] = None,
         **simulatorbackend_kwargs,
     ):
         assert (
@@ -309,7 +393,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         )
         self.blackbox_name = blackbox_name
         self.dataset = dataset
-        self._blackbox = None
+        self._blackbox = blackbox
         if surrogate is not None:
             # makes sure the surrogate can be constructed
             make_surrogate(surrogate=surrogate, surrogate_kwargs=surrogate_kwargs)
@@ -318,8 +402,10 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
             surrogate_kwargs if surrogate_kwargs is not None else dict()
         )
         self._add_surrogate_kwargs = (
-            add_surrogate_kwargs if add_surrogate_kwargs is not None else dict()
+            dict(add_surrogate_kwargs) if add_surrogate_kwargs is not None else dict()
         )
+        if surrogate is not None:
+            self._add_surrogate_kwargs.setdefault("random_seed", surrogate_random_seed)
         if config_space_surrogate is not None:
             self._config_space_surrogate = {
                 k: v for k, v in config_space_surrogate.items() if isinstance(v, Domain)
@@ -327,33 +413,52 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         else:
             self._config_space_surrogate = None
 
+    def _cache_key(self):
+        return cache_key(
+            "BlackboxRepositoryBackend",
+            self.blackbox_name,
+            dataset=self.dataset,
+            surrogate=self._surrogate,
+            surrogate_kwargs=self._surrogate_kwargs,
+            add_surrogate_kwargs=self._add_surrogate_kwargs,
+            config_space_surrogate=self._config_space_surrogate,
+        )
+
+    def _load_blackbox(self) -> Blackbox:
+        # Pass ``self._surrogate_kwargs`` as ``yahpo_kwargs``. This is used if
+        # ``self.blackbox_name`` is a YAHPO blackbox, and is ignored otherwise
+        blackbox = load_blackbox_cached(
+            self.blackbox_name,
+            yahpo_kwargs=self._surrogate_kwargs,
+        )
+        if self.dataset is None:
+            assert not isinstance(blackbox, dict), (
+                f"blackbox_name = '{self.blackbox_name}' maps to a dict, "
+                + "dataset argument must be given"
+            )
+        else:
+            blackbox = blackbox[self.dataset]
+        if self._surrogate is not None:
+            surrogate = make_surrogate(
+                surrogate=self._surrogate, surrogate_kwargs=self._surrogate_kwargs
+            )
+            blackbox = add_surrogate(
+                blackbox=blackbox,
+                surrogate=surrogate,
+                configuration_space=self._config_space_surrogate,
+                **self._add_surrogate_kwargs,
+            )
+        return blackbox
+
     @property
     def blackbox(self) -> Blackbox:
         if self._blackbox is None:
-            # Pass ``self._surrogate_kwargs`` as ``yahpo_kwargs``. This is used if
-            # ``self.blackbox_name`` is a YAHPO blackbox, and is ignored otherwise
-            self._blackbox = load_blackbox(
-                self.blackbox_name,
-                yahpo_kwargs=self._surrogate_kwargs,
+            # Blackboxes (along with fitted surrogate models) are shared
+            # between all backends of the process which use the same
+            # arguments
+            self._blackbox = blackbox_cache().get(
+                self._cache_key(), self._load_blackbox
             )
-            if self.dataset is None:
-                assert not isinstance(self._blackbox, dict), (
-                    f"blackbox_name = '{self.blackbox_name}' maps to a dict, "
-                    + "dataset argument must be given"
-                )
-            else:
-                self._blackbox = self._blackbox[self.dataset]
-            if self._surrogate is not None:
-                surrogate = make_surrogate(
-                    surrogate=self._surrogate, surrogate_kwargs=self._surrogate_kwargs
-                )
-                self._blackbox = add_surrogate(
-                    blackbox=self._blackbox,
-                    surrogate=surrogate,
-                    configuration_space=self._config_space_surrogate,
-                    **self._add_surrogate_kwargs,
-                )
-
         return self._blackbox
 
     def __getstate__(self):
@@ -370,6 +475,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
             "dataset": self.dataset,
             "surrogate": self._surrogate,
             "surrogate_kwargs": self._surrogate_kwargs,
+            "add_surrogate_kwargs": self._add_surrogate_kwargs,
         }
         if self._config_space_surrogate is not None:
             state["config_space_surrogate"] = config_space_to_json_dict(
@@ -390,6 +496,7 @@ class BlackboxRepositoryBackend(_BlackboxSimulatorBackend):
         self.dataset = state["dataset"]
         self._surrogate = state["surrogate"]
         self._surrogate_kwargs = state["surrogate_kwargs"]
+        self._add_surrogate_kwargs = state.get("add_surrogate_kwargs", dict())
         self._blackbox = None
         if "config_space_surrogate" in state:
             self._config_space_surrogate = config_space_from_json_dict(
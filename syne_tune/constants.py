@@ -77,12 +77,23 @@ ST_REMOTE_UPLOAD_DIR_NAME = "tuner"
 ST_RESULTS_DATAFRAME_FILENAME = "results.csv.zip"
 """Name for results dataframe stored in ``StoreResultsCallback``"""  # pylint: disable=W0105
 
+ST_RESULTS_SEGMENTS_DIRNAME = "results_segments"
+"""Name for directory of results segments stored in ``StoreResultsCallback``
+with ``append_only=True``"""  # pylint: disable=W0105
+
+ST_RESULTS_SEGMENT_POSTFIX = "-results.csv.gz"
+"""Postfix of file names of results segments"""  # pylint: disable=W0105
+
 ST_METADATA_FILENAME = "metadata.json"
 """Name for metadata file stored in ``Tuner``"""  # pylint: disable=W0105
 
 ST_TUNER_DILL_FILENAME = "tuner.dill"
 """Name for final tuner object file stored in ``Tuner``"""  # pylint: disable=W0105
 
+ST_TUNER_JOURNAL_FILENAME = "tuner-journal.dill"
+"""Name for journal of incremental tuner checkpoints, which are replayed on top
+of ``ST_TUNER_DILL_FILENAME`` when loading the tuner"""  # pylint: disable=W0105
+
 ST_DATETIME_FORMAT = "%Y-%m-%d-%H-%M-%S"
 """Datetime format used in result path names"""  # pylint: disable=W0105
 
@@ -25,10 +25,13 @@ from syne_tune import Tuner
 from syne_tune.constants import (
     ST_METADATA_FILENAME,
     ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_SEGMENTS_DIRNAME,
+    ST_RESULTS_SEGMENT_POSTFIX,
     ST_TUNER_DILL_FILENAME,
     ST_TUNER_CREATION_TIMESTAMP,
     ST_TUNER_TIME,
 )
+from syne_tune.results_callback import load_results_dataframe
 from syne_tune.try_import import try_import_aws_message, try_import_visual_message
 from syne_tune.util import experiment_path, s3_experiment_path, metric_name_mode
 
@@ -269,6 +272,14 @@ def download_single_experiment(
             s3.download_file(s3_bucket, f"{s3_key}/{file}", str(tgt_dir / file))
         except ClientError as e:
             logger.info(f"could not find {file} on {s3_path}")
+    # Results may also have been stored in segments
+    segments_key = f"{s3_key}/{ST_RESULTS_SEGMENTS_DIRNAME}/"
+    response = s3.list_objects_v2(Bucket=s3_bucket, Prefix=segments_key)
+    for obj in response.get("Contents", []):
+        file = obj["Key"][len(s3_key) + 1 :]
+        if file.endswith(ST_RESULTS_SEGMENT_POSTFIX):
+            (tgt_dir / file).parent.mkdir(exist_ok=True, parents=True)
+            s3.download_file(s3_bucket, obj["Key"], str(tgt_dir / file))
 
 
 def load_experiment(
@@ -303,11 +314,7 @@ def load_experiment(
     except FileNotFoundError:
         metadata = None
     try:
-        results_fname = ST_RESULTS_DATAFRAME_FILENAME
-        if (path / results_fname).exists():
-            results = pd.read_csv(path / results_fname)
-        else:
-            results = pd.read_csv(path / results_fname[:-4])
+        results = load_results_dataframe(path)
     except Exception:
         results = None
     if load_tuner:
@@ -0,0 +1,281 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from collections import Counter
+import copy
+import logging
+import time
+from typing import Dict, Any
+
+import pandas as pd
+
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+from syne_tune.backend.simulator_backend.simulator_backend import SimulatorBackend
+from syne_tune.backend.simulator_backend.simulator_callback import (
+    simulated_stop_criterion,
+    advance_time_when_sleeping,
+)
+from syne_tune.backend.trial_status import Status, Trial
+from syne_tune.backend.trial_backend import (
+    TrialAndStatusInformation,
+    TrialIdAndResultList,
+)
+from syne_tune.constants import (
+    ST_DECISION,
+    ST_STATUS,
+    ST_TRIAL_ID,
+    ST_WORKER_COST,
+)
+from syne_tune.optimizer.scheduler import TrialScheduler
+from syne_tune.optimizer.schedulers.fifo import FIFOScheduler
+from syne_tune.tuner import TunerLoopMixin
+from syne_tune.tuner_callback import TunerCallback
+from syne_tune.tuning_status import MetricsStatistics
+
+logger = logging.getLogger(__name__)
+
+
+_STATUS_FINISHED = (
+    Status.completed,
+    Status.stopped,
+    Status.stopping,
+    Status.failed,
+)
+
+
+class _SimulationStatus:
+    """
+    Replaces :class:`~syne_tune.tuning_status.TuningStatus` in
+    :func:`fast_simulate`. Supports the properties used by
+    :class:`~syne_tune.StoppingCriterion`, which are maintained incrementally
+    instead of being recomputed over all trials in every iteration.
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.overall_metric_statistics = MetricsStatistics()
+        self.last_trial_status_seen = dict()
+        self._status_counts = Counter()
+        self._cost_per_trial = dict()
+        self._cost = 0.0
+
+    def update(
+        self,
+        trial_status_dict: TrialAndStatusInformation,
+        new_results: TrialIdAndResultList,
+    ):
+        for trial_id, (_, status) in trial_status_dict.items():
+            old_status = self.last_trial_status_seen.get(trial_id)
+            if old_status != status:
+                if old_status is not None:
+                    self._status_counts[old_status] -= 1
+                self._status_counts[status] += 1
+                self.last_trial_status_seen[trial_id] = status
+        for trial_id, new_result in new_results:
+            self.overall_metric_statistics.add(new_result)
+            cost = new_result.get(ST_WORKER_COST)
+            if cost is not None:
+                old_cost = self._cost_per_trial.get(trial_id, 0)
+                if cost > old_cost:
+                    self._cost += cost - old_cost
+                    self._cost_per_trial[trial_id] = cost
+
+    @property
+    def num_trials_started(self) -> int:
+        return len(self.last_trial_status_seen)
+
+    @property
+    def num_trials_completed(self) -> int:
+        return self._status_counts[Status.completed]
+
+    @property
+    def num_trials_failed(self) -> int:
+        return self._status_counts[Status.failed]
+
+    @property
+    def num_trials_finished(self) -> int:
+        return sum(self._status_counts[status] for status in _STATUS_FINISHED)
+
+    @property
+    def num_trials_running(self) -> int:
+        return self._status_counts[Status.in_progress]
+
+    @property
+    def wallclock_time(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    @property
+    def cost(self) -> float:
+        return self._cost
+
+
+class _StoreResults(TunerCallback):
+    """
+    Collects results with the same columns as written by
+    :class:`~syne_tune.results_callback.StoreResultsCallback`, but keeps them
+    in memory only.
+    """
+
+    def __init__(self):
+        self.results = MetricsBuffer()
+
+    def on_trial_result(
+        self, trial: Trial, status: str, result: Dict[str, Any], decision: str
+    ):
+        # Note that ``SimulatorBackend`` has already added ``ST_TUNER_TIME``
+        result = copy.copy(result)
+        result[ST_DECISION] = decision
+        result[ST_STATUS] = status
+        result[ST_TRIAL_ID] = trial.trial_id
+        for key, value in trial.config.items():
+            result[f"config_{key}"] = value
+        self.results.append(result)
+
+
+class _FastSimulation(TunerLoopMixin):
+    """
+    Implements :func:`fast_simulate`. The main loop is the one of
+    :meth:`~syne_tune.Tuner.run` with default arguments, so that results are
+    the same. Differences are the tuning status, sleeping (which advances
+    simulated time), and the only callback, which collects results.
+    """
+
+    def __init__(
+        self,
+        trial_backend: SimulatorBackend,
+        scheduler: TrialScheduler,
+        stop_criterion,
+        n_workers: int,
+        advance_to_next_event: bool,
+        quantize_to_sleep_time: bool,
+        max_failures: int,
+    ):
+        self.trial_backend = trial_backend
+        self.scheduler = scheduler
+        self.stop_criterion = simulated_stop_criterion(stop_criterion)
+        self.n_workers = n_workers
+        self.sleep_time = 0
+        self.advance_to_next_event = advance_to_next_event
+        self.quantize_to_sleep_time = quantize_to_sleep_time
+        self.max_failures = max_failures
+        self.asynchronous_scheduling = True
+        self.wait_trial_completion_when_stopping = False
+        self.start_jobs_without_delay = True
+        self._store_results = _StoreResults()
+        self.callbacks = [self._store_results]
+        self.tuning_status = _SimulationStatus()
+        self.tuner_saver = None
+        self.status_printer = None
+        self.last_seen_result_per_trial = dict()
+        self.trials_scheduler_stopped = set()
+
+    def _sleep(self):
+        advance_time_when_sleeping(
+            trial_backend=self.trial_backend,
+            advance_to_next_event=self.advance_to_next_event,
+            quantize_to_sleep_time=self.quantize_to_sleep_time,
+        )
+
+    def run(self) -> pd.DataFrame:
+        if isinstance(self.scheduler, FIFOScheduler):
+            self.scheduler.set_time_keeper(self.trial_backend.time_keeper)
+        self.trial_backend.time_keeper.start_of_time()
+        try:
+            self._run_tuning_loop(done_trials_statuses=dict())
+        finally:
+            self.trial_backend.stop_all()
+        num_trials_failed = self.tuning_status.num_trials_failed
+        if num_trials_failed > self.max_failures:
+            raise ValueError(
+                f"Stopped as {num_trials_failed} failures were reached "
+                f"(max_failures = {self.max_failures})"
+            )
+        return self._store_results.results.to_dataframe()
+
+
+def fast_simulate(
+    trial_backend: SimulatorBackend,
+    scheduler: TrialScheduler,
+    stop_criterion,
+    n_workers: int,
+    advance_to_next_event: bool = False,
+    quantize_to_sleep_time: bool = False,
+    max_failures: int = 1,
+) -> pd.DataFrame:
+    """
+    Runs a simulated experiment with ``trial_backend`` and ``scheduler``,
+    without going through :class:`~syne_tune.Tuner`. The results are the same
+    as for
+
+    .. code-block:: python
+
+       callback = SimulatorCallback(
+           advance_to_next_event=advance_to_next_event,
+           quantize_to_sleep_time=quantize_to_sleep_time,
+       )
+       tuner = Tuner(
+           trial_backend=trial_backend,
+           scheduler=scheduler,
+           stop_criterion=stop_criterion,
+           n_workers=n_workers,
+           sleep_time=0,
+           max_failures=max_failures,
+           callbacks=[callback],
+       )
+       tuner.run()
+       df = callback.dataframe()
+
+    Simulated events are processed by ``trial_backend``, and the main loop is
+    shared with :class:`~syne_tune.Tuner`. What is skipped is everything which
+    does not influence the results: callbacks, printing of the tuning status,
+    storing results and checkpointing the tuner, and writing metadata. Also,
+    the statistics used by ``stop_criterion`` are maintained incrementally,
+    while :class:`~syne_tune.tuning_status.TuningStatus` recomputes them over
+    all trials in every iteration. For long simulations with many trials, this
+    is substantially faster.
+
+    Only default arguments of :class:`~syne_tune.Tuner` are supported. The
+    stopping criterion can depend on the properties ``num_trials_started``,
+    ``num_trials_completed``, ``num_trials_finished``, ``num_trials_failed``,
+    ``cost``, and ``overall_metric_statistics`` of the tuning status. As with
+    :class:`~syne_tune.backend.simulator_backend.SimulatorCallback`,
+    ``max_wallclock_time`` of :class:`~syne_tune.StoppingCriterion` refers to
+    simulated time.
+
+    :param trial_backend: Simulator backend, typically
+        :class:`~syne_tune.blackbox_repository.BlackboxRepositoryBackend`
+    :param scheduler: Scheduler
+    :param stop_criterion: Stopping criterion
+    :param n_workers: Number of workers
+    :param advance_to_next_event: See
+        :class:`~syne_tune.backend.simulator_backend.SimulatorCallback`.
+        Defaults to ``False``
+    :param quantize_to_sleep_time: See
+        :class:`~syne_tune.backend.simulator_backend.SimulatorCallback`.
+        Defaults to ``False``
+    :param max_failures: The simulation is stopped with an error once more
+        than this number of trials failed. Defaults to 1
+    :return: Results dataframe, same as ``callback.dataframe()`` in the code
+        above
+    """
+    assert isinstance(
+        trial_backend, SimulatorBackend
+    ), "fast_simulate can only be used with SimulatorBackend"
+    return _FastSimulation(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        stop_criterion=stop_criterion,
+        n_workers=n_workers,
+        advance_to_next_event=advance_to_next_event,
+        quantize_to_sleep_time=quantize_to_sleep_time,
+        max_failures=max_failures,
+    ).run()
@@ -11,7 +11,11 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import itertools
-from typing import Optional, List, Union, Dict, Any
+import logging
+import multiprocessing
+import time
+import traceback
+from typing import Optional, List, Union, Dict, Any, Tuple
 
 import numpy as np
 from tqdm import tqdm
@@ -36,7 +40,8 @@ from syne_tune.experiments.launchers.utils import (
     effective_random_seed,
 )
 from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
-from syne_tune.blackbox_repository import load_blackbox
+from syne_tune.blackbox_repository import load_blackbox, load_blackbox_cached
+from syne_tune.blackbox_repository.blackbox import Blackbox
 from syne_tune.blackbox_repository.simulated_tabular_backend import (
     BlackboxRepositoryBackend,
 )
@@ -48,6 +53,7 @@ from syne_tune.stopping_criterion import StoppingCriterion
 from syne_tune.tuner import Tuner
 from syne_tune.util import sanitize_sagemaker_name
 
+logger = logging.getLogger(__name__)
 
 SIMULATED_BACKEND_EXTRA_PARAMETERS = [
     dict(
@@ -81,6 +87,15 @@ SIMULATED_BACKEND_EXTRA_PARAMETERS = [
         default=False,
         help="If 1, scheduler only suggests configs contained in tabulated benchmark",
     ),
+    dict(
+        name="num_workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes running experiments in parallel. Not to be "
+            "confused with n_workers, the number of workers in each experiment"
+        ),
+    ),
 ]
 
 
@@ -164,6 +179,264 @@ def get_transfer_learning_evaluations(
     return transfer_learning_evaluations
 
 
+def _max_resource_attr(benchmark: SurrogateBenchmarkDefinition) -> str:
+    max_resource_attr = benchmark.max_resource_attr
+    if max_resource_attr is None:
+        max_resource_attr = "my_max_resource_attr"
+    return max_resource_attr
+
+
+def _fits_surrogate(
+    configuration: ConfigDict, benchmark: SurrogateBenchmarkDefinition
+) -> bool:
+    # Don't need surrogate if configurations are restricted
+    return not configuration.restrict_configurations and benchmark.surrogate is not None
+
+
+def _create_trial_backend(
+    configuration: ConfigDict,
+    benchmark: SurrogateBenchmarkDefinition,
+    random_seed: Optional[int] = None,
+    blackbox: Optional[Blackbox] = None,
+) -> BlackboxRepositoryBackend:
+    if configuration.restrict_configurations:
+        # Don't need surrogate in this case
+        kwargs = dict()
+    else:
+        # The surrogate model is fitted with the seed of the experiment, so
+        # results do not depend on whether experiments run in parallel or not
+        add_surrogate_kwargs = benchmark.add_surrogate_kwargs
+        if _fits_surrogate(configuration, benchmark) and random_seed is not None:
+            add_surrogate_kwargs = {
+                "random_seed": random_seed,
+                **(add_surrogate_kwargs or dict()),
+            }
+        kwargs = dict(
+            surrogate=benchmark.surrogate,
+            surrogate_kwargs=benchmark.surrogate_kwargs,
+            add_surrogate_kwargs=add_surrogate_kwargs,
+        )
+    return BlackboxRepositoryBackend(
+        blackbox_name=benchmark.blackbox_name,
+        elapsed_time_attr=benchmark.elapsed_time_attr,
+        max_resource_attr=_max_resource_attr(benchmark),
+        support_checkpointing=configuration.support_checkpointing,
+        dataset=benchmark.dataset_name,
+        blackbox=blackbox,
+        **kwargs,
+    )
+
+
+def _run_experiment_simulated_backend(
+    configuration: ConfigDict,
+    methods: MethodDefinitions,
+    benchmark_definitions: Dict[str, SurrogateBenchmarkDefinition],
+    method: str,
+    seed: int,
+    benchmark_name: str,
+    master_random_seed: int,
+    extra_results: Optional[ExtraResultsComposer] = None,
+    map_method_args: Optional[MapMethodArgsType] = None,
+    extra_tuning_job_metadata: Optional[DictStrKey] = None,
+    use_transfer_learning: bool = False,
+    blackbox: Optional[Blackbox] = None,
+    tuner_name_suffix: Optional[str] = None,
+):
+    """
+    Runs a single experiment with simulator backend, for a combination of
+    ``method``, ``seed``, and ``benchmark_name``.
+    """
+    experiment_tag = configuration.experiment_tag
+    random_seed = effective_random_seed(master_random_seed, seed)
+    np.random.seed(random_seed)
+    benchmark = benchmark_definitions[benchmark_name]
+    default_n_workers = benchmark.n_workers
+    if configuration.n_workers is not None:
+        benchmark.n_workers = configuration.n_workers
+    if configuration.max_wallclock_time is not None:
+        benchmark.max_wallclock_time = configuration.max_wallclock_time
+    elif (
+        configuration.scale_max_wallclock_time
+        and configuration.n_workers is not None
+        and configuration.n_workers < default_n_workers
+    ):
+        # Scale ``max_wallclock_time``
+        factor = default_n_workers / configuration.n_workers
+        bm_mwt = benchmark.max_wallclock_time
+        benchmark.max_wallclock_time = int(bm_mwt * factor)
+        print(
+            f"Scaling max_wallclock_time: {benchmark.max_wallclock_time} (from {bm_mwt})"
+        )
+    print(
+        f"Starting experiment ({method}/{benchmark_name}/{seed}) of {experiment_tag}"
+        f"  max_wallclock_time = {benchmark.max_wallclock_time}, "
+        f"  n_workers = {benchmark.n_workers}"
+    )
+
+    max_resource_attr = _max_resource_attr(benchmark)
+    trial_backend = _create_trial_backend(
+        configuration, benchmark, random_seed=random_seed, blackbox=blackbox
+    )
+    blackbox = trial_backend.blackbox
+    resource_attr = blackbox.fidelity_name()
+    config_space = blackbox.configuration_space_with_max_resource_attr(
+        max_resource_attr
+    )
+    method_kwargs = dict(
+        config_space=config_space,
+        metric=benchmark.metric,
+        mode=benchmark.mode,
+        random_seed=random_seed,
+        resource_attr=resource_attr,
+        max_resource_attr=max_resource_attr,
+        use_surrogates="lcbench" in benchmark_name,
+        fcnet_ordinal=configuration.fcnet_ordinal,
+        scheduler_kwargs=dict(
+            points_to_evaluate=benchmark.points_to_evaluate,
+        ),
+    )
+    if use_transfer_learning:
+        method_kwargs["transfer_learning_evaluations"] = (
+            get_transfer_learning_evaluations(
+                blackbox_name=benchmark.blackbox_name,
+                test_task=benchmark.dataset_name,
+                datasets=benchmark.datasets,
+            ),
+        )
+    search_options = dict(debug_log=configuration.verbose)
+    if configuration.restrict_configurations:
+        search_options["restrict_configurations"] = blackbox.all_configurations()
+    if configuration.max_size_data_for_model is not None:
+        search_options[
+            "max_size_data_for_model"
+        ] = configuration.max_size_data_for_model
+    method_kwargs["scheduler_kwargs"]["search_options"] = search_options
+    if map_method_args is not None:
+        method_kwargs = map_method_args(configuration, method, method_kwargs)
+    scheduler = methods[method](MethodArguments(**method_kwargs))
+
+    stop_criterion = StoppingCriterion(
+        max_wallclock_time=benchmark.max_wallclock_time,
+        max_num_evaluations=benchmark.max_num_evaluations,
+    )
+    metadata = get_metadata(
+        seed=seed,
+        method=method,
+        experiment_tag=experiment_tag,
+        benchmark_name=benchmark_name,
+        random_seed=master_random_seed,
+        max_size_data_for_model=configuration.max_size_data_for_model,
+        extra_metadata=extra_tuning_job_metadata,
+    )
+    metadata["fcnet_ordinal"] = configuration.fcnet_ordinal
+    if benchmark.add_surrogate_kwargs is not None:
+        metadata["predict_curves"] = int(
+            benchmark.add_surrogate_kwargs["predict_curves"]
+        )
+    tuner_name = experiment_tag
+    if tuner_name_suffix is not None:
+        tuner_name += f"-{tuner_name_suffix}"
+    if configuration.use_long_tuner_name_prefix:
+        tuner_name += f"-{sanitize_sagemaker_name(benchmark_name)}-{seed}"
+    callbacks = [SimulatorCallback(extra_results_composer=extra_results)]
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler,
+        stop_criterion=stop_criterion,
+        n_workers=benchmark.n_workers,
+        sleep_time=0,
+        callbacks=callbacks,
+        results_update_interval=600,
+        print_update_interval=600,
+        tuner_name=tuner_name,
+        metadata=metadata,
+        save_tuner=configuration.save_tuner,
+    )
+    tuner.run()
+
+
+# Arguments of :func:`_run_experiment_simulated_backend` shared by all
+# experiments. Set before worker processes are forked, so they are inherited
+# rather than pickled (``methods`` typically contains lambda functions)
+_shared_experiment_kwargs = None
+
+
+def _run_experiment_in_worker(
+    combination: Tuple[int, Tuple[str, int, str]]
+) -> Tuple[int, Optional[str]]:
+    """
+    Runs experiment in a worker process of
+    :func:`start_experiment_simulated_backend`. Failures are isolated: an
+    exception is returned as formatted traceback, instead of being raised.
+
+    :param combination: ``(index, (method, seed, benchmark_name))``
+    :return: ``(index, error)``, where ``error`` is ``None`` if the
+        experiment succeeded
+    """
+    index, (method, seed, benchmark_name) = combination
+    kwargs = _shared_experiment_kwargs
+    try:
+        _run_experiment_simulated_backend(
+            method=method,
+            seed=seed,
+            benchmark_name=benchmark_name,
+            blackbox=kwargs["blackboxes"].get(benchmark_name),
+            # Tuners started at the same time must have different names
+            tuner_name_suffix=str(index),
+            **kwargs["experiment_kwargs"],
+        )
+        return index, None
+    except Exception:
+        return index, traceback.format_exc()
+
+
+def _run_experiments_in_parallel(
+    combinations: List[Tuple[str, int, str]],
+    num_workers: int,
+    blackboxes: Dict[str, Blackbox],
+    **experiment_kwargs,
+):
+    global _shared_experiment_kwargs
+
+    _shared_experiment_kwargs = dict(
+        blackboxes=blackboxes, experiment_kwargs=experiment_kwargs
+    )
+    failures = []
+    start_time = time.perf_counter()
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes=num_workers) as pool:
+            for index, error in tqdm(
+                pool.imap_unordered(
+                    _run_experiment_in_worker, list(enumerate(combinations))
+                ),
+                total=len(combinations),
+            ):
+                if error is not None:
+                    method, seed, benchmark_name = combinations[index]
+                    logger.error(
+                        f"Experiment ({method}/{benchmark_name}/{seed}) failed:\n"
+                        + error
+                    )
+                    failures.append(combinations[index])
+    finally:
+        _shared_experiment_kwargs = None
+    total_time = time.perf_counter() - start_time
+    num_experiments = len(combinations)
+    print(
+        f"Ran {num_experiments} experiments with {num_workers} worker processes "
+        f"in {total_time:.2f} seconds "
+        f"({3600 * num_experiments / total_time:.1f} experiments per hour). "
+        f"{num_experiments - len(failures)} experiments succeeded, "
+        f"{len(failures)} failed"
+    )
+    if failures:
+        raise RuntimeError(
+            f"The following experiments (method, seed, benchmark) failed:\n"
+            f"{failures}\nSee log output above for the exceptions raised."
+        )
+
+
 def start_experiment_simulated_backend(
     configuration: ConfigDict,
     methods: MethodDefinitions,
@@ -178,6 +451,16 @@ def start_experiment_simulated_backend(
     runs over methods selected from ``methods``, repetitions and benchmarks
     selected from ``benchmark_definitions``
 
+    If ``configuration.num_workers > 1``, experiments are run in parallel
+    instead, using this number of worker processes. Blackboxes (along with
+    surrogate models) are loaded once in the main process, before workers are
+    forked, so that their memory is shared between workers. A failing
+    experiment does not stop the others. Failures are logged, and an
+    exception is raised once all experiments are done. Random seeds of
+    experiments do not depend on how they are run. Surrogate models are
+    fitted with the random seed of each experiment, so results are the same
+    for sequential and parallel runs.
+
     ``map_method_args`` can be used to modify ``method_kwargs`` for constructing
     :class:`~syne_tune.experiments.baselines.MethodArguments`, depending on
     ``configuration`` and the method. This allows for extra flexibility to specify specific arguments for chosen methods
@@ -235,129 +518,48 @@ def start_experiment_simulated_backend(
         itertools.product(method_names, configuration.seeds, benchmark_names)
     )
     print(combinations)
-    do_scale = (
-        configuration.scale_max_wallclock_time
-        and configuration.n_workers is not None
-        and configuration.max_wallclock_time is None
+    experiment_kwargs = dict(
+        configuration=configuration,
+        methods=methods,
+        benchmark_definitions=benchmark_definitions,
+        master_random_seed=master_random_seed,
+        extra_results=extra_results,
+        map_method_args=map_method_args,
+        extra_tuning_job_metadata=extra_tuning_job_metadata,
+        use_transfer_learning=use_transfer_learning,
     )
-    for method, seed, benchmark_name in tqdm(combinations):
-        random_seed = effective_random_seed(master_random_seed, seed)
-        np.random.seed(random_seed)
-        benchmark = benchmark_definitions[benchmark_name]
-        default_n_workers = benchmark.n_workers
-        if configuration.n_workers is not None:
-            benchmark.n_workers = configuration.n_workers
-        if configuration.max_wallclock_time is not None:
-            benchmark.max_wallclock_time = configuration.max_wallclock_time
-        elif do_scale and configuration.n_workers < default_n_workers:
-            # Scale ``max_wallclock_time``
-            factor = default_n_workers / configuration.n_workers
-            bm_mwt = benchmark.max_wallclock_time
-            benchmark.max_wallclock_time = int(bm_mwt * factor)
-            print(
-                f"Scaling max_wallclock_time: {benchmark.max_wallclock_time} (from {bm_mwt})"
-            )
-        print(
-            f"Starting experiment ({method}/{benchmark_name}/{seed}) of {experiment_tag}"
-            f"  max_wallclock_time = {benchmark.max_wallclock_time}, "
-            f"  n_workers = {benchmark.n_workers}"
-        )
-
-        max_resource_attr = benchmark.max_resource_attr
-        if max_resource_attr is None:
-            max_resource_attr = "my_max_resource_attr"
-        if configuration.restrict_configurations:
-            # Don't need surrogate in this case
-            kwargs = dict()
-        else:
-            kwargs = dict(
-                surrogate=benchmark.surrogate,
-                surrogate_kwargs=benchmark.surrogate_kwargs,
-                add_surrogate_kwargs=benchmark.add_surrogate_kwargs,
-            )
-        trial_backend = BlackboxRepositoryBackend(
-            blackbox_name=benchmark.blackbox_name,
-            elapsed_time_attr=benchmark.elapsed_time_attr,
-            max_resource_attr=max_resource_attr,
-            support_checkpointing=configuration.support_checkpointing,
-            dataset=benchmark.dataset_name,
-            **kwargs,
-        )
-
-        blackbox = trial_backend.blackbox
-        resource_attr = blackbox.fidelity_name()
-        config_space = blackbox.configuration_space_with_max_resource_attr(
-            max_resource_attr
-        )
-        method_kwargs = dict(
-            config_space=config_space,
-            metric=benchmark.metric,
-            mode=benchmark.mode,
-            random_seed=random_seed,
-            resource_attr=resource_attr,
-            max_resource_attr=max_resource_attr,
-            use_surrogates="lcbench" in benchmark_name,
-            fcnet_ordinal=configuration.fcnet_ordinal,
-            scheduler_kwargs=dict(
-                points_to_evaluate=benchmark.points_to_evaluate,
-            ),
-        )
-        if use_transfer_learning:
-            method_kwargs["transfer_learning_evaluations"] = (
-                get_transfer_learning_evaluations(
-                    blackbox_name=benchmark.blackbox_name,
-                    test_task=benchmark.dataset_name,
-                    datasets=benchmark.datasets,
-                ),
-            )
-        search_options = dict(debug_log=configuration.verbose)
-        if configuration.restrict_configurations:
-            search_options["restrict_configurations"] = blackbox.all_configurations()
-        if configuration.max_size_data_for_model is not None:
-            search_options[
-                "max_size_data_for_model"
-            ] = configuration.max_size_data_for_model
-        method_kwargs["scheduler_kwargs"]["search_options"] = search_options
-        if map_method_args is not None:
-            method_kwargs = map_method_args(configuration, method, method_kwargs)
-        scheduler = methods[method](MethodArguments(**method_kwargs))
-
-        stop_criterion = StoppingCriterion(
-            max_wallclock_time=benchmark.max_wallclock_time,
-            max_num_evaluations=benchmark.max_num_evaluations,
-        )
-        metadata = get_metadata(
-            seed=seed,
-            method=method,
-            experiment_tag=experiment_tag,
-            benchmark_name=benchmark_name,
-            random_seed=master_random_seed,
-            max_size_data_for_model=configuration.max_size_data_for_model,
-            extra_metadata=extra_tuning_job_metadata,
+    num_workers = min(configuration.num_workers, len(combinations))
+    if num_workers > 1:
+        # Load blackboxes before worker processes are forked. Surrogate
+        # models depend on the seed of the experiment, so they are fitted in
+        # the workers. In this case, only the blackbox data is loaded here,
+        # into the cache shared by the process and inherited by the workers
+        blackboxes = dict()
+        for benchmark_name in benchmark_names:
+            benchmark = benchmark_definitions[benchmark_name]
+            if _fits_surrogate(configuration, benchmark):
+                load_blackbox_cached(
+                    benchmark.blackbox_name,
+                    yahpo_kwargs=benchmark.surrogate_kwargs or dict(),
+                )
+            else:
+                blackboxes[benchmark_name] = _create_trial_backend(
+                    configuration, benchmark
+                ).blackbox
+        _run_experiments_in_parallel(
+            combinations=combinations,
+            num_workers=num_workers,
+            blackboxes=blackboxes,
+            **experiment_kwargs,
         )
-        metadata["fcnet_ordinal"] = configuration.fcnet_ordinal
-        if benchmark.add_surrogate_kwargs is not None:
-            metadata["predict_curves"] = int(
-                benchmark.add_surrogate_kwargs["predict_curves"]
+    else:
+        for method, seed, benchmark_name in tqdm(combinations):
+            _run_experiment_simulated_backend(
+                method=method,
+                seed=seed,
+                benchmark_name=benchmark_name,
+                **experiment_kwargs,
             )
-        tuner_name = experiment_tag
-        if configuration.use_long_tuner_name_prefix:
-            tuner_name += f"-{sanitize_sagemaker_name(benchmark_name)}-{seed}"
-        callbacks = [SimulatorCallback(extra_results_composer=extra_results)]
-        tuner = Tuner(
-            trial_backend=trial_backend,
-            scheduler=scheduler,
-            stop_criterion=stop_criterion,
-            n_workers=benchmark.n_workers,
-            sleep_time=0,
-            callbacks=callbacks,
-            results_update_interval=600,
-            print_update_interval=600,
-            tuner_name=tuner_name,
-            metadata=metadata,
-            save_tuner=configuration.save_tuner,
-        )
-        tuner.run()
 
 
 def main(
@@ -13,7 +13,11 @@
 from pathlib import Path
 from typing import Optional
 
-from syne_tune.constants import ST_METADATA_FILENAME, ST_RESULTS_DATAFRAME_FILENAME
+from syne_tune.constants import (
+    ST_METADATA_FILENAME,
+    ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_SEGMENT_POSTFIX,
+)
 from syne_tune.optimizer.schedulers.random_seeds import (
     generate_random_seed,
     RANDOM_SEED_UPPER_BOUND,
@@ -33,7 +37,8 @@ def sync_from_s3_command(experiment_name: str, s3_bucket: Optional[str] = None)
     return (
         f'aws s3 sync {s3_source_path} {target_path} --exclude "*" '
         f'--include "*{ST_METADATA_FILENAME}" '
-        f'--include "*{ST_RESULTS_DATAFRAME_FILENAME}"'
+        f'--include "*{ST_RESULTS_DATAFRAME_FILENAME}" '
+        f'--include "*{ST_RESULTS_SEGMENT_POSTFIX}"'
     )
 
 
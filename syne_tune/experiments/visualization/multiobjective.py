@@ -30,10 +30,10 @@ def hypervolume_indicator_column_generator(
     dataframe). For a metric with ``mode == "max"``, we use its negative.
 
     This mapping is used to create the ``dataframe_column_generator`` argument
-    of :meth:`~syne_tune.experiments.ComparativeResults.plot`. Since the
-    current implementation is not incremental and quite slow, if you plot
-    results for single-fidelity HPO methods, it is strongly recommended to
-    also use ``one_result_per_trial=True``:
+    of :meth:`~syne_tune.experiments.ComparativeResults.plot`. If you plot
+    results for single-fidelity HPO methods, it is recommended to also use
+    ``one_result_per_trial=True``, which reduces the number of results to be
+    processed:
 
     .. code:: python
 
@@ -55,8 +55,8 @@ def hypervolume_indicator_column_generator(
     :param metrics_and_modes: List of ``(metric, mode)``, see above
     :param reference_point: Reference point for hypervolume computation. If not
         given, a default value is used
-    :param increment: If ``> 1``, the HV indicator is linearly interpolated, this
-        is faster. Defaults to 1 (no interpolation)
+    :param increment: If ``> 1``, the HV indicator is linearly interpolated.
+        Defaults to 1 (no interpolation)
     :return: Dataframe column generator
     """
     assert (
@@ -416,6 +416,14 @@ class ComparativeResults:
         is supported only if ``with_subdirs``
     :param s3_bucket: Only if ``download_from_s3 == True``. If not given, the
         default bucket for the SageMaker session is used
+    :param num_workers: Number of worker processes used to load result files
+        in :meth:`plot`. Defaults to 1 (no parallelization)
+    :param use_cache: If ``True``, metadata and results (restricted to the
+        columns needed for plotting) of each experiment are cached on disk, see
+        :func:`~syne_tune.experiments.visualization.results_utils.results_cache_path`.
+        Entries are reloaded if the modification time of their files changes.
+        This speeds up plotting of studies with many experiments. Defaults to
+        ``False``
     """
 
     def __init__(
@@ -433,6 +441,8 @@ class ComparativeResults:
         metadata_subplot_level: bool = False,
         download_from_s3: bool = False,
         s3_bucket: Optional[str] = None,
+        num_workers: int = 1,
+        use_cache: bool = False,
     ):
         if download_from_s3:
             assert (
@@ -448,6 +458,7 @@ class ComparativeResults:
             benchmark_key=benchmark_key,
             with_subdirs=with_subdirs,
             datetime_bounds=datetime_bounds,
+            use_cache=use_cache,
         )
         self._reverse_index = result["index"]
         assert result["setup_names"] == set(setups), (
@@ -463,6 +474,8 @@ class ComparativeResults:
         self.setups = tuple(setups)
         self.num_runs = num_runs
         self._default_plot_params = copy.deepcopy(plot_params)
+        self._num_workers = num_workers
+        self._use_cache = use_cache
 
     def _check_benchmark_name(self, benchmark_name: Optional[str]) -> str:
         err_msg = f"benchmark_name must be one of {list(self._reverse_index.keys())}"
@@ -835,8 +848,19 @@ class ComparativeResults:
             plot_params = PlotParameters()
         plot_params = plot_params.merge_defaults(self._default_plot_params)
         logger.info(f"Load results for benchmark {benchmark_name}")
+        if dataframe_column_generator is None:
+            # Only load columns which are needed. We cannot know which columns
+            # ``dataframe_column_generator`` depends on
+            columns = [ST_TUNER_TIME, "trial_id", plot_params.metric]
+            if extra_results_keys is not None:
+                columns.extend(extra_results_keys)
+        else:
+            columns = None
         results_df = load_results_dataframe_per_benchmark(
-            self._reverse_index[benchmark_name]
+            self._reverse_index[benchmark_name],
+            columns=columns,
+            num_workers=self._num_workers,
+            use_cache=self._use_cache,
         )
         logger.info("Aggregate results")
         aggregate_result = self._transform_and_aggregrate_results(
@@ -13,6 +13,8 @@
 import itertools
 import json
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 import subprocess
 from subprocess import CalledProcessError
@@ -26,8 +28,11 @@ from syne_tune.constants import (
     ST_DATETIME_FORMAT,
     ST_METADATA_FILENAME,
     ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_SEGMENTS_DIRNAME,
+    ST_RESULTS_SEGMENT_POSTFIX,
 )
 from syne_tune.experiments.launchers.utils import sync_from_s3_command
+from syne_tune.results_callback import load_results_dataframe
 from syne_tune.util import experiment_path, s3_experiment_path
 
 logger = logging.getLogger(__name__)
@@ -42,6 +47,17 @@ MapMetadataToSubplot = Callable[[Dict[str, Any]], Optional[int]]
 
 SINGLE_BENCHMARK_KEY = "SINGLE_BENCHMARK"
 
+RESULTS_CACHE_DIRNAME = ".results_cache"
+
+
+def results_cache_path() -> Path:
+    """
+    :return: Directory for cached metadata and results, used if
+        ``use_cache=True`` in :func:`create_index_for_result_files` and
+        :func:`load_results_dataframe_per_benchmark`. It is safe to remove it
+    """
+    return experiment_path() / RESULTS_CACHE_DIRNAME
+
 
 def _strip_common_prefix(tuner_path: str) -> str:
     prefix_path = str(experiment_path())
@@ -157,6 +173,59 @@ def _get_benchmark_name(
     return benchmark_name
 
 
+def _write_atomically(path: Path, write: Callable[[str], None]):
+    # Writes to temporary file first, so that readers never see a partial file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = str(path) + f".tmp{os.getpid()}"
+    write(tmp_path)
+    os.replace(tmp_path, str(path))
+
+
+class _MetadataCache:
+    """
+    Persistent cache of metadata files of experiments with name
+    ``experiment_name``. An entry is valid as long as the modification time
+    of the metadata file does not change.
+    """
+
+    def __init__(self, experiment_name: str):
+        self._path = results_cache_path() / f"metadata-{experiment_name}.json"
+        self._entries = dict()
+        if self._path.exists():
+            try:
+                with open(str(self._path), "r") as f:
+                    self._entries = json.load(f)
+            except Exception as ex:
+                logger.warning(f"Ignoring corrupt cache file {self._path}: {ex}")
+        self._modified = False
+
+    def load(self, meta_path: Path) -> Dict[str, Any]:
+        key = _strip_common_prefix(str(meta_path))
+        mtime = meta_path.stat().st_mtime_ns
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        metadata = _load_metadata(meta_path)
+        self._entries[key] = [mtime, metadata]
+        self._modified = True
+        return metadata
+
+    def save(self):
+        if self._modified:
+
+            def write(path: str):
+                with open(path, "w") as f:
+                    json.dump(self._entries, f)
+
+            _write_atomically(self._path, write)
+            self._modified = False
+
+
+def _load_metadata(meta_path: Path) -> Dict[str, Any]:
+    with open(str(meta_path), "r") as f:
+        return json.load(f)
+
+
 def create_index_for_result_files(
     experiment_names: Tuple[str, ...],
     metadata_to_setup: MapMetadataToSetup,
@@ -167,6 +236,7 @@ def create_index_for_result_files(
     with_subdirs: Optional[Union[str, List[str]]] = "*",
     datetime_bounds: Optional[DateTimeBounds] = None,
     seed_key: Optional[str] = None,
+    use_cache: bool = False,
 ) -> Union[Dict[str, Any], Dict[Tuple[str, int], Any]]:
     """
     Helper function for :class:`ComparativeResults`.
@@ -220,6 +290,11 @@ def create_index_for_result_files(
     ``seed_key`` in the metadata dict. This mode is needed for plots focusing
     on a single experiment.
 
+    If ``use_cache=True``, the content of metadata files is cached on disk,
+    in :func:`results_cache_path`. Entries are reloaded if the modification
+    time of a metadata file changes. This speeds up creating the index for
+    studies with many experiments.
+
     :param experiment_names: Tuple of experiment names (prefixes, without the
         timestamps)
     :param metadata_to_setup: See above
@@ -231,6 +306,7 @@ def create_index_for_result_files(
     :param with_subdirs: See above. Defaults to "*"
     :param datetime_bounds: See above
     :param seed_key: See above
+    :param use_cache: See above. Defaults to ``False``
     :return: Dictionary; entry "index" for index (see above); entry
         "setup_names" for setup names encountered; entry "metadata_values" see
         ``metadata_keys``
@@ -245,6 +321,12 @@ def create_index_for_result_files(
     datetime_bounds = _convert_datetime_bounds(datetime_bounds, experiment_names)
     is_map_dict = isinstance(metadata_to_setup, dict)
     for experiment_name in experiment_names:
+        if use_cache:
+            metadata_cache = _MetadataCache(experiment_name)
+            load_metadata = metadata_cache.load
+        else:
+            metadata_cache = None
+            load_metadata = _load_metadata
         datetime_lower, datetime_upper = datetime_bounds[experiment_name]
         patterns = [experiment_name + "-*/" + ST_METADATA_FILENAME]
         if with_subdirs is not None:
@@ -261,8 +343,7 @@ def create_index_for_result_files(
                 continue  # Skip this result
             # Load metadata
             try:
-                with open(str(meta_path), "r") as f:
-                    metadata = json.load(f)
+                metadata = load_metadata(meta_path)
             except FileNotFoundError:
                 metadata = None
             if metadata is None:
@@ -314,6 +395,8 @@ def create_index_for_result_files(
                         key_sequence=key_sequence,
                         value=metadata[key],
                     )
+        if metadata_cache is not None:
+            metadata_cache.save()
 
     result = {
         "index": reverse_index,
@@ -324,8 +407,87 @@ def create_index_for_result_files(
     return result
 
 
+def _results_files_mtime(tuner_path: Path) -> Optional[int]:
+    """
+    :param tuner_path: Path of experiment
+    :return: Latest modification time of result files (in nanoseconds), or
+        ``None`` if there are no result files
+    """
+    results_file = tuner_path / ST_RESULTS_DATAFRAME_FILENAME
+    paths = itertools.chain(
+        [results_file, results_file.with_suffix("")],
+        (tuner_path / ST_RESULTS_SEGMENTS_DIRNAME).glob(
+            f"*{ST_RESULTS_SEGMENT_POSTFIX}"
+        ),
+    )
+    mtimes = [path.stat().st_mtime_ns for path in paths if path.exists()]
+    return max(mtimes) if mtimes else None
+
+
+def _results_cache_file(tuner_path: str) -> Path:
+    # ``tuner_path`` is relative to :func:`experiment_path`
+    return (
+        results_cache_path() / "results" / ("--".join(Path(tuner_path).parts) + ".pkl")
+    )
+
+
+def _load_results_for_experiment(
+    args: Tuple[str, Optional[List[str]], Optional[str]]
+) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    Loads results for a single experiment. This is run in worker processes
+    by :func:`load_results_dataframe_per_benchmark`.
+
+    If ``cache_file`` is given, results are loaded from there if the cached
+    entry is still valid (same modification time of result files, and it
+    contains all of ``columns``). Otherwise, results are loaded from the
+    result files and written to ``cache_file``.
+
+    :param args: ``(tuner_path, columns, cache_file)``
+    :return: ``(df, error_message)``, where ``df`` is ``None`` if results
+        could not be loaded
+    """
+    tuner_path, columns, cache_file = args
+    tuner_path = Path(tuner_path)
+    try:
+        if cache_file is not None:
+            cache_file = Path(cache_file)
+            mtime = _results_files_mtime(tuner_path)
+            if mtime is None:
+                return None, None
+            if cache_file.exists():
+                entry = pd.read_pickle(cache_file)
+                cached_columns = entry["columns"]
+                if entry["mtime"] == mtime and (
+                    cached_columns is None
+                    or (columns is not None and set(columns) <= set(cached_columns))
+                ):
+                    df = entry["df"]
+                    if columns is not None:
+                        df = df.drop(
+                            columns=[name for name in df.columns if name not in columns]
+                        )
+                    return df, None
+        df = load_results_dataframe(tuner_path, columns=columns)
+        if cache_file is not None:
+            entry = {
+                "mtime": mtime,
+                "columns": None if columns is None else sorted(columns),
+                "df": df,
+            }
+            _write_atomically(cache_file, lambda path: pd.to_pickle(entry, path))
+        return df, None
+    except FileNotFoundError:
+        return None, None
+    except Exception as ex:
+        return None, f"{tuner_path}: Error in pd.read_csv\n{ex}"
+
+
 def load_results_dataframe_per_benchmark(
-    experiment_list: List[Tuple[str, str, int]]
+    experiment_list: List[Tuple[str, str, int]],
+    columns: Optional[List[str]] = None,
+    num_workers: int = 1,
+    use_cache: bool = False,
 ) -> Optional[pd.DataFrame]:
     """
     Helper function for :class:`ComparativeResults`.
@@ -335,22 +497,46 @@ def load_results_dataframe_per_benchmark(
     "setup_name", "suplot_no", "tuner_name", whose values are constant
     across data for one experiment, allowing for later grouping.
 
+    If ``columns`` is given, only these columns are loaded from result files,
+    which is faster if results have many columns. If ``num_workers > 1``,
+    results are loaded in parallel by a pool of worker processes. If
+    ``use_cache=True``, results of each experiment (restricted to
+    ``columns``) are cached on disk, in :func:`results_cache_path`. Entries
+    are reloaded if the modification time of result files changes.
+
     :param experiment_list: Information about experiments, see
         :func:`create_index_for_result_files`
+    :param columns: Columns to be loaded. Defaults to all columns
+    :param num_workers: Number of worker processes for loading results.
+        Defaults to 1 (no parallelization)
+    :param use_cache: See above. Defaults to ``False``
     :return: Dataframe with all results combined
     """
+    if columns is not None:
+        columns = list(columns)
+    jobs = [
+        (
+            # Add common prefix that was stripped off
+            str(experiment_path() / tuner_path),
+            columns,
+            str(_results_cache_file(tuner_path)) if use_cache else None,
+        )
+        for tuner_path, _, _ in experiment_list
+    ]
+    num_workers = min(num_workers, len(jobs))
+    if num_workers > 1:
+        with multiprocessing.Pool(num_workers) as pool:
+            chunksize = max(len(jobs) // (4 * num_workers), 1)
+            results = pool.map(_load_results_for_experiment, jobs, chunksize)
+    else:
+        results = map(_load_results_for_experiment, jobs)
     dfs = []
-    for tuner_path, setup_name, subplot_no in experiment_list:
-        # Add common prefix that was stripped off
+    for (tuner_path, setup_name, subplot_no), (df, error_message) in zip(
+        experiment_list, results
+    ):
         tuner_path = experiment_path() / tuner_path
-        df_filename = str(tuner_path / ST_RESULTS_DATAFRAME_FILENAME)
-        try:
-            df = pd.read_csv(df_filename)
-        except FileNotFoundError:
-            df = None
-        except Exception as ex:
-            logger.error(f"{df_filename}: Error in pd.read_csv\n{ex}")
-            df = None
+        if error_message is not None:
+            logger.error(error_message)
         if df is None:
             logger.warning(
                 f"{tuner_path}: Meta-data matches filter, but "
@@ -378,8 +564,8 @@ def download_result_files_from_s3(
     Downloads result files from S3. This works only if the result objects on S3
     have prefixes ``f"{s3_experiment_path(s3_bucket)}{ename}/"``, where ``ename``
     is in ``experiment_names``. Only files with names
-    :const:`ST_METADATA_FILENAME` and :const:`ST_RESULTS_DATAFRAME_FILENAME`
-    are downloaded.
+    :const:`ST_METADATA_FILENAME` and :const:`ST_RESULTS_DATAFRAME_FILENAME`,
+    as well as results segments, are downloaded.
 
     :param experiment_names: Tuple of experiment names (prefixes, without the
         timestamps)
@@ -411,7 +597,11 @@ def download_result_files_from_s3(
             logger.warning(err_msg)
         # Recursive download with boto3. This is quite slow!
         target_path = str(experiment_path() / experiment_name)
-        valid_postfixes = [ST_METADATA_FILENAME, ST_RESULTS_DATAFRAME_FILENAME]
+        valid_postfixes = [
+            ST_METADATA_FILENAME,
+            ST_RESULTS_DATAFRAME_FILENAME,
+            ST_RESULTS_SEGMENT_POSTFIX,
+        ]
         result = s3_download_files_recursively(
             s3_source_path=s3_source_path,
             target_path=target_path,
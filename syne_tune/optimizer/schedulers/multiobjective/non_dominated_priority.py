@@ -10,16 +10,124 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+from bisect import bisect_left, bisect_right
 from typing import Optional, List, Union
 
 import numpy as np
 
 
+def _pareto_efficient_2d(X: np.ndarray) -> np.ndarray:
+    """
+    Sort-and-sweep for :func:`pareto_efficient` in 2D. After sorting the items
+    w.r.t. the first cost (ties broken by the second), an item is dominated if
+    and only if an item with smaller first cost has a second cost which is not
+    larger, or an item with the same first cost has a smaller second cost.
+    """
+    order = np.lexsort((X[:, 1], X[:, 0]))
+    xs = X[order, 0]
+    ys = X[order, 1]
+    # Start positions of groups of items with the same first cost. Within a
+    # group, the first item has the smallest second cost
+    is_group_start = np.ones(xs.size, dtype=bool)
+    is_group_start[1:] = xs[1:] != xs[:-1]
+    group_start = np.maximum.accumulate(np.where(is_group_start, np.arange(xs.size), 0))
+    # Smallest second cost over items with smaller first cost
+    cummin_ys = np.minimum.accumulate(ys)
+    prev_min_ys = np.full(xs.size, np.inf)
+    has_prev = group_start > 0
+    prev_min_ys[has_prev] = cummin_ys[group_start[has_prev] - 1]
+    # Items in the first group have no predecessors (``prev_min_ys <= ys``
+    # would be true for ``ys = inf``)
+    dominated = (has_prev & (prev_min_ys <= ys)) | (ys[group_start] < ys)
+    mask = np.empty(xs.size, dtype=bool)
+    mask[order] = ~dominated
+    return mask
+
+
+def _pareto_efficient_3d(X: np.ndarray) -> np.ndarray:
+    """
+    Sweep for :func:`pareto_efficient` in 3D. Items are processed in
+    lexicographic order, so that an item can only be dominated by items
+    processed before. We maintain the 2D Pareto front w.r.t. the second and
+    third costs of the efficient items processed so far, sorted by the second
+    cost (so the third is descending). An item is dominated if and only if the
+    front item with the largest second cost not exceeding its own has a third
+    cost which is not larger. This costs ``O(log N)`` per item, plus the
+    updates of the front.
+    """
+    order = np.lexsort(X.T[::-1])
+    X_sorted = X[order].tolist()
+    is_efficient = np.zeros(X.shape[0], dtype=bool)
+    front_ys = []
+    front_zs = []
+    prev_item = None
+    prev_efficient = False
+    for pos, item in enumerate(X_sorted):
+        if item == prev_item:
+            # Duplicates do not dominate each other
+            is_efficient[pos] = prev_efficient
+            continue
+        _, y, z = item
+        front_pos = bisect_right(front_ys, y) - 1
+        efficient = front_pos < 0 or front_zs[front_pos] > z
+        if efficient:
+            # Remove front items dominated by the new one
+            start = bisect_left(front_ys, y)
+            end = start
+            while end < len(front_ys) and front_zs[end] >= z:
+                end += 1
+            front_ys[start:end] = [y]
+            front_zs[start:end] = [z]
+        is_efficient[pos] = efficient
+        prev_item = item
+        prev_efficient = efficient
+    mask = np.empty(X.shape[0], dtype=bool)
+    mask[order] = is_efficient
+    return mask
+
+
+def _pareto_efficient_sweep(X: np.ndarray) -> np.ndarray:
+    """
+    Sweep for :func:`pareto_efficient` in any dimension. Items are processed
+    in lexicographic order, so that an item can only be dominated by items
+    processed before, or in the same block. Each block is compared against
+    the Pareto front of the items processed so far, and against itself, in
+    a vectorized manner.
+    """
+    num_items, num_dims = X.shape
+    order = np.lexsort(X.T[::-1])
+    X_sorted = X[order]
+    front = np.zeros((0, num_dims), dtype=X.dtype)
+    is_efficient = np.zeros(num_items, dtype=bool)
+    start = 0
+    while start < num_items:
+        # Limit size of temporary arrays of shape ``(block_size, num_front, D)``
+        block_size = min(max(2**20 // ((front.shape[0] + 1) * num_dims), 16), 1024)
+        end = min(start + block_size, num_items)
+        block = X_sorted[start:end]
+        others = np.vstack((front, block))
+        # ``dominated[i, j]`` is ``True`` if ``others[j]`` dominates ``block[i]``
+        less_equal = np.all(others[None, :, :] <= block[:, None, :], axis=-1)
+        less = np.any(others[None, :, :] < block[:, None, :], axis=-1)
+        block_efficient = ~np.any(less_equal & less, axis=1)
+        is_efficient[start:end] = block_efficient
+        front = np.vstack((front, block[block_efficient]))
+        start = end
+    mask = np.empty(num_items, dtype=bool)
+    mask[order] = is_efficient
+    return mask
+
+
 def pareto_efficient(X: np.ndarray) -> np.ndarray:
     """
     Evaluates for each allocation in the provided array whether it is Pareto efficient. The costs
     are assumed to be improved by lowering them (eg lower is better).
 
+    For two and three costs, this uses sort-and-sweep algorithms in ``O(N log N)`` (plus updates
+    of a sorted list in 3D). Otherwise, allocations are processed in lexicographic order and
+    compared block-wise against the Pareto front found so far, which costs
+    ``O(N log N + N F D)``, where ``F`` is the size of the Pareto front.
+
     Parameters
     ----------
     X: np.ndarray [N, D]
@@ -31,20 +139,19 @@ def pareto_efficient(X: np.ndarray) -> np.ndarray:
     np.ndarray [N]
         A boolean array, indicating for each allocation whether it is Pareto efficient.
     """
-    # First, we assume that all allocations are Pareto efficient, i.e. not dominated
+    X = np.asarray(X)
+    # An allocation is dominated by A if all costs are equal or lower and at least one cost is
+    # strictly lower. Allocations with NaN costs are never dominated and do not dominate others
     mask = np.ones(X.shape[0], dtype=bool)
-    # Then, we iterate over all allocations A and check which are dominated by then current
-    # allocation A. If it is, we don't need to check it against another allocation.
-    for i, allocation in enumerate(X):
-        # Only consider allocation if it hasn't been dominated yet
-        if mask[i]:
-            # An allocation is dominated by A if all costs are equal or lower and at least one cost
-            # is strictly lower. Using that definition, A cannot be dominated by itself.
-            dominated = np.all(allocation <= X[mask], axis=1) * np.any(
-                allocation < X[mask], axis=1
-            )
-            mask[mask] = ~dominated
-
+    valid = ~np.any(np.isnan(X), axis=1)
+    X_valid = X[valid]
+    if X_valid.shape[0] > 1:
+        if X_valid.shape[1] == 2:
+            mask[valid] = _pareto_efficient_2d(X_valid)
+        elif X_valid.shape[1] == 3:
+            mask[valid] = _pareto_efficient_3d(X_valid)
+        else:
+            mask[valid] = _pareto_efficient_sweep(X_valid)
     return mask
 
 
@@ -71,29 +178,35 @@ def compute_epsilon_net(X: np.ndarray, dim: Optional[int] = None) -> np.ndarray:
     np.ndarray [N]
         A list of item indices, defining a sparsified order of the items.
     """
-    indices = set(range(X.shape[0]))
+    num_items = X.shape[0]
 
     # Choose the seed item according to dim
     if dim is None:
-        initial_index = np.random.choice(X.shape[0])
+        initial_index = np.random.choice(num_items)
     else:
         initial_index = np.argmin(X, axis=0)[dim]
 
     # Initialize the order
     order = [initial_index]
-    indices.remove(initial_index)
 
-    # Iterate until all models have been chosen
-    while indices:
-        # Get the distance to all items that have already been chosen
-        ordered_indices = list(indices)
-        diff = X[ordered_indices][:, None, :].repeat(len(order), axis=1) - X[order]
-        min_distances = np.linalg.norm(diff, axis=-1).min(-1)
+    # Distance of each item to the closest item already chosen. This is updated with the distances
+    # to the latest chosen item only. Items already chosen get distance -1, so they are never
+    # chosen again. Among items with the same distance, the one with the smallest index is chosen
+    is_chosen = np.zeros(num_items, dtype=bool)
+    is_chosen[initial_index] = True
+    min_distances = np.linalg.norm(X - X[initial_index], axis=-1)
+    min_distances[is_chosen] = -1
 
+    # Iterate until all models have been chosen
+    for _ in range(num_items - 1):
         # Then, choose the one with the maximum distance to all points
-        choice = ordered_indices[min_distances.argmax()]
+        choice = int(min_distances.argmax())
         order.append(choice)
-        indices.remove(choice)
+        is_chosen[choice] = True
+        np.minimum(
+            min_distances, np.linalg.norm(X - X[choice], axis=-1), out=min_distances
+        )
+        min_distances[is_chosen] = -1
 
     # convert argsort indices to rank
     ranks = np.empty(len(order), dtype=int)
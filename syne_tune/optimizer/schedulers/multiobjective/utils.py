@@ -10,7 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import List, Optional
+
 import numpy as np
 
 from syne_tune.try_import import try_import_moo_message
@@ -56,13 +58,180 @@ def linear_interpolate(hv_indicator: np.ndarray, indices: List[int]):
         hv_indicator[first : (last + 1)] = np.linspace(v_first, v_last, num=num)
 
 
-# TODO: Use code for incremental hypervolume (adding one more point). Computation
-# here can be slow.
-# At least we could check for each new row if it is dominated by rows before. If
-# so, the cumulative indicator remains the same.
+class _ParetoFront2D:
+    """
+    Pareto front of points in 2D (minimization), together with the area it
+    dominates w.r.t. a reference point. Points are stored sorted by the first
+    coordinate (ascending), so that the second coordinate is descending.
+    Adding a point costs logarithmic time, plus time linear in the number of
+    points it dominates.
+
+    :param reference_point: Reference point, shape ``(2,)``
+    """
+
+    def __init__(self, reference_point: np.ndarray):
+        self._ref_x, self._ref_y = float(reference_point[0]), float(reference_point[1])
+        self._xs = []
+        self._ys = []
+        self.area = 0.0
+
+    def add(self, x: float, y: float) -> float:
+        """
+        Adds point ``(x, y)`` to the front.
+
+        :param x: First coordinate
+        :param y: Second coordinate
+        :return: Exclusive contribution of the point, by which ``area`` is
+            increased
+        """
+        if x >= self._ref_x or y >= self._ref_y:
+            return 0.0
+        xs, ys = self._xs, self._ys
+        # Is new point weakly dominated? It suffices to check the point with
+        # the largest first coordinate ``<= x``
+        pos = bisect_right(xs, x) - 1
+        if pos >= 0 and ys[pos] <= y:
+            return 0.0
+        # Points dominated by the new point are in ``range(start, end)``
+        start = bisect_left(xs, x)
+        end = start
+        while end < len(xs) and ys[end] >= y:
+            end += 1
+        # Sweep over the first coordinate, from ``x`` to the first point not
+        # dominated to the right (or reference point). Until the first
+        # dominated point, the new point is covered up to its left neighbour,
+        # beyond that, up to the dominated point to the left
+        height = (ys[start - 1] if start > 0 else self._ref_y) - y
+        left = x
+        contribution = 0.0
+        for pos in range(start, end):
+            contribution += (xs[pos] - left) * height
+            left = xs[pos]
+            height = ys[pos] - y
+        right = xs[end] if end < len(xs) else self._ref_x
+        contribution += (right - left) * height
+        xs[start:end] = [x]
+        ys[start:end] = [y]
+        self.area += contribution
+        return contribution
+
+    def points(self) -> np.ndarray:
+        return np.array([self._xs, self._ys]).T.reshape((-1, 2))
+
+
+def _hypervolume_3d(points: np.ndarray, reference_point: np.ndarray) -> float:
+    """
+    Hypervolume of points in 3D, computed by a sweep over the third
+    coordinate, maintaining the 2D Pareto front of the first two coordinates.
+    """
+    points = points[points[:, 2] < reference_point[2]]
+    points = points[np.argsort(points[:, 2], kind="stable")]
+    front = _ParetoFront2D(reference_point[:2])
+    volume = 0.0
+    z_next = np.append(points[1:, 2], reference_point[2])
+    for (x, y, z), z_upper in zip(points, z_next):
+        front.add(x, y)
+        volume += front.area * (z_upper - z)
+    return volume
+
+
+class IncrementalHypervolume:
+    """
+    Maintains the Pareto front (minimization) of points added one at a time,
+    together with the hypervolume it dominates w.r.t. a fixed reference point.
+    Points which are weakly dominated by the current front, or do not
+    dominate the reference point, are skipped in time ``O(d |front|)``.
+    Otherwise, the hypervolume is increased by the exclusive contribution of
+    the new point, which is its box minus the hypervolume of the front clipped
+    to this box. For 2D and 3D, specialized sweep algorithms are used, for
+    higher dimensions we fall back to :func:`hypervolume`.
+
+    :param reference_point: Reference point, shape ``(d,)``
+    """
+
+    def __init__(self, reference_point: np.ndarray):
+        self._reference_point = np.asarray(reference_point, dtype=np.float64)
+        num_dims = self._reference_point.size
+        self._front_2d = (
+            _ParetoFront2D(self._reference_point) if num_dims == 2 else None
+        )
+        self._front = np.zeros((0, num_dims))
+        self._hypervolume = 0.0
+
+    @property
+    def hypervolume(self) -> float:
+        if self._front_2d is not None:
+            return self._front_2d.area
+        return self._hypervolume
+
+    @property
+    def pareto_front(self) -> np.ndarray:
+        """
+        :return: Current Pareto front, shape ``(num_front, d)``. Only contains
+            points dominating the reference point
+        """
+        if self._front_2d is not None:
+            return np.array([self._front_2d._xs, self._front_2d._ys]).T.reshape((-1, 2))
+        return self._front
+
+    def _clipped_hypervolume(self, point: np.ndarray) -> float:
+        clipped = np.maximum(self._front, point.reshape((1, -1)))
+        num_dims = point.size
+        # A clipped point equal to ``point`` in all coordinates but ``k``
+        # covers a slab of the box of ``point``. Only the thickest slab along
+        # each axis matters, and any clipped point inside of it can be removed.
+        # This reduces the number of points to the neighbourhood of ``point``
+        is_equal = clipped == point.reshape((1, -1))
+        slab_mask = is_equal.sum(axis=1) == num_dims - 1
+        if num_dims > 1 and np.any(slab_mask):
+            slab_points = clipped[slab_mask]
+            slab_axes = np.argmin(is_equal[slab_mask], axis=1)
+            bounds = np.full(num_dims, np.inf)
+            np.minimum.at(
+                bounds, slab_axes, slab_points[np.arange(slab_axes.size), slab_axes]
+            )
+            axes = np.flatnonzero(np.isfinite(bounds))
+            slab_points = np.tile(point, (axes.size, 1))
+            slab_points[np.arange(axes.size), axes] = bounds[axes]
+            is_covered = np.any(clipped >= bounds.reshape((1, -1)), axis=1)
+            clipped = np.vstack((clipped[np.logical_not(is_covered)], slab_points))
+        if num_dims == 1:
+            return float(self._reference_point[0] - clipped.min())
+        if num_dims == 3:
+            return _hypervolume_3d(clipped, self._reference_point)
+        return hypervolume(clipped, self._reference_point)
+
+    def add(self, point: np.ndarray) -> float:
+        """
+        Adds point to the front.
+
+        :param point: New point, shape ``(d,)``
+        :return: Hypervolume after adding ``point``
+        """
+        point = np.asarray(point, dtype=np.float64).reshape((-1,))
+        if self._front_2d is not None:
+            self._front_2d.add(point[0], point[1])
+            return self._front_2d.area
+        if np.any(point >= self._reference_point):
+            return self._hypervolume
+        front = self._front
+        if front.shape[0] > 0:
+            if np.any(np.all(front <= point, axis=1)):
+                return self._hypervolume  # Weakly dominated
+            contribution = np.prod(
+                self._reference_point - point
+            ) - self._clipped_hypervolume(point)
+            front = front[np.any(front < point, axis=1)]
+        else:
+            contribution = np.prod(self._reference_point - point)
+        self._front = np.vstack((front, point.reshape((1, -1))))
+        self._hypervolume += float(contribution)
+        return self._hypervolume
+
+
 def hypervolume_cumulative(
     results_array: np.ndarray,
-    reference_point: np.ndarray = None,
+    reference_point: Optional[np.ndarray] = None,
     increment: int = 1,
 ) -> np.ndarray:
     """
@@ -70,28 +239,30 @@ def hypervolume_cumulative(
     Returns an array with hypervolumes given by an increasing range of points.
     ``return_array[idx] = hypervolume(results_array[0 : (idx + 1)])``.
 
-    The current implementation is very slow, since the hypervolume index is not
-    computed incrementally. A solution for now is to use ``increment > 1``,
-    in which case the HV index is only computed every ``increment`` entry, and
-    linearly interpolated in between.
+    The hypervolume indicator is computed incrementally, see
+    :class:`IncrementalHypervolume`. If ``increment > 1``, the indicator is
+    only reported for every ``increment`` entry, and linearly interpolated in
+    between. This is not needed anymore for speed, but supported for
+    backwards compatibility.
 
     :param results_array: Array with experiment results ordered by time with
         shape ``(npoints, ndimensions)``.
     :param reference_point: Reference points for hypervolume calculations.
         If ``None``, the maximum values of each dimension of results_array is
         used.
+    :param increment: See above. Defaults to 1
     :return: Cumulative hypervolume array, shape ``(npoints,)``
     """
     if reference_point is None:
         reference_point = default_reference_point(results_array)
-    indicator_fn = HV(ref_point=reference_point)
-    hypervolume_indicator = np.zeros(shape=len(results_array))
-    sz = len(results_array)
-    indices = list(range(0, sz, increment))
-    if indices[-1] != sz - 1:
-        indices.append(sz - 1)
-    for idx in indices:
-        hypervolume_indicator[idx] = indicator_fn(results_array[0 : (idx + 1)])
+    incremental_hypervolume = IncrementalHypervolume(reference_point)
+    hypervolume_indicator = np.array(
+        [incremental_hypervolume.add(point) for point in results_array]
+    )
     if increment > 1:
+        sz = len(results_array)
+        indices = list(range(0, sz, increment))
+        if indices[-1] != sz - 1:
+            indices.append(sz - 1)
         linear_interpolate(hypervolume_indicator, indices)
     return hypervolume_indicator
@@ -51,6 +51,7 @@ class OptimizationConfig:
     lbfgs_maxiter: int
     verbose: bool
     n_starts: int
+    n_workers: int = 1
 
 
 @dataclass
@@ -236,6 +236,7 @@ class GaussianProcessOptimizeModel(GaussianProcessModel):
             bounds=self.likelihood.box_constraints_internal(),
             random_state=self._random_state,
             n_starts=n_starts,
+            n_workers=self.optimization_config.n_workers,
             tol=self.optimization_config.lbfgs_tol,
             maxiter=self.optimization_config.lbfgs_maxiter,
         )
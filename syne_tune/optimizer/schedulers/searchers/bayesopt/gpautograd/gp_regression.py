@@ -10,9 +10,11 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Optional
+from typing import Optional, Dict, Any
 import logging
 
+import numpy as np
+
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
     OptimizationConfig,
 )
@@ -55,6 +57,12 @@ class GaussianProcessRegression(GaussianProcessOptimizeModel):
     :param random_seed: Random seed to be used (optional)
     :param fit_reset_params: Reset parameters to initial values before running
         'fit'? If False, 'fit' starts from the current values
+
+    If :meth:`recompute_states` is called for the same parameters as used for
+    the current posterior state, with data whose features extend those of the
+    current state (e.g., new observations or fantasies are appended), the
+    Cholesky factor is updated incrementally, at a cost of O(n^2) per new
+    row instead of O(n^3).
     """
 
     def __init__(
@@ -78,8 +86,48 @@ class GaussianProcessRegression(GaussianProcessOptimizeModel):
             target_transform=target_transform,
             initial_noise_variance=initial_noise_variance,
         )
+        self._params_for_states = None
         self.reset_params()
 
     @property
     def likelihood(self) -> MarginalLikelihood:
         return self._likelihood
+
+    def _recompute_states(self, data: Dict[str, Any]):
+        self.likelihood.data_precomputations(data)
+        params = self.get_params()
+        chol_fact_prefix = self._chol_fact_prefix(data, params)
+        noise_variance_prefix = None
+        if chol_fact_prefix is not None:
+            noise_variance_prefix = self._states[0].jittered_noise_variance
+        self._states = [
+            self.likelihood.get_posterior_state(
+                data,
+                chol_fact_prefix=chol_fact_prefix,
+                noise_variance_prefix=noise_variance_prefix,
+            )
+        ]
+        self._params_for_states = {k: np.copy(v) for k, v in params.items()}
+
+    def _chol_fact_prefix(
+        self, data: Dict[str, Any], params: Dict[str, Any]
+    ) -> Optional[np.ndarray]:
+        """
+        If the current posterior state was computed for the same parameters,
+        and its features share the first k rows with ``data["features"]``,
+        the leading (k, k) block of its Cholesky factor can be reused.
+
+        :param data: Training data
+        :param params: Current parameters
+        :return: Cholesky factor for first k rows, or ``None``
+        """
+        if not self._states or self._params_for_states is None:
+            return None
+        old_params = self._params_for_states
+        if params.keys() != old_params.keys() or not all(
+            np.array_equal(v, old_params[k]) for k, v in params.items()
+        ):
+            return None
+        return self._states[0].chol_fact_for_prefix(
+            data["features"], self.likelihood.get_noise_variance(as_ndarray=True)
+        )
@@ -11,9 +11,11 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 from typing import Callable, Optional, List, Dict, Any
+import numpy as np
 import autograd.numpy as anp
 from autograd.builtins import isinstance
 from numpy.random import RandomState
+from scipy.linalg import lapack
 
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
     DEFAULT_MCMC_CONFIG,
@@ -40,6 +42,9 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.mean import (
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.posterior_state import (
     GaussProcPosteriorState,
 )
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.posterior_utils import (
+    predict_posterior_marginals_stacked,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.slice import (
     SliceSampler,
 )
@@ -60,6 +65,14 @@ class GPRegressionMCMC(GaussianProcessModel):
         self._states = None
         self.samples = None
         self.build_kernel = build_kernel
+        # Likelihood objects for MCMC samples, see
+        # :meth:`_likelihoods_for_samples`
+        self._sample_likelihoods = None
+        self._samples_for_likelihoods = None
+        # Inverse Cholesky factors of posterior states, stacked, see
+        # :meth:`predict`
+        self._inv_chol_facts = None
+        self._states_for_inv_chol_facts = None
 
     @property
     def states(self) -> Optional[List[GaussProcPosteriorState]]:
@@ -128,6 +141,37 @@ class GPRegressionMCMC(GaussianProcessModel):
         assert len(self.samples) > 0
         self._states = self._create_posterior_states(self.samples, features, targets)
 
+    def predict(self, features_test: np.ndarray):
+        """
+        Predictions for a small number of test points (as requested for every
+        step when the acquisition function is optimized with L-BFGS) are
+        dominated by per-state overhead. In this case, the inverse Cholesky
+        factors of all states are computed once and cached, and predictions
+        for all MCMC samples are obtained by stacked matrix products. For
+        larger numbers of test points, triangular solves per state are
+        cheaper.
+        """
+        features_test = self._assert_check_xtest(features_test)
+        states = self.states
+        if len(states) < 2 or features_test.shape[0] > _MAX_NUM_TEST_FOR_STACKED:
+            return super().predict(features_test)
+        if self._states_for_inv_chol_facts is not states:
+            self._inv_chol_facts = np.stack(
+                [_inverse_lower_triangular(state.chol_fact) for state in states]
+            )
+            self._states_for_inv_chol_facts = states
+        post_means, post_vars = predict_posterior_marginals_stacked(
+            features=states[0].features,
+            means=[state.mean for state in states],
+            kernels=[state.kernel for state in states],
+            inv_chol_facts=self._inv_chol_facts,
+            pred_mats=np.stack([state.pred_mat for state in states]),
+            test_features=features_test,
+        )
+        if post_means.shape[2] == 1:
+            post_means = np.reshape(post_means, post_means.shape[:2])
+        return list(zip(post_means, post_vars))
+
     def _is_feasible(self, hp_values: anp.ndarray) -> bool:
         pos = 0
         for _, encoding in self.likelihood.param_encoding_pairs():
@@ -142,6 +186,35 @@ class GPRegressionMCMC(GaussianProcessModel):
             pos += dim
         return True
 
+    def _likelihoods_for_samples(
+        self, samples: List[anp.ndarray]
+    ) -> List[GaussianProcessMarginalLikelihood]:
+        """
+        Creating likelihood objects is expensive compared to computing
+        posterior states for a moderate number of data points. Since
+        ``samples`` typically remain the same between calls of
+        :meth:`recompute_states`, the likelihood objects are cached.
+
+        :param samples: MCMC samples of GP hyperparameters
+        :return: Likelihood objects, one for each sample
+        """
+        old_samples = self._samples_for_likelihoods
+        if (
+            self._sample_likelihoods is None
+            or len(old_samples) != len(samples)
+            or not all(anp.array_equal(x, y) for x, y in zip(old_samples, samples))
+        ):
+            likelihoods = []
+            for sample in samples:
+                likelihood = _create_likelihood(
+                    self.build_kernel, random_state=self._random_state
+                )
+                _set_gp_hps(sample, likelihood)
+                likelihoods.append(likelihood)
+            self._sample_likelihoods = likelihoods
+            self._samples_for_likelihoods = [anp.array(x, copy=True) for x in samples]
+        return self._sample_likelihoods
+
     def _create_posterior_states(self, samples, features, targets):
         ycols = targets.shape[1]
         if ycols == 1:
@@ -149,26 +222,49 @@ class GPRegressionMCMC(GaussianProcessModel):
         else:
             num_fantasy_samples = ycols // self.number_samples
             ycols = num_fantasy_samples
+        likelihoods = self._likelihoods_for_samples(samples)
+        old_states = self._states if self._states is not None else []
         states = []
         offset = 0
-        for sample in samples:
-            likelihood = _create_likelihood(
-                self.build_kernel, random_state=self._random_state
-            )
-            _set_gp_hps(sample, likelihood)
+        for pos, likelihood in enumerate(likelihoods):
             targets_part = targets[:, offset : (offset + ycols)]
+            # If the previous state for this sample was computed with the same
+            # likelihood object, its Cholesky factor can be reused for rows
+            # shared with ``features``
+            noise_variance = likelihood.get_noise_variance(as_ndarray=True)
+            chol_fact_prefix = None
+            noise_variance_prefix = None
+            if pos < len(old_states) and old_states[pos].kernel is likelihood.kernel:
+                old_state = old_states[pos]
+                chol_fact_prefix = old_state.chol_fact_for_prefix(
+                    features, noise_variance
+                )
+                noise_variance_prefix = old_state.jittered_noise_variance
             state = GaussProcPosteriorState(
                 features=features,
                 targets=targets_part,
                 mean=likelihood.mean,
                 kernel=likelihood.kernel,
-                noise_variance=likelihood.get_noise_variance(as_ndarray=True),
+                noise_variance=noise_variance,
+                chol_fact_prefix=chol_fact_prefix,
+                noise_variance_prefix=noise_variance_prefix,
             )
             states.append(state)
             offset += num_fantasy_samples
         return states
 
 
+# Larger numbers of test points are predicted by :meth:`GPRegressionMCMC.predict`
+# with triangular solves per MCMC sample
+_MAX_NUM_TEST_FOR_STACKED = 4
+
+
+def _inverse_lower_triangular(chol_fact: np.ndarray) -> np.ndarray:
+    inv_chol_fact, info = lapack.dtrtri(chol_fact, lower=1)
+    assert info == 0, f"Inversion of Cholesky factor failed (info = {info})"
+    return inv_chol_fact
+
+
 def _get_gp_hps(likelihood: GaussianProcessMarginalLikelihood) -> anp.ndarray:
     """Get GP hyper-parameters as numpy array for a given likelihood object."""
     hp_values = []
@@ -187,7 +187,23 @@ class GaussianProcessMarginalLikelihood(MarginalLikelihood):
             + f"(received {features.shape[0]} and {targets.shape[0]})"
         )
 
-    def get_posterior_state(self, data: Dict[str, Any]) -> PosteriorState:
+    def get_posterior_state(
+        self,
+        data: Dict[str, Any],
+        chol_fact_prefix: Optional[np.ndarray] = None,
+        noise_variance_prefix: Optional[np.ndarray] = None,
+    ) -> PosteriorState:
+        """
+        :param data: Input data
+        :param chol_fact_prefix: Cholesky factor of posterior state for the
+            current parameters and the first k rows of ``data["features"]``.
+            If given, the Cholesky factor is computed incrementally. Must not
+            be used when gradients are computed
+        :param noise_variance_prefix: Noise variance (including jitter) used
+            for ``chol_fact_prefix``, see
+            :class:`~syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.posterior_state.GaussProcPosteriorState`
+        :return: Posterior state
+        """
         self.assert_data_entries(data)
         targets = self.target_transform(data["targets"])
         return GaussProcPosteriorState(
@@ -196,6 +212,8 @@ class GaussianProcessMarginalLikelihood(MarginalLikelihood):
             mean=self.mean,
             kernel=self.kernel,
             noise_variance=self._noise_variance(),
+            chol_fact_prefix=chol_fact_prefix,
+            noise_variance_prefix=noise_variance_prefix,
         )
 
     def forward(self, data: Dict[str, Any]):
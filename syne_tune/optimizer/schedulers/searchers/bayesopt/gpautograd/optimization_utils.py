@@ -10,7 +10,9 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import multiprocessing
+import threading
 import numpy as np
 from scipy import optimize
 from autograd import value_and_grad
@@ -88,7 +90,7 @@ def _apply_lbfgs_internal(
     param_converter: ParamVecDictConverter,
     param_numpy_array,
     param_bounds,
-    **kwargs
+    **kwargs,
 ):
     # Run L-BFGS-B
     LBFGS_tol = kwargs.get("tol", default_LBFGS_tol)
@@ -244,8 +246,88 @@ def apply_lbfgs(exec_func, param_dict, bounds, **kwargs):
     return ret_info
 
 
+def _run_restart(
+    start_params: Dict[str, np.ndarray], exec_func, param_dict, bounds, kwargs
+):
+    for name, value in start_params.items():
+        param_dict[name].set_data(value)
+    decorator = ExecutorDecorator(exec_func)
+    ret_info = apply_lbfgs(decorator.exec_func, param_dict, bounds, **kwargs)
+    final_params = {name: np.copy(param.data()) for name, param in param_dict.items()}
+    return ret_info, decorator.best_objective, final_params
+
+
+# Arguments of :func:`_run_restart` in a worker process, set by
+# :func:`_init_restart_worker`
+_worker_restart_args = None
+
+
+def _init_restart_worker(exec_func, param_dict, bounds, kwargs):
+    # Worker processes are forked, so that arguments are not pickled (the
+    # objective ``exec_func`` is a closure around the criterion)
+    global _worker_restart_args
+
+    _worker_restart_args = (exec_func, param_dict, bounds, kwargs)
+
+
+def _run_restart_in_worker(start_params: Dict[str, np.ndarray]):
+    return _run_restart(start_params, *_worker_restart_args)
+
+
+_warned_about_sequential_restarts = False
+
+
+def _can_run_restarts_in_parallel() -> bool:
+    global _warned_about_sequential_restarts
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        reason = "start method 'fork' is not supported on this platform"
+    elif threading.active_count() > 1:
+        # Forking a process while other threads are running can deadlock, if
+        # one of them holds a lock at that moment
+        reason = "other threads are running in this process"
+    else:
+        return True
+    if not _warned_about_sequential_restarts:
+        logger.warning(
+            f"Restarts of L-BFGS are run sequentially instead of in parallel, "
+            f"since {reason}"
+        )
+        _warned_about_sequential_restarts = True
+    return False
+
+
+def _run_restarts(
+    exec_func,
+    param_dict,
+    bounds,
+    start_params_list: List[Dict[str, np.ndarray]],
+    n_workers: int,
+    **kwargs,
+) -> List[tuple]:
+    n_workers = min(n_workers, len(start_params_list))
+    if n_workers > 1 and _can_run_restarts_in_parallel():
+        with multiprocessing.get_context("fork").Pool(
+            n_workers,
+            initializer=_init_restart_worker,
+            initargs=(exec_func, param_dict, bounds, kwargs),
+        ) as pool:
+            return pool.map(_run_restart_in_worker, start_params_list, chunksize=1)
+    else:
+        return [
+            _run_restart(start_params, exec_func, param_dict, bounds, kwargs)
+            for start_params in start_params_list
+        ]
+
+
 def apply_lbfgs_with_multiple_starts(
-    exec_func, param_dict, bounds, random_state, n_starts=N_STARTS, **kwargs
+    exec_func,
+    param_dict,
+    bounds,
+    random_state,
+    n_starts=N_STARTS,
+    n_workers: Optional[int] = None,
+    **kwargs,
 ):
     """
     When dealing with non-convex problems (e.g., optimization the marginal
@@ -262,44 +344,68 @@ def apply_lbfgs_with_multiple_starts(
     We catch exceptions and return ret_infos about these. If none of the
     restarts worked, param_dict is not modified.
 
+    If ``n_workers > 1``, restarts are run in parallel, using a pool of
+    ``n_workers`` forked processes. All starting points are sampled upfront
+    with ``random_state``, so results do not depend on ``n_workers``. Since
+    processes have to be forked, this only pays off if the criterion is
+    expensive to evaluate (e.g., a GP with many observations). Forking is
+    not safe if other threads are running in the process (for example, if
+    the tuner writes results with
+    :class:`~syne_tune.util.BackgroundWriter`). In this case, or if the
+    platform does not support forking, restarts are run sequentially, and a
+    warning is logged.
+
     :param exec_func: see above
     :param param_dict: see above
     :param bounds: see above
     :param random_state: RandomState for sampling
     :param n_starts: Number of times we start an optimization with L-BFGS
         (must be >= 1)
+    :param n_workers: Number of processes to run restarts in parallel.
+        Defaults to 1 (sequential)
     :return: List ret_infos of length n_starts. Entry is None if optimization
         worked, or otherwise has dict with info about exception caught
     """
     assert n_starts >= 1
+    if n_workers is None:
+        n_workers = 1
 
     copy_of_initial_param_dict = _deep_copy_param_dict(param_dict)
-    best_objective_over_restarts = None
-    best_param_dict_over_restarts = copy_of_initial_param_dict
-
-    # Loop over restarts
-    ret_infos = []
+    # Sample all starting points upfront. The first one is param_dict
+    start_params_list = []
     for iter in range(n_starts):
+        start_param_dict = _deep_copy_param_dict(copy_of_initial_param_dict)
         if iter > 0:
             _inplace_param_dict_randomization(
-                param_dict, copy_of_initial_param_dict, bounds, random_state
+                start_param_dict, copy_of_initial_param_dict, bounds, random_state
             )
+        start_params_list.append(
+            {name: param.data() for name, param in start_param_dict.items()}
+        )
 
-        decorator = ExecutorDecorator(exec_func)
-        ret_info = apply_lbfgs(decorator.exec_func, param_dict, bounds, **kwargs)
+    results = _run_restarts(
+        exec_func, param_dict, bounds, start_params_list, n_workers, **kwargs
+    )
 
+    # Select best parameters over restarts which worked
+    best_objective_over_restarts = None
+    best_params_over_restarts = {
+        name: param.data() for name, param in copy_of_initial_param_dict.items()
+    }
+    ret_infos = []
+    for ret_info, best_objective, final_params in results:
         ret_infos.append(ret_info)
         if ret_info is None and (
             best_objective_over_restarts is None
-            or decorator.best_objective < best_objective_over_restarts
+            or best_objective < best_objective_over_restarts
         ):
-            best_objective_over_restarts = decorator.best_objective
-            best_param_dict_over_restarts = _deep_copy_param_dict(param_dict)
+            best_objective_over_restarts = best_objective
+            best_params_over_restarts = final_params
 
     # We copy back the values of the best parameters into param_dict (again,
     # inplace, as required by the executor)
     for name in param_dict.keys():
-        param_dict[name].set_data(best_param_dict_over_restarts[name].data())
+        param_dict[name].set_data(best_params_over_restarts[name])
     return ret_infos
 
 
@@ -24,7 +24,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.mean import (
     MeanFunction,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.posterior_utils import (
-    cholesky_computations,
+    _cholesky_computations,
     predict_posterior_marginals,
     sample_posterior_marginals,
     sample_posterior_joint,
@@ -138,11 +138,24 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
         kernel: KernelFunctionWithCovarianceScale,
         noise_variance: np.ndarray,
         debug_log: bool = False,
+        chol_fact_prefix: Optional[np.ndarray] = None,
+        noise_variance_prefix: Optional[np.ndarray] = None,
         **kwargs
     ):
         """
         If targets has m > 1 columns, they correspond to fantasy samples.
 
+        If ``chol_fact_prefix`` is given, it is the Cholesky factor of a
+        posterior state for the same model parameters and the first k rows
+        of ``features``. The Cholesky factor is then computed incrementally
+        (see :func:`cholesky_computations`). In this case,
+        ``noise_variance_prefix`` must be ``jittered_noise_variance`` of this
+        state, see :meth:`chol_fact_for_prefix`.
+
+        The noise variance used for the Cholesky factor, which is larger than
+        ``noise_variance`` if jitter had to be added, is
+        ``jittered_noise_variance``.
+
         If targets is None, this is an internal (copy) constructor, where
         kwargs contains chol_fact, pred_mat.
 
@@ -155,6 +168,8 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
         :param mean: Mean function m(X)
         :param kernel: Kernel function k(X, X'), or tuple (see above)
         :param noise_variance: Noise variance sigsq, shape (1,)
+        :param chol_fact_prefix: See above. Optional
+        :param noise_variance_prefix: See above. Optional
         """
         self.mean = mean
         self.kernel = self._check_and_assign_kernel(kernel)
@@ -162,13 +177,19 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
         if targets is not None:
             targets_shape = getval(targets.shape)
             targets = anp.reshape(targets, (targets_shape[0], -1))
-            self.chol_fact, self.pred_mat = cholesky_computations(
+            (
+                self.chol_fact,
+                self.pred_mat,
+                self.jittered_noise_variance,
+            ) = _cholesky_computations(
                 features=features,
                 targets=targets,
                 mean=mean,
                 kernel=kernel,
                 noise_variance=noise_variance,
                 debug_log=debug_log,
+                chol_fact_prefix=chol_fact_prefix,
+                noise_variance_prefix=noise_variance_prefix,
             )
             self.features = anp.array(features, copy=True)
         else:
@@ -176,6 +197,9 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
             self.features = features
             self.chol_fact = kwargs["chol_fact"]
             self.pred_mat = kwargs["pred_mat"]
+            self.jittered_noise_variance = kwargs.get(
+                "jittered_noise_variance", self.noise_variance
+            )
 
     @staticmethod
     def _check_and_assign_kernel(kernel: KernelFunctionWithCovarianceScale):
@@ -200,6 +224,34 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
     def num_fantasies(self):
         return self.pred_mat.shape[1]
 
+    def chol_fact_for_prefix(
+        self, features: np.ndarray, noise_variance: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        If ``features`` share the first k rows with the features of this
+        state, the leading (k, k) block of its Cholesky factor can be passed
+        as ``chol_fact_prefix`` when creating a state for ``features`` and the
+        same model parameters, along with ``jittered_noise_variance`` as
+        ``noise_variance_prefix``.
+
+        :param features: Input points for new state, shape (n, d)
+        :param noise_variance: Noise variance for new state
+        :return: Cholesky factor for first k rows, or ``None`` if ``k == 0``
+            or ``noise_variance`` is different from the one of this state
+        """
+        if not np.array_equal(getval(self.noise_variance), noise_variance):
+            return None
+        old_features = self.features
+        num_rows = min(old_features.shape[0], features.shape[0])
+        if old_features.shape[1] != features.shape[1] or num_rows == 0:
+            return None
+        is_different = np.any(old_features[:num_rows] != features[:num_rows], axis=1)
+        if np.any(is_different):
+            num_rows = int(np.argmax(is_different))
+            if num_rows == 0:
+                return None
+        return self.chol_fact[:num_rows, :num_rows]
+
     def _state_kwargs(self) -> Dict[str, Any]:
         return {
             "features": self.features,
@@ -252,7 +304,8 @@ class GaussProcPosteriorState(PosteriorStateWithSampleJoint):
         the acquisition function is based on the de-normalized predictive
         distribution, which is why we need 'mean_data', 'std_data' here.
 
-        :param input: Single input point x, shape (d,)
+        :param input: Single input point x, shape (d,), or several inputs,
+            shape (n, d) (see :func:`backward_gradient_given_predict`)
         :param head_gradients: See Predictor.backward_gradient
         :param mean_data: Mean used to normalize targets
         :param std_data: Stddev used to normalize targets
@@ -302,14 +355,23 @@ def backward_gradient_given_predict(
     the acquisition function is based on the de-normalized predictive
     distribution, which is why we need 'mean_data', 'std_data' here.
 
+    ``input`` can also be a matrix of n input points, shape (n, d). In this
+    case, the entries of ``head_gradients`` have a leading dimension of size
+    n, and the gradients for all points are returned as (n, d) matrix. This
+    requires that ``predict_func`` returns marginal predictions for each row
+    (i.e., the prediction for a row does not depend on the other rows).
+
     :param predict_func: Function mapping input x to mean, variance
-    :param input: Single input point x, shape (d,)
+    :param input: Single input point x, shape (d,), or matrix, shape (n, d)
     :param head_gradients: See Predictor.backward_gradient
     :param mean_data: Mean used to normalize targets
     :param std_data: Stddev used to normalize targets
     :return:
     """
-    test_feature = np.reshape(input, (1, -1))
+    if input.ndim == 2:
+        test_feature = input
+    else:
+        test_feature = np.reshape(input, (1, -1))
     assert "mean" in head_gradients, "Need head_gradients['mean'] for backward_gradient"
     has_std = "std" in head_gradients
 
@@ -10,7 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Tuple, Union
+from typing import List, Optional, Tuple, Union
 import autograd.numpy as anp
 import autograd.scipy.linalg as aspl
 import numpy as np
@@ -48,6 +48,123 @@ def _extract_kernel_and_scale(kernel: KernelFunctionWithCovarianceScale):
         return kernel, 1.0
 
 
+def _cholesky_append_rows(
+    features,
+    kernel: KernelFunctionWithCovarianceScale,
+    noise_variance,
+    chol_fact_prefix: np.ndarray,
+) -> Optional[np.ndarray]:
+    """
+    Extends Cholesky factor ``chol_fact_prefix`` for the first k rows of
+    ``features`` to all n rows, by appending a block of n - k rows. If
+    ``L1 = chol_fact_prefix`` and ``X = [X1; X2]``, the new rows are
+    ``[L21, L22]``, where
+        L1 L21^T = k(X1, X2),
+        L22 L22^T = k(X2, X2) + noise_variance * I - L21 L21^T
+
+    This costs O(k^2 (n - k) + k (n - k)^2 + (n - k)^3), compared to O(n^3)
+    for a full factorization. Jitter is not added here. If the factorization
+    of the Schur complement fails, ``None`` is returned.
+
+    :param features: Input matrix X (n, d)
+    :param kernel: Kernel function, or tuple
+    :param noise_variance: Noise variance used for ``chol_fact_prefix``,
+        including jitter
+    :param chol_fact_prefix: Cholesky factor for first k rows, shape (k, k)
+    :return: Cholesky factor for all rows (n, n), or ``None``
+    """
+    _kernel, covariance_scale = _extract_kernel_and_scale(kernel)
+    num_prefix = chol_fact_prefix.shape[0]
+    features_prefix = features[:num_prefix]
+    features_new = features[num_prefix:]
+    num_new = features_new.shape[0]
+    kernel_cross = _kernel(features_prefix, features_new) * covariance_scale
+    lmat = aspl.solve_triangular(chol_fact_prefix, kernel_cross, lower=True)
+    schur_mat = (
+        _kernel(features_new, features_new) * covariance_scale
+        + anp.reshape(noise_variance, (1, 1)) * anp.eye(num_new)
+        - anp.matmul(anp.transpose(lmat), lmat)
+    )
+    try:
+        chol_fact_new = cholesky_factorization(schur_mat)
+    except np.linalg.LinAlgError:
+        return None
+    return anp.concatenate(
+        [
+            anp.concatenate(
+                [chol_fact_prefix, anp.zeros((num_prefix, num_new))], axis=1
+            ),
+            anp.concatenate([anp.transpose(lmat), chol_fact_new], axis=1),
+        ],
+        axis=0,
+    )
+
+
+def _jittered_noise_variance(kernel_mat, sys_mat, noise_variance) -> np.ndarray:
+    """
+    :param kernel_mat: Kernel matrix
+    :param sys_mat: Output of :func:`AddJitterOp` for ``kernel_mat`` and
+        ``noise_variance``
+    :param noise_variance: Noise variance
+    :return: Noise variance ``sigsq_final`` such that
+        ``sys_mat = kernel_mat + sigsq_final * I``, shape (1,)
+    """
+    noise_variance = np.reshape(getval(noise_variance), (1,))
+    diag_kernel = np.diag(getval(kernel_mat))
+    diag_sys = np.diag(getval(sys_mat))
+    if np.array_equal(diag_sys, diag_kernel + noise_variance):
+        # No jitter has been added
+        return np.array(noise_variance, copy=True)
+    else:
+        return np.reshape(np.mean(diag_sys - diag_kernel), (1,))
+
+
+def _cholesky_computations(
+    features,
+    targets,
+    mean: MeanFunction,
+    kernel: KernelFunctionWithCovarianceScale,
+    noise_variance,
+    debug_log: bool = False,
+    chol_fact_prefix: Optional[np.ndarray] = None,
+    noise_variance_prefix: Optional[np.ndarray] = None,
+):
+    """
+    Same as :func:`cholesky_computations`, but also returns the noise variance
+    ``sigsq_final`` used for L.
+
+    :return: L, P, sigsq_final
+    """
+    chol_fact = None
+    if chol_fact_prefix is not None:
+        if noise_variance_prefix is None:
+            noise_variance_prefix = noise_variance
+        if chol_fact_prefix.shape[0] == getval(features.shape)[0]:
+            chol_fact = chol_fact_prefix
+        else:
+            chol_fact = _cholesky_append_rows(
+                features, kernel, noise_variance_prefix, chol_fact_prefix
+            )
+        noise_variance_final = noise_variance_prefix
+    if chol_fact is None:
+        _kernel, covariance_scale = _extract_kernel_and_scale(kernel)
+        kernel_mat = _kernel(features, features) * covariance_scale
+        # Add jitter to noise_variance (if needed) in order to guarantee that
+        # Cholesky factorization works
+        sys_mat = AddJitterOp(
+            flatten_and_concat(kernel_mat, noise_variance),
+            initial_jitter_factor=NOISE_VARIANCE_LOWER_BOUND,
+            debug_log="true" if debug_log else "false",
+        )
+        chol_fact = cholesky_factorization(sys_mat)
+        noise_variance_final = _jittered_noise_variance(
+            kernel_mat, sys_mat, noise_variance
+        )
+    centered_y = targets - anp.reshape(mean(features), (-1, 1))
+    pred_mat = aspl.solve_triangular(chol_fact, centered_y, lower=True)
+    return chol_fact, pred_mat, noise_variance_final
+
+
 def cholesky_computations(
     features,
     targets,
@@ -55,6 +172,8 @@ def cholesky_computations(
     kernel: KernelFunctionWithCovarianceScale,
     noise_variance,
     debug_log: bool = False,
+    chol_fact_prefix: Optional[np.ndarray] = None,
+    noise_variance_prefix: Optional[np.ndarray] = None,
 ):
     """
     Given input matrix X (features), target matrix Y (targets), mean and kernel
@@ -66,26 +185,35 @@ def cholesky_computations(
     Here, sigsq_final >= noise_variance is minimal such that the Cholesky
     factorization does not fail.
 
+    If ``chol_fact_prefix`` is given, it is the Cholesky factor for the first
+    k rows of X (for the same kernel and noise variance), and L is obtained by
+    appending rows to it, which is much faster than a full factorization if
+    ``n - k`` is small. If jitter was added when computing
+    ``chol_fact_prefix``, the noise variance including jitter has to be passed
+    as ``noise_variance_prefix``, it is then used for the new rows as well.
+    If appending rows fails, we fall back to a full factorization. This must
+    not be used when gradients are computed.
+
     :param features: Input matrix X (n, d)
     :param targets: Target matrix Y (n, m)
     :param mean: Mean function
     :param kernel: Kernel function, or tuple
     :param noise_variance: Noise variance (may be increased)
     :param debug_log: Debug output during add_jitter CustomOp?
+    :param chol_fact_prefix: See above. Optional
+    :param noise_variance_prefix: See above. Defaults to ``noise_variance``
     :return: L, P
     """
-    _kernel, covariance_scale = _extract_kernel_and_scale(kernel)
-    kernel_mat = _kernel(features, features) * covariance_scale
-    # Add jitter to noise_variance (if needed) in order to guarantee that
-    # Cholesky factorization works
-    sys_mat = AddJitterOp(
-        flatten_and_concat(kernel_mat, noise_variance),
-        initial_jitter_factor=NOISE_VARIANCE_LOWER_BOUND,
-        debug_log="true" if debug_log else "false",
+    chol_fact, pred_mat, _ = _cholesky_computations(
+        features=features,
+        targets=targets,
+        mean=mean,
+        kernel=kernel,
+        noise_variance=noise_variance,
+        debug_log=debug_log,
+        chol_fact_prefix=chol_fact_prefix,
+        noise_variance_prefix=noise_variance_prefix,
     )
-    chol_fact = cholesky_factorization(sys_mat)
-    centered_y = targets - anp.reshape(mean(features), (-1, 1))
-    pred_mat = aspl.solve_triangular(chol_fact, centered_y, lower=True)
     return chol_fact, pred_mat
 
 
@@ -126,6 +254,51 @@ def predict_posterior_marginals(
     )
 
 
+def predict_posterior_marginals_stacked(
+    features,
+    means: List[MeanFunction],
+    kernels: List[KernelFunctionWithCovarianceScale],
+    inv_chol_facts: np.ndarray,
+    pred_mats: np.ndarray,
+    test_features,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Variant of :func:`predict_posterior_marginals` for a number s of posterior
+    states sharing the same training inputs ``features``, such as those for
+    the MCMC samples of a GP model. Instead of one triangular solve per state,
+    the inverse Cholesky factors are applied by a single stacked matrix
+    product. This is for inference only, gradients are not supported.
+
+    :param features: Training inputs, shape (n, d)
+    :param means: Mean functions, one per state
+    :param kernels: Kernel functions (or tuples), one per state
+    :param inv_chol_facts: Inverses of parts L of posterior states, shape
+        (s, n, n)
+    :param pred_mats: Parts P of posterior states, shape (s, n, m)
+    :param test_features: Test inputs, shape (nt, d)
+    :return: posterior_means, shape (s, nt, m), posterior_variances, shape
+        (s, nt)
+    """
+    k_tr_te = []
+    prior_means = []
+    prior_variances = []
+    for mean, kernel in zip(means, kernels):
+        _kernel, covariance_scale = _extract_kernel_and_scale(kernel)
+        k_tr_te.append(_kernel(features, test_features) * covariance_scale)
+        prior_means.append(anp.reshape(mean(test_features), (-1, 1)))
+        prior_variances.append(
+            anp.reshape(_kernel.diagonal(test_features) * covariance_scale, (-1,))
+        )
+    linv_k_tr_te = np.matmul(inv_chol_facts, np.stack(k_tr_te))
+    posterior_means = np.matmul(
+        np.transpose(linv_k_tr_te, (0, 2, 1)), pred_mats
+    ) + np.stack(prior_means)
+    posterior_variances = np.stack(prior_variances) - np.sum(
+        np.square(linv_k_tr_te), axis=1
+    )
+    return posterior_means, np.maximum(posterior_variances, MIN_POSTERIOR_VARIANCE)
+
+
 def sample_posterior_marginals(
     features,
     mean: MeanFunction,
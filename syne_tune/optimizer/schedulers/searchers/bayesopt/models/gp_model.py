@@ -47,6 +47,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.hypertune.gp_m
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.posterior_state import (
     PosteriorState,
+    GaussProcPosteriorState,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.base_classes import (
     Predictor,
@@ -156,6 +157,19 @@ class GaussProcPredictor(BasePredictor):
             for poster_state, head_gradient in zip(poster_states, head_gradients)
         ]
 
+    def backward_gradient_batch(
+        self, inputs: np.ndarray, head_gradients: List[Dict[str, np.ndarray]]
+    ) -> List[np.ndarray]:
+        poster_states = self.posterior_states
+        if poster_states is None or not all(
+            isinstance(poster_state, GaussProcPosteriorState)
+            for poster_state in poster_states
+        ):
+            return super().backward_gradient_batch(inputs, head_gradients)
+        # Predictions are marginal for each input, so that gradients for all
+        # inputs can be computed in a single backward pass
+        return self.backward_gradient(inputs, head_gradients)
+
     def does_mcmc(self):
         return isinstance(self._gpmodel, GPRegressionMCMC)
 
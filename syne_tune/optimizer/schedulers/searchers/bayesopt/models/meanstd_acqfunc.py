@@ -302,6 +302,62 @@ class MeanStdAcquisitionFunction(AcquisitionFunction):
             gradient += output_gradient
         return fval, gradient
 
+    def compute_acq_with_gradient_batch(
+        self, inputs: np.ndarray, predictor: Optional[OutputPredictor] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if predictor is None:
+            predictor = self.predictor
+        if isinstance(predictor, Predictor):
+            predictor = dictionarize_objective(predictor)
+        num_inputs = inputs.shape[0]
+        output_to_predictions = self._map_outputs_to_predictions(predictor, inputs)
+        current_bests = self._get_current_bests(predictor)
+
+        # Reshaping of predictions to accomodate _compute_heads_and_gradients.
+        # We also store the original shapes, which are needed below
+        shapes = dict()
+        for output_name, preds_for_samples in output_to_predictions.items():
+            shapes[output_name] = {k: v.shape for k, v in preds_for_samples[0].items()}
+            for prediction in preds_for_samples:
+                for k in prediction.keys():
+                    prediction[k] = prediction[k].reshape((num_inputs, -1))
+
+        # Same as in ``compute_acq_with_gradient``, but for all inputs at once
+        fvals_list = []
+        list_values = [
+            list(enumerate(output_to_predictions[name]))
+            for name in self.predictor_output_names
+        ]
+        head_gradient = {
+            name: [None] * len(predictions)
+            for name, predictions in output_to_predictions.items()
+        }
+        for preds_and_pos in itertools.product(*list_values):
+            positions, predictions = zip(*preds_and_pos)
+            output_to_preds = dict(zip(self.predictor_output_names, predictions))
+            current_best = current_bests(positions)
+            head_result = self._compute_heads_and_gradients(
+                output_to_preds, current_best
+            )
+            fvals_list.append(head_result.hval.reshape((-1,)))
+            for output_name, pos in zip(self.predictor_output_names, positions):
+                head_gradient[output_name][pos] = self._add_head_gradients(
+                    head_result.gradient[output_name], head_gradient[output_name][pos]
+                )
+
+        fvals = np.mean(fvals_list, axis=0)
+        num_total = len(fvals_list)
+        gradients = 0.0
+        for output_name, output_model in predictor.items():
+            shp = shapes[output_name]
+            head_grad = [
+                {k: v.reshape(shp[k]) for k, v in orig_grad.items()}
+                for orig_grad in head_gradient[output_name]
+            ]
+            gradient_list = output_model.backward_gradient_batch(inputs, head_grad)
+            gradients += np.sum(gradient_list, axis=0) / num_total
+        return fvals, gradients
+
     def _map_outputs_to_predictions(
         self, predictor: OutputPredictor, inputs: np.ndarray
     ) -> PredictionsPerOutput:
@@ -359,3 +415,49 @@ class MeanStdAcquisitionFunction(AcquisitionFunction):
             All values have the same shape as the corresponding predictions
         """
         raise NotImplementedError
+
+    def _compute_heads_and_gradients(
+        self,
+        output_to_predictions: SamplePredictionsPerOutput,
+        current_best: Optional[np.ndarray],
+    ) -> HeadWithGradient:
+        """
+        Variant of :meth:`_compute_head_and_gradient` for ``n`` inputs. The
+        default implementation calls :meth:`_compute_head_and_gradient` for
+        each input. Subclasses can do better.
+
+        :param: output_to_predictions: Dictionary mapping each output to a
+            dict containing predictive moments, keys as in
+            ``_output_to_keys_predict``.  "mean" entry has shape ``(n, nf)``,
+            "std" entry has shape ``(n, 1)``.
+        :param current_best: Incumbent, shape ``(nf,)``
+        :return: ``hval``, shape ``(n,)``, and head gradients (in
+            ``gradient``) for each output model. Their values have the same
+            shape as the corresponding predictions
+        """
+        num_inputs = next(iter(output_to_predictions.values()))["mean"].shape[0]
+        head_results = [
+            self._compute_head_and_gradient(
+                {
+                    output_name: {k: v[pos] for k, v in predictions.items()}
+                    for output_name, predictions in output_to_predictions.items()
+                },
+                current_best,
+            )
+            for pos in range(num_inputs)
+        ]
+        return HeadWithGradient(
+            hval=np.array([result.hval for result in head_results]).reshape((-1,)),
+            gradient={
+                output_name: {
+                    k: np.vstack(
+                        [
+                            np.reshape(result.gradient[output_name][k], (1, -1))
+                            for result in head_results
+                        ]
+                    )
+                    for k in head_results[0].gradient[output_name].keys()
+                }
+                for output_name in head_results[0].gradient.keys()
+            },
+        )
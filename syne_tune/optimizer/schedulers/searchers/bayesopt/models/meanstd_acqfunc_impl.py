@@ -132,6 +132,28 @@ class EIAcquisitionFunction(MeanStdAcquisitionFunction):
             gradient={self.active_metric: dict(mean=dh_dmean, std=dh_dstd)},
         )
 
+    def _compute_heads_and_gradients(
+        self,
+        output_to_predictions: SamplePredictionsPerOutput,
+        current_best: Optional[np.ndarray],
+    ) -> HeadWithGradient:
+        assert current_best is not None
+        means, stds = self._extract_mean_and_std(output_to_predictions)
+        nf_mean = means.shape[1]
+        current_best = current_best.reshape((1, -1))
+        assert current_best.size == nf_mean
+
+        # phi, Phi is PDF and CDF of Gaussian
+        phi, Phi, u = get_quantiles(self.jitter, current_best, means, stds)
+        self._debug_append_data(means, stds, current_best, u)
+        f_acqu = stds * (u * Phi + phi)
+        dh_dmean = Phi / nf_mean
+        dh_dstd = -np.mean(phi, axis=1, keepdims=True)
+        return HeadWithGradient(
+            hval=-np.mean(f_acqu, axis=1),
+            gradient={self.active_metric: dict(mean=dh_dmean, std=dh_dstd)},
+        )
+
     def _debug_append_data(
         self,
         means: np.ndarray,
@@ -200,6 +222,21 @@ class LCBAcquisitionFunction(MeanStdAcquisitionFunction):
             gradient={self.active_metric: dict(mean=dh_dmean, std=dh_dstd)},
         )
 
+    def _compute_heads_and_gradients(
+        self,
+        output_to_predictions: SamplePredictionsPerOutput,
+        current_best: Optional[np.ndarray],
+    ) -> HeadWithGradient:
+        means, stds = self._extract_mean_and_std(output_to_predictions)
+        nf_mean = means.shape[1]
+
+        dh_dmean = np.ones_like(means) / nf_mean
+        dh_dstd = (-self.kappa) * np.ones_like(stds)
+        return HeadWithGradient(
+            hval=np.mean(means - stds * self.kappa, axis=1),
+            gradient={self.active_metric: dict(mean=dh_dmean, std=dh_dstd)},
+        )
+
 
 class EIpuAcquisitionFunction(MeanStdAcquisitionFunction):
     r"""
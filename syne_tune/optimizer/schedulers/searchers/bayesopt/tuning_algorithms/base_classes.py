@@ -176,6 +176,34 @@ class Predictor:
         """
         raise NotImplementedError
 
+    def backward_gradient_batch(
+        self, inputs: np.ndarray, head_gradients: List[Dict[str, np.ndarray]]
+    ) -> List[np.ndarray]:
+        r"""
+        Variant of :meth:`backward_gradient` for ``n`` input points, which
+        computes the gradients :math:`\nabla_{x_i} f(x_i)` for all rows
+        :math:`x_i` of ``inputs``. Here, head gradients have the same shape as
+        the statistics returned by :meth:`predict` for ``inputs``.
+
+        The default implementation calls :meth:`backward_gradient` for each
+        row. Subclasses can do better.
+
+        :param inputs: Input points, shape ``(n, d)``
+        :param head_gradients: See above
+        :return: Gradients, shape ``(n, d)`` (several if MCMC is used)
+        """
+        gradients = [
+            self.backward_gradient(
+                input,
+                [
+                    {k: v[pos : (pos + 1)] for k, v in head_gradient.items()}
+                    for head_gradient in head_gradients
+                ],
+            )
+            for pos, input in enumerate(inputs)
+        ]
+        return [np.vstack(grads) for grads in zip(*gradients)]
+
 
 # Useful type that allows for a dictionary mapping each output name to a Predictor.
 # This is needed for multi-output BO methods such as constrained BO, where each output
@@ -210,6 +238,26 @@ class ScoringFunction:
         """
         raise NotImplementedError
 
+    def score_ndarray_matrix(
+        self,
+        inputs: np.ndarray,
+        hp_ranges: HyperparameterRanges,
+        predictor: Optional[OutputPredictor] = None,
+    ) -> List[float]:
+        """
+        Variant of :meth:`score` for candidates encoded by ``hp_ranges``. The
+        default implementation decodes the candidates and calls :meth:`score`.
+        Subclasses can do better.
+
+        :param inputs: Encoded candidates (rows), shape ``(n, d)``
+        :param hp_ranges: Encoding used for ``inputs``
+        :param predictor: Overrides default predictor
+        :return: List of score values, length ``n``
+        """
+        return self.score(
+            [hp_ranges.from_ndarray(input) for input in inputs], predictor=predictor
+        )
+
 
 class AcquisitionFunction(ScoringFunction):
     """
@@ -244,6 +292,30 @@ class AcquisitionFunction(ScoringFunction):
         """
         raise NotImplementedError
 
+    def compute_acq_with_gradient_batch(
+        self, inputs: np.ndarray, predictor: Optional[OutputPredictor] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        r"""
+        Variant of :meth:`compute_acq_with_gradient` for ``n`` input points
+        :math:`x_i`, given as rows of ``inputs``. The default implementation
+        calls :meth:`compute_acq_with_gradient` for each row. Subclasses can
+        do better.
+
+        :param inputs: Input points, shape ``(n, d)``
+        :param predictor: If given, overrides ``self.predictor``
+        :return: Values :math:`f(x_i)`, shape ``(n,)``, and gradients
+            :math:`\nabla_{x_i} f(x_i)`, shape ``(n, d)``
+        """
+        fvals, gradients = zip(
+            *[
+                self.compute_acq_with_gradient(input, predictor=predictor)
+                for input in inputs
+            ]
+        )
+        return np.array(fvals).reshape((-1,)), np.vstack(
+            [np.reshape(gradient, (1, -1)) for gradient in gradients]
+        )
+
     def score(
         self,
         candidates: Iterable[Configuration],
@@ -259,6 +331,22 @@ class AcquisitionFunction(ScoringFunction):
         inputs = hp_ranges.to_ndarray_matrix(candidates)
         return list(self.compute_acq(inputs, predictor=predictor))
 
+    def score_ndarray_matrix(
+        self,
+        inputs: np.ndarray,
+        hp_ranges: HyperparameterRanges,
+        predictor: Optional[OutputPredictor] = None,
+    ) -> List[float]:
+        if predictor is None:
+            predictor = self.predictor
+        if isinstance(predictor, dict):
+            active_predictor = predictor[self.active_metric]
+        else:
+            active_predictor = predictor
+        if not same_encoding(hp_ranges, active_predictor.hp_ranges_for_prediction()):
+            return super().score_ndarray_matrix(inputs, hp_ranges, predictor=predictor)
+        return list(self.compute_acq(inputs, predictor=predictor))
+
 
 AcquisitionFunctionConstructor = Callable[[Any], AcquisitionFunction]
 
@@ -311,6 +399,25 @@ class LocalOptimizer:
         """
         raise NotImplementedError
 
+    def optimize_batch(
+        self,
+        candidates: List[Configuration],
+        predictor: Optional[OutputPredictor] = None,
+    ) -> List[Configuration]:
+        """Run local optimizations, starting from each entry of ``candidates``
+
+        The default implementation calls :meth:`optimize` for each entry.
+        Subclasses can do better.
+
+        :param candidates: Starting points
+        :param predictor: Overrides ``self.predictor``
+        :return: Configurations found by local optimization, same size as
+            ``candidates``
+        """
+        return [
+            self.optimize(candidate, predictor=predictor) for candidate in candidates
+        ]
+
 
 class CandidateGenerator:
     """
@@ -332,3 +439,30 @@ class CandidateGenerator:
             the number of candidates returned can be ``< num_cands``
         """
         raise NotImplementedError
+
+    def generate_candidates_en_bulk_encoded(
+        self, num_cands: int, exclusion_list: Optional[ExclusionList] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Variant of :meth:`generate_candidates_en_bulk`, which returns candidates
+        encoded by ``self.hp_ranges`` as rows of a matrix, so that they do not
+        have to be created as configurations. Returns ``None`` if this is not
+        supported, which is the default.
+
+        :param num_cands: Number of candidates to generate
+        :param exclusion_list: If given, these candidates must not be returned
+        :return: Matrix of encoded candidates, or ``None``
+        """
+        return None
+
+
+def same_encoding(hp_ranges: HyperparameterRanges, other: HyperparameterRanges) -> bool:
+    """
+    :param hp_ranges: Feature generator
+    :param other: Feature generator
+    :return: Do ``hp_ranges`` and ``other`` encode configurations in the same
+        way?
+    """
+    return hp_ranges is other or (
+        hp_ranges.name_last_pos == other.name_last_pos and hp_ranges == other
+    )
@@ -10,7 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import List, Tuple, Iterator, Optional
+from typing import List, Tuple, Iterator, Optional, Iterable
 import logging
 from dataclasses import dataclass
 import numpy as np
@@ -216,6 +216,7 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             f"BayesOpt Algorithm: Generating {num_initial_candidates} "
             "initial candidates."
         )
+        initial_inputs = None
         if self.sample_unique_candidates:
             # This can be expensive, depending on what type Candidate is
             initial_candidates = generate_unique_candidates(
@@ -225,14 +226,31 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             )
         else:
             # Will not return candidates in ``exclusion_candidates``, but there
-            # can be duplicates
-            initial_candidates = (
-                self.initial_candidates_generator.generate_candidates_en_bulk(
+            # can be duplicates. If supported, candidates are generated in
+            # encoded form, and only those which are locally optimized are
+            # decoded
+            generator = self.initial_candidates_generator
+            initial_inputs = generator.generate_candidates_en_bulk_encoded(
+                num_initial_candidates, exclusion_list=self.exclusion_candidates
+            )
+            if initial_inputs is None:
+                initial_candidates = generator.generate_candidates_en_bulk(
                     num_initial_candidates, exclusion_list=self.exclusion_candidates
                 )
-            )
         logger.info("BayesOpt Algorithm: Scoring (and reordering) candidates.")
-        if self.debug_log is not None:
+        if initial_inputs is not None:
+            top_scores, initial_candidates = _order_encoded_candidates(
+                inputs=initial_inputs,
+                hp_ranges=self.initial_candidates_generator.hp_ranges,
+                scoring_function=self.initial_candidates_scorer,
+                predictor=predictor,
+            )
+            if self.debug_log is not None:
+                initial_candidates = iter(initial_candidates)
+                config = next(initial_candidates)
+                self.debug_log.set_init_config(config, top_scores[:5])
+                initial_candidates = itertools.chain([config], initial_candidates)
+        elif self.debug_log is not None:
             candidates_and_scores = _order_candidates(
                 candidates=initial_candidates,
                 scoring_function=self.initial_candidates_scorer,
@@ -254,6 +272,7 @@ class BayesianOptimizationAlgorithm(NextCandidatesAlgorithm):
             local_optimizer=self.local_optimizer,
             hp_ranges=self.exclusion_candidates.hp_ranges,
             predictor=predictor,
+            batch_size=num_candidates,
         )
         logger.info("BayesOpt Algorithm: Selecting final set of candidates.")
         if self.debug_log is not None and isinstance(
@@ -293,23 +312,61 @@ def _order_candidates(
         return [cand for score, cand in sorted_list]
 
 
+def _order_encoded_candidates(
+    inputs: np.ndarray,
+    hp_ranges: HyperparameterRanges,
+    scoring_function: ScoringFunction,
+    predictor: Optional[Predictor],
+) -> Tuple[np.ndarray, Iterator[Configuration]]:
+    """
+    Variant of :func:`_order_candidates` for candidates encoded by
+    ``hp_ranges``. Candidates are decoded lazily, in the order of their scores.
+
+    :return: ``(sorted_scores, candidates)``
+    """
+    if inputs.shape[0] == 0:
+        return np.zeros(0), iter([])
+    scores = np.array(
+        scoring_function.score_ndarray_matrix(inputs, hp_ranges, predictor=predictor)
+    )
+    # Stable sort, same as :func:`_order_candidates`
+    order = np.argsort(scores, kind="stable")
+    candidates = (hp_ranges.from_ndarray(inputs[pos]) for pos in order)
+    return scores[order], candidates
+
+
 def _lazily_locally_optimize(
-    candidates: List[Configuration],
+    candidates: Iterable[Configuration],
     local_optimizer: LocalOptimizer,
     hp_ranges: HyperparameterRanges,
     predictor: Optional[Predictor],
+    batch_size: int = 1,
 ) -> Iterator[Tuple[Configuration, Configuration]]:
     """
     Due to local deduplication we do not know in advance how many candidates
     we have to locally optimize, hence this helper to create a lazy generator
     of locally optimized candidates.
     Note that ``candidates`` may contain duplicates, but such are skipped here.
+
+    Candidates are locally optimized in batches of size ``batch_size``, using
+    ``local_optimizer.optimize_batch``. If more than one candidate is to be
+    selected, this is faster than optimizing them one by one.
     """
     considered_already = ExclusionList(hp_ranges)
+    batch = []
     for cand in candidates:
         if not considered_already.contains(cand):
             considered_already.add(cand)
-            yield cand, local_optimizer.optimize(cand, predictor=predictor)
+            batch.append(cand)
+            if len(batch) == batch_size:
+                yield from zip(
+                    batch, local_optimizer.optimize_batch(batch, predictor=predictor)
+                )
+                batch = []
+    if batch:
+        yield from zip(
+            batch, local_optimizer.optimize_batch(batch, predictor=predictor)
+        )
 
 
 # Note: If ``duplicate_detector`` is at least :class:`DuplicateDetectorIdentical`,
@@ -23,6 +23,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.base_cl
     OutputPredictor,
     CandidateGenerator,
     AcquisitionFunctionConstructor,
+    same_encoding,
 )
 from syne_tune.optimizer.schedulers.searchers.utils.common import Configuration
 from syne_tune.optimizer.schedulers.searchers.utils.exclusion_list import ExclusionList
@@ -63,7 +64,21 @@ class IndependentThompsonSampling(ScoringFunction):
     ) -> List[float]:
         if predictor is None:
             predictor = self.predictor
-        predictions_list = predictor.predict_candidates(candidates)
+        return self._score_predictions(predictor.predict_candidates(candidates))
+
+    def score_ndarray_matrix(
+        self,
+        inputs: np.ndarray,
+        hp_ranges: HyperparameterRanges,
+        predictor: Optional[Predictor] = None,
+    ) -> List[float]:
+        if predictor is None:
+            predictor = self.predictor
+        if not same_encoding(hp_ranges, predictor.hp_ranges_for_prediction()):
+            return super().score_ndarray_matrix(inputs, hp_ranges, predictor=predictor)
+        return self._score_predictions(predictor.predict(inputs))
+
+    def _score_predictions(self, predictions_list: List[dict]) -> List[float]:
         scores = []
         # If the model supports fantasizing, posterior_means is a matrix. In
         # that case, samples are drawn for every column, then averaged (why
@@ -132,6 +147,78 @@ class LBFGSOptimizeAcquisition(LocalOptimizer):
             result = self.hp_ranges.from_ndarray(optimized_x.flatten())
             return result
 
+    def optimize_batch(
+        self,
+        candidates: List[Configuration],
+        predictor: Optional[OutputPredictor] = None,
+    ) -> List[Configuration]:
+        """
+        Local optimizations from all ``candidates`` are run in lockstep, by
+        minimizing the sum of acquisition function values over all of them
+        with a single L-BFGS-B run. Since this sum decomposes over the
+        candidates, its local minima are local minima for each of them.
+        Acquisition function values and gradients for all candidates are
+        computed in a single call, which is much faster than running
+        :meth:`optimize` for each candidate.
+
+        The relative stopping tolerance ``factr`` of L-BFGS-B applies to the
+        sum, so it is divided by the number of candidates. If the joint line
+        search terminates abnormally, we fall back to running :meth:`optimize`
+        for each candidate. Candidates whose acquisition value got worse are
+        reverted to their starting points.
+        """
+        if len(candidates) <= 1:
+            return super().optimize_batch(candidates, predictor=predictor)
+        if predictor is None:
+            predictor = self.predictor
+        acquisition_function = self.acquisition_class(predictor, self.active_metric)
+
+        x0 = self.hp_ranges.to_ndarray_matrix(candidates)
+        num_candidates, dimension = x0.shape
+        bounds = self.hp_ranges.get_ndarray_bounds()
+        n_evaluations = [0]  # wrapped in list to allow access from function
+
+        def f_df(x):
+            n_evaluations[0] += 1
+            fvals, gradients = acquisition_function.compute_acq_with_gradient_batch(
+                x.reshape((num_candidates, dimension))
+            )
+            return np.sum(fvals), gradients.reshape((-1,))
+
+        res = fmin_l_bfgs_b(
+            f_df,
+            x0=x0.reshape((-1,)),
+            bounds=bounds * num_candidates,
+            maxiter=1000,
+            factr=1e7 / num_candidates,
+        )
+        self.num_evaluations = n_evaluations[0]
+        if res[2]["task"] == b"ABNORMAL_TERMINATION_IN_LNSRCH":
+            logger.warning(
+                f"ABNORMAL_TERMINATION_IN_LNSRCH in lbfgs after {n_evaluations[0]} evaluations, "
+                "optimizing candidates one by one"
+            )
+            return super().optimize_batch(candidates, predictor=predictor)
+        else:
+            # Clip to avoid situation where result is small epsilon out of bounds
+            a_min, a_max = zip(*bounds)
+            optimized_x = np.clip(
+                res[0].reshape((num_candidates, dimension)), a_min, a_max
+            )
+            assert np.linalg.norm(res[0] - optimized_x.reshape((-1,))) < 1e-6, (
+                res[0],
+                optimized_x,
+                bounds,
+            )
+            # Only the sum is guaranteed to decrease, not each of its terms
+            got_worse = acquisition_function.compute_acq(
+                optimized_x
+            ) > acquisition_function.compute_acq(x0)
+            return [
+                candidate if worse else self.hp_ranges.from_ndarray(x)
+                for candidate, x, worse in zip(candidates, optimized_x, got_worse)
+            ]
+
 
 class NoOptimization(LocalOptimizer):
     def __init__(self, *args, **kwargs):
@@ -205,6 +292,47 @@ class RandomStatefulCandidateGenerator(CandidateGenerator):
                 )
             return configs
 
+    def generate_candidates_en_bulk_encoded(
+        self, num_cands: int, exclusion_list=None
+    ) -> Optional[np.ndarray]:
+        """
+        Same as :meth:`generate_candidates_en_bulk`, and uses ``random_state``
+        in the same way, but candidates are sampled and encoded column by
+        column, and compared with ``exclusion_list`` by the bytes of their
+        encodings. Returns ``None`` if ``exclusion_list`` does not support this.
+        """
+        if exclusion_list is None:
+            return self.hp_ranges.random_ndarray_matrix(self.random_state, num_cands)
+        assert isinstance(
+            exclusion_list, ExclusionList
+        ), "exclusion_list must be of type ExclusionList"
+        if not (
+            exclusion_list.supports_ndarray_matrix()
+            and same_encoding(self.hp_ranges, exclusion_list.hp_ranges)
+        ):
+            return None
+        matrices = []
+        num_done = 0
+        for i in range(MAX_RETRIES_CANDIDATES_EN_BULK):
+            # See :meth:`generate_candidates_en_bulk`
+            num_requested = min(num_cands, (num_cands - num_done) * (i + 1))
+            matrix = self.hp_ranges.random_ndarray_matrix(
+                self.random_state, num_requested
+            )
+            matrix = matrix[~exclusion_list.contains_ndarray_matrix(matrix)]
+            num_new = min(num_cands - num_done, matrix.shape[0])
+            matrices.append(matrix[:num_new])
+            num_done += num_new
+            if num_done == num_cands:
+                break
+        if num_done < num_cands:
+            logger.warning(
+                f"Could only sample {num_done} candidates where "
+                f"{num_cands} were requested. len(exclusion_list) = "
+                f"{len(exclusion_list)}"
+            )
+        return np.vstack(matrices)
+
 
 def generate_unique_candidates(
     candidates_generator: CandidateGenerator,
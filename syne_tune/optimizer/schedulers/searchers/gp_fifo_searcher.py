@@ -145,6 +145,12 @@ class GPFIFOSearcher(BayesianOptimizationSearcher):
     :param opt_nstarts: Parameter for surrogate model fitting. Number of
         random restarts. Defaults to 2
     :type opt_nstarts: int, optional
+    :param opt_nworkers: Parameter for surrogate model fitting. Number of
+        processes used to run the random restarts in parallel. This pays off
+        only if there are many observations. Processes are forked, which is
+        not done if other threads are running (restarts are then run
+        sequentially). Defaults to 1
+    :type opt_nworkers: int, optional
     :param opt_maxiter: Parameter for surrogate model fitting. Maximum
         number of iterations per restart. Defaults to 50
     :type opt_maxiter: int, optional
@@ -192,6 +192,7 @@ def _create_gp_common(hp_ranges: HyperparameterRanges, **kwargs):
         lbfgs_maxiter=kwargs["opt_maxiter"],
         verbose=kwargs["opt_verbose"],
         n_starts=kwargs["opt_nstarts"],
+        n_workers=kwargs.get("opt_nworkers", 1),
     )
     if kwargs.get("debug_log", False):
         debug_log = DebugLogPrinter()
@@ -888,6 +889,7 @@ def _common_defaults(
         "opt_skip_period": 1,
         "opt_maxiter": 50,
         "opt_nstarts": 2,
+        "opt_nworkers": 1,
         "opt_warmstart": False,
         "opt_verbose": False,
         "opt_debug_writer": False,
@@ -940,6 +942,7 @@ def _common_defaults(
         "opt_skip_period": Integer(1, None),
         "opt_maxiter": Integer(1, None),
         "opt_nstarts": Integer(1, None),
+        "opt_nworkers": Integer(1, None),
         "opt_warmstart": Boolean(),
         "opt_verbose": Boolean(),
         "opt_debug_writer": Boolean(),
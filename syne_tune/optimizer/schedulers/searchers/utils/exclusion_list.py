@@ -12,6 +12,8 @@
 # permissions and limitations under the License.
 from typing import Optional, Dict, Any, List, Union, Set
 
+import numpy as np
+
 from syne_tune.config_space import config_space_size
 from syne_tune.optimizer.schedulers.searchers.bayesopt.datatypes.tuning_job_state import (
     TuningJobState,
@@ -32,6 +34,12 @@ class ExclusionList:
     and queried with extended configs. In that case, the resource attribute
     is removed from the config.
 
+    Configurations encoded as rows of a matrix can be queried with
+    :meth:`contains_ndarray_matrix`, without decoding them. Here, rows are
+    compared by their bytes, so encodings have to be equal, not just match
+    strings. This is not supported if the exclusion list is created from
+    match strings only (see :meth:`supports_ndarray_matrix`).
+
     :param hp_ranges: Encodes configurations to vectors
     :param configurations: Initial configurations. Default is empty
     """
@@ -55,10 +63,16 @@ class ExclusionList:
             configurations = []
         if isinstance(configurations, list):
             self.excl_set = set(self._to_matchstr(config) for config in configurations)
+            # Byte strings of encoded configs, for :meth:`contains_ndarray_matrix`.
+            # Configs are encoded only once this is used
+            self._encoded_keys = set()
+            self._configs_to_encode = list(configurations)
         else:
             # Copy constructor
             assert isinstance(configurations, set)
             self.excl_set = configurations
+            self._encoded_keys = None
+            self._configs_to_encode = []
 
     def _to_matchstr(self, config) -> str:
         return self.hp_ranges.config_to_match_string(config, keys=self.keys)
@@ -68,12 +82,53 @@ class ExclusionList:
 
     def add(self, config: Configuration):
         self.excl_set.add(self._to_matchstr(config))
+        if self._encoded_keys is not None:
+            self._configs_to_encode.append(config)
+
+    def supports_ndarray_matrix(self) -> bool:
+        """
+        :return: Can :meth:`contains_ndarray_matrix` be used?
+        """
+        return self._encoded_keys is not None
+
+    def contains_ndarray_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        :param matrix: Configs encoded by ``hp_ranges`` (rows), can be
+            extended
+        :return: Boolean vector, with entries ``True`` for rows contained in
+            the exclusion list
+        """
+        assert (
+            self.supports_ndarray_matrix()
+        ), "Exclusion list has been created from match strings only"
+        if self._configs_to_encode:
+            self._encoded_keys.update(
+                _ndarray_row_keys(
+                    self.hp_ranges.to_ndarray_matrix(
+                        self._configs_to_encode, skip_last=True
+                    )
+                )
+            )
+            self._configs_to_encode = []
+        resource_attr = self.hp_ranges.name_last_pos
+        if resource_attr is not None and matrix.shape[1] == self.hp_ranges.ndarray_size:
+            # Remove columns for resource attribute
+            start, end = self.hp_ranges.encoded_ranges[resource_attr]
+            matrix = np.delete(matrix, np.s_[start:end], axis=1)
+        return np.array(
+            [key in self._encoded_keys for key in _ndarray_row_keys(matrix)],
+            dtype=bool,
+        )
 
     def copy(self) -> "ExclusionList":
-        return ExclusionList(
+        excl_list = ExclusionList(
             hp_ranges=self.hp_ranges,
             configurations=self.excl_set.copy(),
         )
+        if self._encoded_keys is not None:
+            excl_list._encoded_keys = self._encoded_keys.copy()
+            excl_list._configs_to_encode = self._configs_to_encode.copy()
+        return excl_list
 
     def __len__(self) -> int:
         return len(self.excl_set)
@@ -92,6 +147,14 @@ class ExclusionList:
     def clone_from_state(self, state: Dict[str, Any]):
         self.keys = state["keys"]
         self.excl_set = set(state["excl_set"])
+        self._encoded_keys = None
+        self._configs_to_encode = []
+
+
+def _ndarray_row_keys(matrix: np.ndarray) -> List[bytes]:
+    # Adding 0.0 maps -0.0 to 0.0, which has different bytes
+    matrix = np.ascontiguousarray(matrix, dtype=np.float64) + 0.0
+    return [row.tobytes() for row in matrix]
 
 
 class ExclusionListFromState(ExclusionList):
@@ -148,12 +148,23 @@ class HyperparameterRanges:
         """
         raise NotImplementedError
 
-    def to_ndarray_matrix(self, configs: Iterable[Configuration]) -> np.ndarray:
+    def to_ndarray_matrix(
+        self, configs: Iterable[Configuration], skip_last: bool = False
+    ) -> np.ndarray:
         """Map configurations to ``[0, 1]`` encoded matrix
 
+        The default implementation calls :meth:`to_ndarray` for each config.
+        Subclasses may override this with a faster vectorized variant.
+
         :param configs: Configurations to encode
+        :param skip_last: If True and ``name_last_pos`` is used, the
+            corresponding attribute is skipped, so that configs can be
+            non-extended, and the columns for this attribute are not
+            returned. Not supported by the default implementation
         :return: Matrix of encoded vectors (rows)
         """
+        if skip_last and self.name_last_pos is not None:
+            raise NotImplementedError
         return np.vstack([self.to_ndarray(config) for config in configs])
 
     @property
@@ -215,10 +226,24 @@ class HyperparameterRanges:
         """
         return self._transform_config(self._random_config(random_state))
 
+    def _random_columns(
+        self, random_state: RandomState, num_configs: int
+    ) -> Dict[str, List[Hyperparameter]]:
+        # Sample all values of a hyperparameter in one go, which is much faster
+        # than sampling config by config
+        return {
+            k: v.sample(random_state=random_state, size=num_configs)
+            for k, v in self._config_space_for_sampling.items()
+        }
+
     def _random_configs(
         self, random_state: RandomState, num_configs: int
     ) -> List[Configuration]:
-        return [self._random_config(random_state) for _ in range(num_configs)]
+        if num_configs < 2:
+            return [self._random_config(random_state) for _ in range(num_configs)]
+        columns = self._random_columns(random_state, num_configs)
+        keys = list(columns.keys())
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
 
     def random_configs(self, random_state, num_configs: int) -> List[Configuration]:
         """Draws random configurations
@@ -232,6 +257,22 @@ class HyperparameterRanges:
             for config in self._random_configs(random_state, num_configs)
         ]
 
+    def random_ndarray_matrix(
+        self, random_state: RandomState, num_configs: int
+    ) -> np.ndarray:
+        """Draws random configurations, encoded as rows of a matrix
+
+        Same as ``to_ndarray_matrix(random_configs(random_state, num_configs))``,
+        and uses ``random_state`` in the same way. Subclasses may override this
+        with a variant which does not create configurations.
+
+        :param random_state: Random state
+        :param num_configs: Number of configurations to sample
+        :return: Matrix of encoded random configurations, shape
+            ``(num_configs, ndarray_size)``
+        """
+        return self.to_ndarray_matrix(self.random_configs(random_state, num_configs))
+
     def get_ndarray_bounds(self) -> List[Tuple[float, float]]:
         """
         :return: List of ``(lower, upper)`` bounds for each dimension in
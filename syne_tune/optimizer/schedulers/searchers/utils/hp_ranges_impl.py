@@ -10,7 +10,7 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Tuple, Dict, List, Any, Optional, Union
+from typing import Tuple, Dict, List, Any, Optional, Union, Iterable
 import numpy as np
 
 from syne_tune.config_space import (
@@ -49,6 +49,17 @@ class HyperparameterRange:
     def to_ndarray(self, hp: Hyperparameter) -> np.ndarray:
         raise NotImplementedError
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        """
+        Encodes a list of values for this hyperparameter. Subclasses may
+        override this with a vectorized variant.
+
+        :param hps: Values of this hyperparameter
+        :return: Matrix of shape ``(len(hps), ndarray_size())``, rows are
+            encodings of entries of ``hps``
+        """
+        return np.vstack([self.to_ndarray(hp) for hp in hps])
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         raise NotImplementedError
 
@@ -134,6 +145,17 @@ class HyperparameterRangeContinuous(HyperparameterRange):
             result = np.clip((hp_internal - lower) / (upper - lower), 0.0, 1.0)
         return np.array([result])
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        values = np.asarray(hps, dtype=np.float64).reshape((-1, 1))
+        assert np.all(
+            (self.lower_bound - EPS <= values) & (values <= self.upper_bound + EPS)
+        ), (values, self)
+        lower, upper = self.lower_internal, self.upper_internal
+        if upper == lower:
+            return np.zeros_like(values)
+        hp_internal = self.scaling.to_internal(values)
+        return np.clip((hp_internal - lower) / (upper - lower), 0.0, 1.0)
+
     def from_ndarray(self, ndarray: np.ndarray) -> Hyperparameter:
         return scale_from_zero_one(
             ndarray.item(),
@@ -218,6 +240,9 @@ class HyperparameterRangeInteger(HyperparameterRange):
     def to_ndarray(self, hp: Hyperparameter) -> np.ndarray:
         return self._continuous_range.to_ndarray(float(hp))
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        return self._continuous_range.to_ndarray_matrix(hps)
+
     def _round_to_int(self, value: float) -> int:
         return int(np.clip(round(value), self.lower_bound, self.upper_bound))
 
@@ -320,6 +345,18 @@ class HyperparameterRangeFiniteRange(HyperparameterRange):
     def to_ndarray(self, hp: Hyperparameter) -> np.ndarray:
         return self._range_int.to_ndarray(self._map_to_int(hp))
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        if self._step_internal == 0:
+            int_vals = np.zeros(len(hps))
+        else:
+            y_int = np.clip(
+                self._scaling.to_internal(np.asarray(hps, dtype=np.float64)),
+                self._lower_internal,
+                self._upper_internal,
+            )
+            int_vals = np.round((y_int - self._lower_internal) / self._step_internal)
+        return self._range_int.to_ndarray_matrix(int_vals)
+
     def from_ndarray(self, ndarray: np.ndarray) -> Hyperparameter:
         int_val = self._range_int.from_ndarray(ndarray)
         return self._map_from_int(int_val)
@@ -364,6 +401,10 @@ class HyperparameterRangeCategorical(HyperparameterRange):
         self.choices = list(choices)
         self.num_choices = len(self.choices)
         assert self.num_choices > 0
+        # Maps value to position in ``choices`` (first one for duplicates)
+        self._choice_to_index = {
+            val: pos for pos, val in reversed(list(enumerate(self.choices)))
+        }
 
     @staticmethod
     def _assert_value_type(value):
@@ -401,6 +442,16 @@ class HyperparameterRangeCategorical(HyperparameterRange):
                 raise AssertionError(err_msg)
         return firstpos
 
+    def _choices_to_indices(self, hps: List[Hyperparameter]) -> np.ndarray:
+        """
+        :param hps: Values of this hyperparameter
+        :return: Positions of entries of ``hps`` in ``choices``
+        """
+        try:
+            return np.array([self._choice_to_index[hp] for hp in hps], dtype=np.int64)
+        except KeyError as ex:
+            raise AssertionError("{} not in {}".format(ex.args[0], self))
+
     def __repr__(self) -> str:
         return "{}({}, {})".format(
             self.__class__.__name__, repr(self.name), repr(self.choices)
@@ -462,6 +513,12 @@ class HyperparameterRangeCategoricalNonBinary(HyperparameterRangeCategorical):
         result[idx] = 1.0
         return result
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        indices = self._choices_to_indices(hps)
+        result = np.zeros(shape=(indices.size, self.num_choices))
+        result[np.arange(indices.size), indices] = 1.0
+        return result
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == self.num_choices, (cand_ndarray, self)
         return self.choices[int(np.argmax(cand_ndarray))]
@@ -522,6 +579,9 @@ class HyperparameterRangeCategoricalBinary(HyperparameterRangeCategorical):
         idx = self.choices.index(hp)
         return self._range_int.to_ndarray(idx)
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        return self._range_int.to_ndarray_matrix(self._choices_to_indices(hps))
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == 1
         return self.choices[self._range_int.from_ndarray(cand_ndarray)]
@@ -570,6 +630,9 @@ class HyperparameterRangeOrdinalEqual(HyperparameterRangeCategorical):
         idx = self.choices.index(hp)
         return self._range_int.to_ndarray(idx)
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        return self._range_int.to_ndarray_matrix(self._choices_to_indices(hps))
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == 1
         return self.choices[self._range_int.from_ndarray(cand_ndarray)]
@@ -658,6 +721,12 @@ class HyperparameterRangeOrdinalNearestNeighbor(HyperparameterRangeCategorical):
             np.log(float(hp)) if self.log_scale else float(hp)
         )
 
+    def to_ndarray_matrix(self, hps: List[Hyperparameter]) -> np.ndarray:
+        values = np.array(self.choices, dtype=np.float64)[self._choices_to_indices(hps)]
+        return self._range_int.to_ndarray_matrix(
+            np.log(values) if self.log_scale else values
+        )
+
     def from_ndarray(self, cand_ndarray: np.ndarray) -> Hyperparameter:
         assert len(cand_ndarray) == 1
         return self._domain_int.cast_int(self._range_int.from_ndarray(cand_ndarray))
@@ -779,6 +848,44 @@ class HyperparameterRangesImpl(HyperparameterRanges):
         ]
         return np.hstack(pieces)
 
+    def _hp_ranges_to_encode(self, skip_last: bool) -> List[HyperparameterRange]:
+        if skip_last and self.name_last_pos is not None:
+            return self._hp_ranges[:-1]  # Skip last pos
+        else:
+            return self._hp_ranges
+
+    def to_ndarray_matrix(
+        self, configs: Iterable[Configuration], skip_last: bool = False
+    ) -> np.ndarray:
+        # Encode column by column, which is much faster than row by row
+        if not isinstance(configs, list):
+            configs = list(configs)
+        hp_ranges = self._hp_ranges_to_encode(skip_last)
+        if not configs:
+            return np.zeros((0, sum(x.ndarray_size() for x in hp_ranges)))
+        pieces = [
+            hp_range.to_ndarray_matrix([config[hp_range.name] for config in configs])
+            for hp_range in hp_ranges
+        ]
+        return np.hstack(pieces)
+
+    def random_ndarray_matrix(
+        self, random_state: np.random.RandomState, num_configs: int
+    ) -> np.ndarray:
+        if num_configs < 2:
+            return super().random_ndarray_matrix(random_state, num_configs)
+        # Columns are sampled and encoded one by one, configurations are not
+        # created
+        columns = self._random_columns(random_state, num_configs)
+        if self.is_attribute_fixed():
+            columns[self.name_last_pos] = [self.value_for_last_pos] * num_configs
+        return np.hstack(
+            [
+                hp_range.to_ndarray_matrix(columns[hp_range.name])
+                for hp_range in self._hp_ranges
+            ]
+        )
+
     def from_ndarray(self, enc_config: np.ndarray) -> Configuration:
         enc_config = enc_config.reshape((-1, 1))
         assert enc_config.size == self._ndarray_size, (
@@ -16,7 +16,8 @@ import sys
 import json
 import logging
 from ast import literal_eval
-from typing import List, Dict, Any
+from pathlib import Path
+from typing import List, Dict, Any, Union, Optional, Callable, MutableSequence
 from time import time, perf_counter
 from dataclasses import dataclass
 
@@ -38,6 +39,14 @@ logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
+_METRIC_LINE_REGEX = re.compile(r"\[" + ST_SAGEMAKER_METRIC_TAG + r"\]: (\{.*\})")
+
+
+# If set, serialized reports are also passed to this function, see
+# :func:`set_report_callback`
+_report_callback: Optional[Callable[[str], None]] = None
+
+
 @dataclass
 class Reporter:
     """
@@ -127,9 +136,26 @@ class Reporter:
         ), f"Invalid value in report: kwargs = {kwargs}"
 
 
+def set_report_callback(callback: Optional[Callable[[str], None]]):
+    """
+    Sets a function which is called with every report (serialized as JSON
+    string), on top of the report being written to stdout. This is used by
+    worker processes of :class:`~syne_tune.backend.PythonBackend`, which send
+    results directly to the backend instead of them being parsed from the log.
+
+    :param callback: Function called with each serialized report, or ``None``
+        in order to remove a callback set before
+    """
+    global _report_callback
+    _report_callback = callback
+
+
 def _report_logger(**kwargs):
-    print(f"[{ST_SAGEMAKER_METRIC_TAG}]: {_serialize_report_dict(kwargs)}")
+    report_str = _serialize_report_dict(kwargs)
+    print(f"[{ST_SAGEMAKER_METRIC_TAG}]: {report_str}")
     sys.stdout.flush()
+    if _report_callback is not None:
+        _report_callback(report_str)
 
 
 def _serialize_report_dict(report_dict: Dict[str, Any]) -> str:
@@ -159,7 +185,73 @@ def retrieve(log_lines: List[str]) -> List[Dict[str, float]]:
     :return: list of metrics retrieved from the log lines.
     """
     metrics = []
-    regex = r"\[" + ST_SAGEMAKER_METRIC_TAG + r"\]: (\{.*\})"
-    for metric_values in re.findall(regex, "\n".join(log_lines)):
+    for metric_values in _METRIC_LINE_REGEX.findall("\n".join(log_lines)):
         metrics.append(json.loads(metric_values))
     return metrics
+
+
+class IncrementalLogRetriever:
+    """
+    Retrieves metrics reported with :func:`_report_logger` from a log file
+    which is still being appended to, such as the ``std.out`` of a running
+    trial. In contrast to :func:`retrieve`, the log file is not parsed from
+    the start on every call. We remember the byte offset up to which the
+    file has been processed, and only parse complete lines appended since
+    then. A trailing line without newline is left for the next call, since
+    it may still be written to.
+
+    All metrics retrieved so far are collected in :attr:`metrics`.
+
+    :param log_path: Path to log file. It is fine if the file does not exist
+        yet
+    :param metrics: Container (supporting ``extend``) in which metrics are
+        collected, such as
+        :class:`~syne_tune.backend.metrics_buffer.MetricsBuffer`. Defaults to
+        an empty list
+    """
+
+    def __init__(
+        self,
+        log_path: Union[str, Path],
+        metrics: Optional[MutableSequence[Dict[str, Any]]] = None,
+    ):
+        self.log_path = Path(log_path)
+        self.metrics = [] if metrics is None else metrics
+        self._offset = 0
+        # Size of the log file when last read. This can be larger than
+        # ``_offset`` if the file ends with a partial line
+        self._observed_size = 0
+
+    def has_new_output(self) -> bool:
+        """
+        :return: Has the log file grown since the last call of
+            :meth:`retrieve_new`?
+        """
+        try:
+            return os.path.getsize(self.log_path) > self._observed_size
+        except FileNotFoundError:
+            return False
+
+    def retrieve_new(self) -> List[Dict[str, float]]:
+        """
+        Parses lines appended to the log file since the last call, and appends
+        metrics found there to :attr:`metrics`.
+
+        :return: List of metrics retrieved from new lines in the log file
+        """
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+        self._observed_size = self._offset + len(chunk)
+        # Only complete lines are processed
+        end_pos = chunk.rfind(b"\n") + 1
+        if end_pos == 0:
+            return []
+        self._offset += end_pos
+        new_lines = chunk[:end_pos].decode("utf-8", errors="replace").splitlines()
+        new_metrics = retrieve(log_lines=new_lines)
+        self.metrics.extend(new_metrics)
+        return new_metrics
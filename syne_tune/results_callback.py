@@ -10,11 +10,13 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
-from typing import Dict, Any, Optional, List
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterator, Union, Callable
 from time import perf_counter
 import copy
 import pandas as pd
 
+from syne_tune.backend.metrics_buffer import MetricsBuffer
 from syne_tune.backend.trial_status import Trial
 from syne_tune.constants import (
     ST_DECISION,
@@ -22,9 +24,11 @@ from syne_tune.constants import (
     ST_STATUS,
     ST_TUNER_TIME,
     ST_RESULTS_DATAFRAME_FILENAME,
+    ST_RESULTS_SEGMENTS_DIRNAME,
+    ST_RESULTS_SEGMENT_POSTFIX,
 )
 from syne_tune.tuner_callback import TunerCallback
-from syne_tune.util import RegularCallback
+from syne_tune.util import RegularCallback, BackgroundWriter, run_or_submit
 
 
 class ExtraResultsComposer:
@@ -64,26 +68,51 @@ class StoreResultsCallback(TunerCallback):
     Default implementation of :class:`~TunerCallback` which records all
     reported results, and allows to store them as CSV file.
 
+    By default, all results are written to a single file, which is rewritten
+    every time results are stored. For experiments with very many results,
+    this becomes expensive. If ``append_only=True``, only results received
+    since they were last stored are written, as a new segment file in
+    ``{tuner.tuner_path}/{ST_RESULTS_SEGMENTS_DIRNAME}``. Use
+    :func:`load_results_dataframe` in order to load results stored in either
+    way.
+
+    Results are collected in :attr:`results`, a
+    :class:`~syne_tune.backend.metrics_buffer.MetricsBuffer`, which can be
+    used like a list of dictionaries.
+
+    If the tuner has a ``background_writer``, results are written on its
+    background thread, and the writer is flushed in :meth:`on_tuning_end`.
+
     :param add_wallclock_time: If ``True``, wallclock time since call of
         ``on_tuning_start`` is stored as
         :const:`~syne_tune.constants.ST_TUNER_TIME`.
     :param extra_results_composer: Optional. If given, this is called in
         :meth:`on_trial_result`, and the resulting dictionary is appended as
         extra columns to the results dataframe
+    :param append_only: If ``True``, results are stored as segment files, see
+        above. Defaults to ``False``
     """
 
     def __init__(
         self,
         add_wallclock_time: bool = True,
         extra_results_composer: Optional[ExtraResultsComposer] = None,
+        append_only: bool = False,
     ):
-        self.results = []
+        self.results = MetricsBuffer()
         self.csv_file = None
         self.save_results_at_frequency = None
         self.add_wallclock_time = add_wallclock_time
+        self.append_only = append_only
         self._extra_results_composer = extra_results_composer
         self._start_time_stamp = None
         self._tuner = None
+        self._background_writer: Optional[BackgroundWriter] = None
+        # Used if ``append_only == True``: Number of entries of ``results``
+        # stored in segments so far, and number of segments
+        self._segments_path = None
+        self._num_results_stored = 0
+        self._num_segments = 0
 
     def _set_time_fields(self, result: Dict[str, Any]):
         """
@@ -124,19 +153,68 @@ class StoreResultsCallback(TunerCallback):
     def store_results(self):
         """
         Store current results into CSV file, of name
-        ``{tuner.tuner_path}/{ST_RESULTS_DATAFRAME_FILENAME}``.
+        ``{tuner.tuner_path}/{ST_RESULTS_DATAFRAME_FILENAME}``. If
+        ``append_only=True``, results not stored so far are written into a new
+        segment file instead.
         """
         if self.csv_file is not None:
-            self.dataframe().to_csv(self.csv_file, index=False)
+            if self.append_only:
+                self._store_new_results_segment()
+            else:
+                results_df = self.dataframe()
+                csv_file = self.csv_file
+                run_or_submit(
+                    lambda: results_df.to_csv(csv_file, index=False),
+                    self._background_writer,
+                )
+
+    def _store_new_results_segment(self):
+        new_results = self.results[self._num_results_stored :]
+        if new_results:
+            segments_path = self._segments_path
+            segment_file = (
+                segments_path / f"{self._num_segments:06d}{ST_RESULTS_SEGMENT_POSTFIX}"
+            )
+
+            def write_segment():
+                segments_path.mkdir(parents=True, exist_ok=True)
+                pd.DataFrame(new_results).to_csv(segment_file, index=False)
+
+            run_or_submit(write_segment, self._background_writer)
+            self._num_results_stored = len(self.results)
+            self._num_segments += 1
+
+    def _remove_stale_segments(self):
+        """
+        If tuning is resumed from a checkpoint, the previous run may have
+        written more segments than recorded in the checkpoint. These contain
+        results which are not part of :attr:`results`, and segments with the
+        same index are written again, so they must be removed.
+        """
+        if not self._segments_path.exists():
+            return
+        postfix_len = len(ST_RESULTS_SEGMENT_POSTFIX)
+        for segment_file in self._segments_path.glob(f"*{ST_RESULTS_SEGMENT_POSTFIX}"):
+            index = segment_file.name[:-postfix_len]
+            if index.isdigit() and int(index) >= self._num_segments:
+                segment_file.unlink()
 
     def dataframe(self) -> pd.DataFrame:
-        return pd.DataFrame(self.results)
+        return self.results.to_dataframe()
 
     def on_tuning_start(self, tuner):
         # We set the path of the csv file once the tuner is created, since the
         # path may change when the tuner is stopped and resumed again on a
         # different machine.
         self.csv_file = str(tuner.tuner_path / ST_RESULTS_DATAFRAME_FILENAME)
+        if self.append_only:
+            segments_path = tuner.tuner_path / ST_RESULTS_SEGMENTS_DIRNAME
+            if segments_path != self._segments_path:
+                # All results have to be stored at the new location
+                self._segments_path = segments_path
+                self._num_results_stored = 0
+                self._num_segments = 0
+            self._remove_stale_segments()
         # We only save results every ``results_update_frequency`` seconds as
         # this operation may be expensive on remote storage.
         self.save_results_at_frequency = RegularCallback(
@@ -147,8 +225,64 @@ class StoreResultsCallback(TunerCallback):
             self._start_time_stamp = perf_counter()
         if self._extra_results_composer is not None:
             self._tuner = tuner
+        self._background_writer = getattr(tuner, "background_writer", None)
 
     def on_tuning_end(self):
         # Store the results in case some results were not committed yet (since
         # they are saved every ``results_update_interval`` seconds)
         self.store_results()
+        if self._background_writer is not None:
+            self._background_writer.flush()
+
+
+def _usecols(columns: Optional[List[str]]) -> Optional[Callable[[str], bool]]:
+    # We use a callable, so that columns which are not present are ignored
+    if columns is None:
+        return None
+    columns = set(columns)
+    return lambda name: name in columns
+
+
+def iterate_results_segments(
+    tuner_path: Union[str, Path], columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterates over segments of results stored by :class:`StoreResultsCallback`
+    with ``append_only=True``, in the order they were written. Segments are
+    loaded one at a time.
+
+    :param tuner_path: Path of experiment
+    :param columns: If given, only these columns are loaded (columns not
+        present are ignored). Defaults to all columns
+    :return: Iterator over results dataframes of segments
+    """
+    segments_path = Path(tuner_path) / ST_RESULTS_SEGMENTS_DIRNAME
+    usecols = _usecols(columns)
+    for segment_file in sorted(segments_path.glob(f"*{ST_RESULTS_SEGMENT_POSTFIX}")):
+        yield pd.read_csv(segment_file, usecols=usecols)
+
+
+def load_results_dataframe(
+    tuner_path: Union[str, Path], columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Loads results stored by :class:`StoreResultsCallback`, either in a single
+    file (default) or in segments (``append_only=True``).
+
+    :param tuner_path: Path of experiment
+    :param columns: If given, only these columns are loaded (columns not
+        present are ignored). This is faster for results with many columns.
+        Defaults to all columns
+    :return: Results dataframe
+    :raises FileNotFoundError: If no results are found in ``tuner_path``
+    """
+    tuner_path = Path(tuner_path)
+    usecols = _usecols(columns)
+    results_file = tuner_path / ST_RESULTS_DATAFRAME_FILENAME
+    if results_file.exists():
+        return pd.read_csv(results_file, usecols=usecols)
+    segments = list(iterate_results_segments(tuner_path, columns=columns))
+    if segments:
+        return pd.concat(segments, ignore_index=True)
+    # Uncompressed CSV file
+    return pd.read_csv(tuner_path / ST_RESULTS_DATAFRAME_FILENAME[:-4], usecols=usecols)
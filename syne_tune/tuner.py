@@ -36,6 +36,7 @@ from syne_tune.optimizer.schedulers.remove_checkpoints import (
     RemoveCheckpointsSchedulerMixin,
 )
 from syne_tune.tuner_callback import TunerCallback
+from syne_tune.tuner_checkpoint import IncrementalTunerSaver
 from syne_tune.results_callback import StoreResultsCallback
 from syne_tune.tuning_status import TuningStatus, print_best_metric_found
 from syne_tune.util import (
@@ -45,12 +46,363 @@ from syne_tune.util import (
     name_from_base,
     dump_json_with_numpy,
     metric_name_mode,
+    BackgroundWriter,
+    run_or_submit,
 )
 
 logger = logging.getLogger(__name__)
 
 
-class Tuner:
+class TunerLoopMixin:
+    """
+    Steps of the main tuning loop, shared between :class:`Tuner` and
+    :func:`~syne_tune.experiments.fast_simulate.fast_simulate`.
+
+    The class using this mixin needs to provide the members ``trial_backend``,
+    ``scheduler``, ``stop_criterion``, ``n_workers``, ``sleep_time``,
+    ``max_failures``, ``asynchronous_scheduling``,
+    ``wait_trial_completion_when_stopping``, ``start_jobs_without_delay``,
+    ``callbacks``, ``tuning_status``, ``tuner_saver``, ``status_printer``,
+    ``last_seen_result_per_trial``, ``trials_scheduler_stopped``, as well as
+    the method ``_sleep``. ``tuner_saver`` and ``status_printer`` may be
+    ``None``, in which case the tuner is not saved and the tuning status is
+    not printed.
+    """
+
+    def _run_tuning_loop(self, done_trials_statuses: TrialAndStatusInformation):
+        """Runs the main tuning loop until the stopping condition is met
+
+        :param done_trials_statuses: Trials which are not running, along with
+            their status. Updated in place
+        """
+        # ``running_trial_ids`` contains the ids of all trials currently running,
+        # whether they were started from scratch or were resumed from a pausing
+        # state
+        running_trials_ids = set()
+
+        config_space_exhausted = False
+        stop_condition_reached = self._stop_condition()
+
+        while (
+            # we stop when either the stop condition is reached
+            not stop_condition_reached
+            # or when all trials are done if the wait_trial_completion is activated
+            or self.wait_trial_completion_when_stopping
+            and len(running_trials_ids) > 0
+        ):
+            for callback in self.callbacks:
+                callback.on_loop_start()
+
+            new_done_trial_statuses, new_results = self._process_new_results(
+                running_trials_ids=running_trials_ids,
+            )
+
+            if new_results and self.tuner_saver is not None:
+                # Save tuner state only if there have been new results
+                self.tuner_saver(tuner=self)
+
+            # update the list of done trials and remove those from ``running_trials_ids``
+            # Note: It is important to update ``running_trials_ids`` before
+            # calling ``_schedule_new_tasks``.
+            # Otherwise, a trial can be registered as paused in
+            # ``_process_new_results``, and immediately be resumed in
+            # ``_schedule_new_tasks``. If ``new_done_trial_statuses`` is subtracted from
+            # ``running_trials_ids`` afterwards only, this trial is removed from
+            # ``running_trials_ids`` even though it is running. Also, its status remains
+            # paused, because the next call of ``_process_new_results`` only considers
+            # trials in ``running_trials_ids``.
+            done_trials_statuses.update(new_done_trial_statuses)
+            running_trials_ids.difference_update(new_done_trial_statuses.keys())
+
+            if (
+                config_space_exhausted
+                or self.wait_trial_completion_when_stopping
+                and stop_condition_reached
+            ):
+                # if the search space is exhausted, we loop until the running trials are done or until the
+                # stop condition is reached
+                if len(running_trials_ids) > 0:
+                    if config_space_exhausted:
+                        logger.debug(
+                            f"Configuration space exhausted, waiting for completion of running trials "
+                            f"{running_trials_ids}"
+                        )
+                    else:
+                        logger.debug(
+                            f"Stopping criterion reached, waiting for completion of running trials "
+                            f"{running_trials_ids}"
+                        )
+                    self._sleep()
+                else:
+                    break
+            else:
+                try:
+                    self._schedule_new_tasks(running_trials_ids=running_trials_ids)
+                except StopIteration:
+                    logger.info(
+                        "Tuning is finishing as the whole configuration space got exhausted."
+                    )
+                    config_space_exhausted = True
+                    print(
+                        "Tuning is finishing as the whole configuration space got exhausted."
+                    )
+
+            if self.status_printer is not None:
+                self.status_printer(self.tuning_status)
+
+            for callback in self.callbacks:
+                callback.on_loop_end()
+
+            stop_condition_reached = self._stop_condition()
+
+    def _stop_condition(self) -> bool:
+        return (
+            self.stop_criterion(self.tuning_status)
+            or self.tuning_status.num_trials_failed > self.max_failures
+        )
+
+    def _process_new_results(
+        self, running_trials_ids: Set[int]
+    ) -> (TrialAndStatusInformation, TrialIdAndResultList):
+        """Communicates new results from the backend to the scheduler
+
+        Returns dictionary of trials which are not running, along with their
+        status, in ``done_trials_statuses``, and list of new results (tuples
+        ``(trial_id, result)``), observed since the previous call, in
+        ``new_results``.
+
+        :param running_trials_ids: Trials currently running
+        :return: ``(done_trials_statuses, new_results)``
+        """
+
+        # fetch new results
+        trial_status_dict, new_results = self.trial_backend.fetch_status_results(
+            trial_ids=list(running_trials_ids)
+        )
+
+        for callback in self.callbacks:
+            callback.on_fetch_status_results(
+                trial_status_dict=trial_status_dict, new_results=new_results
+            )
+
+        assert len(running_trials_ids) <= self.n_workers
+
+        # Gets list of trials that are done with the new results.
+        # The trials can be finished for different reasons:
+        # - they completed,
+        # - they were stopped independently of the scheduler, e.g. due to a
+        #   timeout argument or a manual interruption
+        # - scheduler decided to interrupt them.
+        # Note: ``done_trials`` includes trials which are paused.
+        done_trials_statuses = self._update_running_trials(
+            trial_status_dict, new_results
+        )
+        trial_status_dict.update(done_trials_statuses)
+
+        # update status with new results and all done trials
+        self.tuning_status.update(
+            trial_status_dict=trial_status_dict, new_results=new_results
+        )
+
+        return done_trials_statuses, new_results
+
+    def _schedule_new_tasks(self, running_trials_ids: Set[int]):
+        """Schedules new tasks if resources are available or sleep.
+
+        Note: If ``start_jobs_without_delay`` is False, we ask the backend for
+        the number of busy workers, instead of trusting ``running_trials_ids``.
+        The latter does not contain trials which have been stopped or completed,
+        but the underlying job is still not completely done.
+
+        :param running_trials_ids: set if trial-ids currently running, gets
+            updated if new trials are scheduled.
+        """
+        running_trials_threshold = self.n_workers if self.asynchronous_scheduling else 1
+        if self.start_jobs_without_delay:
+            # Assume that only the trials in ``running_trial_ids`` are busy (which
+            # is an underestimate for certain backends)
+            busy_trial_ids = None
+            num_busy_workers = len(running_trials_ids)
+        else:
+            # Ask backend how many workers are really busy
+            busy_trial_ids = self.trial_backend.busy_trial_ids()
+            num_busy_workers = len(busy_trial_ids)
+        if num_busy_workers >= running_trials_threshold:
+            # Note: For synchronous scheduling, we need to sleep here if at
+            # least one worker is busy
+            logger.debug(
+                f"{num_busy_workers} of {self.n_workers} workers are "
+                f"busy, wait for {self.sleep_time} seconds"
+            )
+            self._sleep()
+        else:
+            if not self.start_jobs_without_delay and num_busy_workers < len(
+                running_trials_ids
+            ):
+                # In this case, the information from the backend is more recent
+                running_trials_ids = set(x[0] for x in busy_trial_ids)
+            # Schedule as many trials as we have free workers
+            for _ in range(self.n_workers - num_busy_workers):
+                trial = self._schedule_new_task()
+                trial_id = trial.trial_id
+                running_trials_ids.add(trial_id)
+                # Update tuning status
+                self.tuning_status.update(
+                    trial_status_dict={trial_id: (trial, Status.in_progress)},
+                    new_results=[],
+                )
+
+    def _schedule_new_task(self) -> Optional[TrialResult]:
+        """Schedules a new task according to scheduler suggestion.
+
+        :return: Information for the trial suggested, ``None`` if the scheduler does
+            not suggest a new configuration (this can happen if its configuration
+            space is exhausted)
+        """
+        suggestion = self.scheduler.suggest(trial_id=self.trial_backend.new_trial_id())
+        if suggestion is None:
+            logger.info("Searcher ran out of candidates, tuning job is stopping.")
+            raise StopIteration
+        elif suggestion.spawn_new_trial_id:
+            # we schedule a new trial, possibly using the checkpoint of ``checkpoint_trial_id``
+            # if given.
+            trial = self.trial_backend.start_trial(
+                config=suggestion.config.copy(),
+                checkpoint_trial_id=suggestion.checkpoint_trial_id,
+            )
+            self.scheduler.on_trial_add(trial=trial)
+            for callback in self.callbacks:
+                callback.on_start_trial(trial)
+            logger.info(f"(trial {trial.trial_id}) - scheduled {suggestion}")
+            return trial
+        else:
+            # suggestion is a trial_id to resume, with possibly a new configuration
+            log_msg = f"Resuming trial {suggestion.checkpoint_trial_id}"
+            if suggestion.config is not None:
+                log_msg += f" with new_config = {suggestion.config}"
+            logger.info(log_msg)
+            trial = self.trial_backend.resume_trial(
+                trial_id=suggestion.checkpoint_trial_id, new_config=suggestion.config
+            )
+            for callback in self.callbacks:
+                callback.on_resume_trial(trial)
+            return trial
+
+    def _update_running_trials(
+        self,
+        trial_status_dict: TrialAndStatusInformation,
+        new_results: TrialIdAndResultList,
+    ) -> TrialAndStatusInformation:
+        """
+        Updates schedulers with new results and sends decision to stop/pause
+        trials to the backend. Trials can be finished because:
+
+        * the scheduler decided to stop or pause.
+        * the trial failed.
+        * the trial was stopped independently of the scheduler, e.g. due to a
+          timeout argument or a manual interruption.
+        * the trial completed.
+
+        :param trial_status_dict: Information on trials from
+            ``trial_backend.fetch_status_results``
+        :param new_results: New results from ``trial_backend.fetch_status_results``
+        :return: Dictionary mapping trial-ids that are finished to status
+        """
+        # gets the list of jobs from running_jobs that are done
+        done_trials = dict()
+
+        for trial_id, result in new_results:
+            if trial_id not in done_trials:
+                trial, status = trial_status_dict[trial_id]
+
+                # communicate new result to the searcher and the scheduler
+                self.last_seen_result_per_trial[trial_id] = result
+                decision = self.scheduler.on_trial_result(trial=trial, result=result)
+
+                for callback in self.callbacks:
+                    callback.on_trial_result(
+                        trial=trial,
+                        status=status,
+                        result=result,
+                        decision=decision,
+                    )
+
+                if decision == SchedulerDecision.STOP:
+                    if status != Status.completed:
+                        # we override the status immediately, this avoids calling the backend status another time to
+                        # update after the change which may be expensive
+                        status = Status.stopped
+                        self.trial_backend.stop_trial(trial_id=trial_id, result=result)
+                    self.scheduler.on_trial_remove(trial=trial)
+                    done_trials[trial_id] = (trial, status)
+                    self.trials_scheduler_stopped.add(trial_id)
+
+                elif decision == SchedulerDecision.PAUSE:
+                    status = Status.paused
+                    self.trial_backend.pause_trial(trial_id=trial_id, result=result)
+                    self.scheduler.on_trial_remove(trial=trial)
+                    done_trials[trial_id] = (trial, status)
+
+        for trial_id, (trial, status) in trial_status_dict.items():
+            # Status "completed", "stopped" and "failed" are signaled to scheduler.
+            # Status "in_progress" and "stopping" are not signaled, although the first one could be added
+            # to notify the scheduler of pending runtimes (even in the absence of new results).
+
+            if status == Status.completed:
+                # since the code above updates ``trial_status_dict[trial_id]`` after a pause/stop scheduling decision
+                # this callback is never called after a pause/stop scheduler decision.
+                if (
+                    trial_id not in done_trials
+                    or done_trials[trial_id][1] != Status.paused
+                ):
+                    logger.info(f"Trial trial_id {trial_id} completed.")
+                # If scheduler marks trial as ``Status.paused``, this overrides
+                # ``Status.completed`` (which was assigned because the job
+                # completed)
+                done_trial = done_trials.get(trial_id)
+                if done_trial is not None and done_trial[1] == Status.paused:
+                    status = Status.paused
+                if trial_id not in self.last_seen_result_per_trial:
+                    logger.error(
+                        f"trial {trial_id} completed and no metrics got observed, corresponding log:"
+                    )
+                    stdout = "".join(self.trial_backend.stdout(trial_id))
+                    stderr = "".join(self.trial_backend.stderr(trial_id))
+                    logger.error(stdout)
+                    logger.error(stderr)
+                    raise ValueError(
+                        f"trial {trial_id} completed and no metrics got observed"
+                    )
+
+                last_result = self.last_seen_result_per_trial[trial_id]
+                if trial_id not in done_trials:
+                    self.scheduler.on_trial_complete(trial, last_result)
+                if status == Status.completed:
+                    for callback in self.callbacks:
+                        callback.on_trial_complete(trial, last_result)
+                done_trials[trial_id] = (trial, status)
+
+            if status == Status.failed:
+                logger.info(f"Trial trial_id {trial_id} failed.")
+                self.scheduler.on_trial_error(trial)
+                done_trials[trial_id] = (trial, status)
+
+            # For the case when the trial is stopped independently of the scheduler, we choose to use
+            # scheduler.on_trial_error(...) since it was not the scheduler's decision to stop the trial.
+            if (
+                status == Status.stopped
+                and trial_id not in self.trials_scheduler_stopped
+            ):
+                logger.info(
+                    f"Trial trial_id {trial_id} was stopped independently of the scheduler."
+                )
+                self.scheduler.on_trial_error(trial)
+                done_trials[trial_id] = (trial, status)
+
+        return done_trials
+
+
+class Tuner(TunerLoopMixin):
     """
     Controller of tuning loop, manages interplay between scheduler and
     trial backend. Also, stopping criterion and number of workers are
@@ -129,6 +481,26 @@ class Tuner:
         experiment is ru remotely, we recommend to set this, since otherwise
         checkpoints and logs are synced to S3, along with tuning results, which
         is costly and error-prone.
+    :param wait_for_trial_events: If ``True``, the tuner does not sleep for
+        ``sleep_time`` seconds when all workers are busy, but waits until a busy
+        trial reports a new result or finishes, for at most ``sleep_time``
+        seconds. This is supported by
+        :class:`~syne_tune.backend.LocalBackend`, and can substantially reduce
+        idle time of workers if trials are short. Backends which do not
+        support this fall back to sleeping. Defaults to ``False``
+    :param save_tuner_incrementally: If ``True`` and ``save_tuner=True``, the
+        tuner saved every ``results_update_interval`` seconds while tuning is
+        running is written as a journal of changes on top of a base snapshot,
+        using :class:`~syne_tune.tuner_checkpoint.IncrementalTunerSaver`. This
+        is recommended for long experiments with many results, where
+        serializing the whole tuner becomes expensive. :meth:`load` replays
+        the journal, and a full snapshot is written at the end of tuning.
+        Defaults to ``False``
+    :param save_in_background: If ``True``, results, metadata and tuner
+        checkpoints are written to ``tuner_path`` by a background thread (see
+        :class:`~syne_tune.util.BackgroundWriter`), so that slow storage does
+        not delay the tuning loop. All writes are completed before :meth:`run`
+        returns. Defaults to ``False``
     """
 
     def __init__(
@@ -150,6 +522,9 @@ class Tuner:
         save_tuner: bool = True,
         start_jobs_without_delay: bool = True,
         trial_backend_path: Optional[str] = None,
+        wait_for_trial_events: bool = False,
+        save_tuner_incrementally: bool = False,
+        save_in_background: bool = False,
     ):
         self.trial_backend = trial_backend
         self.scheduler = scheduler
@@ -162,6 +537,12 @@ class Tuner:
         self.metadata = self._enrich_metadata(metadata)
         self.save_tuner = save_tuner
         self.start_jobs_without_delay = start_jobs_without_delay
+        self.wait_for_trial_events = wait_for_trial_events
+        self.background_writer = BackgroundWriter() if save_in_background else None
+        if save_tuner and save_tuner_incrementally:
+            self._incremental_saver = IncrementalTunerSaver()
+        else:
+            self._incremental_saver = None
 
         self.max_failures = max_failures
         self.print_update_interval = print_update_interval
@@ -243,7 +624,7 @@ class Tuner:
             # saves the tuner every ``results_update_interval`` seconds
             if self.save_tuner:
                 self.tuner_saver = RegularCallback(
-                    callback=lambda tuner: tuner.save(),
+                    callback=lambda tuner: tuner._save_checkpoint(),
                     call_seconds_frequency=self.results_update_interval,
                 )
 
@@ -254,86 +635,9 @@ class Tuner:
 
             self.tuner_path.mkdir(exist_ok=True, parents=True)
 
-            self._save_metadata()
-
-            # ``running_trial_ids`` contains the ids of all trials currently running,
-            # whether they were started from scratch or were resumed from a pausing
-            # state
-            running_trials_ids = set()
-
-            config_space_exhausted = False
-            stop_condition_reached = self._stop_condition()
-
-            while (
-                # we stop when either the stop condition is reached
-                not stop_condition_reached
-                # or when all trials are done if the wait_trial_completion is activated
-                or self.wait_trial_completion_when_stopping
-                and len(running_trials_ids) > 0
-            ):
-                for callback in self.callbacks:
-                    callback.on_loop_start()
-
-                new_done_trial_statuses, new_results = self._process_new_results(
-                    running_trials_ids=running_trials_ids,
-                )
-
-                if new_results and self.save_tuner:
-                    # Save tuner state only if there have been new results
-                    self.tuner_saver(tuner=self)
-
-                # update the list of done trials and remove those from ``running_trials_ids``
-                # Note: It is important to update ``running_trials_ids`` before
-                # calling ``_schedule_new_tasks``.
-                # Otherwise, a trial can be registered as paused in
-                # ``_process_new_results``, and immediately be resumed in
-                # ``_schedule_new_tasks``. If ``new_done_trial_statuses`` is subtracted from
-                # ``running_trials_ids`` afterwards only, this trial is removed from
-                # ``running_trials_ids`` even though it is running. Also, its status remains
-                # paused, because the next call of ``_process_new_results`` only considers
-                # trials in ``running_trials_ids``.
-                done_trials_statuses.update(new_done_trial_statuses)
-                running_trials_ids.difference_update(new_done_trial_statuses.keys())
-
-                if (
-                    config_space_exhausted
-                    or self.wait_trial_completion_when_stopping
-                    and stop_condition_reached
-                ):
-                    # if the search space is exhausted, we loop until the running trials are done or until the
-                    # stop condition is reached
-                    if len(running_trials_ids) > 0:
-                        if config_space_exhausted:
-                            logger.debug(
-                                f"Configuration space exhausted, waiting for completion of running trials "
-                                f"{running_trials_ids}"
-                            )
-                        else:
-                            logger.debug(
-                                f"Stopping criterion reached, waiting for completion of running trials "
-                                f"{running_trials_ids}"
-                            )
-                        self._sleep()
-                    else:
-                        break
-                else:
-                    try:
-                        self._schedule_new_tasks(running_trials_ids=running_trials_ids)
-                    except StopIteration:
-                        logger.info(
-                            "Tuning is finishing as the whole configuration space got exhausted."
-                        )
-                        config_space_exhausted = True
-                        print(
-                            "Tuning is finishing as the whole configuration space got exhausted."
-                        )
-
-                self.status_printer(self.tuning_status)
-
-                for callback in self.callbacks:
-                    callback.on_loop_end()
+            self._save_metadata()
 
-                stop_condition_reached = self._stop_condition()
+            self._run_tuning_loop(done_trials_statuses)
         except Exception as e:
             logger.error(
                 "An error happened during the tuning, cleaning up resources and logging final resources "
@@ -357,6 +661,8 @@ class Tuner:
             # Serialize Tuner object
             if self.save_tuner:
                 self.save()
+            if self.background_writer is not None:
+                self.background_writer.close()
 
             logger.info("Stopping trials that may still be running.")
             self.trial_backend.stop_all()
@@ -374,9 +680,15 @@ class Tuner:
             )
 
     def _sleep(self):
-        time.sleep(self.sleep_time)
+        if self.wait_for_trial_events:
+            sleep_time = self.trial_backend.wait_for_trial_event(
+                timeout=self.sleep_time
+            )
+        else:
+            time.sleep(self.sleep_time)
+            sleep_time = self.sleep_time
         for callback in self.callbacks:
-            callback.on_tuning_sleep(self.sleep_time)
+            callback.on_tuning_sleep(sleep_time)
 
     @staticmethod
     def _set_metadata(metadata: Dict[str, Any], name: str, value):
@@ -402,141 +714,12 @@ class Tuner:
         return res
 
     def _save_metadata(self):
-        dump_json_with_numpy(self.metadata, self.tuner_path / ST_METADATA_FILENAME)
-
-    def _stop_condition(self) -> bool:
-        return (
-            self.stop_criterion(self.tuning_status)
-            or self.tuning_status.num_trials_failed > self.max_failures
-        )
-
-    def _process_new_results(
-        self, running_trials_ids: Set[int]
-    ) -> (TrialAndStatusInformation, TrialIdAndResultList):
-        """Communicates new results from the backend to the scheduler
-
-        Returns dictionary of trials which are not running, along with their
-        status, in ``done_trials_statuses``, and list of new results (tuples
-        ``(trial_id, result)``), observed since the previous call, in
-        ``new_results``.
-
-        :param running_trials_ids: Trials currently running
-        :return: ``(done_trials_statuses, new_results)``
-        """
-
-        # fetch new results
-        trial_status_dict, new_results = self.trial_backend.fetch_status_results(
-            trial_ids=list(running_trials_ids)
-        )
-
-        for callback in self.callbacks:
-            callback.on_fetch_status_results(
-                trial_status_dict=trial_status_dict, new_results=new_results
-            )
-
-        assert len(running_trials_ids) <= self.n_workers
-
-        # Gets list of trials that are done with the new results.
-        # The trials can be finished for different reasons:
-        # - they completed,
-        # - they were stopped independently of the scheduler, e.g. due to a
-        #   timeout argument or a manual interruption
-        # - scheduler decided to interrupt them.
-        # Note: ``done_trials`` includes trials which are paused.
-        done_trials_statuses = self._update_running_trials(
-            trial_status_dict, new_results
-        )
-        trial_status_dict.update(done_trials_statuses)
-
-        # update status with new results and all done trials
-        self.tuning_status.update(
-            trial_status_dict=trial_status_dict, new_results=new_results
+        metadata_json = dump_json_with_numpy(self.metadata)
+        metadata_path = self.tuner_path / ST_METADATA_FILENAME
+        run_or_submit(
+            lambda: metadata_path.write_text(metadata_json), self.background_writer
         )
 
-        return done_trials_statuses, new_results
-
-    def _schedule_new_tasks(self, running_trials_ids: Set[int]):
-        """Schedules new tasks if resources are available or sleep.
-
-        Note: If ``start_jobs_without_delay`` is False, we ask the backend for
-        the number of busy workers, instead of trusting ``running_trials_ids``.
-        The latter does not contain trials which have been stopped or completed,
-        but the underlying job is still not completely done.
-
-        :param running_trials_ids: set if trial-ids currently running, gets
-            updated if new trials are scheduled.
-        """
-        running_trials_threshold = self.n_workers if self.asynchronous_scheduling else 1
-        if self.start_jobs_without_delay:
-            # Assume that only the trials in ``running_trial_ids`` are busy (which
-            # is an underestimate for certain backends)
-            busy_trial_ids = None
-            num_busy_workers = len(running_trials_ids)
-        else:
-            # Ask backend how many workers are really busy
-            busy_trial_ids = self.trial_backend.busy_trial_ids()
-            num_busy_workers = len(busy_trial_ids)
-        if num_busy_workers >= running_trials_threshold:
-            # Note: For synchronous scheduling, we need to sleep here if at
-            # least one worker is busy
-            logger.debug(
-                f"{num_busy_workers} of {self.n_workers} workers are "
-                f"busy, wait for {self.sleep_time} seconds"
-            )
-            self._sleep()
-        else:
-            if not self.start_jobs_without_delay and num_busy_workers < len(
-                running_trials_ids
-            ):
-                # In this case, the information from the backend is more recent
-                running_trials_ids = set(x[0] for x in busy_trial_ids)
-            # Schedule as many trials as we have free workers
-            for _ in range(self.n_workers - num_busy_workers):
-                trial = self._schedule_new_task()
-                trial_id = trial.trial_id
-                running_trials_ids.add(trial_id)
-                # Update tuning status
-                self.tuning_status.update(
-                    trial_status_dict={trial_id: (trial, Status.in_progress)},
-                    new_results=[],
-                )
-
-    def _schedule_new_task(self) -> Optional[TrialResult]:
-        """Schedules a new task according to scheduler suggestion.
-
-        :return: Information for the trial suggested, ``None`` if the scheduler does
-            not suggest a new configuration (this can happen if its configuration
-            space is exhausted)
-        """
-        suggestion = self.scheduler.suggest(trial_id=self.trial_backend.new_trial_id())
-        if suggestion is None:
-            logger.info("Searcher ran out of candidates, tuning job is stopping.")
-            raise StopIteration
-        elif suggestion.spawn_new_trial_id:
-            # we schedule a new trial, possibly using the checkpoint of ``checkpoint_trial_id``
-            # if given.
-            trial = self.trial_backend.start_trial(
-                config=suggestion.config.copy(),
-                checkpoint_trial_id=suggestion.checkpoint_trial_id,
-            )
-            self.scheduler.on_trial_add(trial=trial)
-            for callback in self.callbacks:
-                callback.on_start_trial(trial)
-            logger.info(f"(trial {trial.trial_id}) - scheduled {suggestion}")
-            return trial
-        else:
-            # suggestion is a trial_id to resume, with possibly a new configuration
-            log_msg = f"Resuming trial {suggestion.checkpoint_trial_id}"
-            if suggestion.config is not None:
-                log_msg += f" with new_config = {suggestion.config}"
-            logger.info(log_msg)
-            trial = self.trial_backend.resume_trial(
-                trial_id=suggestion.checkpoint_trial_id, new_config=suggestion.config
-            )
-            for callback in self.callbacks:
-                callback.on_resume_trial(trial)
-            return trial
-
     def _handle_failure(self, done_trials_statuses: Dict[int, Tuple[Trial, str]]):
         logger.error(f"Stopped as {self.max_failures} failures were reached")
         for trial_id, (_, status) in done_trials_statuses.items():
@@ -549,6 +732,16 @@ class Tuner:
                 raise ValueError(f"Trial - {trial_id} failed")
 
     def save(self, folder: Optional[str] = None):
+        if self.background_writer is not None:
+            # Pending writes must not overtake this one
+            self.background_writer.flush()
+        if self._incremental_saver is not None and (
+            folder is None or Path(folder) == self.tuner_path
+        ):
+            # Writes full snapshot and clears the journal
+            self._incremental_saver.save(self, compact=True)
+            self.trial_backend.on_tuner_save()  # callback
+            return
         if folder is None:
             tuner_serialized_path = self.tuner_path / ST_TUNER_DILL_FILENAME
         else:
@@ -558,125 +751,32 @@ class Tuner:
             dill.dump(self, f)
             self.trial_backend.on_tuner_save()  # callback
 
+    def _save_checkpoint(self):
+        """
+        Called every ``results_update_interval`` seconds while tuning is
+        running, if there have been new results.
+        """
+        if self._incremental_saver is not None:
+            self._incremental_saver.save(self, writer=self.background_writer)
+        else:
+            tuner_serialized_path = self.tuner_path / ST_TUNER_DILL_FILENAME
+            logger.debug(f"saving tuner in {tuner_serialized_path}")
+            tuner_serialized = dill.dumps(self)
+            run_or_submit(
+                lambda: tuner_serialized_path.write_bytes(tuner_serialized),
+                self.background_writer,
+            )
+        self.trial_backend.on_tuner_save()  # callback
+
     @staticmethod
     def load(tuner_path: Optional[str]):
         with open(Path(tuner_path) / ST_TUNER_DILL_FILENAME, "rb") as f:
             tuner = dill.load(f)
-            tuner.tuner_path = Path(experiment_path(tuner_name=tuner.name))
-            return tuner
-
-    def _update_running_trials(
-        self,
-        trial_status_dict: TrialAndStatusInformation,
-        new_results: TrialIdAndResultList,
-    ) -> TrialAndStatusInformation:
-        """
-        Updates schedulers with new results and sends decision to stop/pause
-        trials to the backend. Trials can be finished because:
-
-        * the scheduler decided to stop or pause.
-        * the trial failed.
-        * the trial was stopped independently of the scheduler, e.g. due to a
-          timeout argument or a manual interruption.
-        * the trial completed.
-
-        :param trial_status_dict: Information on trials from
-            ``trial_backend.fetch_status_results``
-        :param new_results: New results from ``trial_backend.fetch_status_results``
-        :return: Dictionary mapping trial-ids that are finished to status
-        """
-        # gets the list of jobs from running_jobs that are done
-        done_trials = dict()
-
-        for trial_id, result in new_results:
-            if trial_id not in done_trials:
-                trial, status = trial_status_dict[trial_id]
-
-                # communicate new result to the searcher and the scheduler
-                self.last_seen_result_per_trial[trial_id] = result
-                decision = self.scheduler.on_trial_result(trial=trial, result=result)
-
-                for callback in self.callbacks:
-                    callback.on_trial_result(
-                        trial=trial,
-                        status=status,
-                        result=result,
-                        decision=decision,
-                    )
-
-                if decision == SchedulerDecision.STOP:
-                    if status != Status.completed:
-                        # we override the status immediately, this avoids calling the backend status another time to
-                        # update after the change which may be expensive
-                        status = Status.stopped
-                        self.trial_backend.stop_trial(trial_id=trial_id, result=result)
-                    self.scheduler.on_trial_remove(trial=trial)
-                    done_trials[trial_id] = (trial, status)
-                    self.trials_scheduler_stopped.add(trial_id)
-
-                elif decision == SchedulerDecision.PAUSE:
-                    status = Status.paused
-                    self.trial_backend.pause_trial(trial_id=trial_id, result=result)
-                    self.scheduler.on_trial_remove(trial=trial)
-                    done_trials[trial_id] = (trial, status)
-
-        for trial_id, (trial, status) in trial_status_dict.items():
-            # Status "completed", "stopped" and "failed" are signaled to scheduler.
-            # Status "in_progress" and "stopping" are not signaled, although the first one could be added
-            # to notify the scheduler of pending runtimes (even in the absence of new results).
-
-            if status == Status.completed:
-                # since the code above updates ``trial_status_dict[trial_id]`` after a pause/stop scheduling decision
-                # this callback is never called after a pause/stop scheduler decision.
-                if (
-                    trial_id not in done_trials
-                    or done_trials[trial_id][1] != Status.paused
-                ):
-                    logger.info(f"Trial trial_id {trial_id} completed.")
-                # If scheduler marks trial as ``Status.paused``, this overrides
-                # ``Status.completed`` (which was assigned because the job
-                # completed)
-                done_trial = done_trials.get(trial_id)
-                if done_trial is not None and done_trial[1] == Status.paused:
-                    status = Status.paused
-                if trial_id not in self.last_seen_result_per_trial:
-                    logger.error(
-                        f"trial {trial_id} completed and no metrics got observed, corresponding log:"
-                    )
-                    stdout = "".join(self.trial_backend.stdout(trial_id))
-                    stderr = "".join(self.trial_backend.stderr(trial_id))
-                    logger.error(stdout)
-                    logger.error(stderr)
-                    raise ValueError(
-                        f"trial {trial_id} completed and no metrics got observed"
-                    )
-
-                last_result = self.last_seen_result_per_trial[trial_id]
-                if trial_id not in done_trials:
-                    self.scheduler.on_trial_complete(trial, last_result)
-                if status == Status.completed:
-                    for callback in self.callbacks:
-                        callback.on_trial_complete(trial, last_result)
-                done_trials[trial_id] = (trial, status)
-
-            if status == Status.failed:
-                logger.info(f"Trial trial_id {trial_id} failed.")
-                self.scheduler.on_trial_error(trial)
-                done_trials[trial_id] = (trial, status)
-
-            # For the case when the trial is stopped independently of the scheduler, we choose to use
-            # scheduler.on_trial_error(...) since it was not the scheduler's decision to stop the trial.
-            if (
-                status == Status.stopped
-                and trial_id not in self.trials_scheduler_stopped
-            ):
-                logger.info(
-                    f"Trial trial_id {trial_id} was stopped independently of the scheduler."
-                )
-                self.scheduler.on_trial_error(trial)
-                done_trials[trial_id] = (trial, status)
-
-        return done_trials
+        incremental_saver = getattr(tuner, "_incremental_saver", None)
+        if incremental_saver is not None:
+            tuner = incremental_saver.replay_journal(tuner, tuner_path)
+        tuner.tuner_path = Path(experiment_path(tuner_name=tuner.name))
+        return tuner
 
     @staticmethod
     def _default_callback():
@@ -0,0 +1,242 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import io
+import logging
+import math
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Any, Tuple, Optional
+
+import dill
+
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+from syne_tune.constants import ST_TUNER_DILL_FILENAME, ST_TUNER_JOURNAL_FILENAME
+from syne_tune.results_callback import StoreResultsCallback
+from syne_tune.util import BackgroundWriter, run_or_submit
+
+logger = logging.getLogger(__name__)
+
+
+def _append_only_histories(tuner) -> Dict[str, List[Any]]:
+    """
+    Collects the lists in the state of ``tuner`` which grow with the number of
+    results, and to which entries are only ever appended.
+
+    :param tuner: :class:`~syne_tune.Tuner` object
+    :return: Dictionary from unique key to list
+    """
+    histories = dict()
+    for pos, callback in enumerate(tuner.callbacks):
+        if isinstance(callback, StoreResultsCallback):
+            histories[f"callback{pos}-results"] = callback.results
+    for trial_id, trial_result in tuner.trial_backend._trial_dict.items():
+        histories[f"trial{trial_id}-metrics"] = trial_result.metrics
+    return histories
+
+
+def _same_value(value: Any, other: Any) -> bool:
+    if isinstance(value, float) and isinstance(other, float):
+        return value == other or (math.isnan(value) and math.isnan(other))
+    if isinstance(value, dict) and isinstance(other, dict):
+        return value.keys() == other.keys() and all(
+            _same_value(v, other[k]) for k, v in value.items()
+        )
+    return value is other or value == other
+
+
+class _HistoryPickler(dill.Pickler):
+    def __init__(self, file, history_keys: Dict[int, str]):
+        super().__init__(file)
+        self._history_keys = history_keys
+
+    def persistent_id(self, obj):
+        return self._history_keys.get(id(obj))
+
+
+class _HistoryUnpickler(dill.Unpickler):
+    def __init__(self, file, histories: Dict[str, List[Any]]):
+        super().__init__(file)
+        self._histories = histories
+
+    def persistent_load(self, pid):
+        return self._histories[pid]
+
+
+class IncrementalTunerSaver:
+    """
+    Saves a :class:`~syne_tune.Tuner` incrementally, so that the cost of a save
+    is roughly proportional to the activity since the previous one, instead of
+    growing with the length of the experiment.
+
+    A checkpoint consists of a base snapshot ``ST_TUNER_DILL_FILENAME``, which
+    is a serialized tuner just as written by :meth:`~syne_tune.Tuner.save`,
+    and a journal ``ST_TUNER_JOURNAL_FILENAME`` of records appended to by
+    :meth:`save`. The bulk of the tuner state consists of lists of results
+    which are only ever appended to (metrics of trials in the backend, results
+    stored by :class:`~syne_tune.results_callback.StoreResultsCallback`). A
+    journal record contains the entries appended to these lists since the
+    previous record, along with the remaining (core) state of the tuner,
+    which refers to these lists by key. The core state is written in full,
+    since the state of the scheduler cannot be reconstructed by replaying
+    results without repeating its decisions.
+
+    :meth:`load` replays the journal on top of the base snapshot. Once the
+    journal has grown larger than the base snapshot, it is compacted: a new
+    base snapshot is written, and the journal is started afresh.
+    """
+
+    def __init__(self):
+        # Incremented whenever a new base snapshot is written. Journal records
+        # of a different generation are ignored
+        self.generation = 0
+        # Maps key of history to its length and last entry, when last saved
+        self._stored_histories: Dict[str, Tuple[int, Any]] = dict()
+        self._base_size = 0
+        self._journal_size = 0
+
+    def _stored_length(self, key: str, history: List[Any]) -> int:
+        length, last_entry = self._stored_histories.get(key, (0, None))
+        # Entries of :class:`~syne_tune.backend.metrics_buffer.MetricsBuffer`
+        # are fresh copies, so NaN values have to be compared as equal
+        if length > len(history) or (
+            length > 0 and not _same_value(history[length - 1], last_entry)
+        ):
+            length = 0  # History is not an extension of what was stored
+        return length
+
+    def _update_stored_histories(self, histories: Dict[str, List[Any]]):
+        self._stored_histories = {
+            key: (len(history), history[-1] if history else None)
+            for key, history in histories.items()
+        }
+
+    def save(
+        self,
+        tuner,
+        compact: bool = False,
+        writer: Optional[BackgroundWriter] = None,
+    ):
+        """
+        Appends a record to the journal in ``tuner.tuner_path``, or writes a
+        new base snapshot if the journal has grown too large or ``compact`` is
+        ``True``.
+
+        :param tuner: :class:`~syne_tune.Tuner` object to be saved
+        :param compact: If ``True``, a new base snapshot is written in any case
+        :param writer: If given, files are written by this background writer.
+            The tuner is serialized before this method returns
+        """
+        tuner_path = Path(tuner.tuner_path)
+        histories = _append_only_histories(tuner)
+        if compact or self._base_size == 0 or self._journal_size > self._base_size:
+            self._save_base_snapshot(tuner, tuner_path, histories, writer)
+        else:
+            self._append_journal_record(tuner, tuner_path, histories, writer)
+
+    def _save_base_snapshot(
+        self,
+        tuner,
+        tuner_path: Path,
+        histories: Dict[str, List[Any]],
+        writer: Optional[BackgroundWriter],
+    ):
+        self.generation += 1
+        self._update_stored_histories(histories)
+        self._journal_size = 0
+        base_path = tuner_path / ST_TUNER_DILL_FILENAME
+        journal_path = tuner_path / ST_TUNER_JOURNAL_FILENAME
+        logger.debug(f"saving tuner in {base_path}")
+        base_snapshot = dill.dumps(tuner)
+        self._base_size = len(base_snapshot)
+
+        def write_base_snapshot():
+            tmp_path = base_path.with_name(base_path.name + ".tmp")
+            tmp_path.write_bytes(base_snapshot)
+            os.replace(tmp_path, base_path)
+            journal_path.unlink(missing_ok=True)
+
+        run_or_submit(write_base_snapshot, writer)
+
+    def _append_journal_record(
+        self,
+        tuner,
+        tuner_path: Path,
+        histories: Dict[str, List[Any]],
+        writer: Optional[BackgroundWriter],
+    ):
+        deltas = dict()
+        for key, history in histories.items():
+            start = self._stored_length(key, history)
+            if start < len(history) or key not in self._stored_histories:
+                deltas[key] = (start, history[start:])
+        # The core state contains this object, so it has to be updated first
+        self._update_stored_histories(histories)
+        core = io.BytesIO()
+        history_keys = {id(history): key for key, history in histories.items()}
+        _HistoryPickler(core, history_keys).dump(tuner)
+        record = dill.dumps(
+            dict(generation=self.generation, core=core.getvalue(), deltas=deltas)
+        )
+        journal_path = tuner_path / ST_TUNER_JOURNAL_FILENAME
+        logger.debug(f"appending tuner checkpoint to {journal_path}")
+
+        def append_record():
+            with open(journal_path, "ab") as f:
+                f.write(record)
+
+        run_or_submit(append_record, writer)
+        self._journal_size += len(record)
+
+    def replay_journal(self, tuner, tuner_path: Path):
+        """
+        Replays the journal in ``tuner_path`` on top of ``tuner``, which has
+        been loaded from the base snapshot this object belongs to.
+
+        :param tuner: :class:`~syne_tune.Tuner` object loaded from base snapshot
+        :param tuner_path: Path containing the journal
+        :return: Tuner object with state of the most recent journal record
+        """
+        journal_path = Path(tuner_path) / ST_TUNER_JOURNAL_FILENAME
+        if not journal_path.exists():
+            return tuner
+        histories = _append_only_histories(tuner)
+        core = None
+        with open(journal_path, "rb") as f:
+            while True:
+                try:
+                    record = dill.load(f)
+                except EOFError:
+                    break
+                except pickle.UnpicklingError:
+                    logger.warning(f"{journal_path}: Ignoring incomplete final record")
+                    break
+                if record["generation"] != self.generation:
+                    continue  # Record belongs to an earlier base snapshot
+                if any(
+                    start > len(histories.get(key, []))
+                    for key, (start, _) in record["deltas"].items()
+                ):
+                    logger.warning(
+                        f"{journal_path}: Records are missing, ignoring the "
+                        "remaining journal"
+                    )
+                    break
+                for key, (start, entries) in record["deltas"].items():
+                    history = histories.setdefault(key, MetricsBuffer())
+                    del history[start:]
+                    history.extend(entries)
+                core = record["core"]
+        if core is None:
+            return tuner
+        return _HistoryUnpickler(io.BytesIO(core), histories).load()
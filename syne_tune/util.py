@@ -12,13 +12,15 @@
 # permissions and limitations under the License.
 import json
 import os
+import queue
 import re
 import string
 import random
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Union, Dict, Any, Iterable
+from typing import Optional, List, Union, Dict, Any, Iterable, Callable
 from time import perf_counter
 from contextlib import contextmanager
 from typing import Tuple, Union, List
@@ -61,6 +63,102 @@ class RegularCallback:
             self.callback(*args, **kwargs)
 
 
+class BackgroundWriter:
+    """
+    Runs write jobs (functions without arguments) submitted by :meth:`submit`
+    on a single background thread, in the order they were submitted. This
+    allows the tuning loop to continue while results or snapshots are written
+    to slow storage. Jobs must only use data which is not modified on the main
+    thread afterwards.
+
+    If ``max_queue_size`` jobs are pending, :meth:`submit` blocks until one of
+    them is done. An exception raised by a job is logged, and re-raised by the
+    next call of :meth:`submit`, :meth:`flush` or :meth:`close`.
+
+    Objects can be serialized along with the tuner. The background thread is
+    started once the first job is submitted.
+
+    :param max_queue_size: Maximum number of pending jobs. Defaults to 16
+    """
+
+    def __init__(self, max_queue_size: int = 16):
+        self.max_queue_size = max_queue_size
+        self._queue = None
+        self._thread = None
+        self._error = None
+
+    def __getstate__(self):
+        return {"max_queue_size": self.max_queue_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def submit(self, job: Callable[[], Any]):
+        """
+        :param job: Write job to be run on the background thread
+        """
+        self._raise_error()
+        if self._thread is None:
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._thread = threading.Thread(
+                target=self._run, name="syne-tune-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put(job)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                job()
+            except Exception as ex:
+                logger.error(f"Error in background write job:\n{ex}")
+                if self._error is None:
+                    self._error = ex
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    def flush(self):
+        """
+        Blocks until all jobs submitted so far are done.
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """
+        Runs all pending jobs and stops the background thread. A subsequent
+        :meth:`submit` starts a new thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._queue = None
+        self._raise_error()
+
+
+def run_or_submit(job: Callable[[], Any], writer: Optional[BackgroundWriter]):
+    """
+    :param job: Write job
+    :param writer: If given, ``job`` is submitted to this writer. Otherwise,
+        it is run right away
+    """
+    if writer is None:
+        job()
+    else:
+        writer.submit(job)
+
+
 def experiment_path(
     tuner_name: Optional[str] = None, local_path: Optional[str] = None
 ) -> Path:
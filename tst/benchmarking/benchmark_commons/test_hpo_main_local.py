@@ -10,11 +10,25 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import json
+import os
+from pathlib import Path
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
+
+from syne_tune.blackbox_repository import repository, simulated_tabular_backend
+from syne_tune.blackbox_repository import blackbox_cache as blackbox_cache_module
+from syne_tune.blackbox_repository.blackbox_cache import BlackboxCache
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.constants import ST_METADATA_FILENAME, ST_RESULTS_DATAFRAME_FILENAME
+from syne_tune.experiments.benchmark_definitions import SurrogateBenchmarkDefinition
 from syne_tune.experiments.default_baselines import RandomSearch
 from syne_tune.experiments.launchers.hpo_main_common import ConfigDict
+from syne_tune.experiments.launchers.utils import effective_random_seed
 from benchmarking.nursery.benchmark_multiobjective.baselines import (
     Methods,
     MOREA,
@@ -24,7 +38,8 @@ from benchmarking.nursery.benchmark_multiobjective.benchmark_definitions import
     nas201_mo_benchmark,
 )
 from benchmarking.nursery.benchmark_multiobjective.hpo_main import main
-from syne_tune.config_space import choice
+from syne_tune.config_space import choice, randint
+from syne_tune.experiments.launchers import hpo_main_simulator
 
 
 class HPOMainLocalTests(unittest.TestCase):
@@ -91,6 +106,7 @@ class HPOMainLocalTests(unittest.TestCase):
                 "support_checkpointing": True,
                 "fcnet_ordinal": "nn-log",
                 "restrict_configurations": False,
+                "num_workers": 1,
                 "seeds": seeds,
             }
         )
@@ -99,3 +115,178 @@ class HPOMainLocalTests(unittest.TestCase):
 
         expected_call_count = len(methods) * len(benchmark_definitions) * len(seeds)
         assert mock_tuner.call_count == expected_call_count
+
+    @patch(
+        "syne_tune.experiments.launchers.hpo_main_simulator.config_from_argparse",
+        new_callable=MagicMock,
+    )
+    @patch(
+        "syne_tune.experiments.launchers.hpo_main_simulator.Tuner",
+        new_callable=MagicMock,
+    )
+    @patch(
+        "syne_tune.experiments.launchers.hpo_main_simulator.BlackboxRepositoryBackend.blackbox",
+        new_callable=MagicMock,
+    )
+    def test_experiments_run_in_parallel(
+        self, mock_blackbox, mock_tuner, mock_config_from_argparse
+    ):
+        config_space = {"hp_x0": choice(["a", "b"]), "epochs": 200}
+        mock_blackbox.configuration_space_with_max_resource_attr.return_value = (
+            config_space
+        )
+        seeds = [0, 1, 2]
+        master_random_seed = 31415927
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+
+            # Experiments run in worker processes, so we record them in files
+            def create_method(name: str, fails: bool = False):
+                def method(method_arguments):
+                    if fails:
+                        raise ValueError("method fails")
+                    seed = method_arguments.random_seed
+                    (tmp_path / f"{name}-{seed}").touch()
+                    return RandomSearch(method_arguments)
+
+                return method
+
+            methods = {
+                Methods.RS: create_method(Methods.RS),
+                Methods.MOREA: create_method(Methods.MOREA, fails=True),
+                Methods.LSOBO: create_method(Methods.LSOBO),
+            }
+            benchmark_definitions = {
+                "nas201-cifar10": nas201_mo_benchmark("cifar10"),
+            }
+            mock_config_from_argparse.return_value = ConfigDict.from_dict(
+                {
+                    "experiment_tag": "my-new-experiment",
+                    "num_seeds": len(seeds),
+                    "start_seed": False,
+                    "method": None,
+                    "save_tuner": False,
+                    "n_workers": None,
+                    "max_wallclock_time": None,
+                    "random_seed": master_random_seed,
+                    "max_size_data_for_model": None,
+                    "scale_max_wallclock_time": False,
+                    "use_long_tuner_name_prefix": True,
+                    "launched_remotely": False,
+                    "benchmark": None,
+                    "verbose": False,
+                    "support_checkpointing": True,
+                    "fcnet_ordinal": "nn-log",
+                    "restrict_configurations": False,
+                    "num_workers": 3,
+                    "seeds": seeds,
+                }
+            )
+
+            # Failure of one method does not stop the others
+            with self.assertRaises(RuntimeError):
+                main(methods, benchmark_definitions)
+            expected_files = {
+                f"{name}-{effective_random_seed(master_random_seed, seed)}"
+                for name in (Methods.RS, Methods.LSOBO)
+                for seed in seeds
+            }
+            assert {path.name for path in tmp_path.iterdir()} == expected_files
+
+    @patch(
+        "syne_tune.experiments.launchers.hpo_main_simulator.config_from_argparse",
+        new_callable=MagicMock,
+    )
+    def test_parallel_and_sequential_results_are_the_same(
+        self, mock_config_from_argparse
+    ):
+        n = 10
+        num_epochs = 5
+        random_state = np.random.RandomState(0)
+        objectives_evaluations = random_state.rand(n, 1, num_epochs, 2)
+        objectives_evaluations[..., 1] = np.cumsum(
+            objectives_evaluations[..., 1], axis=2
+        )
+        blackbox = BlackboxTabular(
+            hyperparameters=pd.DataFrame({"hp_x": np.arange(n)}),
+            configuration_space={"hp_x": randint(0, n - 1)},
+            fidelity_space={"epoch": randint(1, num_epochs)},
+            objectives_evaluations=objectives_evaluations,
+            objectives_names=["error", "elapsed_time"],
+        )
+        # Surrogate fitting is random
+        benchmark_definitions = {
+            "my-benchmark": SurrogateBenchmarkDefinition(
+                max_wallclock_time=3600,
+                n_workers=2,
+                elapsed_time_attr="elapsed_time",
+                metric="error",
+                mode="min",
+                blackbox_name="my-blackbox",
+                dataset_name="task",
+                max_num_evaluations=30,
+                surrogate="RandomForestRegressor",
+                surrogate_kwargs={"n_estimators": 3},
+            )
+        }
+        methods = {Methods.RS: RandomSearch}
+        seeds = [0, 1]
+        columns = ["trial_id", "hp_x", "epoch", "error", "elapsed_time"]
+        results = dict()
+        for num_workers in (1, 2):
+            mock_config_from_argparse.return_value = ConfigDict.from_dict(
+                {
+                    "experiment_tag": "my-new-experiment",
+                    "num_seeds": len(seeds),
+                    "start_seed": False,
+                    "method": None,
+                    "save_tuner": False,
+                    "n_workers": None,
+                    "max_wallclock_time": None,
+                    "random_seed": 31415927,
+                    "max_size_data_for_model": None,
+                    "scale_max_wallclock_time": False,
+                    "use_long_tuner_name_prefix": True,
+                    "launched_remotely": False,
+                    "benchmark": None,
+                    "verbose": False,
+                    "support_checkpointing": True,
+                    "fcnet_ordinal": "nn-log",
+                    "restrict_configurations": False,
+                    "num_workers": num_workers,
+                    "seeds": seeds,
+                }
+            )
+            # Nothing is cached, so that each run fits its own surrogate
+            with tempfile.TemporaryDirectory() as tmp_dir, patch.dict(
+                os.environ, {"SYNETUNE_FOLDER": tmp_dir}
+            ), patch.object(
+                repository, "load_blackbox", return_value={"task": blackbox}
+            ), patch.object(
+                blackbox_cache_module, "_blackbox_cache", BlackboxCache(max_size=0)
+            ), patch.object(
+                simulated_tabular_backend,
+                "add_surrogate",
+                wraps=simulated_tabular_backend.add_surrogate,
+            ) as mock_add_surrogate:
+                hpo_main_simulator.main(methods, benchmark_definitions)
+                if num_workers == 1:
+                    # Each experiment fits its surrogate with its own seed
+                    surrogate_seeds = [
+                        call.kwargs["random_seed"]
+                        for call in mock_add_surrogate.call_args_list
+                    ]
+                    assert sorted(surrogate_seeds) == sorted(
+                        effective_random_seed(31415927, seed) for seed in seeds
+                    )
+                results[num_workers] = dict()
+                for path in Path(tmp_dir).iterdir():
+                    seed = json.loads((path / ST_METADATA_FILENAME).read_text())["seed"]
+                    df = pd.read_csv(path / ST_RESULTS_DATAFRAME_FILENAME)
+                    results[num_workers][seed] = df.rename(
+                        columns={"config_hp_x": "hp_x"}
+                    )[columns]
+        assert set(results[1].keys()) == set(seeds)
+        for seed in seeds:
+            pd.testing.assert_frame_equal(results[1][seed], results[2][seed])
@@ -14,11 +14,12 @@ import tempfile
 
 import numpy as np
 import pandas as pd
+import pytest
 
 import syne_tune.config_space as sp
 
 from syne_tune.blackbox_repository import BlackboxOffline
-from syne_tune.blackbox_repository.blackbox import from_function
+from syne_tune.blackbox_repository.blackbox import Blackbox, from_function
 from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
 from syne_tune.blackbox_repository.blackbox_offline import (
     deserialize as deserialize_offline,
@@ -192,7 +193,8 @@ def test_blackbox_offline_fidelities():
             assert (res == np.array([u * v, 0.5 * u * v]).reshape(2, 1)).all()
 
 
-def test_blackbox_tabular_serialization():
+@pytest.mark.parametrize("mmap_mode", [None, "r", "c"])
+def test_blackbox_tabular_serialization(mmap_mode):
     hyperparameters = pd.DataFrame(
         data=np.stack([x1, x2]).T, columns=["hp_x1", "hp_x2"]
     )
@@ -219,7 +221,7 @@ def test_blackbox_tabular_serialization():
     with tempfile.TemporaryDirectory() as tmpdirname:
         print(f"serializing and deserializing blackbox in folder {tmpdirname}")
         serialize_tabular(bb_dict, tmpdirname)
-        bb_dict2 = deserialize_tabular(tmpdirname)
+        bb_dict2 = deserialize_tabular(tmpdirname, mmap_mode=mmap_mode)
 
         print(
             bb_dict2["slice"].objective_function(
@@ -238,6 +240,16 @@ def test_blackbox_tabular_serialization():
                 bb1.objectives_evaluations.reshape(-1),
                 bb2.objectives_evaluations.reshape(-1),
             )
+            assert bb2.objectives_evaluations.flags.writeable == (mmap_mode != "r")
+
+        if mmap_mode == "c":
+            # Changes must not be written to disk
+            bb_dict2["slice"].objectives_evaluations[:] = 0
+            bb_dict3 = deserialize_tabular(tmpdirname, mmap_mode="r")
+            np.testing.assert_allclose(
+                bb_dict["slice"].objectives_evaluations.reshape(-1),
+                bb_dict3["slice"].objectives_evaluations.reshape(-1),
+            )
 
         # blackbox.serialize(tmpdirname)
         # blackbox_deserialized = deserialize(tmpdirname)
@@ -292,3 +304,113 @@ def test_blackbox_tabular():
     assert np.allclose(
         np.ravel(objectives_evaluations.transpose((1, 0, 2, 3))), np.ravel(y.to_numpy())
     )
+
+
+def test_blackbox_tabular_batch():
+    data = np.stack([x1, x2]).T
+    hyperparameters = pd.DataFrame(data=data, columns=["hp_x1", "hp_x2"])
+    num_evals = len(hyperparameters)
+    num_seeds = 3
+    num_fidelities = 5
+    num_objectives = 2
+    objectives_evaluations = np.random.rand(
+        num_evals, num_seeds, num_fidelities, num_objectives
+    )
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["a", "b"],
+    )
+    random_state = np.random.RandomState(0)
+    positions = random_state.randint(0, num_evals, size=20)
+    configs = [{"hp_x1": x1[pos], "hp_x2": x2[pos]} for pos in positions]
+    fidelities = random_state.randint(1, num_fidelities + 1, size=20)
+    seeds = random_state.randint(0, num_seeds, size=20)
+
+    res = blackbox.objective_function_batch(configs, fidelities=fidelities, seeds=seeds)
+    assert res.shape == (20, num_objectives)
+    for pos, config, fidelity, seed, res_row in zip(
+        positions, configs, fidelities, seeds, res
+    ):
+        expected = objectives_evaluations[pos, seed, fidelity - 1, :]
+        assert np.allclose(res_row, expected)
+        res_single = blackbox.objective_function(config, fidelity=fidelity, seed=seed)
+        assert np.allclose(list(res_single.values()), expected)
+    # Default implementation in base class gives the same
+    res_base = Blackbox.objective_function_batch(
+        blackbox,
+        configs,
+        fidelities=[{"hp_epoch": fidelity} for fidelity in fidelities],
+        seeds=seeds,
+    )
+    assert np.allclose(res_base, res)
+    # All fidelities, single seed
+    res = blackbox.objective_function_batch(configs, seeds=1)
+    assert np.allclose(res, objectives_evaluations[positions, 1, :, :])
+
+    with pytest.raises(ValueError):
+        blackbox.objective_function_batch([{"hp_x1": -1.0, "hp_x2": x2[0]}])
+
+
+def _impute_objectives_values_reference(objectives_evaluations):
+    # Former implementation of ``BlackboxTabular._impute_objectives_values``
+    objectives_evaluations = objectives_evaluations.copy()
+    (
+        num_configs,
+        num_seeds,
+        num_fidelities,
+        num_objectives,
+    ) = objectives_evaluations.shape
+    for config_idx in range(num_configs):
+        for seed_idx in range(num_seeds):
+            for fidelity_idx in range(num_fidelities):
+                for objective_idx in range(num_objectives):
+                    if np.isnan(
+                        objectives_evaluations[
+                            config_idx, seed_idx, fidelity_idx, objective_idx
+                        ]
+                    ):
+                        objectives_evaluations[
+                            config_idx, seed_idx, fidelity_idx, objective_idx
+                        ] = objectives_evaluations[
+                            config_idx, seed_idx, fidelity_idx - 1, objective_idx
+                        ]
+    nan_mask = np.isnan(objectives_evaluations).any((1, 2, 3))
+    return nan_mask, objectives_evaluations[~nan_mask]
+
+
+@pytest.mark.parametrize("num_fidelities", [1, 5])
+def test_blackbox_tabular_impute_objectives_values(num_fidelities):
+    data = np.stack([x1, x2]).T
+    hyperparameters = pd.DataFrame(data=data, columns=["hp_x1", "hp_x2"])
+    num_evals = len(hyperparameters)
+    num_seeds = 3
+    num_objectives = 2
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(
+        num_evals, num_seeds, num_fidelities, num_objectives
+    )
+    objectives_evaluations[
+        random_state.rand(*objectives_evaluations.shape) < 0.3
+    ] = np.nan
+    # Some configurations with all values missing
+    objectives_evaluations[:2] = np.nan
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["a", "b"],
+    )
+
+    nan_mask, expected = _impute_objectives_values_reference(objectives_evaluations)
+    hps, values = blackbox._impute_objectives_values()
+    np.testing.assert_array_equal(values, expected)
+    pd.testing.assert_frame_equal(hps, hyperparameters[~nan_mask])
+    # Result is cached
+    hps2, values2 = blackbox._impute_objectives_values()
+    assert hps2 is hps and values2 is values
+    # Original values are not modified
+    assert np.isnan(blackbox.objectives_evaluations).sum() > 0
@@ -0,0 +1,159 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import syne_tune.config_space as sp
+from syne_tune.blackbox_repository import repository
+from syne_tune.blackbox_repository import blackbox_cache as blackbox_cache_module
+from syne_tune.blackbox_repository.blackbox_cache import BlackboxCache, cache_key
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    BlackboxRepositoryBackend,
+)
+
+
+def test_blackbox_cache_lru():
+    cache = BlackboxCache(max_size=2)
+    num_loads = dict()
+
+    def loader(name):
+        def load():
+            num_loads[name] = num_loads.get(name, 0) + 1
+            return name.upper()
+
+        return load
+
+    assert cache.get("a", loader("a")) == "A"
+    assert cache.get("b", loader("b")) == "B"
+    assert cache.get("a", loader("a")) == "A"
+    # "b" is least recently used, so it is evicted
+    assert cache.get("c", loader("c")) == "C"
+    assert "a" in cache and "b" not in cache and "c" in cache
+    assert cache.get("b", loader("b")) == "B"
+    assert num_loads == {"a": 1, "b": 2, "c": 1}
+    assert cache.statistics() == {
+        "num_hits": 1,
+        "num_misses": 4,
+        "num_evictions": 2,
+        "size": 2,
+        "max_size": 2,
+    }
+    cache.preload("d", loader("d"))
+    assert "d" in cache and cache.statistics()["num_misses"] == 4
+    cache.set_max_size(0)
+    assert len(cache) == 0
+    assert cache.get("a", loader("a")) == "A"
+    assert len(cache) == 0 and num_loads["a"] == 2
+
+
+def test_cache_key():
+    key1 = cache_key("a", b={"x": 1, "y": [1, 2]}, c=None)
+    key2 = cache_key("a", c=None, b={"y": [1, 2], "x": 1})
+    assert key1 == key2
+    assert hash(key1) == hash(key2)
+    assert cache_key("a", b={"x": 2, "y": [1, 2]}, c=None) != key1
+    # Values which are not hashable
+    assert cache_key(np.arange(3)) == cache_key(np.arange(3))
+
+
+def _create_blackbox() -> BlackboxTabular:
+    n = 5
+    num_epochs = 3
+    hyperparameters = pd.DataFrame({"hp_x": np.arange(n)})
+    objectives_evaluations = np.random.rand(n, 1, num_epochs, 2)
+    objectives_evaluations[..., 1] = np.cumsum(objectives_evaluations[..., 1], axis=2)
+    return BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space={"hp_x": sp.choice(list(range(n)))},
+        fidelity_space={"epoch": sp.randint(1, num_epochs)},
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["error", "elapsed_time"],
+    )
+
+
+def test_blackbox_repository_backend_uses_cache(monkeypatch):
+    cache = BlackboxCache(max_size=4)
+    monkeypatch.setattr(blackbox_cache_module, "_blackbox_cache", cache)
+    blackboxes = {"task1": _create_blackbox(), "task2": _create_blackbox()}
+    num_loads = []
+
+    def load_blackbox(name, **kwargs):
+        num_loads.append(name)
+        return blackboxes
+
+    monkeypatch.setattr(repository, "load_blackbox", load_blackbox)
+
+    def create_backend(dataset):
+        return BlackboxRepositoryBackend(
+            blackbox_name="my-blackbox",
+            elapsed_time_attr="elapsed_time",
+            dataset=dataset,
+        )
+
+    backend = create_backend("task1")
+    assert backend.blackbox is blackboxes["task1"]
+    assert create_backend("task1").blackbox is blackboxes["task1"]
+    assert create_backend("task2").blackbox is blackboxes["task2"]
+    # Serialization does not store the blackbox, which is obtained from the
+    # cache after deserialization
+    backend = pickle.loads(pickle.dumps(backend))
+    assert backend.blackbox is blackboxes["task1"]
+    assert num_loads == ["my-blackbox"]
+    statistics = cache.statistics()
+    assert statistics["num_misses"] == 3  # my-blackbox, task1, task2
+    assert statistics["num_hits"] == 3
+
+
+def test_blackbox_repository_backend_surrogate_seed(monkeypatch):
+    cache = BlackboxCache(max_size=4)
+    monkeypatch.setattr(blackbox_cache_module, "_blackbox_cache", cache)
+    blackboxes = {"task1": _create_blackbox()}
+    monkeypatch.setattr(repository, "load_blackbox", lambda name, **kwargs: blackboxes)
+
+    def load_surrogate(seed=None):
+        kwargs = dict() if seed is None else dict(surrogate_random_seed=seed)
+        np.random.seed(31415927)
+        expected_draw = np.random.RandomState(31415927).randint(0, 1000000)
+        blackbox = BlackboxRepositoryBackend(
+            blackbox_name="my-blackbox",
+            elapsed_time_attr="elapsed_time",
+            dataset="task1",
+            surrogate="RandomForestRegressor",
+            surrogate_kwargs={"n_estimators": 3},
+            config_space_surrogate={"hp_x": sp.randint(0, 4)},
+            **kwargs,
+        ).blackbox
+        # The global random number generator must not be used
+        assert np.random.randint(0, 1000000) == expected_draw
+        return blackbox
+
+    blackbox1 = load_surrogate(0)
+    blackbox2 = load_surrogate(1)
+    blackbox3 = load_surrogate(0)
+    # Surrogate fitted for a different seed is not taken from the cache
+    assert blackbox2 is not blackbox1
+    assert blackbox3 is blackbox1
+    # Without a seed, the default seed 0 is used
+    assert load_surrogate() is blackbox1
+    # Fitting again gives the same surrogate
+    cache.clear()
+    blackbox4 = load_surrogate(0)
+    assert blackbox4 is not blackbox1
+    for hp_x in range(5):
+        np.testing.assert_array_equal(
+            blackbox4.objective_function({"hp_x": hp_x}, seed=0),
+            blackbox1.objective_function({"hp_x": hp_x}, seed=0),
+        )
@@ -9,10 +9,18 @@
 # or in the "license" file accompanying this file. This file is distributed
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
+import itertools
+
 import numpy as np
 import pandas as pd
+import pytest
 
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
 from syne_tune.config_space import randint
+from syne_tune.constants import ST_TRIAL_ID, ST_DECISION
+from syne_tune.optimizer.baselines import RandomSearch, ASHA
+from syne_tune.tuner_callback import TunerCallback
 from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
 from syne_tune.blackbox_repository.simulated_tabular_backend import (
     UserBlackboxBackend,
@@ -112,3 +120,143 @@ def test_pause_and_resume():
         if resource == pause_resource + 1:
             got_it[trial_id] = True
     assert all(got_it)
+
+
+class CountLoopIterations(TunerCallback):
+    def __init__(self):
+        self.num_iterations = 0
+
+    def on_loop_start(self):
+        self.num_iterations += 1
+
+
+def _run_simulation(scheduler_cls=RandomSearch, backend_kwargs=None, **callback_kwargs):
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(range(n), range(n))), columns=hp_names
+    )
+    metric = "error"
+    elapsed_time_attr = "elapsed_time"
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, n_epochs, 2)
+    # Each epoch takes between 10 and 100 seconds
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        10 + 90 * objectives_evaluations[:, :, :, 1], axis=2
+    )
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=[metric, elapsed_time_attr],
+    )
+    if backend_kwargs is None:
+        backend_kwargs = dict()
+    trial_backend = UserBlackboxBackend(
+        blackbox=blackbox, elapsed_time_attr=elapsed_time_attr, **backend_kwargs
+    )
+    scheduler_kwargs = dict(metric=metric, random_seed=31415927)
+    if scheduler_cls is ASHA:
+        scheduler_kwargs.update(resource_attr=resource_attr, max_t=n_epochs)
+    simulator_callback = SimulatorCallback(**callback_kwargs)
+    count_callback = CountLoopIterations()
+    tuner = Tuner(
+        trial_backend=trial_backend,
+        scheduler=scheduler_cls(cs, **scheduler_kwargs),
+        stop_criterion=StoppingCriterion(max_num_trials_started=8),
+        n_workers=3,
+        sleep_time=0,
+        results_update_interval=3600,
+        print_update_interval=3600,
+        callbacks=[simulator_callback, count_callback],
+        tuner_name="advance-to-next-event",
+        save_tuner=False,
+        wait_trial_completion_when_stopping=True,
+    )
+    tuner.run()
+    results = {
+        (result[ST_TRIAL_ID], result[resource_attr]): (
+            result[metric],
+            result[ST_DECISION],
+        )
+        for result in simulator_callback.results
+    }
+    return results, count_callback.num_iterations
+
+
+@pytest.mark.parametrize("quantize_to_sleep_time", [False, True])
+def test_advance_to_next_event(tmp_path, monkeypatch, quantize_to_sleep_time):
+    monkeypatch.setenv("SYNETUNE_FOLDER", str(tmp_path))
+    results_fixed, num_iterations_fixed = _run_simulation()
+    results_next, num_iterations_next = _run_simulation(
+        advance_to_next_event=True,
+        quantize_to_sleep_time=quantize_to_sleep_time,
+    )
+    assert len(results_fixed) >= 8 * n_epochs
+    assert results_next == results_fixed
+    assert num_iterations_next < num_iterations_fixed / 2
+
+
+def test_lazy_result_events(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYNETUNE_FOLDER", str(tmp_path))
+    results_eager, _ = _run_simulation(ASHA, advance_to_next_event=True)
+    results_lazy, _ = _run_simulation(
+        ASHA,
+        backend_kwargs=dict(lazy_result_events=True),
+        advance_to_next_event=True,
+    )
+    assert results_lazy == results_eager
+
+
+def test_learning_curve_cache():
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(range(n), range(n))), columns=hp_names
+    )
+    metric = "error"
+    elapsed_time_attr = "elapsed_time"
+    max_resource_attr = "max_epochs"
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, n_epochs, 2)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        1 + objectives_evaluations[:, :, :, 1], axis=2
+    )
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=[metric, elapsed_time_attr],
+    )
+    backend = UserBlackboxBackend(
+        blackbox=blackbox,
+        elapsed_time_attr=elapsed_time_attr,
+        max_resource_attr=max_resource_attr,
+    )
+    backend.time_keeper.start_of_time()
+    config = {hp_names[0]: 3, hp_names[1]: 7, max_resource_attr: 2}
+    trial_id = backend.start_trial(config).trial_id
+    all_results = backend.config_objectives(
+        {**config, max_resource_attr: n_epochs}, seed=0
+    )
+    # Run until ``max_epochs``, then pause and resume several times
+    previous_resource = 0
+    for max_resource in (2, 3, n_epochs):
+        config[max_resource_attr] = max_resource
+        _, results = backend._run_job_and_collect_results(trial_id, config)
+        expected = all_results[previous_resource:max_resource]
+        assert [result[resource_attr] for result in results] == [
+            result[resource_attr] for result in expected
+        ]
+        offset = 0
+        if previous_resource > 0:
+            offset = all_results[previous_resource - 1][elapsed_time_attr]
+        for result, result_expected in zip(results, expected):
+            assert result[metric] == result_expected[metric]
+            np.testing.assert_almost_equal(
+                result[elapsed_time_attr], result_expected[elapsed_time_attr] - offset
+            )
+        if max_resource < n_epochs:
+            # Learning curve is kept until the trial runs until the end
+            assert trial_id in backend._learning_curve_for_trial
+            backend._pause_trial(trial_id, results[-1])
+        previous_resource = max_resource
+    assert trial_id not in backend._learning_curve_for_trial
@@ -10,6 +10,8 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import logging
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -18,6 +20,7 @@ from sklearn.neighbors import KNeighborsRegressor
 from sklearn.neural_network import MLPRegressor
 
 from syne_tune.blackbox_repository import BlackboxOffline
+from syne_tune.blackbox_repository.blackbox_cache import cache_key
 from syne_tune.blackbox_repository.blackbox_surrogate import add_surrogate
 from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
 
@@ -142,3 +145,115 @@ def test_blackbox_tabular_surrogate():
         res = blackbox.objective_function(configuration)
         assert res.shape == (num_fidelities, num_objectives)
         assert np.allclose(np.ravel(res), np.ravel(objectives_evaluations[i, 0, :, :]))
+
+
+@pytest.mark.parametrize(
+    "predict_curves, fit_differences, num_seeds",
+    [
+        (False, False, 1),
+        (False, True, 1),
+        (True, False, 1),
+        (True, True, 2),
+    ],
+)
+def test_surrogate_batch_and_memoization(predict_curves, fit_differences, num_seeds):
+    n = 10
+    cs = {
+        "hp_x1": sp.randint(0, n - 1),
+        "hp_x2": sp.randint(0, 1),
+    }
+    hyperparameters = pd.DataFrame(
+        [(x1, x2) for x1 in range(n) for x2 in range(2)], columns=list(cs.keys())
+    )
+    fidelity_values = np.array([1, 2, 5, 10])
+    num_fidelities = len(fidelity_values)
+    objectives_evaluations = np.random.rand(
+        len(hyperparameters), num_seeds, num_fidelities, 2
+    )
+    objectives_evaluations[..., 1] = np.cumsum(objectives_evaluations[..., 1], axis=2)
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space={"hp_epoch": sp.randint(1, 10)},
+        objectives_evaluations=objectives_evaluations,
+        fidelity_values=fidelity_values,
+        objectives_names=["error", "elapsed_time"],
+    )
+    blackbox = add_surrogate(
+        blackbox,
+        surrogate=KNeighborsRegressor(n_neighbors=3),
+        predict_curves=predict_curves,
+        separate_seeds=num_seeds > 1,
+        fit_differences=["elapsed_time"] if fit_differences else None,
+    )
+    configurations = [
+        {"hp_x1": np.random.randint(0, n), "hp_x2": np.random.randint(0, 2)}
+        for _ in range(15)
+    ]
+    seeds = np.random.randint(0, num_seeds, size=len(configurations))
+
+    # Batch prediction for all fidelities
+    batch = blackbox.objective_function_batch(configurations, seeds=seeds)
+    assert batch.shape == (len(configurations), num_fidelities, 2)
+    for config, seed, values in zip(configurations, seeds, batch):
+        np.testing.assert_allclose(
+            blackbox.objective_function(config, seed=seed), values
+        )
+    # Batch prediction for given fidelities
+    fidelities = fidelity_values[np.arange(len(configurations)) % num_fidelities]
+    batch = blackbox.objective_function_batch(
+        configurations, fidelities=fidelities, seeds=seeds
+    )
+    assert batch.shape == (len(configurations), 2)
+    for config, fidelity, seed, values in zip(configurations, fidelities, seeds, batch):
+        result = blackbox.objective_function(
+            config, fidelity={"hp_epoch": fidelity}, seed=seed
+        )
+        np.testing.assert_allclose(
+            [result[name] for name in blackbox.objectives_names], values
+        )
+
+    # Repeated queries are served from the memo cache, without calling the
+    # surrogate model
+    curves = [
+        blackbox.objective_function(config, seed=seed)
+        for config, seed in zip(configurations, seeds)
+    ]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Surrogate model must not be called")
+
+    for pipeline in blackbox.surrogate_pipeline:
+        pipeline.predict = fail
+    for config, seed, curve in zip(configurations, seeds, curves):
+        result = blackbox.objective_function(config, seed=seed)
+        np.testing.assert_array_equal(result, curve)
+        # Modifying the result does not modify the cache
+        result[:] = -1
+        np.testing.assert_array_equal(
+            blackbox.objective_function(config, seed=seed), curve
+        )
+
+
+def test_surrogate_memoization_eviction(caplog):
+    n = 10
+    cs = {"hp_x1": sp.randint(0, n - 1)}
+    hyperparameters = pd.DataFrame({"hp_x1": np.arange(n)})
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space={"hp_epoch": sp.randint(1, 1)},
+        objectives_evaluations=np.random.rand(n, 1, 1, 1),
+        objectives_names=["error"],
+    )
+    blackbox = add_surrogate(blackbox, surrogate=KNeighborsRegressor(n_neighbors=1))
+    blackbox.prediction_cache_size = 3
+    with caplog.at_level(logging.INFO):
+        for x1 in list(range(n)) + [n - 1, 0]:
+            blackbox.objective_function({"hp_x1": x1}, seed=0)
+    # Least recently used predictions are evicted, without logging
+    assert len(blackbox._prediction_cache) == 3
+    assert list(blackbox._prediction_cache.keys()) == [
+        (cache_key({"hp_x1": x1}), None, 0) for x1 in [n - 2, n - 1, 0]
+    ]
+    assert not caplog.records
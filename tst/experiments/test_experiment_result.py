@@ -10,12 +10,16 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import copy
 from unittest.mock import Mock
 
 import pandas as pd
 import pytest
 
-from syne_tune.experiments import ExperimentResult
+from syne_tune.backend.trial_status import Trial
+from syne_tune.constants import ST_RESULTS_SEGMENTS_DIRNAME
+from syne_tune.experiments import ExperimentResult, load_experiment
+from syne_tune.results_callback import StoreResultsCallback
 
 
 @pytest.mark.parametrize(
@@ -46,3 +50,84 @@ def test_get_best_result(metadata: dict, results: pd.DataFrame, expected_result:
         name="some name", results=results, metadata=metadata, tuner=Mock(), path=Mock()
     )
     assert exp_result.best_config() == expected_result
+
+
+@pytest.mark.parametrize("append_only", [False, True])
+def test_load_experiment_results(tmp_path, append_only: bool):
+    tuner_name = "some-tuner"
+    tuner = Mock(
+        tuner_path=tmp_path / tuner_name,
+        results_update_interval=3600,
+        background_writer=None,
+    )
+    tuner.tuner_path.mkdir()
+    callback = StoreResultsCallback(add_wallclock_time=False, append_only=append_only)
+    callback.on_tuning_start(tuner)
+    expected_results = []
+    for trial_id in range(3):
+        trial = Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        for step in range(1, 4):
+            callback.on_trial_result(
+                trial=trial,
+                status="InProgress",
+                result={"step": step, "loss": trial_id + 1 / step},
+                decision="CONTINUE",
+            )
+            expected_results.append((trial_id, step, trial_id + 1 / step))
+        callback.store_results()
+    callback.on_tuning_end()
+
+    segments_path = tuner.tuner_path / ST_RESULTS_SEGMENTS_DIRNAME
+    if append_only:
+        assert len(list(segments_path.iterdir())) == 3
+    else:
+        assert not segments_path.exists()
+    results = load_experiment(
+        tuner_name, download_if_not_found=False, local_path=str(tmp_path)
+    ).results
+    assert results is not None
+    assert [
+        (row.trial_id, row.step, pytest.approx(row.loss))
+        for row in results.itertuples()
+    ] == expected_results
+
+
+def test_resume_append_only_removes_stale_segments(tmp_path):
+    tuner_name = "some-tuner"
+    tuner = Mock(
+        tuner_path=tmp_path / tuner_name,
+        results_update_interval=3600,
+        background_writer=None,
+    )
+    tuner.tuner_path.mkdir()
+
+    def report_and_store(callback, trial_id):
+        trial = Trial(trial_id=trial_id, config={"x": trial_id}, creation_time=None)
+        callback.on_trial_result(
+            trial=trial,
+            status="InProgress",
+            result={"step": 1, "loss": float(trial_id)},
+            decision="CONTINUE",
+        )
+        callback.store_results()
+
+    callback = StoreResultsCallback(add_wallclock_time=False, append_only=True)
+    callback.on_tuning_start(tuner)
+    report_and_store(callback, 0)
+    # Checkpoint is written here
+    callback_checkpoint = copy.deepcopy(callback)
+    # Run continues, writing more segments, then crashes
+    for trial_id in (1, 2, 3):
+        report_and_store(callback, trial_id)
+    segments_path = tuner.tuner_path / ST_RESULTS_SEGMENTS_DIRNAME
+    assert len(list(segments_path.iterdir())) == 4
+
+    # Resume from checkpoint
+    callback = callback_checkpoint
+    callback.on_tuning_start(tuner)
+    report_and_store(callback, 10)
+    callback.on_tuning_end()
+    results = load_experiment(
+        tuner_name, download_if_not_found=False, local_path=str(tmp_path)
+    ).results
+    assert list(results.trial_id) == [0, 10]
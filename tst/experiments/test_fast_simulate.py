@@ -0,0 +1,111 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.simulator_backend.simulator_callback import SimulatorCallback
+from syne_tune.backend.simulator_backend.time_keeper import SimulatedTimeKeeper
+from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
+from syne_tune.blackbox_repository.simulated_tabular_backend import (
+    UserBlackboxBackend,
+)
+from syne_tune.config_space import randint
+from syne_tune.experiments.fast_simulate import fast_simulate
+from syne_tune.optimizer.baselines import RandomSearch, ASHA
+
+
+n = 10
+n_epochs = 9
+hp_names = ["hp_x1", "hp_x2"]
+resource_attr = "hp_epoch"
+metric = "error"
+elapsed_time_attr = "elapsed_time"
+cs = {name: randint(0, n - 1) for name in hp_names}
+cs_fidelity = {resource_attr: randint(1, n_epochs)}
+
+
+def _create_trial_backend():
+    hyperparameters = pd.DataFrame(
+        list(itertools.product(range(n), range(n))), columns=hp_names
+    )
+    random_state = np.random.RandomState(0)
+    objectives_evaluations = random_state.rand(len(hyperparameters), 1, n_epochs, 2)
+    objectives_evaluations[:, :, :, 1] = np.cumsum(
+        10 + 90 * objectives_evaluations[:, :, :, 1], axis=2
+    )
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=[metric, elapsed_time_attr],
+    )
+    return UserBlackboxBackend(blackbox=blackbox, elapsed_time_attr=elapsed_time_attr)
+
+
+def _create_scheduler(scheduler_cls):
+    scheduler_kwargs = dict(metric=metric, random_seed=31415927)
+    if scheduler_cls is ASHA:
+        scheduler_kwargs.update(resource_attr=resource_attr, max_t=n_epochs)
+    return scheduler_cls(cs, **scheduler_kwargs)
+
+
+@pytest.mark.parametrize(
+    "scheduler_cls, advance_to_next_event",
+    [
+        (RandomSearch, False),
+        (RandomSearch, True),
+        (ASHA, False),
+        (ASHA, True),
+    ],
+)
+def test_fast_simulate_same_as_tuner(
+    tmp_path, monkeypatch, scheduler_cls, advance_to_next_event
+):
+    monkeypatch.setenv("SYNETUNE_FOLDER", str(tmp_path))
+    # Real time spent in the tuning loop would otherwise leak into simulated
+    # time, so that results are not deterministic
+    monkeypatch.setattr(
+        SimulatedTimeKeeper, "real_time_since_last_recent_exit", lambda self: 0.0
+    )
+    stop_criterion = StoppingCriterion(max_wallclock_time=3000)
+    n_workers = 3
+    callback = SimulatorCallback(advance_to_next_event=advance_to_next_event)
+    tuner = Tuner(
+        trial_backend=_create_trial_backend(),
+        scheduler=_create_scheduler(scheduler_cls),
+        stop_criterion=stop_criterion,
+        n_workers=n_workers,
+        sleep_time=0,
+        results_update_interval=3600,
+        print_update_interval=3600,
+        callbacks=[callback],
+        tuner_name="fast-simulate",
+        save_tuner=False,
+    )
+    tuner.run()
+    df_tuner = callback.dataframe()
+
+    df_fast = fast_simulate(
+        trial_backend=_create_trial_backend(),
+        scheduler=_create_scheduler(scheduler_cls),
+        stop_criterion=stop_criterion,
+        n_workers=n_workers,
+        advance_to_next_event=advance_to_next_event,
+    )
+    assert len(df_tuner) > 2 * n_epochs
+    pd.testing.assert_frame_equal(df_fast, df_tuner)
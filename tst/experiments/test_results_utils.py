@@ -0,0 +1,112 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from syne_tune.constants import (
+    ST_METADATA_FILENAME,
+    ST_RESULTS_DATAFRAME_FILENAME,
+    ST_TUNER_TIME,
+)
+from syne_tune.experiments.visualization.results_utils import (
+    create_index_for_result_files,
+    load_results_dataframe_per_benchmark,
+    results_cache_path,
+)
+from syne_tune.util import experiment_path
+
+experiment_name = "my-study"
+
+setup_names = ["rs", "bo"]
+
+
+def _write_results(tuner_path, seed: int, offset: float = 0):
+    random_state = np.random.RandomState(seed)
+    num_rows = 20
+    df = pd.DataFrame(
+        {
+            ST_TUNER_TIME: np.cumsum(random_state.rand(num_rows)),
+            "trial_id": np.arange(num_rows) // 2,
+            "error": random_state.rand(num_rows) + offset,
+            "extra": random_state.rand(num_rows),
+        }
+    )
+    df.to_csv(tuner_path / ST_RESULTS_DATAFRAME_FILENAME, index=False)
+
+
+def _create_experiments(num_seeds: int):
+    for setup_name in setup_names:
+        for seed in range(num_seeds):
+            tuner_name = f"{experiment_name}-2023-03-19-22-01-{seed:02d}-{setup_name}"
+            tuner_path = experiment_path() / experiment_name / "0" / tuner_name
+            tuner_path.mkdir(parents=True)
+            metadata = {"algorithm": setup_name, "benchmark": "bm", "seed": seed}
+            with open(tuner_path / ST_METADATA_FILENAME, "w") as f:
+                json.dump(metadata, f)
+            _write_results(tuner_path, seed)
+
+
+def _load_results(use_cache: bool, num_workers: int = 1, columns=None):
+    index = create_index_for_result_files(
+        experiment_names=(experiment_name,),
+        metadata_to_setup=lambda metadata: metadata["algorithm"],
+        metadata_keys=["seed"],
+        use_cache=use_cache,
+    )
+    assert index["setup_names"] == set(setup_names)
+    df = load_results_dataframe_per_benchmark(
+        sorted(index["index"]["bm"]),
+        columns=columns,
+        num_workers=num_workers,
+        use_cache=use_cache,
+    )
+    return index, df
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_results_cache(tmp_path, monkeypatch, num_workers):
+    monkeypatch.setenv("SYNETUNE_FOLDER", str(tmp_path))
+    num_seeds = 3
+    _create_experiments(num_seeds)
+    index, df_expected = _load_results(use_cache=False)
+    assert len(df_expected) == 2 * num_seeds * 20
+    assert not results_cache_path().exists()
+    columns = [ST_TUNER_TIME, "trial_id", "error"]
+    # First call fills the cache, second call reads from it
+    for _ in range(2):
+        index_cached, df = _load_results(
+            use_cache=True, num_workers=num_workers, columns=columns
+        )
+        assert index_cached == index
+        pd.testing.assert_frame_equal(df, df_expected.drop(columns=["extra"]))
+    assert results_cache_path().exists()
+    # Loading more columns than are cached
+    _, df = _load_results(use_cache=True, num_workers=num_workers)
+    pd.testing.assert_frame_equal(df, df_expected)
+    # Changing a file invalidates its cache entry
+    tuner_path = experiment_path() / index["index"]["bm"][0][0]
+    _write_results(tuner_path, seed=0, offset=10)
+    mtime_ns = (tuner_path / ST_RESULTS_DATAFRAME_FILENAME).stat().st_mtime_ns
+    os.utime(
+        tuner_path / ST_RESULTS_DATAFRAME_FILENAME,
+        ns=(mtime_ns + 10**9, mtime_ns + 10**9),
+    )
+    _, df = _load_results(use_cache=True, num_workers=num_workers, columns=columns)
+    df_changed = df[df["tuner_name"] == tuner_path.name]
+    assert len(df_changed) == 20
+    assert (df_changed["error"] >= 10).all()
+    assert (df[df["tuner_name"] != tuner_path.name]["error"] < 10).all()
@@ -10,10 +10,15 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import threading
+
 import numpy
 import autograd.numpy as anp
 import pytest
 
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd import (
+    optimization_utils,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.mean import (
     ScalarMeanFunction,
 )
@@ -27,6 +32,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
     NOISE_VARIANCE_LOWER_BOUND,
     INVERSE_BANDWIDTHS_LOWER_BOUND,
+    OptimizationConfig,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gluon_blocks_helpers import (
     LogarithmScalarEncoding,
@@ -185,3 +191,114 @@ def test_gp_regression_2d_with_ard():
     numpy.testing.assert_almost_equal(mu_train, y_train, decimal=2)
     # Fewer decimals imposed for the test points
     numpy.testing.assert_almost_equal(mu_test, y_test, decimal=1)
+
+
+def test_gp_regression_incremental_recompute_states():
+    random_state = numpy.random.RandomState(0)
+    dimension = 3
+    num_data = 40
+    num_new = 5
+    features = random_state.uniform(-5, 5, size=(num_data + num_new, dimension))
+    targets = numpy.sin(features[:, 0]) + 0.1 * random_state.normal(
+        size=num_data + num_new
+    )
+    features_test = random_state.uniform(-5, 5, size=(10, dimension))
+
+    model = GaussianProcessRegression(kernel=Matern52(dimension=dimension, ARD=True))
+    model.fit({"features": features[:num_data], "targets": targets[:num_data]})
+    chol_fact_old = model.states[0].chol_fact
+    # Append new rows and fantasy targets: Cholesky factor is extended
+    targets_fantasy = numpy.stack([targets, 2 * targets], axis=1)
+    data = {"features": features, "targets": targets_fantasy}
+    model.recompute_states(data)
+    state = model.states[0]
+    numpy.testing.assert_array_equal(
+        state.chol_fact[:num_data, :num_data], chol_fact_old
+    )
+    predictions = model.predict(features_test)
+    # Compare against full recomputation
+    state_full = model.likelihood.get_posterior_state(data)
+    numpy.testing.assert_almost_equal(state.chol_fact, state_full.chol_fact)
+    numpy.testing.assert_almost_equal(state.pred_mat, state_full.pred_mat)
+    model._states = [state_full]
+    for (mean, variance), (mean_full, variance_full) in zip(
+        predictions, model.predict(features_test)
+    ):
+        numpy.testing.assert_almost_equal(mean, mean_full)
+        numpy.testing.assert_almost_equal(variance, variance_full)
+    # Rows which differ are not reused
+    features_changed = features.copy()
+    features_changed[2, 0] += 1
+    data = {"features": features_changed, "targets": targets}
+    model.recompute_states(data)
+    state_full = model.likelihood.get_posterior_state(data)
+    numpy.testing.assert_almost_equal(model.states[0].chol_fact, state_full.chol_fact)
+    # Changing parameters forces a full recomputation
+    params = model.get_params()
+    params["noise_variance"] = 2 * params["noise_variance"]
+    model.set_params(params)
+    data = {"features": features, "targets": targets}
+    model.recompute_states(data)
+    state_full = model.likelihood.get_posterior_state(data)
+    numpy.testing.assert_almost_equal(model.states[0].chol_fact, state_full.chol_fact)
+    assert not numpy.allclose(
+        model.states[0].chol_fact[:num_data, :num_data], chol_fact_old
+    )
+
+
+def test_gp_regression_parallel_restarts():
+    random_state = numpy.random.RandomState(0)
+    dimension = 3
+    features = random_state.uniform(-5, 5, size=(30, dimension))
+    targets = numpy.sin(features[:, 0]) + 0.1 * random_state.normal(size=30)
+    data = {"features": features, "targets": targets}
+    all_params = []
+    for n_workers in (1, 3):
+        model = GaussianProcessRegression(
+            kernel=Matern52(dimension=dimension, ARD=True),
+            optimization_config=OptimizationConfig(
+                lbfgs_tol=1e-6,
+                lbfgs_maxiter=20,
+                verbose=False,
+                n_starts=4,
+                n_workers=n_workers,
+            ),
+            random_seed=31415927,
+        )
+        model.fit(data)
+        all_params.append(model.get_params())
+    params_sequential, params_parallel = all_params
+    assert params_sequential.keys() == params_parallel.keys()
+    for name, value in params_sequential.items():
+        numpy.testing.assert_almost_equal(value, params_parallel[name])
+
+
+def test_parallel_restarts_fall_back_to_sequential_with_threads(monkeypatch):
+    def fail_get_context(*args, **kwargs):
+        raise AssertionError("Processes must not be forked if threads are running")
+
+    monkeypatch.setattr(
+        optimization_utils.multiprocessing, "get_context", fail_get_context
+    )
+    random_state = numpy.random.RandomState(0)
+    features = random_state.uniform(-5, 5, size=(20, 2))
+    targets = numpy.sin(features[:, 0])
+    stop_event = threading.Event()
+    thread = threading.Thread(target=stop_event.wait)
+    thread.start()
+    try:
+        model = GaussianProcessRegression(
+            kernel=Matern52(dimension=2, ARD=True),
+            optimization_config=OptimizationConfig(
+                lbfgs_tol=1e-6,
+                lbfgs_maxiter=5,
+                verbose=False,
+                n_starts=2,
+                n_workers=2,
+            ),
+            random_seed=31415927,
+        )
+        model.fit({"features": features, "targets": targets})
+    finally:
+        stop_event.set()
+        thread.join()
@@ -31,12 +31,18 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.warping import
     WarpedKernel,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import Matern52
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.constants import (
+    MCMCConfig,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.mean import (
     ScalarMeanFunction,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.likelihood import (
     GaussianProcessMarginalLikelihood,
 )
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_model import (
+    GaussianProcessModel,
+)
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gpr_mcmc import (
     GPRegressionMCMC,
     _get_gp_hps,
@@ -204,6 +210,73 @@ def test_create_likelihood():
     )
 
 
+def test_mcmc_recompute_states_incremental():
+    random_state = anp.random.RandomState(0)
+    num_data, num_new = 20, 3
+    features = random_state.uniform(0, 1, (num_data + num_new, 1))
+    targets = anp.sin(5 * features) + 0.1 * random_state.normal(size=features.shape)
+    features_test = random_state.uniform(0, 1, (10, 1))
+    model = GPRegressionMCMC(
+        build_kernel=build_kernel,
+        mcmc_config=MCMCConfig(n_samples=10, n_burnin=5, n_thinning=1),
+        random_seed=1,
+    )
+    model.fit({"features": features[:num_data], "targets": targets[:num_data]})
+    likelihoods = model._sample_likelihoods
+    num_samples = len(model.samples)
+    # Append rows, and use fantasy targets (one column per MCMC sample)
+    targets_fantasy = anp.tile(targets, (1, model.number_samples))
+    data = {"features": features, "targets": targets_fantasy}
+    model.recompute_states(data)
+    assert model._sample_likelihoods is likelihoods
+    predictions = model.predict(features_test)
+    # Recompute states from scratch
+    model._sample_likelihoods = None
+    model._states = None
+    model.recompute_states(data)
+    assert model._sample_likelihoods is not likelihoods
+    predictions_compare = model.predict(features_test)
+    assert len(predictions) == num_samples
+    for (mean1, var1), (mean2, var2) in zip(predictions, predictions_compare):
+        numpy.testing.assert_almost_equal(mean1, mean2, decimal=5)
+        numpy.testing.assert_almost_equal(var1, var2, decimal=5)
+
+
+def test_mcmc_predict_stacked():
+    random_state = anp.random.RandomState(0)
+    num_data = 20
+    features = random_state.uniform(0, 1, (num_data, 1))
+    targets = anp.sin(5 * features) + 0.1 * random_state.normal(size=features.shape)
+    model = GPRegressionMCMC(
+        build_kernel=build_kernel,
+        mcmc_config=MCMCConfig(n_samples=10, n_burnin=5, n_thinning=1),
+        random_seed=1,
+    )
+    model.fit({"features": features, "targets": targets})
+    targets_fantasy = anp.concatenate(
+        [targets + 0.1 * k for k in range(2 * model.number_samples)], axis=1
+    )
+    for data in (
+        None,
+        {"features": features, "targets": targets_fantasy},
+        {"features": features[:-2], "targets": targets[:-2]},
+    ):
+        if data is not None:
+            model.recompute_states(data)
+        for num_test in (1, 3):
+            features_test = random_state.uniform(0, 1, (num_test, 1))
+            predictions = model.predict(features_test)
+            assert model._states_for_inv_chol_facts is model.states
+            # Compare against predictions computed state by state
+            predictions_compare = GaussianProcessModel.predict(model, features_test)
+            assert len(predictions) == len(predictions_compare)
+            for (mean1, var1), (mean2, var2) in zip(predictions, predictions_compare):
+                assert mean1.shape == mean2.shape
+                assert var1.shape == var2.shape
+                numpy.testing.assert_allclose(mean1, mean2, rtol=1e-8, atol=1e-10)
+                numpy.testing.assert_allclose(var1, var2, rtol=1e-8, atol=1e-10)
+
+
 @pytest.mark.skip(reason="Need manual inspection on the plots")
 def test_mcmc():
     import matplotlib.pyplot as plt
@@ -22,6 +22,9 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.gp_regression
     GaussianProcessRegression,
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel import Matern52
+from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.mean import (
+    ScalarMeanFunction,
+)
 
 
 @pytest.mark.timeout(10)
@@ -97,3 +100,57 @@ def test_incremental_update():
 
 if __name__ == "__main__":
     test_incremental_update()
+
+
+def test_incremental_cholesky_with_jitter():
+    random_state = numpy.random.RandomState(0)
+    kernel = Matern52(dimension=1)
+    kernel.collect_params().initialize()
+    mean = ScalarMeanFunction()
+    mean.collect_params().initialize()
+    noise_variance = numpy.array([0.0])
+    # Repeated rows render the kernel matrix singular, so jitter has to be
+    # added. New rows are far away from these
+    features_prefix = numpy.repeat(random_state.uniform(size=(3, 1)), 4, axis=0)
+    features = numpy.vstack(
+        [features_prefix, 10 + 2 * numpy.arange(5).reshape((-1, 1))]
+    )
+    targets = random_state.normal(size=(features.shape[0], 1))
+    num_prefix = features_prefix.shape[0]
+    state_prefix = GaussProcPosteriorState(
+        features=features_prefix,
+        targets=targets[:num_prefix],
+        mean=mean,
+        kernel=kernel,
+        noise_variance=noise_variance,
+    )
+    jittered_noise_variance = state_prefix.jittered_noise_variance
+    assert jittered_noise_variance[0] > noise_variance[0]
+    chol_fact_prefix = state_prefix.chol_fact_for_prefix(features, noise_variance)
+    assert chol_fact_prefix.shape == (num_prefix, num_prefix)
+    state = GaussProcPosteriorState(
+        features=features,
+        targets=targets,
+        mean=mean,
+        kernel=kernel,
+        noise_variance=noise_variance,
+        chol_fact_prefix=chol_fact_prefix,
+        noise_variance_prefix=jittered_noise_variance,
+    )
+    # Appended rows use the same noise variance (including jitter) as the
+    # prefix
+    numpy.testing.assert_array_equal(
+        state.chol_fact[:num_prefix, :num_prefix], chol_fact_prefix
+    )
+    numpy.testing.assert_array_equal(
+        state.jittered_noise_variance, jittered_noise_variance
+    )
+    numpy.testing.assert_allclose(
+        numpy.matmul(state.chol_fact, state.chol_fact.T),
+        kernel(features, features)
+        + jittered_noise_variance[0] * numpy.eye(features.shape[0]),
+        rtol=0,
+        atol=1e-12,
+    )
+    # Prefix is not reused for a different noise variance
+    assert state_prefix.chol_fact_for_prefix(features, noise_variance + 0.1) is None
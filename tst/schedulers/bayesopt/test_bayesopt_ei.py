@@ -296,6 +296,72 @@ def test_value_same_as_with_gradient():
         np.testing.assert_almost_equal(vec1, vec2)
 
 
+@pytest.mark.timeout(10)
+def test_batch_same_as_with_gradient():
+    # test that compute_acq_with_gradient_batch returns the same values and
+    # gradients as compute_acq_with_gradient
+    for model in default_models():
+        ei = EIAcquisitionFunction(model)
+
+        random = np.random.RandomState(42)
+        X = random.uniform(low=0.0, high=0.1, size=(10, 2))
+
+        fvals, gradients = ei.compute_acq_with_gradient_batch(X)
+        assert fvals.shape == (10,)
+        assert gradients.shape == (10, 2)
+        for x, fval, gradient in zip(X, fvals, gradients):
+            fval_single, gradient_single = ei.compute_acq_with_gradient(x)
+            np.testing.assert_almost_equal(fval, fval_single)
+            np.testing.assert_almost_equal(gradient, gradient_single.flatten())
+
+
+@pytest.mark.timeout(10)
+def test_optimize_batch_improves():
+    random = np.random.RandomState(42)
+    for model in default_models():
+        ei = EIAcquisitionFunction(model)
+        hp_ranges = model.hp_ranges_for_prediction()
+        opt = LBFGSOptimizeAcquisition(hp_ranges, model, EIAcquisitionFunction)
+        initial_points = random.uniform(low=0.0, high=0.1, size=(5, 2))
+        acq0 = ei.compute_acq(initial_points)
+        optimized = opt.optimize_batch(
+            [hp_ranges.from_ndarray(x) for x in initial_points]
+        )
+        assert len(optimized) == len(initial_points)
+        acq_opt = ei.compute_acq(hp_ranges.to_ndarray_matrix(optimized))
+        assert all(acq_opt <= acq0 + 1e-10)
+        assert np.sum(acq_opt) < np.sum(acq0)
+
+
+def test_optimize_batch_abnormal_termination_falls_back(monkeypatch):
+    from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms import (
+        bo_algorithm_components,
+    )
+
+    fmin_l_bfgs_b = bo_algorithm_components.fmin_l_bfgs_b
+
+    # Joint runs over several candidates terminate abnormally, single runs
+    # proceed as usual
+    def fmin_joint_fails(func, x0, bounds, **kwargs):
+        if len(bounds) > 2:
+            return x0, func(x0)[0], {"task": b"ABNORMAL_TERMINATION_IN_LNSRCH"}
+        return fmin_l_bfgs_b(func, x0=x0, bounds=bounds, **kwargs)
+
+    monkeypatch.setattr(bo_algorithm_components, "fmin_l_bfgs_b", fmin_joint_fails)
+    random = np.random.RandomState(42)
+    model = default_models(do_mcmc=False)[0]
+    hp_ranges = model.hp_ranges_for_prediction()
+    opt = LBFGSOptimizeAcquisition(hp_ranges, model, EIAcquisitionFunction)
+    candidates = [
+        hp_ranges.from_ndarray(x)
+        for x in random.uniform(low=0.0, high=0.1, size=(5, 2))
+    ]
+    optimized = opt.optimize_batch(candidates)
+    expected = [opt.optimize(candidate) for candidate in candidates]
+    assert optimized == expected
+    assert optimized != candidates
+
+
 if __name__ == "__main__":
     test_optimization_improves()
     test_numerical_gradient()
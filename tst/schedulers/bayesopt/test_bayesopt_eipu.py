@@ -270,3 +270,21 @@ def test_value_same_as_with_gradient():
             vec1 = eipu.compute_acq(X).flatten()
             vec2 = np.array([eipu.compute_acq_with_gradient(x)[0] for x in X])
             np.testing.assert_almost_equal(vec1, vec2)
+
+
+@pytest.mark.timeout(10)
+def test_batch_same_as_with_gradient():
+    # test that compute_acq_with_gradient_batch returns the same values and
+    # gradients as compute_acq_with_gradient
+    active_models = default_models(INTERNAL_METRIC_NAME)
+    cost_models = default_models(COST_METRIC_NAME)
+    for active_model, cost_model in zip(active_models, cost_models):
+        models = {INTERNAL_METRIC_NAME: active_model, COST_METRIC_NAME: cost_model}
+        eipu = EIpuAcquisitionFunction(models, active_metric=INTERNAL_METRIC_NAME)
+        random = np.random.RandomState(42)
+        X = random.uniform(low=0.0, high=0.1, size=(10, 2))
+        fvals, gradients = eipu.compute_acq_with_gradient_batch(X)
+        for x, fval, gradient in zip(X, fvals, gradients):
+            fval_single, gradient_single = eipu.compute_acq_with_gradient(x)
+            np.testing.assert_almost_equal(fval, fval_single)
+            np.testing.assert_almost_equal(gradient, gradient_single.flatten())
@@ -28,6 +28,7 @@ from syne_tune.optimizer.schedulers.searchers.bayesopt.utils.test_objects import
 )
 from syne_tune.optimizer.schedulers.searchers.bayesopt.tuning_algorithms.bo_algorithm_components import (
     RandomFromSetCandidateGenerator,
+    RandomStatefulCandidateGenerator,
 )
 from syne_tune.optimizer.schedulers.searchers.utils.exclusion_list import ExclusionList
 
@@ -153,3 +154,56 @@ def test_random_from_set_candidate_generator(
             hp_ranges.config_to_match_string(BASE_SET[pos]) for pos in pos_returned
         )
         assert configs_ms == posret_ms
+
+
+@pytest.mark.parametrize("value_for_last_pos", [None, 3])
+def test_random_stateful_candidate_generator_encoded(value_for_last_pos):
+    config_space = {
+        "a": randint(0, 4),
+        "b": choice(["a", "b", "c"]),
+        "c": uniform(0.0, 1.0),
+        "r": randint(1, 9),
+    }
+    hp_ranges = make_hyperparameter_ranges(
+        config_space, name_last_pos="r", value_for_last_pos=value_for_last_pos
+    )
+    excl_configs = [
+        {"a": a, "b": b, "c": 0.5} for a in range(5) for b in ("a", "b") if a != 2
+    ]
+    # Exclusion list has non-extended configs, but can be fed with extended ones
+    excl_list = ExclusionList(hp_ranges, configurations=excl_configs[:5])
+    for config in excl_configs[5:]:
+        excl_list.add(dict(config, r=5))
+    random_state = np.random.RandomState(0)
+    features = hp_ranges.random_ndarray_matrix(random_state, 200)
+    # Some rows are equal to excluded configs, apart from resource attribute
+    excl_features = hp_ranges.to_ndarray_matrix(excl_configs, skip_last=True)
+    num_excl, num_cols = excl_features.shape
+    features[:num_excl, :num_cols] = excl_features
+    is_excluded = excl_list.contains_ndarray_matrix(features)
+    assert is_excluded[:num_excl].all()
+    np.testing.assert_array_equal(
+        is_excluded, [excl_list.contains(hp_ranges.from_ndarray(x)) for x in features]
+    )
+    for num_cands in (10, 100):
+        generator = RandomStatefulCandidateGenerator(
+            hp_ranges, random_state=np.random.RandomState(31415927)
+        )
+        features = generator.generate_candidates_en_bulk_encoded(
+            num_cands, exclusion_list=excl_list
+        )
+        generator = RandomStatefulCandidateGenerator(
+            hp_ranges, random_state=np.random.RandomState(31415927)
+        )
+        configs = generator.generate_candidates_en_bulk(
+            num_cands, exclusion_list=excl_list
+        )
+        assert features.shape == (num_cands, hp_ranges.ndarray_size)
+        np.testing.assert_array_equal(features, hp_ranges.to_ndarray_matrix(configs))
+    # Not supported if exclusion list is created from match strings
+    excl_list = ExclusionList(hp_ranges, configurations=excl_list.excl_set.copy())
+    assert not excl_list.supports_ndarray_matrix()
+    assert (
+        generator.generate_candidates_en_bulk_encoded(10, exclusion_list=excl_list)
+        is None
+    )
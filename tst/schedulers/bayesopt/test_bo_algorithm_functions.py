@@ -107,6 +107,18 @@ def test_lazily_locally_optimize():
         i += 1
 
     assert i == len(original_candidates)
+    # Optimization in batches, duplicates are skipped
+    for batch_size in (2, 5):
+        result = list(
+            _lazily_locally_optimize(
+                candidates=original_candidates + original_candidates[:1],
+                local_optimizer=NoOptimization(None, None, None),
+                hp_ranges=hp_ranges,
+                predictor=None,
+                batch_size=batch_size,
+            )
+        )
+        assert result == [(cand, cand) for cand in original_candidates]
     assert (
         len(
             list(
@@ -507,3 +507,61 @@ def test_encoded_ranges():
     assert encoded_ranges["7"] == (14, 15)
     assert encoded_ranges["8"] == (15, 16)
     assert encoded_ranges["9"] == (16, 17)
+
+
+def test_to_ndarray_matrix_same_as_to_ndarray():
+    config_space = {
+        "0": uniform(0.0, 1.0),
+        "1": loguniform(1.0, 1000.0),
+        "2": reverseloguniform(0.9, 0.9999),
+        "3": randint(1, 10),
+        "4": lograndint(1, 1000),
+        "5": choice(["a", "b", "c"]),
+        "6": choice(["a", "b"]),
+        "7": finrange(0.1, 1.0, 10),
+        "8": logfinrange(1, 100, 5, cast_int=True),
+        "9": ordinal([0.05, 0.25, 0.5, 0.8], kind="equal"),
+        "10": ordinal([0.05, 0.25, 0.5, 0.8], kind="nn"),
+        "11": logordinal([0.05, 0.25, 0.5, 0.8]),
+        "12": randint(3, 3),
+    }
+    hp_ranges = make_hyperparameter_ranges(config_space)
+    random_state = np.random.RandomState(31415927)
+    configs = hp_ranges.random_configs(random_state, num_configs=500)
+    features = hp_ranges.to_ndarray_matrix(configs)
+    features_compare = np.vstack([hp_ranges.to_ndarray(config) for config in configs])
+    assert features.shape == (len(configs), hp_ranges.ndarray_size)
+    assert_allclose(features, features_compare)
+    assert hp_ranges.to_ndarray_matrix([]).shape == (0, hp_ranges.ndarray_size)
+    with pytest.raises(AssertionError):
+        hp_ranges.to_ndarray_matrix([dict(configs[0], **{"5": "d"})])
+
+
+@pytest.mark.parametrize("value_for_last_pos", [None, 7])
+def test_random_ndarray_matrix_same_as_random_configs(value_for_last_pos):
+    config_space = {
+        "0": uniform(0.0, 1.0),
+        "1": loguniform(1.0, 1000.0),
+        "2": lograndint(1, 1000),
+        "3": choice(["a", "b", "c"]),
+        "4": finrange(0.1, 1.0, 10),
+        "5": ordinal([0.05, 0.25, 0.5, 0.8], kind="nn"),
+        "6": randint(3, 3),
+        "r": randint(1, 9),
+    }
+    hp_ranges = make_hyperparameter_ranges(
+        config_space, name_last_pos="r", value_for_last_pos=value_for_last_pos
+    )
+    for num_configs in (0, 1, 200):
+        features = hp_ranges.random_ndarray_matrix(
+            np.random.RandomState(31415927), num_configs
+        )
+        configs = hp_ranges.random_configs(np.random.RandomState(31415927), num_configs)
+        assert features.shape == (num_configs, hp_ranges.ndarray_size)
+        np.testing.assert_array_equal(features, hp_ranges.to_ndarray_matrix(configs))
+        # Encoding without resource attribute
+        start, _ = hp_ranges.encoded_ranges["r"]
+        configs = [{k: v for k, v in config.items() if k != "r"} for config in configs]
+        np.testing.assert_array_equal(
+            features[:, :start], hp_ranges.to_ndarray_matrix(configs, skip_last=True)
+        )
@@ -0,0 +1,89 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import numpy as np
+import pytest
+
+from syne_tune.optimizer.schedulers.multiobjective.non_dominated_priority import (
+    pareto_efficient,
+    compute_epsilon_net,
+)
+
+
+def _pareto_efficient_naive(X: np.ndarray) -> np.ndarray:
+    return np.array(
+        [not np.any(np.all(X <= x, axis=1) & np.any(X < x, axis=1)) for x in X]
+    )
+
+
+def _compute_epsilon_net_naive(X: np.ndarray, initial_index: int) -> np.ndarray:
+    order = [initial_index]
+    remaining = [i for i in range(X.shape[0]) if i != initial_index]
+    while remaining:
+        min_distances = [
+            min(np.linalg.norm(X[i] - X[j]) for j in order) for i in remaining
+        ]
+        order.append(remaining.pop(int(np.argmax(min_distances))))
+    ranks = np.empty(len(order), dtype=int)
+    ranks[order] = np.arange(len(order))
+    return ranks
+
+
+@pytest.mark.parametrize(
+    "num_dims, discretize",
+    [(1, False), (2, False), (2, True), (3, False), (3, True), (5, False)],
+)
+def test_pareto_efficient(num_dims, discretize):
+    random_state = np.random.RandomState(31415927)
+    for _ in range(10):
+        num_items = random_state.randint(low=1, high=200)
+        X = random_state.rand(num_items, num_dims)
+        if discretize:
+            # Creates ties and duplicates
+            X = np.round(X * 3) / 3
+        np.testing.assert_array_equal(pareto_efficient(X), _pareto_efficient_naive(X))
+        # Infinite costs
+        X[random_state.rand(*X.shape) < 0.2] = np.inf
+        X[random_state.rand(*X.shape) < 0.1] = -np.inf
+        np.testing.assert_array_equal(pareto_efficient(X), _pareto_efficient_naive(X))
+
+
+def test_pareto_efficient_infinite_costs():
+    X = np.array([[0.0, np.inf], [1.0, 0.0]])
+    np.testing.assert_array_equal(pareto_efficient(X), [True, True])
+    X = np.array([[-np.inf, 1.0], [0.0, -np.inf], [0.0, np.inf], [np.inf, np.inf]])
+    np.testing.assert_array_equal(pareto_efficient(X), [True, True, False, False])
+
+
+def test_pareto_efficient_many_items():
+    random_state = np.random.RandomState(2718281)
+    # Items on a simplex are all Pareto efficient
+    X = random_state.rand(3000, 3)
+    X[:1500] /= X[:1500].sum(axis=1, keepdims=True)
+    X[1500:] += 0.5
+    mask = pareto_efficient(X)
+    assert mask[:1500].all() and not mask[1500:].any()
+
+
+@pytest.mark.parametrize("discretize", [False, True])
+def test_compute_epsilon_net(discretize):
+    random_state = np.random.RandomState(31415927)
+    for _ in range(5):
+        num_items = random_state.randint(low=1, high=40)
+        X = random_state.rand(num_items, 2)
+        if discretize:
+            X = np.round(X * 3) / 3
+        ranks = compute_epsilon_net(X, dim=1)
+        initial_index = int(np.argmin(X[:, 1]))
+        np.testing.assert_array_equal(
+            ranks, _compute_epsilon_net_naive(X, initial_index)
+        )
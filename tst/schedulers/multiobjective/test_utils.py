@@ -11,11 +11,14 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 import numpy as np
+import pytest
+from pymoo.indicators.hv import HV
 
 from syne_tune.optimizer.schedulers.multiobjective.utils import (
     hypervolume,
     hypervolume_cumulative,
     linear_interpolate,
+    IncrementalHypervolume,
 )
 
 
@@ -48,3 +51,40 @@ def test_linear_interpolate():
     hv_indicator = np.array([3, 0, 0, 0, 13, 0, 0, 0, 25, 0, 0, 0, 5, 0, 0, 9.5])
     linear_interpolate(hv_indicator, indices)
     assert np.allclose(hv_indicator_shouldbe, hv_indicator)
+
+
+@pytest.mark.parametrize(
+    "num_dims, discretize", [(2, False), (2, True), (3, False), (3, True), (4, False)]
+)
+def test_hypervolume_cumulative_against_pymoo(num_dims, discretize):
+    random_state = np.random.RandomState(31415927)
+    for _ in range(5):
+        num_points = random_state.randint(low=1, high=80)
+        points = random_state.rand(num_points, num_dims)
+        if discretize:
+            # Creates ties and duplicate points
+            points = np.round(points * 4) / 4
+        # Some points do not dominate the reference point
+        ref_point = np.full(num_dims, 0.9)
+        hv = hypervolume_cumulative(results_array=points, reference_point=ref_point)
+        hv_pymoo = np.array(
+            [HV(ref_point=ref_point)(points[: (i + 1)]) for i in range(num_points)]
+        )
+        np.testing.assert_allclose(hv, hv_pymoo, rtol=1e-8, atol=1e-10)
+
+
+@pytest.mark.parametrize("num_dims", [2, 3, 4])
+def test_incremental_hypervolume_pareto_front(num_dims):
+    random_state = np.random.RandomState(2718281)
+    points = random_state.rand(100, num_dims)
+    incremental_hypervolume = IncrementalHypervolume(np.ones(num_dims))
+    for point in points:
+        incremental_hypervolume.add(point)
+    front = incremental_hypervolume.pareto_front
+    is_dominated = [
+        np.any(np.all(points <= point, axis=1) & np.any(points < point, axis=1))
+        for point in points
+    ]
+    expected_front = points[np.logical_not(is_dominated)]
+    assert front.shape == expected_front.shape
+    assert set(map(tuple, front)) == set(map(tuple, expected_front))
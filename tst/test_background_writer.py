@@ -0,0 +1,56 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import threading
+import time
+
+import dill
+import pytest
+
+from syne_tune.util import BackgroundWriter
+
+
+def test_background_writer_runs_jobs_in_order():
+    writer = BackgroundWriter(max_queue_size=2)
+    main_thread = threading.current_thread()
+    written = []
+
+    def job(value):
+        def write():
+            time.sleep(0.01)
+            assert threading.current_thread() is not main_thread
+            written.append(value)
+
+        return write
+
+    for value in range(10):
+        writer.submit(job(value))
+    writer.flush()
+    assert written == list(range(10))
+    # Writer can be serialized, and is usable after deserialization
+    writer = dill.loads(dill.dumps(writer))
+    writer.submit(job(10))
+    writer.close()
+    assert written == list(range(11))
+
+
+def test_background_writer_raises_error():
+    writer = BackgroundWriter()
+
+    def failing_job():
+        raise OSError("disk full")
+
+    writer.submit(failing_job)
+    with pytest.raises(OSError):
+        writer.flush()
+    # Error is raised only once
+    writer.close()
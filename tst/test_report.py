@@ -13,7 +13,7 @@
 import logging
 
 from syne_tune import Reporter
-from syne_tune.report import retrieve
+from syne_tune.report import retrieve, IncrementalLogRetriever
 from syne_tune.constants import ST_SAGEMAKER_METRIC_TAG
 
 
@@ -36,3 +36,50 @@ def test_report_logger():
         {"train_nll": 1.45, "time": 1.0, "step": 2},
         {"train_nll": 1.2, "time": 2.0, "step": 3},
     ]
+
+
+def test_incremental_log_retriever(tmp_path):
+    log_path = tmp_path / "std.out"
+    log_retriever = IncrementalLogRetriever(log_path)
+    # Log file does not exist yet
+    assert log_retriever.retrieve_new() == []
+
+    prefix = "[" + ST_SAGEMAKER_METRIC_TAG + "]: "
+    with open(log_path, "w") as f:
+        f.write("some output\n")
+        f.write(prefix + '{"step": 1}\n')
+        # Incomplete line must not be parsed
+        f.write(prefix + '{"step": 2')
+    assert log_retriever.retrieve_new() == [{"step": 1}]
+    assert log_retriever.retrieve_new() == []
+
+    with open(log_path, "a") as f:
+        f.write("}\n")
+        f.write(prefix + '{"step": 3}\n')
+    assert log_retriever.retrieve_new() == [{"step": 2}, {"step": 3}]
+    assert log_retriever.retrieve_new() == []
+    assert log_retriever.metrics == [{"step": 1}, {"step": 2}, {"step": 3}]
+
+    with open(log_path, "r") as f:
+        assert log_retriever.metrics == retrieve(log_lines=f.readlines())
+
+
+def test_incremental_log_retriever_partial_line(tmp_path):
+    log_path = tmp_path / "std.out"
+    log_retriever = IncrementalLogRetriever(log_path)
+    assert not log_retriever.has_new_output()
+
+    # Progress bar output without newline
+    with open(log_path, "w") as f:
+        f.write("done\n")
+        f.write("progress:  10%\r")
+    assert log_retriever.has_new_output()
+    assert log_retriever.retrieve_new() == []
+    # Partial trailing line has been seen, so this must not signal new output
+    assert not log_retriever.has_new_output()
+
+    with open(log_path, "a") as f:
+        f.write("progress:  20%\r")
+    assert log_retriever.has_new_output()
+    log_retriever.retrieve_new()
+    assert not log_retriever.has_new_output()
@@ -162,6 +162,26 @@ def test_start_config_previous_checkpoint(caplog):
     assert results == ["nothing", "nothing", "state-0", "state-1"]
 
 
+@pytest.mark.timeout(20)
+def test_wait_for_trial_event(caplog):
+    caplog.set_level(logging.INFO)
+    path_script = script_checkpoint_example_path()
+    backend = temporary_local_backend(entry_point=path_script)
+    # No busy trials: Waits for the full timeout
+    assert backend.wait_for_trial_event(timeout=0.1) >= 0.1
+
+    trial_id = backend.start_trial(config={"num-epochs": 2}).trial_id
+    # Returns as soon as a result is reported or the trial finishes
+    timeout = 15
+    assert backend.wait_for_trial_event(timeout=timeout) < timeout
+    wait_until_all_trials_completed(backend)
+    trial_statuses, new_metrics = get_status_metrics(backend, trial_id)
+    assert trial_statuses == {trial_id: Status.completed}
+    assert len(new_metrics) == 2
+    # Once the completion has been registered, nothing is left to wait for
+    assert backend.wait_for_trial_event(timeout=0.1) >= 0.1
+
+
 def test_gpu_allocation(caplog):
     caplog.set_level(logging.INFO)
     path_script = Path(__file__).parent / "main_checkpoint.py"
@@ -0,0 +1,59 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+import dill
+import pandas as pd
+import pytest
+
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+
+_results = [
+    {"epoch": 1, "mean_loss": 0.5, "status": "ok", "sizes": [1, 2]},
+    {"epoch": 2, "mean_loss": 0.25},
+    {"epoch": 3.5, "mean_loss": 0.125, "status": "ok", "flag": True},
+    {"epoch": 2**70, "mean_loss": None},
+    {"epoch": 5, "mean_loss": 1},
+]
+
+
+@pytest.mark.parametrize("num_results", [0, 1, 2, 3, len(_results)])
+def test_metrics_buffer_like_list(num_results):
+    results = _results[:num_results]
+    buffer = MetricsBuffer(results)
+    assert len(buffer) == num_results
+    assert buffer == results
+    assert list(buffer) == results
+    for pos in range(num_results):
+        assert buffer[pos] == results[pos]
+        assert buffer[pos - num_results] == results[pos]
+        assert [type(v) for v in buffer[pos].values()] == [
+            type(v) for v in results[pos].values()
+        ]
+    assert buffer[1:] == results[1:]
+    if num_results > 0:
+        pd.testing.assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(results))
+    # Serialization, truncation
+    buffer = dill.loads(dill.dumps(buffer))
+    assert buffer == results
+    del buffer[num_results // 2 :]
+    assert buffer == results[: num_results // 2]
+    buffer.extend(results[num_results // 2 :])
+    assert buffer == results
+
+
+def test_metrics_buffer_returns_copies():
+    buffer = MetricsBuffer(_results[:2])
+    result = buffer[0]
+    result["epoch"] = 10
+    assert buffer[0] == _results[0]
+    with pytest.raises(IndexError):
+        buffer[2]
@@ -10,11 +10,14 @@
 # on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
+import os
+import signal
 import tempfile
 
 import pytest
 
 from syne_tune.backend import PythonBackend
+from syne_tune.backend.python_backend import python_worker
 from syne_tune.backend.trial_status import Status
 from syne_tune.config_space import randint
 from tst.util_test import wait_until_all_trials_completed
@@ -56,3 +59,73 @@ def test_python_backend():
         metrics_second_trial = [metric["y"] for x, metric in metrics if x == 1]
         assert metrics_first_trial == [2, 3, 4, 5, 6]
         assert metrics_second_trial == [3, 4, 5, 6, 7]
+
+
+def g(x, steps):
+    import time
+    from syne_tune import Reporter
+
+    reporter = Reporter()
+    for i in range(steps):
+        reporter(step=i + 1, y=x + i)
+        time.sleep(0.1)
+
+
+@pytest.mark.timeout(10)
+def test_python_backend_worker_pool():
+    with tempfile.TemporaryDirectory() as local_path:
+        backend = PythonBackend(
+            g,
+            config_space={"x": randint(0, 10), "steps": randint(1, 100)},
+            num_pooled_workers=1,
+        )
+        backend.set_path(str(local_path))
+        trial_id = backend.start_trial({"x": 2, "steps": 100}).trial_id
+        while not backend.fetch_status_results([trial_id])[1]:
+            backend.wait_for_trial_event(timeout=0.1)
+        backend.stop_trial(trial_id)
+        trials, _ = backend.fetch_status_results([trial_id])
+        assert trials[trial_id][1] == Status.stopped
+
+        # The interrupted worker can be reused. A second worker may have been
+        # started if the first one was still busy with stopping
+        trial_id = backend.start_trial({"x": 3, "steps": 5}).trial_id
+        while backend.fetch_status_results([trial_id])[0][trial_id][1] != (
+            Status.completed
+        ):
+            backend.wait_for_trial_event(timeout=0.1)
+        backend.stop_all()
+        assert backend._worker_pool._num_workers_started <= 2
+        metrics = backend._all_trial_results([trial_id])[0].metrics
+        assert [metric["y"] for metric in metrics] == [3, 4, 5, 6, 7]
+        assert len(backend.stdout(trial_id)) == 5
+
+
+def test_run_trial_interrupted_while_handling_exception(tmp_path, monkeypatch):
+    def tune_function(x):
+        raise ValueError("trial fails")
+
+    def print_exc():
+        # Interrupt arrives (twice) while the failure of the trial is handled
+        os.kill(os.getpid(), signal.SIGUSR1)
+        os.kill(os.getpid(), signal.SIGUSR1)
+
+    monkeypatch.setattr(python_worker.traceback, "print_exc", print_exc)
+    stdout_inode = os.fstat(1).st_ino
+    old_handler = signal.signal(signal.SIGUSR1, python_worker._interrupt_trial)
+    try:
+        returncode = python_worker.run_trial(
+            tune_function=tune_function,
+            config={"x": 1},
+            trial_id=0,
+            stdout_path=str(tmp_path / "std.out"),
+            stderr_path=str(tmp_path / "std.err"),
+            connection=None,
+        )
+        # Signals after the end of the trial are ignored
+        os.kill(os.getpid(), signal.SIGUSR1)
+    finally:
+        signal.signal(signal.SIGUSR1, old_handler)
+    assert returncode == python_worker.INTERRUPTED_RETURNCODE
+    assert not python_worker._trial_running
+    assert os.fstat(1).st_ino == stdout_inode
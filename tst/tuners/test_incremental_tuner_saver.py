@@ -0,0 +1,140 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+from datetime import datetime
+from typing import Optional
+
+import dill
+
+import pytest
+
+from syne_tune import Tuner, StoppingCriterion
+from syne_tune.backend.metrics_buffer import MetricsBuffer
+from syne_tune.backend.trial_status import Status, TrialResult
+from syne_tune.config_space import randint
+from syne_tune.constants import ST_TUNER_JOURNAL_FILENAME
+from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.util import script_height_example_path
+from tst.util_test import temporary_local_backend
+
+
+def _add_results(
+    tuner: Tuner, trial_id: int, num_results: int, mean_loss: Optional[float] = None
+):
+    trial_dict = tuner.trial_backend._trial_dict
+    if trial_id not in trial_dict:
+        trial_dict[trial_id] = TrialResult(
+            trial_id=trial_id,
+            config={"width": trial_id},
+            creation_time=datetime.now(),
+            status=Status.in_progress,
+            metrics=MetricsBuffer(),
+        )
+    trial = trial_dict[trial_id]
+    for _ in range(num_results):
+        result = {
+            "epoch": len(trial.metrics) + 1,
+            "mean_loss": 1.0 / (trial_id + 1) if mean_loss is None else mean_loss,
+        }
+        trial.metrics.append(result)
+        tuner.last_seen_result_per_trial[trial_id] = result
+        tuner.callbacks[0].on_trial_result(
+            trial=trial, status=trial.status, result=result, decision="CONTINUE"
+        )
+
+
+@pytest.mark.parametrize("save_in_background", [False, True])
+def test_incremental_tuner_saver(tmp_path, monkeypatch, save_in_background):
+    monkeypatch.setenv("SYNETUNE_FOLDER", str(tmp_path))
+    config_space = {"steps": 10, "width": randint(0, 20)}
+    tuner = Tuner(
+        trial_backend=temporary_local_backend(
+            entry_point=str(script_height_example_path())
+        ),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_wallclock_time=1),
+        n_workers=1,
+        tuner_name="incremental-saver",
+        save_tuner_incrementally=True,
+        save_in_background=save_in_background,
+    )
+    tuner.tuner_path.mkdir(parents=True)
+    tuner.callbacks[0].on_tuning_start(tuner)
+    journal_path = tuner.tuner_path / ST_TUNER_JOURNAL_FILENAME
+    for step in range(20):
+        for trial_id in range(step % 3, 4):
+            _add_results(tuner, trial_id, num_results=step % 2 + 1)
+        tuner._save_checkpoint()
+        if save_in_background:
+            tuner.background_writer.flush()
+        if step == 1:
+            assert journal_path.exists()
+        loaded_tuner = Tuner.load(str(tuner.tuner_path))
+        assert (
+            loaded_tuner.last_seen_result_per_trial == tuner.last_seen_result_per_trial
+        )
+        assert loaded_tuner.callbacks[0].results == tuner.callbacks[0].results
+        trial_dict = tuner.trial_backend._trial_dict
+        loaded_trial_dict = loaded_tuner.trial_backend._trial_dict
+        assert set(loaded_trial_dict.keys()) == set(trial_dict.keys())
+        for trial_id, trial in trial_dict.items():
+            assert loaded_trial_dict[trial_id].metrics == trial.metrics
+
+    # Full save writes a new base snapshot and clears the journal
+    tuner.save()
+    assert not journal_path.exists()
+    loaded_tuner = Tuner.load(str(tuner.tuner_path))
+    assert loaded_tuner.callbacks[0].results == tuner.callbacks[0].results
+
+
+def test_incremental_tuner_saver_nan_metrics(tmp_path, monkeypatch):
+    monkeypatch.setenv("SYNETUNE_FOLDER", str(tmp_path))
+    config_space = {"steps": 10, "width": randint(0, 20)}
+    tuner = Tuner(
+        trial_backend=temporary_local_backend(
+            entry_point=str(script_height_example_path())
+        ),
+        scheduler=RandomSearch(config_space, metric="mean_loss", mode="min"),
+        stop_criterion=StoppingCriterion(max_wallclock_time=1),
+        n_workers=1,
+        tuner_name="incremental-saver-nan",
+        save_tuner_incrementally=True,
+    )
+    tuner.tuner_path.mkdir(parents=True)
+    tuner.callbacks[0].on_tuning_start(tuner)
+    num_steps = 5
+    for _ in range(num_steps):
+        _add_results(tuner, trial_id=0, num_results=2, mean_loss=float("nan"))
+        tuner._save_checkpoint()
+    # Histories ending in NaN metrics must not be written again from the start
+    records = []
+    with open(tuner.tuner_path / ST_TUNER_JOURNAL_FILENAME, "rb") as f:
+        while True:
+            try:
+                records.append(dill.load(f))
+            except EOFError:
+                break
+    assert len(records) > 0
+    for record in records:
+        for start, entries in record["deltas"].values():
+            assert start > 0 and len(entries) == 2
+    loaded_tuner = Tuner.load(str(tuner.tuner_path))
+    assert (
+        loaded_tuner.callbacks[0]
+        .results.to_dataframe()
+        .equals(tuner.callbacks[0].results.to_dataframe())
+    )
+    assert (
+        loaded_tuner.trial_backend._trial_dict[0]
+        .metrics.to_dataframe()
+        .equals(tuner.trial_backend._trial_dict[0].metrics.to_dataframe())
+    )